@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Benchmark the parse -> map -> generate pipeline.
+
+Times each stage over the ABIs in tests/fixtures/abis and synthetic ABIs,
+records peak memory, and writes the results as JSON so runs on different
+commits can be compared.
+
+Usage:
+    python scripts/benchmark.py
+    python scripts/benchmark.py --output bench.json
+    python scripts/benchmark.py --compare baseline.json --threshold 0.2
+    python scripts/benchmark.py --abi uniswap_v3_router --synthetic 5000 --repeat 10
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from abi_to_mcp import generate_from_abi  # noqa: E402
+from abi_to_mcp.core.config import GeneratorConfig  # noqa: E402
+from abi_to_mcp.generator.server_generator import ServerGenerator  # noqa: E402
+from abi_to_mcp.mapper.event_mapper import EventMapper  # noqa: E402
+from abi_to_mcp.mapper.function_mapper import FunctionMapper  # noqa: E402
+from abi_to_mcp.mapper.type_mapper import TypeMapper  # noqa: E402
+from abi_to_mcp.parser.abi_parser import ABIParser  # noqa: E402
+from abi_to_mcp.version import __version__  # noqa: E402
+
+FIXTURES_DIR = ROOT / "tests" / "fixtures" / "abis"
+CONTRACT_ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+STAGES = ("parse", "map", "generate", "end_to_end")
+
+# Bumped when the JSON layout changes
+FORMAT_VERSION = 1
+
+
+def synthetic_abi(entries: int) -> List[Dict[str, Any]]:
+    """ABI of `entries` functions and events covering the common type shapes.
+
+    One entry in ten is an event; functions cycle through every state
+    mutability and through scalar, array, tuple and overloaded signatures.
+    """
+    mutabilities = ["view", "nonpayable", "payable", "pure"]
+    parameter_sets = [
+        [{"name": "account", "type": "address"}],
+        [{"name": "owner", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        [{"name": "ids", "type": "uint256[]"}, {"name": "data", "type": "bytes"}],
+        [
+            {
+                "name": "order",
+                "type": "tuple",
+                "components": [
+                    {"name": "maker", "type": "address"},
+                    {"name": "price", "type": "uint128"},
+                    {"name": "salt", "type": "bytes32"},
+                ],
+            }
+        ],
+        [{"name": "flags", "type": "bool[4]"}, {"name": "label", "type": "string"}],
+    ]
+
+    abi: List[Dict[str, Any]] = []
+    for i in range(entries):
+        if i % 10 == 9:
+            abi.append(
+                {
+                    "type": "event",
+                    "name": f"Event{i}",
+                    "anonymous": False,
+                    "inputs": [
+                        {"name": "sender", "type": "address", "indexed": True},
+                        {"name": "id", "type": "uint256", "indexed": True},
+                        {"name": "value", "type": "uint256", "indexed": False},
+                    ],
+                }
+            )
+            continue
+        # Every fifth function overloads the previous name
+        name = f"function{i - 1 if i % 5 == 4 else i}"
+        abi.append(
+            {
+                "type": "function",
+                "name": name,
+                "stateMutability": mutabilities[i % len(mutabilities)],
+                "inputs": parameter_sets[i % len(parameter_sets)],
+                "outputs": [{"name": "", "type": "uint256"}],
+            }
+        )
+    return abi
+
+
+def load_abis(names: Optional[List[str]], synthetic: List[int], workdir: Path) -> Dict[str, Path]:
+    """ABI files to benchmark by name; synthetic ABIs are written to workdir."""
+    abis = {path.stem: path for path in sorted(FIXTURES_DIR.glob("*.json"))}
+    if names:
+        unknown = [name for name in names if name not in abis]
+        if unknown:
+            raise SystemExit(f"Unknown fixture ABI: {', '.join(unknown)} (see {FIXTURES_DIR})")
+        abis = {name: abis[name] for name in names}
+
+    for entries in synthetic:
+        path = workdir / f"synthetic_{entries}.json"
+        path.write_text(json.dumps(synthetic_abi(entries)))
+        abis[path.stem] = path
+    return abis
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Time `repeat` calls of func, then trace one more for peak memory."""
+    func()  # warm-up: imports, template compilation, caches
+
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "mean_s": statistics.fmean(timings),
+        "max_s": max(timings),
+        "peak_memory_bytes": peak,
+    }
+
+
+def benchmark_abi(name: str, path: Path, repeat: int, workdir: Path) -> List[Dict[str, Any]]:
+    """Benchmark every pipeline stage on one ABI."""
+    abi = json.loads(path.read_text())
+    if isinstance(abi, dict):
+        abi = abi.get("abi", abi)
+
+    parser = ABIParser()
+    type_mapper = TypeMapper()
+    function_mapper = FunctionMapper(type_mapper)
+    event_mapper = EventMapper(type_mapper)
+    generator = ServerGenerator(GeneratorConfig(output_dir=workdir / name))
+
+    parsed = parser.parse(abi)
+
+    def map_abi():
+        tools = [function_mapper.map_function(f) for f in parsed.functions]
+        resources = [event_mapper.map_event(e) for e in parsed.events]
+        return tools, resources
+
+    tools, resources = map_abi()
+
+    stages = {
+        "parse": lambda: parser.parse(abi),
+        "map": map_abi,
+        "generate": lambda: generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address=CONTRACT_ADDRESS,
+            network="mainnet",
+        ),
+        "end_to_end": lambda: generate_from_abi(
+            abi_source=str(path),
+            contract_address=CONTRACT_ADDRESS,
+            network="mainnet",
+            output_dir=str(workdir / name),
+        ),
+    }
+
+    return [
+        {"abi": name, "entries": len(abi), "stage": stage, **measure(func, repeat)}
+        for stage, func in stages.items()
+    ]
+
+
+def git_commit() -> Optional[str]:
+    """Commit of the working tree, if it is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print median-time ratios against a baseline; return the regressions."""
+    previous = {(r["abi"], r["stage"]): r for r in baseline["results"]}
+    regressions = []
+
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} (median time):")
+    for result in current["results"]:
+        key = (result["abi"], result["stage"])
+        if key not in previous:
+            continue
+        ratio = result["median_s"] / previous[key]["median_s"]
+        marker = ""
+        if ratio > 1 + threshold:
+            marker = "  REGRESSION"
+            regressions.append(f"{key[0]}/{key[1]}: {ratio:.2f}x")
+        print(f"  {key[0]:<24} {key[1]:<11} {ratio:6.2f}x{marker}")
+    return regressions
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    """Print a table of median times and peak memory."""
+    print(f"{'ABI':<24} {'entries':>7}  {'stage':<11} {'median ms':>10} {'min ms':>9} {'peak MiB':>9}")
+    for r in results:
+        print(
+            f"{r['abi']:<24} {r['entries']:>7}  {r['stage']:<11} "
+            f"{r['median_s'] * 1000:>10.2f} {r['min_s'] * 1000:>9.2f} "
+            f"{r['peak_memory_bytes'] / 2**20:>9.2f}"
+        )
+
+
+def main() -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--abi", action="append", help="Fixture ABI name to benchmark (default: all)"
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        action="append",
+        help="Entries of a synthetic ABI to add (default: 5000; 0 for none)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON file to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Median slowdown counted as a regression (default: 0.2, i.e. 20%%)",
+    )
+    args = parser.parse_args()
+
+    synthetic = [n for n in (args.synthetic or [5000]) if n > 0]
+    with tempfile.TemporaryDirectory(prefix="abi-to-mcp-bench-") as tmp:
+        workdir = Path(tmp)
+        results = []
+        for name, path in load_abis(args.abi, synthetic, workdir).items():
+            print(f"Benchmarking {name}...", file=sys.stderr)
+            results += benchmark_abi(name, path, args.repeat, workdir)
+
+    report = {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "abi_to_mcp": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    print_results(results)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,41 +21,64 @@ Basic usage:
     server.write_to_directory("./my-mcp-server")
 """
 
+from typing import TYPE_CHECKING, Any
+
 from abi_to_mcp.version import __version__
 
-# Core models
-from abi_to_mcp.core.models import (
-    ABIParameter,
-    ABIFunction,
-    ABIEvent,
-    ABIError,
-    ParsedABI,
-    MappedTool,
-    MappedResource,
-    GeneratedFile,
-    GeneratedServer,
-    FetchResult,
-    StateMutability,
-    ToolType,
-)
-
-# Configuration
-from abi_to_mcp.core.config import (
-    GeneratorConfig,
-    FetcherConfig,
-    RuntimeConfig,
-    AppConfig,
-)
-
-# Exceptions
-from abi_to_mcp.core.exceptions import (
-    ABIToMCPError,
-    ABINotFoundError,
-    ABIParseError,
-    ABIValidationError,
-    NetworkError,
-    GeneratorError,
-)
+if TYPE_CHECKING:
+    from abi_to_mcp.core.config import AppConfig, FetcherConfig, GeneratorConfig, RuntimeConfig
+    from abi_to_mcp.core.exceptions import (
+        ABINotFoundError,
+        ABIParseError,
+        ABIToMCPError,
+        ABIValidationError,
+        GeneratorError,
+        NetworkError,
+    )
+    from abi_to_mcp.core.models import (
+        ABIError,
+        ABIEvent,
+        ABIFunction,
+        ABIParameter,
+        FetchResult,
+        GeneratedFile,
+        GeneratedServer,
+        MappedResource,
+        MappedTool,
+        ParsedABI,
+        StateMutability,
+        ToolType,
+    )
+
+# Public name -> module defining it. Names are imported on first access, so
+# importing the package (as the CLI does on every invocation) stays cheap.
+_EXPORTS = {
+    # Core models
+    "ABIParameter": "abi_to_mcp.core.models",
+    "ABIFunction": "abi_to_mcp.core.models",
+    "ABIEvent": "abi_to_mcp.core.models",
+    "ABIError": "abi_to_mcp.core.models",
+    "ParsedABI": "abi_to_mcp.core.models",
+    "MappedTool": "abi_to_mcp.core.models",
+    "MappedResource": "abi_to_mcp.core.models",
+    "GeneratedFile": "abi_to_mcp.core.models",
+    "GeneratedServer": "abi_to_mcp.core.models",
+    "FetchResult": "abi_to_mcp.core.models",
+    "StateMutability": "abi_to_mcp.core.models",
+    "ToolType": "abi_to_mcp.core.models",
+    # Configuration
+    "GeneratorConfig": "abi_to_mcp.core.config",
+    "FetcherConfig": "abi_to_mcp.core.config",
+    "RuntimeConfig": "abi_to_mcp.core.config",
+    "AppConfig": "abi_to_mcp.core.config",
+    # Exceptions
+    "ABIToMCPError": "abi_to_mcp.core.exceptions",
+    "ABINotFoundError": "abi_to_mcp.core.exceptions",
+    "ABIParseError": "abi_to_mcp.core.exceptions",
+    "ABIValidationError": "abi_to_mcp.core.exceptions",
+    "NetworkError": "abi_to_mcp.core.exceptions",
+    "GeneratorError": "abi_to_mcp.core.exceptions",
+}
 
 __all__ = [
     # Version
@@ -88,13 +111,29 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Module attributes, including names not imported yet."""
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
 def generate_from_abi(
     abi_source: str,
     contract_address: str,
     network: str = "mainnet",
     output_dir: str = "./mcp-server",
     **kwargs,
-) -> GeneratedServer:
+) -> "GeneratedServer":
     """
     Generate an MCP server from an ABI source.
 
@@ -119,7 +158,8 @@ def generate_from_abi(
         ... )
         >>> server.write_to_directory("./my-mcp-server")
     """
-    # Lazy imports to avoid circular dependencies
+    # Imported here to keep the package import cheap
+    from abi_to_mcp.core.config import GeneratorConfig
     from abi_to_mcp.fetchers.registry import create_default_registry
     from abi_to_mcp.parser.abi_parser import ABIParser
     from abi_to_mcp.mapper.type_mapper import TypeMapper
@@ -133,8 +173,11 @@ def generate_from_abi(
     config = GeneratorConfig(output_dir=Path(output_dir), **kwargs)
 
     # Fetch ABI
-    registry = create_default_registry()
-    fetch_result = asyncio.run(registry.fetch(abi_source, network=network))
+    async def _fetch() -> "FetchResult":
+        async with create_default_registry() as registry:
+            return await registry.fetch(abi_source, network=network)
+
+    fetch_result = asyncio.run(_fetch())
 
     # Parse ABI
     parser = ABIParser()
@@ -1,13 +1,5 @@
-"""CLI commands for abi-to-mcp."""
+"""CLI commands for abi-to-mcp.
 
-from abi_to_mcp.cli.commands.generate import generate
-from abi_to_mcp.cli.commands.inspect import inspect
-from abi_to_mcp.cli.commands.validate import validate
-from abi_to_mcp.cli.commands.serve import serve
-
-__all__ = [
-    "generate",
-    "inspect",
-    "validate",
-    "serve",
-]
+Each command lives in its own module, imported by cli.main only when the
+command runs, so that `abi-to-mcp --version` and `--help` stay fast.
+"""
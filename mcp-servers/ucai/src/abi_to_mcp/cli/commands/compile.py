@@ -0,0 +1,79 @@
+"""Compile command - Write a compiled ABI artifact."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Optional
+
+from rich import print as rprint
+
+from abi_to_mcp.core.exceptions import ABIToMCPError
+from abi_to_mcp.utils.validation import is_valid_address
+
+
+def compile_artifact(
+    source: str,
+    output: Optional[Path],
+    network: str,
+    contract: Optional[str] = None,
+    use_cache: bool = True,
+    offline: bool = False,
+) -> None:
+    """Parse and map an ABI once and save the result as a compiled artifact."""
+    asyncio.run(
+        _compile_async(
+            source,
+            output,
+            network,
+            contract=contract,
+            use_cache=use_cache,
+            offline=offline,
+        )
+    )
+
+
+async def _compile_async(
+    source: str,
+    output: Optional[Path],
+    network: str,
+    contract: Optional[str] = None,
+    use_cache: bool = True,
+    offline: bool = False,
+) -> None:
+    """Async implementation."""
+    try:
+        from abi_to_mcp.core.compiled import COMPILED_SUFFIX, compile_abi, save_compiled
+        from abi_to_mcp.fetchers import ABICache, create_default_registry
+
+        cache = ABICache() if use_cache or offline else None
+        async with create_default_registry(cache=cache, offline=offline) as registry:
+            if is_valid_address(source):
+                fetch_result = await registry.fetch(source, network=network)
+            elif contract:
+                fetch_result = await registry.fetch(source, contract=contract)
+            else:
+                fetch_result = await registry.fetch(source)
+
+        started = time.perf_counter()
+        compiled = compile_abi(fetch_result.abi)
+        elapsed = time.perf_counter() - started
+
+        if output is None:
+            stem = fetch_result.contract_name or (
+                source if is_valid_address(source) else Path(source).stem
+            )
+            output = Path(f"{stem}{COMPILED_SUFFIX}")
+        save_compiled(compiled, output)
+
+        rprint(f"[bold green]✓ Compiled[/bold green] {source} in {elapsed * 1000:.0f}ms")
+        rprint(f"[bold]Output:[/bold] {output}")
+        rprint(f"[bold]ABI hash:[/bold] {compiled.abi_hash}")
+        rprint(f"[bold]Tools:[/bold] {len(compiled.tools)}")
+        rprint(f"[bold]Resources:[/bold] {len(compiled.resources)}")
+
+    except ABIToMCPError as e:
+        rprint(f"[bold red]Error:[/bold red] {e.message}")
+        raise SystemExit(1) from None
+    except Exception as e:
+        rprint(f"[bold red]Error:[/bold red] {e}")
+        raise SystemExit(1) from None
@@ -2,7 +2,7 @@
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -11,6 +11,9 @@ from rich import print as rprint
 from abi_to_mcp.core.exceptions import ABIToMCPError
 from abi_to_mcp.utils.validation import is_valid_address
 
+if TYPE_CHECKING:
+    from abi_to_mcp.core.compiled import CompiledABI
+
 console = Console()
 
 
@@ -23,6 +26,11 @@ def generate(
     read_only: bool,
     include_events: bool,
     simulation_default: bool,
+    use_cache: bool = True,
+    offline: bool = False,
+    contract: Optional[str] = None,
+    force: bool = False,
+    async_mode: bool = False,
 ) -> None:
     """Generate an MCP server from an ABI."""
     asyncio.run(
@@ -35,6 +43,11 @@ def generate(
             read_only=read_only,
             include_events=include_events,
             simulation_default=simulation_default,
+            use_cache=use_cache,
+            offline=offline,
+            contract=contract,
+            force=force,
+            async_mode=async_mode,
         )
     )
 
@@ -48,6 +61,11 @@ async def _generate_async(
     read_only: bool,
     include_events: bool,
     simulation_default: bool,
+    use_cache: bool = True,
+    offline: bool = False,
+    contract: Optional[str] = None,
+    force: bool = False,
+    async_mode: bool = False,
 ) -> None:
     """Async implementation."""
     try:
@@ -57,80 +75,72 @@ async def _generate_async(
             console=console,
         ) as progress:
             # Import here to avoid circular dependencies
-            from abi_to_mcp.fetchers import create_default_registry
-            from abi_to_mcp.parser import ABIParser
-            from abi_to_mcp.mapper import TypeMapper, FunctionMapper, EventMapper
-            from abi_to_mcp.generator import MCPGenerator
+            from abi_to_mcp.core.compiled import is_compiled_artifact, load_compiled
+            from abi_to_mcp.fetchers import ABICache, create_default_registry
 
-            # Step 1: Fetch
-            task = progress.add_task("Fetching ABI...", total=None)
-            registry = create_default_registry()
+            fetched_name = None
+            compiled_dir = None
 
-            if is_valid_address(source):
-                fetch_result = await registry.fetch(source, network=network)
-                contract_address = contract_address or source
+            if is_compiled_artifact(source):
+                # Step 1: Load a compiled artifact (already parsed and mapped)
+                task = progress.add_task("Loading compiled ABI...", total=None)
+                abi: Union[List[Dict[str, Any]], CompiledABI] = load_compiled(source)
+                progress.update(task, description="✓ Compiled ABI loaded")
             else:
-                fetch_result = await registry.fetch(source)
-                if not contract_address:
-                    rprint("[yellow]Warning: No contract address - using placeholder[/yellow]")
-                    contract_address = "0x0000000000000000000000000000000000000000"
-
-            progress.update(task, description="✓ ABI fetched")
-
-            # Step 2: Parse
-            task = progress.add_task("Parsing ABI...", total=None)
-            parser = ABIParser()
-            parsed = parser.parse(fetch_result.abi)
-            progress.update(task, description=f"✓ Parsed {len(parsed.functions)} functions")
-
-            # Step 3: Map
-            task = progress.add_task("Mapping to MCP...", total=None)
-            type_mapper = TypeMapper()
-            func_mapper = FunctionMapper(type_mapper)
-            event_mapper = EventMapper(type_mapper)
-
-            functions = [f for f in parsed.functions if not read_only or f.is_read_only]
-            tools = [func_mapper.map_function(f) for f in functions]
-            resources = [event_mapper.map_event(e) for e in parsed.events] if include_events else []
+                # Step 1: Fetch
+                task = progress.add_task("Fetching ABI...", total=None)
+                cache = ABICache() if use_cache or offline else None
+
+                async with create_default_registry(cache=cache, offline=offline) as registry:
+                    if is_valid_address(source):
+                        fetch_result = await registry.fetch(source, network=network)
+                    elif contract:
+                        fetch_result = await registry.fetch(source, contract=contract)
+                    else:
+                        fetch_result = await registry.fetch(source)
+
+                abi = fetch_result.abi
+                fetched_name = fetch_result.contract_name
+                # Reuses the cached compiled artifact if the ABI is unchanged
+                compiled_dir = cache.compiled_dir if cache else None
+                progress.update(task, description="✓ ABI fetched")
 
-            progress.update(task, description=f"✓ Mapped {len(tools)} tools")
+            if is_valid_address(source):
+                contract_address = contract_address or source
+            elif not contract_address:
+                rprint("[yellow]Warning: No contract address - using placeholder[/yellow]")
+                contract_address = "0x0000000000000000000000000000000000000000"
 
-            # Step 4: Generate
+            # Steps 2-4: Parse, map, generate and write
             task = progress.add_task("Generating server...", total=None)
-
-            if name is None:
-                name = fetch_result.contract_name or parsed.detected_standard or "Contract"
-
-            generator = MCPGenerator()
-            server = generator.generate(
-                parsed=parsed,
-                tools=tools,
-                resources=resources,
-                contract_address=contract_address,
-                network=network,
-                contract_name=name,
+            counts = render_server(
+                abi,
+                output,
+                network,
+                contract_address,
+                name,
+                fetched_name,
+                read_only,
+                include_events,
+                compiled_dir=compiled_dir,
+                force=force,
+                async_mode=async_mode,
             )
 
-            progress.update(task, description="✓ Server generated")
-
-            # Step 5: Write
-            task = progress.add_task("Writing files...", total=None)
-            output.mkdir(parents=True, exist_ok=True)
-
-            for file in server.files:
-                file_path = output / file.path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text(file.content)
-
-            progress.update(task, description=f"✓ Wrote {len(server.files)} files")
+            # Unchanged files are neither re-rendered nor rewritten unless forced
+            unchanged = counts["files"] - counts["written"]
+            description = f"✓ Generated {counts['tools']} tools, wrote {counts['written']} files"
+            if unchanged:
+                description += f" ({unchanged} unchanged)"
+            progress.update(task, description=description)
 
         # Success
         rprint()
         rprint("[bold green]✓ MCP server generated successfully![/bold green]")
         rprint()
         rprint(f"[bold]Output:[/bold] {output}")
-        rprint(f"[bold]Tools:[/bold] {len(tools)}")
-        rprint(f"[bold]Resources:[/bold] {len(resources)}")
+        rprint(f"[bold]Tools:[/bold] {counts['tools']}")
+        rprint(f"[bold]Resources:[/bold] {counts['resources']}")
         rprint()
         rprint("[bold]Next steps:[/bold]")
         rprint(f"  cd {output}")
@@ -144,3 +154,90 @@ async def _generate_async(
     except Exception as e:
         rprint(f"[bold red]Error:[/bold red] {e}")
         raise SystemExit(1) from None
+
+
+def render_server(
+    abi: Union[List[Dict[str, Any]], "CompiledABI"],
+    output: Path,
+    network: str,
+    contract_address: str,
+    name: Optional[str],
+    contract_name: Optional[str],
+    read_only: bool,
+    include_events: bool,
+    compiled_dir: Optional[Path] = None,
+    force: bool = False,
+    async_mode: bool = False,
+    namespace: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Parse, map, render and write a server for an already fetched ABI.
+
+    Takes only picklable arguments so it can run in a worker process.
+
+    Args:
+        abi: ABI JSON, or an already compiled ABI
+        output: Output directory
+        network: Network name
+        contract_address: Contract address embedded in the server
+        name: Server name (auto-detected if None)
+        contract_name: Contract name reported by the fetcher
+        read_only: Only generate read operations
+        include_events: Include events as MCP resources
+        compiled_dir: Compiled artifact cache directory (None: always parse and map)
+        force: Re-render and rewrite every file instead of skipping unchanged ones
+        async_mode: Generate async tools on AsyncWeb3
+        namespace: Render the contract module of a bundle server under this
+            namespace instead of a standalone server
+
+    Returns:
+        Counts of generated tools, resources and files, and of files written;
+        for a bundle module also its name and tool, write tool and event names
+    """
+    from abi_to_mcp.core.compiled import CompiledABI, load_or_compile
+    from abi_to_mcp.core.config import GeneratorConfig
+    from abi_to_mcp.generator import MCPGenerator
+
+    compiled = abi if isinstance(abi, CompiledABI) else load_or_compile(abi, compiled_dir)
+    parsed = compiled.parsed
+    tools, resources = compiled.select(read_only, include_events)
+
+    generator = MCPGenerator(
+        GeneratorConfig(output_dir=output, incremental=not force, async_mode=async_mode)
+    )
+    contract_name = name or contract_name or parsed.detected_standard or "Contract"
+    if namespace:
+        server = generator.generate_bundle_contract(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            namespace=namespace,
+            contract_address=contract_address,
+            network=network,
+            contract_name=contract_name,
+        )
+    else:
+        server = generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address=contract_address,
+            network=network,
+            contract_name=contract_name,
+        )
+    generator.write_to_disk(server, output)
+
+    counts: Dict[str, Any] = {
+        "tools": len(tools),
+        "resources": len(resources),
+        "files": len(server.files),
+        "written": len(server.files) - len(server.unchanged_files),
+    }
+    if namespace:
+        counts.update(
+            name=contract_name,
+            read_tools=server.read_tools,
+            write_tools=server.write_tools,
+            events=server.events,
+        )
+    return counts
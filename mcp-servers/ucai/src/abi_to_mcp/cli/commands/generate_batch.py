@@ -0,0 +1,534 @@
+"""Generate-batch command implementation.
+
+Generates one MCP server per contract listed in a manifest. Fetches run
+concurrently through a single registry (shared HTTP client, rate limiter and
+ABI cache); parsing, mapping and rendering run in a process pool.
+
+Manifest format (YAML or JSON)::
+
+    defaults:
+      network: mainnet
+      read_only: false
+      include_events: true
+      async: false
+    contracts:
+      - source: "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+        name: USDC
+      - source: ./abis/vault.json
+        address: "0x1234..."
+        network: arbitrum
+        output: arbitrum-vault
+      - source: ./artifacts/build-info/4f2c.json
+        contract: contracts/Pool.sol:Pool
+        address: "0x5678..."
+
+With bundle=True the contracts are served by a single server in the output
+directory: each is rendered as contracts/<namespace>/ (the output key or the
+name, as an identifier) and its tools are named <namespace>__<tool>.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+from rich import print as rprint
+
+from abi_to_mcp.cli.commands.generate import render_server
+from abi_to_mcp.core.exceptions import ABIToMCPError, ConfigurationError
+from abi_to_mcp.core.models import BundleContract
+from abi_to_mcp.utils.validation import is_valid_address
+
+if TYPE_CHECKING:
+    from abi_to_mcp.fetchers.registry import FetcherRegistry
+
+console = Console()
+
+# Report written to the batch output directory
+REPORT_FILENAME = "batch-report.json"
+
+# Per-contract keys accepted in the manifest (and in its defaults section)
+_ENTRY_KEYS = {
+    "source",
+    "contract",
+    "name",
+    "network",
+    "address",
+    "output",
+    "read_only",
+    "include_events",
+    "async",
+}
+
+
+@dataclass
+class BatchEntry:
+    """One contract to generate."""
+
+    source: str
+    output: Path
+    network: str = "mainnet"
+    name: Optional[str] = None
+    contract: Optional[str] = None
+    address: Optional[str] = None
+    read_only: bool = False
+    include_events: bool = True
+    async_mode: bool = False
+    namespace: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of generating one contract."""
+
+    source: str
+    network: str
+    output: str
+    status: str = "ok"
+    error: Optional[str] = None
+    tools: int = 0
+    resources: int = 0
+    files: int = 0
+    written: int = 0
+    fetch_seconds: float = 0.0
+    render_seconds: float = 0.0
+    namespace: Optional[str] = None
+    address: Optional[str] = None
+    # Contract module of a bundle, once rendered (not part of the report)
+    bundle_contract: Optional[BundleContract] = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the contract was generated."""
+        return self.status == "ok"
+
+
+def load_manifest(
+    path: Path, output: Path, async_mode: bool = False, bundle: bool = False
+) -> List[BatchEntry]:
+    """
+    Load and validate a batch manifest.
+
+    Relative file sources are resolved against the manifest's directory;
+    output directories are relative to the batch output directory and
+    default to a slug of the name (or network and source).
+
+    Args:
+        path: Manifest file (.yaml, .yml or .json)
+        output: Batch output directory
+        async_mode: Default for entries that do not set "async"
+        bundle: Render every entry as a contract module of one bundle
+            server: its output is contracts/<namespace> and all entries
+            must share the same async setting
+
+    Returns:
+        Entries in manifest order
+
+    Raises:
+        ConfigurationError: If the manifest is missing or malformed, or a
+            file source has no address
+        ImportError: If a YAML manifest is given and PyYAML is not installed
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise ConfigurationError(f"Cannot read manifest {path}: {e}") from e
+
+    if path.suffix.lower() == ".json":
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Invalid JSON in manifest {path}: {e}") from e
+    else:
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError(
+                "PyYAML is required for YAML manifests. Install with: pip install pyyaml"
+            ) from e
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ConfigurationError(f"Invalid YAML in manifest {path}: {e}") from e
+
+    if isinstance(data, list):
+        data = {"contracts": data}
+    if not isinstance(data, dict) or not isinstance(data.get("contracts"), list):
+        raise ConfigurationError("Manifest must contain a 'contracts' list", config_key="contracts")
+
+    defaults = data.get("defaults") or {}
+    _check_keys(defaults, "defaults")
+
+    entries: List[BatchEntry] = []
+    used_outputs: set = set()
+
+    for index, raw in enumerate(data["contracts"]):
+        if isinstance(raw, str):
+            raw = {"source": raw}
+        if not isinstance(raw, dict) or not raw.get("source"):
+            raise ConfigurationError(
+                f"Contract #{index + 1} must have a 'source'", config_key=f"contracts[{index}]"
+            )
+        _check_keys(raw, f"contracts[{index}]")
+
+        values = {**defaults, **raw}
+        source = str(values["source"])
+        if not is_valid_address(source):
+            if not values.get("address"):
+                raise ConfigurationError(
+                    f"Contract #{index + 1} ({source}) is a file source and needs an 'address'",
+                    config_key=f"contracts[{index}].address",
+                )
+            if not Path(source).is_absolute():
+                source = str((path.parent / source).resolve())
+
+        network = values.get("network", "mainnet")
+        out_name = values.get("output") or _slugify(
+            values.get("name")
+            or (values.get("contract") or "").split(":")[-1]
+            or f"{network}-{Path(source).stem}"
+        )
+        namespace = None
+        if bundle:
+            namespace = _unique(_namespace(out_name), used_outputs, separator="_")
+            entry_output = output / "contracts" / namespace
+        else:
+            entry_output = output / _unique(out_name, used_outputs)
+
+        entries.append(
+            BatchEntry(
+                source=source,
+                output=entry_output,
+                network=network,
+                name=values.get("name"),
+                contract=values.get("contract"),
+                address=values.get("address"),
+                read_only=bool(values.get("read_only", False)),
+                include_events=bool(values.get("include_events", True)),
+                async_mode=bool(values.get("async", async_mode)),
+                namespace=namespace,
+            )
+        )
+
+    if bundle and len({entry.async_mode for entry in entries}) > 1:
+        raise ConfigurationError(
+            "All contracts of a bundle must use the same 'async' setting", config_key="async"
+        )
+
+    return entries
+
+
+def generate_batch(
+    manifest: Path,
+    output: Path,
+    concurrency: int = 8,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    offline: bool = False,
+    force: bool = False,
+    async_mode: bool = False,
+    bundle: bool = False,
+) -> None:
+    """Generate MCP servers for every contract in a manifest, or one bundle server."""
+    try:
+        entries = load_manifest(manifest, output, async_mode=async_mode, bundle=bundle)
+    except (ABIToMCPError, ImportError) as e:
+        rprint(f"[bold red]Error:[/bold red] {getattr(e, 'message', e)}")
+        raise SystemExit(1) from None
+
+    if not entries:
+        rprint("[yellow]Manifest lists no contracts[/yellow]")
+        return
+
+    started = time.perf_counter()
+    results = asyncio.run(
+        _generate_batch_async(
+            entries,
+            concurrency=concurrency,
+            workers=workers,
+            use_cache=use_cache,
+            offline=offline,
+            force=force,
+        )
+    )
+
+    bundle_files = None
+    if bundle and any(r.ok for r in results):
+        try:
+            bundle_files = write_bundle(results, output, entries[0].async_mode, force)
+        except ABIToMCPError as e:
+            rprint(f"[bold red]Error:[/bold red] {e.message}")
+            raise SystemExit(1) from None
+    elapsed = time.perf_counter() - started
+
+    report_path = write_report(results, output, elapsed)
+    _print_summary(results, elapsed, report_path)
+    if bundle_files is not None:
+        rprint(f"[bold]Bundle server:[/bold] {output / 'server.py'} ({bundle_files} files written)")
+
+    if any(not r.ok for r in results):
+        raise SystemExit(1)
+
+
+async def _generate_batch_async(
+    entries: List[BatchEntry],
+    concurrency: int = 8,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    offline: bool = False,
+    force: bool = False,
+) -> List[BatchResult]:
+    """
+    Fetch concurrently and render in a process pool.
+
+    Args:
+        entries: Contracts to generate
+        concurrency: Maximum number of fetches in flight
+        workers: Render processes (None: CPU count, 0: render in this process)
+        use_cache: Use the on-disk ABI cache
+        offline: Serve addresses only from the ABI cache
+        force: Re-render and rewrite every file instead of skipping unchanged ones
+
+    Returns:
+        One result per entry, in manifest order
+    """
+    from abi_to_mcp.fetchers import ABICache, create_default_registry
+
+    cache = ABICache() if use_cache or offline else None
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    executor: Optional[Executor] = None
+    if workers != 0:
+        executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+
+    try:
+        async with create_default_registry(cache=cache, offline=offline) as registry:
+            compiled_dir = cache.compiled_dir if cache else None
+            return await asyncio.gather(
+                *(
+                    _generate_one(entry, registry, semaphore, executor, compiled_dir, force)
+                    for entry in entries
+                )
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+async def _generate_one(
+    entry: BatchEntry,
+    registry: "FetcherRegistry",
+    semaphore: asyncio.Semaphore,
+    executor: Optional[Executor],
+    compiled_dir: Optional[Path] = None,
+    force: bool = False,
+) -> BatchResult:
+    """Fetch and render a single contract, capturing any failure."""
+    result = BatchResult(
+        source=entry.source,
+        network=entry.network,
+        output=str(entry.output),
+        namespace=entry.namespace,
+    )
+    stage = "fetch"
+
+    try:
+        async with semaphore:
+            started = time.perf_counter()
+            if is_valid_address(entry.source):
+                fetch_result = await registry.fetch(entry.source, network=entry.network)
+            elif entry.contract:
+                fetch_result = await registry.fetch(entry.source, contract=entry.contract)
+            else:
+                fetch_result = await registry.fetch(entry.source)
+        result.fetch_seconds = time.perf_counter() - started
+
+        stage = "render"
+        # load_manifest guarantees an address for file sources
+        address = entry.address or entry.source
+        result.address = address
+
+        render_args = (
+            fetch_result.abi,
+            entry.output,
+            entry.network,
+            address,
+            entry.name,
+            fetch_result.contract_name,
+            entry.read_only,
+            entry.include_events,
+            compiled_dir,
+            force,
+            entry.async_mode,
+            entry.namespace,
+        )
+
+        started = time.perf_counter()
+        if executor is None:
+            counts = render_server(*render_args)
+        else:
+            loop = asyncio.get_running_loop()
+            counts = await loop.run_in_executor(executor, render_server, *render_args)
+        result.render_seconds = time.perf_counter() - started
+
+        result.tools = counts["tools"]
+        result.resources = counts["resources"]
+        result.files = counts["files"]
+        result.written = counts["written"]
+        if entry.namespace:
+            result.bundle_contract = BundleContract(
+                namespace=entry.namespace,
+                name=counts["name"],
+                address=address,
+                network=entry.network,
+                read_tools=counts["read_tools"],
+                write_tools=counts["write_tools"],
+                events=counts["events"],
+            )
+
+    except Exception as e:
+        result.status = f"{stage} failed"
+        result.error = e.message if isinstance(e, ABIToMCPError) else str(e) or type(e).__name__
+
+    return result
+
+
+def write_bundle(
+    results: List[BatchResult], output: Path, async_mode: bool = False, force: bool = False
+) -> int:
+    """
+    Write the server of a bundle whose contract modules are rendered.
+
+    The bundle serves the contracts rendered successfully; the modules of
+    the others are not loaded.
+
+    Args:
+        results: Per-contract results of a bundle batch
+        output: Batch output directory (the bundle server's directory)
+        async_mode: Whether the contract modules are async
+        force: Rewrite every file instead of skipping unchanged ones
+
+    Returns:
+        Number of bundle-level files written
+    """
+    from abi_to_mcp.core.config import GeneratorConfig
+    from abi_to_mcp.generator import MCPGenerator
+
+    contracts = [r.bundle_contract for r in results if r.ok and r.bundle_contract]
+    generator = MCPGenerator(
+        GeneratorConfig(output_dir=output, incremental=not force, async_mode=async_mode)
+    )
+    server = generator.generate_bundle(contracts)
+    generator.write_to_disk(server, output)
+    return len(server.files) - len(server.unchanged_files)
+
+
+def write_report(results: List[BatchResult], output: Path, elapsed: float) -> Path:
+    """
+    Write the JSON summary report.
+
+    Args:
+        results: Per-contract results
+        output: Batch output directory
+        elapsed: Wall-clock time of the whole batch
+
+    Returns:
+        Path of the report file
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    report: Dict[str, Any] = {
+        "total": len(results),
+        "succeeded": sum(1 for r in results if r.ok),
+        "failed": sum(1 for r in results if not r.ok),
+        "elapsed_seconds": round(elapsed, 3),
+        "contracts": [_report_entry(r) for r in results],
+    }
+    report_path = output / REPORT_FILENAME
+    report_path.write_text(json.dumps(report, indent=2))
+    return report_path
+
+
+def _print_summary(results: List[BatchResult], elapsed: float, report_path: Path) -> None:
+    """Print a table of per-contract outcomes."""
+    table = Table(title="Batch Generation")
+    table.add_column("Source", style="cyan", overflow="fold")
+    table.add_column("Network", style="yellow")
+    table.add_column("Status")
+    table.add_column("Tools", justify="right")
+    table.add_column("Written", justify="right")
+    table.add_column("Fetch (s)", justify="right")
+    table.add_column("Render (s)", justify="right")
+
+    for r in results:
+        status = "[green]✓ ok[/green]" if r.ok else f"[red]✗ {r.status}[/red]"
+        table.add_row(
+            r.source,
+            r.network,
+            status,
+            str(r.tools) if r.ok else "-",
+            f"{r.written}/{r.files}" if r.ok else "-",
+            f"{r.fetch_seconds:.2f}",
+            f"{r.render_seconds:.2f}" if r.ok else "-",
+        )
+
+    console.print(table)
+
+    failed = [r for r in results if not r.ok]
+    for r in failed:
+        rprint(f"[red]✗ {r.source}:[/red] {r.error}")
+
+    rprint()
+    kind = "contracts" if any(r.namespace for r in results) else "servers"
+    rprint(
+        f"[bold]{len(results) - len(failed)}/{len(results)} {kind} generated[/bold] "
+        f"in {elapsed:.2f}s"
+    )
+    rprint(f"[bold]Report:[/bold] {report_path}")
+
+
+def _report_entry(result: BatchResult) -> Dict[str, Any]:
+    """A result as reported in the JSON summary."""
+    entry = asdict(result)
+    del entry["bundle_contract"]
+    return entry
+
+
+def _check_keys(values: Dict[str, Any], where: str) -> None:
+    """Reject unknown manifest keys (usually typos)."""
+    unknown = set(values) - _ENTRY_KEYS
+    if unknown:
+        raise ConfigurationError(
+            f"Unknown key(s) in {where}: {', '.join(sorted(unknown))}", config_key=where
+        )
+
+
+def _slugify(value: str) -> str:
+    """Turn a name into a directory-safe slug."""
+    slug = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-").lower()
+    return slug or "contract"
+
+
+def _namespace(name: str) -> str:
+    """Turn an output name into a bundle namespace (a Python identifier)."""
+    namespace = re.sub(r"[^a-zA-Z0-9]+", "_", name).strip("_").lower()
+    if not namespace or namespace[0].isdigit():
+        namespace = "contract_" + namespace
+    return namespace.rstrip("_")
+
+
+def _unique(name: str, used: set, separator: str = "-") -> str:
+    """Make an output directory name unique within the batch."""
+    candidate = name
+    suffix = 2
+    while candidate in used:
+        candidate = f"{name}{separator}{suffix}"
+        suffix += 1
+    used.add(candidate)
+    return candidate
@@ -1,6 +1,9 @@
 """Inspect command - Show ABI details."""
 
 import asyncio
+from pathlib import Path
+from typing import List, Optional, Sequence
+
 from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
@@ -11,34 +14,66 @@ from abi_to_mcp.utils.validation import is_valid_address
 console = Console()
 
 
-def inspect(source: str, network: str) -> None:
+def inspect(
+    source: str,
+    network: str,
+    use_cache: bool = True,
+    offline: bool = False,
+    check: Optional[Sequence[str]] = None,
+    rpc_url: Optional[str] = None,
+) -> None:
     """Inspect an ABI and show details."""
-    asyncio.run(_inspect_async(source, network))
-
-
-async def _inspect_async(source: str, network: str) -> None:
+    asyncio.run(
+        _inspect_async(
+            source,
+            network,
+            use_cache=use_cache,
+            offline=offline,
+            check=check,
+            rpc_url=rpc_url,
+        )
+    )
+
+
+async def _inspect_async(
+    source: str,
+    network: str,
+    use_cache: bool = True,
+    offline: bool = False,
+    check: Optional[Sequence[str]] = None,
+    rpc_url: Optional[str] = None,
+) -> None:
     """Async implementation."""
     try:
-        from abi_to_mcp.fetchers import create_default_registry
-        from abi_to_mcp.parser import ABIParser
+        addresses = _expand_addresses(check or [])
+
+        from abi_to_mcp.core.compiled import is_compiled_artifact, load_compiled, load_or_compile
+        from abi_to_mcp.fetchers import ABICache, create_default_registry
 
         rprint(f"\n[bold]Inspecting:[/bold] {source}\n")
 
-        # Fetch
-        registry = create_default_registry()
-        if is_valid_address(source):
-            fetch_result = await registry.fetch(source, network=network)
+        if is_compiled_artifact(source):
+            # Already parsed; the mapped tools are never decoded
+            parsed = load_compiled(source).parsed
+            rprint("[blue]Source:[/blue] compiled artifact")
+            rprint()
         else:
-            fetch_result = await registry.fetch(source)
-
-        rprint(f"[blue]Source:[/blue] {fetch_result.source}")
-        if fetch_result.contract_name:
-            rprint(f"[blue]Name:[/blue] {fetch_result.contract_name}")
-        rprint()
+            # Fetch
+            cache = ABICache() if use_cache or offline else None
+            async with create_default_registry(cache=cache, offline=offline) as registry:
+                if is_valid_address(source):
+                    fetch_result = await registry.fetch(source, network=network)
+                else:
+                    fetch_result = await registry.fetch(source)
+
+            rprint(f"[blue]Source:[/blue] {fetch_result.source}")
+            if fetch_result.contract_name:
+                rprint(f"[blue]Name:[/blue] {fetch_result.contract_name}")
+            rprint()
 
-        # Parse
-        parser = ABIParser()
-        parsed = parser.parse(fetch_result.abi)
+            # Parse (reuses the cached compiled artifact if the ABI is unchanged)
+            compiled_dir = cache.compiled_dir if cache else None
+            parsed = load_or_compile(fetch_result.abi, compiled_dir).parsed
 
         if parsed.detected_standard:
             rprint(f"[green]Standard:[/green] {parsed.detected_standard}")
@@ -81,9 +116,62 @@ async def _inspect_async(source: str, network: str) -> None:
         rprint(f"  Errors: {len(parsed.errors)}")
         rprint()
 
+        if addresses:
+            await asyncio.to_thread(_check_addresses, addresses, network, rpc_url)
+
     except ABIToMCPError as e:
         rprint(f"[bold red]Error:[/bold red] {e.message}")
         raise SystemExit(1) from None
     except Exception as e:
         rprint(f"[bold red]Error:[/bold red] {e}")
         raise SystemExit(1) from None
+
+
+def _expand_addresses(values: Sequence[str]) -> List[str]:
+    """Flatten --check values: comma-separated lists and @file (one address per line)."""
+    addresses: List[str] = []
+    for value in values:
+        if value.startswith("@"):
+            lines = Path(value[1:]).read_text(encoding="utf-8").splitlines()
+            items = [line.split("#", 1)[0] for line in lines]
+        else:
+            items = value.split(",")
+        addresses.extend(item.strip() for item in items if item.strip())
+    return addresses
+
+
+def _check_addresses(addresses: List[str], network: str, rpc_url: Optional[str]) -> None:
+    """Show contract status, balance and nonce per address (three batched queries)."""
+    from abi_to_mcp.runtime.web3_client import Web3Client
+
+    client = Web3Client(rpc_url=rpc_url, network=network)
+    contracts = client.is_contracts(addresses)
+    balances = client.get_balances(addresses)
+    nonces = client.get_transaction_counts(addresses)
+
+    table = Table(title=f"Addresses ({network})")
+    table.add_column("Address", style="cyan")
+    table.add_column("Type", style="magenta")
+    table.add_column(f"Balance ({client.network_config['currency']})", justify="right")
+    table.add_column("Nonce", justify="right")
+
+    for contract, balance, nonce in zip(contracts, balances, nonces, strict=True):
+        error = contract.error or balance.error or nonce.error
+        if error:
+            table.add_row(contract.address, "[red]error[/red]", f"[red]{error}[/red]", "-")
+            continue
+        table.add_row(
+            contract.address,
+            "contract" if contract.value else "EOA",
+            f"{balance.value / 10**18:.6f}",
+            str(nonce.value),
+        )
+
+    console.print(table)
+    failed = sum(
+        1
+        for c, b, n in zip(contracts, balances, nonces, strict=True)
+        if not (c.ok and b.ok and n.ok)
+    )
+    rprint(f"  Checked: {len(addresses)} ({failed} failed)")
+    rprint()
@@ -1,7 +1,22 @@
-"""Validate command implementation."""
+"""Validate command implementation.
 
+A single file is validated step by step with a readable report. Directories,
+globs and lists of files are validated in a process pool: results stream as
+text or JSON Lines, and files whose structural hash (the hash of the parsed
+ABI, see hash_abi) is unchanged since the last run are skipped.
+"""
+
+import glob
+import hashlib
 import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatch
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
 from rich.console import Console
 from rich import print as rprint
 
@@ -9,13 +24,39 @@ from abi_to_mcp.core.exceptions import ABIToMCPError
 
 console = Console()
 
+# Result cache of multi-file runs, in the ABI cache directory
+CACHE_FILENAME = "validate-cache.json"
+
+# Files picked up when a directory is validated
+ABI_FILE_PATTERNS = ("*.json", "*.abic")
+
+OUTPUT_FORMATS = ("text", "jsonl")
+
+
+@dataclass
+class FileValidation:
+    """Outcome of validating one file."""
+
+    path: str
+    status: str = "passed"
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    entries: int = 0
+    hash: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file has no errors."""
+        return not self.errors
+
 
 def validate(source: str, strict: bool = False) -> None:
     """
     Run the validate command.
 
     Performs validation checks:
-    1. Valid JSON structure
+    1. Valid JSON structure (or a current compiled artifact)
     2. Valid ABI array format
     3. All entry types recognized
     4. All Solidity types recognized
@@ -23,7 +64,7 @@ def validate(source: str, strict: bool = False) -> None:
     6. (Strict) All parameters have names
 
     Args:
-        source: Path to ABI file
+        source: Path to ABI file or compiled artifact
         strict: Enable strict validation checks
     """
     try:
@@ -43,14 +84,25 @@ def validate(source: str, strict: bool = False) -> None:
         errors = []
         warnings = []
 
-        # Step 1: Valid JSON
-        try:
-            with open(path) as f:
-                data = json.load(f)
-            rprint("[green]✓[/green] Valid JSON")
-        except json.JSONDecodeError as e:
-            rprint(f"[red]✗[/red] Invalid JSON: {e}")
-            raise SystemExit(1) from None
+        from abi_to_mcp.core.compiled import is_compiled_artifact, load_compiled
+
+        # Step 1: Valid JSON, or a compiled artifact holding the ABI it was built from
+        if is_compiled_artifact(path):
+            try:
+                compiled = load_compiled(path)
+            except ABIToMCPError as e:
+                rprint(f"[red]✗[/red] {e.message}")
+                raise SystemExit(1) from None
+            data = compiled.parsed.raw_abi
+            rprint(f"[green]✓[/green] Compiled artifact (ABI {compiled.abi_hash[:12]})")
+        else:
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                rprint("[green]✓[/green] Valid JSON")
+            except json.JSONDecodeError as e:
+                rprint(f"[red]✗[/red] Invalid JSON: {e}")
+                raise SystemExit(1) from None
 
         # Step 2: Valid array or extract ABI
         abi = None
@@ -88,19 +140,7 @@ def validate(source: str, strict: bool = False) -> None:
             rprint("[green]✓[/green] All entries valid")
 
         # Step 4: Type recognition
-        from abi_to_mcp.mapper.type_mapper import TypeMapper
-
-        type_mapper = TypeMapper()
-        unknown_types = set()
-
-        for entry in abi:
-            if entry.get("type") in ("function", "event", "error", "constructor"):
-                for param in entry.get("inputs", []) + entry.get("outputs", []):
-                    param_type = param.get("type", "")
-                    try:
-                        type_mapper.parse_type(param_type, param.get("components"))
-                    except Exception:
-                        unknown_types.add(param_type)
+        unknown_types = _unknown_types(abi)
 
         if unknown_types:
             for t in unknown_types:
@@ -115,16 +155,7 @@ def validate(source: str, strict: bool = False) -> None:
             rprint("[bold]Strict checks:[/bold]")
 
             # Check for duplicate function signatures
-            signatures = []
-            duplicates = []
-            for entry in abi:
-                if entry.get("type") == "function":
-                    name = entry.get("name", "")
-                    inputs = tuple(p.get("type", "") for p in entry.get("inputs", []))
-                    sig = (name, inputs)
-                    if sig in signatures:
-                        duplicates.append(f"{name}({','.join(inputs)})")
-                    signatures.append(sig)
+            duplicates = _duplicate_functions(abi)
 
             if duplicates:
                 for dup in duplicates:
@@ -134,12 +165,7 @@ def validate(source: str, strict: bool = False) -> None:
                 rprint("[green]✓[/green] No duplicate functions")
 
             # Check for unnamed parameters
-            unnamed = []
-            for entry in abi:
-                if entry.get("type") in ("function", "event"):
-                    for i, param in enumerate(entry.get("inputs", [])):
-                        if not param.get("name"):
-                            unnamed.append(f"{entry.get('name', 'unknown')}.input[{i}]")
+            unnamed = _unnamed_parameters(abi)
 
             if unnamed:
                 for u in unnamed[:5]:  # Show first 5
@@ -165,3 +191,403 @@ def validate(source: str, strict: bool = False) -> None:
     except Exception as e:
         rprint(f"[red]Error:[/red] {e}")
         raise SystemExit(1) from None
+
+
+def validate_many(
+    sources: Sequence[str],
+    strict: bool = False,
+    workers: Optional[int] = None,
+    output_format: str = "text",
+    use_cache: bool = True,
+    exclude: Sequence[str] = (),
+) -> None:
+    """
+    Validate many ABI files in a process pool.
+
+    Args:
+        sources: Files, directories (searched recursively for *.json and
+            *.abic) and glob patterns
+        strict: Enable strict validation checks
+        workers: Validation processes (None: CPU count, 0: validate in this process)
+        output_format: "text" for a summary, "jsonl" for one JSON object per file
+        use_cache: Skip files whose structural hash is unchanged since the last run
+        exclude: Glob patterns of paths to leave out (e.g. "*.dbg.json")
+    """
+    if output_format not in OUTPUT_FORMATS:
+        rprint(
+            f"[red]Error:[/red] Unknown format: {output_format} "
+            f"(choose from {', '.join(OUTPUT_FORMATS)})"
+        )
+        raise SystemExit(1)
+
+    paths, missing = expand_sources(sources, exclude)
+    if not paths and not missing:
+        rprint(f"[red]Error:[/red] No ABI files found in: {', '.join(sources)}")
+        raise SystemExit(1)
+
+    started = time.perf_counter()
+    cache = _load_cache() if use_cache else {}
+
+    results: List[FileValidation] = []
+    for result in _validate_paths(paths, strict, workers, cache):
+        results.append(result)
+        _emit(result, output_format)
+    for source in missing:
+        result = FileValidation(path=source, status="failed", errors=["File not found"])
+        results.append(result)
+        _emit(result, output_format)
+
+    if use_cache:
+        _save_cache(cache, results, strict)
+
+    if output_format == "text":
+        _print_summary(results, time.perf_counter() - started)
+
+    if any(not r.ok for r in results):
+        raise SystemExit(1)
+
+
+def expand_sources(
+    sources: Sequence[str], exclude: Sequence[str] = ()
+) -> Tuple[List[Path], List[str]]:
+    """
+    Resolve files, directories and glob patterns to the files to validate.
+
+    Args:
+        sources: Command-line sources
+        exclude: Glob patterns matched against each path and its file name
+
+    Returns:
+        The files (each once, in source order) and the sources that matched nothing
+    """
+    paths: List[Path] = []
+    seen = set()
+    missing = []
+
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            found = sorted(
+                {f for pattern in ABI_FILE_PATTERNS for f in path.rglob(pattern) if f.is_file()}
+            )
+        elif path.is_file():
+            found = [path]
+        elif glob.has_magic(source):
+            found = sorted(Path(p) for p in glob.glob(source, recursive=True))
+            found = [f for f in found if f.is_file()]
+        else:
+            missing.append(source)
+            continue
+
+        for f in found:
+            if any(fnmatch(str(f), pattern) or fnmatch(f.name, pattern) for pattern in exclude):
+                continue
+            key = f.resolve()
+            if key not in seen:
+                seen.add(key)
+                paths.append(f)
+
+    return paths, missing
+
+
+def validate_file(
+    path: Path, strict: bool = False, known_hash: Optional[str] = None
+) -> Optional[FileValidation]:
+    """
+    Validate one ABI file without printing.
+
+    Args:
+        path: ABI file or compiled artifact
+        strict: Enable strict validation checks
+        known_hash: Structural hash of the file's last validation; if the file
+            still has it, validation is skipped and None is returned
+
+    Returns:
+        FileValidation, or None if the file is unchanged
+    """
+    result = FileValidation(path=str(path))
+    try:
+        abi, result.hash = _load_abi(path)
+    except _InvalidFile as e:
+        result.hash = e.hash
+        if known_hash is not None and e.hash == known_hash:
+            return None
+        result.status = "failed"
+        result.errors.append(str(e))
+        return result
+
+    if known_hash is not None and result.hash == known_hash:
+        return None
+
+    result.entries = len(abi)
+    result.errors, result.warnings = check_abi(abi, strict)
+    if result.errors:
+        result.status = "failed"
+    return result
+
+
+def check_abi(abi: List[Dict[str, Any]], strict: bool = False) -> Tuple[List[str], List[str]]:
+    """
+    Run the validation checks on an ABI.
+
+    Args:
+        abi: ABI entries
+        strict: Also check for duplicate functions and unnamed parameters
+
+    Returns:
+        Errors and warnings
+    """
+    from abi_to_mcp.parser.abi_parser import ABIParser
+
+    errors = list(ABIParser().validate(abi))
+    warnings = [f"Unknown type: {t}" for t in _unknown_types(abi)]
+    if strict:
+        warnings += [f"Duplicate function: {d}" for d in _duplicate_functions(abi)]
+        warnings += [f"Unnamed parameter: {u}" for u in _unnamed_parameters(abi)]
+    return errors, warnings
+
+
+class _InvalidFile(Exception):
+    """A file that does not hold an ABI."""
+
+    def __init__(self, message: str, hash: str):
+        super().__init__(message)
+        self.hash = hash
+
+
+def _load_abi(path: Path) -> Tuple[List[Dict[str, Any]], str]:
+    """Read the ABI of a file and its structural hash."""
+    from abi_to_mcp.core.compiled import MAGIC, hash_abi, load_compiled_bytes
+
+    raw = path.read_bytes()
+    raw_hash = hashlib.sha256(raw).hexdigest()
+
+    if raw.startswith(MAGIC):
+        try:
+            compiled = load_compiled_bytes(raw)
+        except ABIToMCPError as e:
+            raise _InvalidFile(e.message, raw_hash) from None
+        return compiled.parsed.raw_abi, compiled.abi_hash
+
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise _InvalidFile(f"Invalid JSON: {e}", raw_hash) from None
+
+    # Files without an ABI have no structural hash: key them on their bytes
+    if isinstance(data, dict):
+        if "abi" not in data:
+            raise _InvalidFile("Object does not contain 'abi' key", raw_hash)
+        data = data["abi"]
+    if not isinstance(data, list):
+        raise _InvalidFile("Expected array or object with 'abi' key", raw_hash)
+
+    if not data:
+        raise _InvalidFile("ABI is empty", raw_hash)
+    return data, hash_abi(data)
+
+
+def _unknown_types(abi: List[Dict[str, Any]]) -> List[str]:
+    """Parameter types the type mapper does not recognize."""
+    from abi_to_mcp.mapper.type_mapper import TypeMapper
+
+    type_mapper = TypeMapper()
+    unknown_types = set()
+
+    for entry in abi:
+        if entry.get("type") in ("function", "event", "error", "constructor"):
+            for param in entry.get("inputs", []) + entry.get("outputs", []):
+                param_type = param.get("type", "")
+                try:
+                    type_mapper.parse_type(param_type, param.get("components"))
+                except Exception:
+                    unknown_types.add(param_type)
+
+    return sorted(unknown_types)
+
+
+def _duplicate_functions(abi: List[Dict[str, Any]]) -> List[str]:
+    """Function signatures that appear more than once."""
+    signatures = set()
+    duplicates = []
+    for entry in abi:
+        if entry.get("type") == "function":
+            name = entry.get("name", "")
+            inputs = tuple(p.get("type", "") for p in entry.get("inputs", []))
+            sig = (name, inputs)
+            if sig in signatures:
+                duplicates.append(f"{name}({','.join(inputs)})")
+            signatures.add(sig)
+    return duplicates
+
+
+def _unnamed_parameters(abi: List[Dict[str, Any]]) -> List[str]:
+    """Function and event inputs without a name."""
+    unnamed = []
+    for entry in abi:
+        if entry.get("type") in ("function", "event"):
+            for i, param in enumerate(entry.get("inputs", [])):
+                if not param.get("name"):
+                    unnamed.append(f"{entry.get('name', 'unknown')}.input[{i}]")
+    return unnamed
+
+
+def _validate_job(job: Tuple[Path, bool, Optional[str]]) -> Optional[FileValidation]:
+    """Process pool entry point."""
+    return validate_file(*job)
+
+
+def _validate_paths(
+    paths: List[Path],
+    strict: bool,
+    workers: Optional[int],
+    cache: Dict[str, Any],
+) -> Iterator[FileValidation]:
+    """Validate files, reusing cached results; yields results as they are ready."""
+    jobs = []
+    entries: List[Optional[Dict[str, Any]]] = []
+    for path in paths:
+        entry = _cached_entry(cache, path, strict)
+        if entry is None:
+            jobs.append((path, strict, None))
+        elif _stat(path) == (entry["size"], entry["mtime_ns"]):
+            yield _from_cache(path, entry)
+            continue
+        else:
+            # Touched or reformatted: re-read, but skip validation if the hash matches
+            jobs.append((path, strict, entry["hash"]))
+        entries.append(entry)
+
+    if not jobs:
+        return
+
+    workers = os.cpu_count() if workers is None else workers
+    if workers == 0 or len(jobs) == 1:
+        outcomes: Iterator[Optional[FileValidation]] = map(_validate_job, jobs)
+        for job, entry, result in zip(jobs, entries, outcomes, strict=True):
+            yield _job_result(job[0], entry, result)
+        return
+
+    workers = min(workers or 1, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = executor.map(_validate_job, jobs, chunksize=chunksize)
+        for job, entry, result in zip(jobs, entries, outcomes, strict=True):
+            yield _job_result(job[0], entry, result)
+
+
+def _job_result(
+    path: Path, entry: Optional[Dict[str, Any]], result: Optional[FileValidation]
+) -> FileValidation:
+    """A job's result, or its cache entry if the file was unchanged."""
+    if result is not None:
+        return result
+    # Only jobs given a known hash (so with a cache entry) skip validation
+    assert entry is not None
+    return _from_cache(path, entry)
+
+
+def _cache_path() -> Path:
+    """Location of the validation result cache."""
+    from abi_to_mcp.core.config import default_cache_dir
+
+    return default_cache_dir() / CACHE_FILENAME
+
+
+def _load_cache() -> Dict[str, Any]:
+    """Cached results by resolved path; empty if missing, unreadable or outdated."""
+    from abi_to_mcp.version import __version__
+
+    try:
+        data = json.loads(_cache_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != __version__:
+        return {}
+    files: Dict[str, Any] = data.get("files", {})
+    return files
+
+
+def _save_cache(cache: Dict[str, Any], results: List[FileValidation], strict: bool) -> None:
+    """Record this run's results; a cache that cannot be written is ignored."""
+    from abi_to_mcp.version import __version__
+
+    # Forget files that were deleted or moved since they were cached
+    for key in [key for key in cache if not os.path.exists(key)]:
+        del cache[key]
+
+    for result in results:
+        path = Path(result.path)
+        if result.hash is None:
+            continue
+        try:
+            size, mtime_ns = _stat(path)
+        except OSError:
+            continue
+        cache[str(path.resolve())] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "hash": result.hash,
+            "strict": strict,
+            "result": {
+                "status": result.status,
+                "errors": result.errors,
+                "warnings": result.warnings,
+                "entries": result.entries,
+            },
+        }
+
+    cache_path = _cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": __version__, "files": cache}))
+        tmp.replace(cache_path)
+    except OSError:
+        pass
+
+
+def _cached_entry(cache: Dict[str, Any], path: Path, strict: bool) -> Optional[Dict[str, Any]]:
+    """The cache entry of a file, if it was validated with the same strictness."""
+    entry: Optional[Dict[str, Any]] = cache.get(str(path.resolve()))
+    if entry is None or entry.get("strict") != strict:
+        return None
+    return entry
+
+
+def _from_cache(path: Path, entry: Dict[str, Any]) -> FileValidation:
+    """A cached result, reported for path."""
+    return FileValidation(path=str(path), hash=entry["hash"], cached=True, **entry["result"])
+
+
+def _stat(path: Path) -> Tuple[int, int]:
+    """Size and modification time of a file."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _emit(result: FileValidation, output_format: str) -> None:
+    """Stream one result."""
+    if output_format == "jsonl":
+        print(json.dumps(asdict(result)), flush=True)
+        return
+
+    for error in result.errors:
+        rprint(f"[red]✗[/red] {result.path}: {error}")
+    for warning in result.warnings:
+        rprint(f"[yellow]![/yellow] {result.path}: {warning}")
+
+
+def _print_summary(results: List[FileValidation], elapsed: float) -> None:
+    """Print the totals of a multi-file run."""
+    failed = sum(1 for r in results if not r.ok)
+    warned = sum(1 for r in results if r.ok and r.warnings)
+    cached = sum(1 for r in results if r.cached)
+
+    rprint("")
+    color = "red" if failed else "yellow" if warned else "green"
+    rprint(
+        f"[{color}]{len(results)} file(s): {len(results) - failed} passed, "
+        f"{failed} failed, {warned} with warnings[/{color}] "
+        f"({cached} unchanged) in {elapsed:.2f}s"
+    )
@@ -3,12 +3,11 @@
 This module defines the Typer CLI application with all commands.
 """
 
+import glob
+
 import typer
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 
 from abi_to_mcp.version import __version__
 
@@ -20,13 +19,13 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
-
 
 def version_callback(value: bool):
     """Print version and exit."""
     if value:
-        rprint(f"[bold blue]UCAI[/bold blue] version [green]{__version__}[/green]")
+        # typer.style keeps --version from importing rich
+        name = typer.style("UCAI", fg=typer.colors.BLUE, bold=True)
+        typer.echo(f"{name} version {typer.style(__version__, fg=typer.colors.GREEN)}")
         raise typer.Exit()
 
 
@@ -54,7 +53,7 @@ def main_callback(
 def generate(
     source: str = typer.Argument(
         ...,
-        help="ABI source: file path or contract address (0x...)",
+        help="ABI source: file path, compiled artifact (.abic) or contract address (0x...)",
     ),
     output: Path = typer.Option(
         Path("./mcp-server"),
@@ -98,7 +97,28 @@ def generate(
         False,
         "--force",
         "-f",
-        help="Overwrite output directory if it exists",
+        help="Re-render and rewrite every file, even if unchanged",
+    ),
+    async_mode: bool = typer.Option(
+        False,
+        "--async",
+        help="Generate async tools on AsyncWeb3 (non-blocking RPC calls)",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Use the on-disk ABI cache for contract addresses",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar="ABI_TO_MCP_OFFLINE",
+        help="Serve contract addresses only from the ABI cache",
+    ),
+    contract: Optional[str] = typer.Option(
+        None,
+        "--contract",
+        help="Contract to use from a build-info/standard-json file (Name or path/File.sol:Name)",
     ),
 ):
     """
@@ -120,8 +140,17 @@ def generate(
 
         # Custom output directory
         abi-to-mcp generate ./abi.json -a 0x... -o ./my-mcp-server
+
+        # One contract from a Hardhat build-info file
+        abi-to-mcp generate ./artifacts/build-info/abc.json --contract Token -a 0x...
+
+        # From a compiled artifact (skips parsing and mapping)
+        abi-to-mcp generate ./Token.abic -a 0x...
+
+        # Async server on AsyncWeb3
+        abi-to-mcp generate 0x... --async
     """
-    from abi_to_mcp.cli.commands import generate as cmd_generate
+    from abi_to_mcp.cli.commands.generate import generate as cmd_generate
 
     cmd_generate(
         source=source,
@@ -132,6 +161,158 @@ def generate(
         read_only=read_only,
         include_events=include_events,
         simulation_default=simulation_default,
+        use_cache=use_cache,
+        offline=offline,
+        contract=contract,
+        force=force,
+        async_mode=async_mode,
+    )
+
+
+@app.command("generate-batch")
+def generate_batch(
+    manifest: Path = typer.Argument(
+        ...,
+        help="Manifest listing the contracts to generate (YAML or JSON)",
+    ),
+    output: Path = typer.Option(
+        Path("./mcp-servers"),
+        "--output",
+        "-o",
+        help="Directory receiving one server directory per contract",
+    ),
+    concurrency: int = typer.Option(
+        8,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum number of concurrent ABI fetches",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=0,
+        help="Render processes (default: CPU count, 0: render in-process)",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Use the on-disk ABI cache for contract addresses",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar="ABI_TO_MCP_OFFLINE",
+        help="Serve contract addresses only from the ABI cache",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Re-render and rewrite every file, even if unchanged",
+    ),
+    async_mode: bool = typer.Option(
+        False,
+        "--async",
+        help="Generate async tools on AsyncWeb3 (non-blocking RPC calls)",
+    ),
+    bundle: bool = typer.Option(
+        False,
+        "--bundle",
+        help="Generate one server serving every contract (tools named <contract>__<tool>)",
+    ),
+):
+    """
+    Generate MCP servers for every contract in a manifest.
+
+    Fetches run concurrently, rendering runs in a process pool, and a
+    summary report (batch-report.json) is written to the output directory.
+    Files that are already up to date are not rewritten.
+
+    With --bundle, the contracts are served by a single server in the output
+    directory, sharing one Web3 client and read cache per network.
+
+    EXAMPLES:
+
+        abi-to-mcp generate-batch deployment.yaml -o ./servers
+
+        abi-to-mcp generate-batch deployment.yaml --concurrency 16 --workers 4
+
+        abi-to-mcp generate-batch deployment.yaml --bundle -o ./defi-server
+    """
+    from abi_to_mcp.cli.commands.generate_batch import generate_batch as cmd_generate_batch
+
+    cmd_generate_batch(
+        manifest=manifest,
+        output=output,
+        concurrency=concurrency,
+        workers=workers,
+        use_cache=use_cache,
+        offline=offline,
+        force=force,
+        async_mode=async_mode,
+        bundle=bundle,
+    )
+
+
+@app.command("compile")
+def compile_abi(
+    source: str = typer.Argument(
+        ...,
+        help="ABI source: file path or contract address (0x...)",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Artifact path (default: ./<contract name>.abic)",
+    ),
+    network: str = typer.Option(
+        "mainnet",
+        "--network",
+        "-n",
+        help="Network for contract lookups",
+    ),
+    contract: Optional[str] = typer.Option(
+        None,
+        "--contract",
+        help="Contract to use from a build-info/standard-json file (Name or path/File.sol:Name)",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Use the on-disk ABI cache for contract addresses",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar="ABI_TO_MCP_OFFLINE",
+        help="Serve contract addresses only from the ABI cache",
+    ),
+):
+    """
+    Compile an ABI into a binary artifact for instant reloading.
+
+    The artifact holds the parsed ABI and its mapped tools and resources;
+    generate, inspect and validate accept it in place of the ABI and skip
+    parsing and mapping.
+
+    EXAMPLES:
+
+        abi-to-mcp compile ./token.json -o token.abic
+
+        abi-to-mcp generate token.abic -a 0x...
+    """
+    from abi_to_mcp.cli.commands.compile import compile_artifact as cmd_compile
+
+    cmd_compile(
+        source=source,
+        output=output,
+        network=network,
+        contract=contract,
+        use_cache=use_cache,
+        offline=offline,
     )
 
 
@@ -139,7 +320,7 @@ def generate(
 def inspect(
     source: str = typer.Argument(
         ...,
-        help="ABI source: file path or contract address",
+        help="ABI source: file path, compiled artifact or contract address",
     ),
     network: str = typer.Option(
         "mainnet",
@@ -147,50 +328,132 @@ def inspect(
         "-n",
         help="Network for contract lookups",
     ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Use the on-disk ABI cache for contract addresses",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar="ABI_TO_MCP_OFFLINE",
+        help="Serve contract addresses only from the ABI cache",
+    ),
+    check: Optional[List[str]] = typer.Option(
+        None,
+        "--check",
+        "-c",
+        help="Addresses to check on-chain (repeatable, comma-separated, or @file)",
+    ),
+    rpc_url: Optional[str] = typer.Option(
+        None,
+        "--rpc-url",
+        envvar="RPC_URL",
+        help="RPC URL(s) for --check (comma-separated for failover)",
+    ),
 ):
     """
     Inspect an ABI and show what would be generated.
 
     Shows detected standard, functions, events, and estimated tool count
-    without generating any files.
+    without generating any files. With --check, also reports whether each
+    address is a contract, its balance and nonce, using batched RPC calls.
 
     EXAMPLES:
 
         abi-to-mcp inspect ./token.json
 
         abi-to-mcp inspect 0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48
+
+        abi-to-mcp inspect ./token.json --check @holders.txt
     """
-    from abi_to_mcp.cli.commands import inspect as cmd_inspect
+    from abi_to_mcp.cli.commands.inspect import inspect as cmd_inspect
 
-    cmd_inspect(source=source, network=network)
+    cmd_inspect(
+        source=source,
+        network=network,
+        use_cache=use_cache,
+        offline=offline,
+        check=check,
+        rpc_url=rpc_url,
+    )
 
 
 @app.command()
 def validate(
-    source: str = typer.Argument(
+    sources: List[str] = typer.Argument(
         ...,
-        help="ABI source: file path",
+        help="ABI files, compiled artifacts, directories or glob patterns",
     ),
     strict: bool = typer.Option(
         False,
         "--strict",
         help="Enable strict validation (check for duplicates, unnamed params)",
     ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Validation processes for many files (default: CPU count, 0: in-process)",
+    ),
+    output_format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output for many files: text or jsonl (one JSON object per file)",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Skip files unchanged since the last run",
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        "-x",
+        help="Glob pattern of files to skip (repeatable), e.g. '*.dbg.json'",
+    ),
 ):
     """
     Validate an ABI without generating.
 
     Checks JSON structure, ABI format validity, and type recognition.
+    A single file gets a step-by-step report; directories, globs and
+    several files are validated in parallel.
 
     EXAMPLES:
 
         abi-to-mcp validate ./token.json
 
         abi-to-mcp validate ./token.json --strict
+
+        abi-to-mcp validate ./artifacts -x '*.dbg.json'
+
+        abi-to-mcp validate 'abis/**/*.json' --format jsonl
     """
-    from abi_to_mcp.cli.commands import validate as cmd_validate
+    single = (
+        len(sources) == 1
+        and output_format == "text"
+        and not exclude
+        and not Path(sources[0]).is_dir()
+        and not glob.has_magic(sources[0])
+    )
+    if single:
+        from abi_to_mcp.cli.commands.validate import validate as cmd_validate
 
-    cmd_validate(source=source, strict=strict)
+        cmd_validate(source=sources[0], strict=strict)
+        return
+
+    from abi_to_mcp.cli.commands.validate import validate_many
+
+    validate_many(
+        sources,
+        strict=strict,
+        workers=workers,
+        output_format=output_format,
+        use_cache=cache,
+        exclude=exclude or (),
+    )
 
 
 @app.command()
@@ -226,7 +489,7 @@ def serve(
         # Run with HTTP transport
         abi-to-mcp serve --transport http --port 8080
     """
-    from abi_to_mcp.cli.commands import serve as cmd_serve
+    from abi_to_mcp.cli.commands.serve import serve as cmd_serve
 
     cmd_serve(directory=directory, port=port, transport=transport)
 
@@ -236,6 +499,9 @@ def networks():
     """
     List all supported networks.
     """
+    from rich.console import Console
+    from rich.table import Table
+
     from abi_to_mcp.core.constants import NETWORKS
 
     table = Table(title="Supported Networks")
@@ -252,7 +518,7 @@ def networks():
             config["explorer"],
         )
 
-    console.print(table)
+    Console().print(table)
 
 
 def main():
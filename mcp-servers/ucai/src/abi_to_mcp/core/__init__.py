@@ -4,65 +4,156 @@ This module contains shared configuration, constants, models, and exceptions
 used throughout the package.
 """
 
-from abi_to_mcp.core.config import (
-    GeneratorConfig,
-    FetcherConfig,
-    RuntimeConfig,
-    AppConfig,
-    NetworkConfig,
-    get_default_config,
-)
+from typing import TYPE_CHECKING, Any
 
-from abi_to_mcp.core.constants import (
-    NETWORKS,
-    SOLIDITY_TO_JSON_SCHEMA,
-    STATE_MUTABILITY_MAP,
-    ERC_STANDARDS,
-    DEFAULT_GAS_LIMITS,
-)
+if TYPE_CHECKING:
+    from abi_to_mcp.core.config import (
+        GeneratorConfig,
+        FetcherConfig,
+        RuntimeConfig,
+        AppConfig,
+        NetworkConfig,
+        get_default_config,
+    )
 
-from abi_to_mcp.core.exceptions import (
-    ABIToMCPError,
-    FetcherError,
-    ABINotFoundError,
-    ContractNotVerifiedError,
-    NetworkError,
-    RateLimitError,
-    InvalidAddressError,
-    ParserError,
-    ABIParseError,
-    ABIValidationError,
-    UnsupportedTypeError,
-    GeneratorError,
-    TemplateError,
-    CodeGenerationError,
-    OutputDirectoryError,
-    Web3ConnectionError,
-    TransactionError,
-    SimulationError,
-    SignerNotConfiguredError,
-    InsufficientFundsError,
-    CLIError,
-    InvalidInputError,
-    ConfigurationError,
-)
+    from abi_to_mcp.core.constants import (
+        IMMUTABLE_GETTERS,
+        MULTICALL3_ADDRESS,
+        NETWORKS,
+        SOLIDITY_TO_JSON_SCHEMA,
+        STATE_MUTABILITY_MAP,
+        ERC_STANDARDS,
+        DEFAULT_GAS_LIMITS,
+        RPC_BATCH_SIZE,
+        SPLIT_MODULES_THRESHOLD,
+    )
 
-from abi_to_mcp.core.models import (
-    StateMutability,
-    ToolType,
-    ABIParameter,
-    ABIFunction,
-    ABIEvent,
-    ABIError,
-    ParsedABI,
-    ToolParameter,
-    MappedTool,
-    ResourceField,
-    MappedResource,
-    GeneratedFile,
-    GeneratedServer,
-    FetchResult,
-)
+    from abi_to_mcp.core.exceptions import (
+        ABIToMCPError,
+        FetcherError,
+        ABINotFoundError,
+        ContractNotVerifiedError,
+        NetworkError,
+        RateLimitError,
+        InvalidAddressError,
+        ParserError,
+        ABIParseError,
+        ABIValidationError,
+        UnsupportedTypeError,
+        GeneratorError,
+        TemplateError,
+        CodeGenerationError,
+        OutputDirectoryError,
+        Web3ConnectionError,
+        TransactionError,
+        SimulationError,
+        SignerNotConfiguredError,
+        InsufficientFundsError,
+        CLIError,
+        InvalidInputError,
+        ConfigurationError,
+    )
+
+    from abi_to_mcp.core.compiled import (
+        CompiledABI,
+        compile_abi,
+        load_compiled,
+        load_or_compile,
+        save_compiled,
+    )
+
+    from abi_to_mcp.core.models import (
+        StateMutability,
+        ToolType,
+        ABIParameter,
+        ABIFunction,
+        ABIEvent,
+        ABIError,
+        ParsedABI,
+        ToolParameter,
+        MappedTool,
+        ResourceField,
+        MappedResource,
+        GeneratedFile,
+        GeneratedServer,
+        BundleContract,
+        FetchResult,
+    )
+
+# Module -> public names it defines. Names are imported on first access, so
+# importing one core module (e.g. core.exceptions) does not load the others.
+_EXPORTS = {
+    "abi_to_mcp.core.config": (
+        "GeneratorConfig",
+        "FetcherConfig",
+        "RuntimeConfig",
+        "AppConfig",
+        "NetworkConfig",
+        "get_default_config",
+    ),
+    "abi_to_mcp.core.constants": (
+        "IMMUTABLE_GETTERS",
+        "MULTICALL3_ADDRESS",
+        "NETWORKS",
+        "SOLIDITY_TO_JSON_SCHEMA",
+        "STATE_MUTABILITY_MAP",
+        "ERC_STANDARDS",
+        "DEFAULT_GAS_LIMITS",
+        "RPC_BATCH_SIZE",
+        "SPLIT_MODULES_THRESHOLD",
+    ),
+    "abi_to_mcp.core.exceptions": (
+        "ABIToMCPError",
+        "FetcherError",
+        "ABINotFoundError",
+        "ContractNotVerifiedError",
+        "NetworkError",
+        "RateLimitError",
+        "InvalidAddressError",
+        "ParserError",
+        "ABIParseError",
+        "ABIValidationError",
+        "UnsupportedTypeError",
+        "GeneratorError",
+        "TemplateError",
+        "CodeGenerationError",
+        "OutputDirectoryError",
+        "Web3ConnectionError",
+        "TransactionError",
+        "SimulationError",
+        "SignerNotConfiguredError",
+        "InsufficientFundsError",
+        "CLIError",
+        "InvalidInputError",
+        "ConfigurationError",
+    ),
+    "abi_to_mcp.core.compiled": (
+        "CompiledABI",
+        "compile_abi",
+        "load_compiled",
+        "load_or_compile",
+        "save_compiled",
+    ),
+    "abi_to_mcp.core.models": (
+        "StateMutability",
+        "ToolType",
+        "ABIParameter",
+        "ABIFunction",
+        "ABIEvent",
+        "ABIError",
+        "ParsedABI",
+        "ToolParameter",
+        "MappedTool",
+        "ResourceField",
+        "MappedResource",
+        "GeneratedFile",
+        "GeneratedServer",
+        "BundleContract",
+        "FetchResult",
+    ),
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
 
 __all__ = [
     # Config
@@ -73,11 +164,15 @@ __all__ = [
     "NetworkConfig",
     "get_default_config",
     # Constants
+    "IMMUTABLE_GETTERS",
+    "MULTICALL3_ADDRESS",
     "NETWORKS",
     "SOLIDITY_TO_JSON_SCHEMA",
     "STATE_MUTABILITY_MAP",
     "ERC_STANDARDS",
     "DEFAULT_GAS_LIMITS",
+    "RPC_BATCH_SIZE",
+    "SPLIT_MODULES_THRESHOLD",
     # Exceptions
     "ABIToMCPError",
     "FetcherError",
@@ -116,5 +211,28 @@ __all__ = [
     "MappedResource",
     "GeneratedFile",
     "GeneratedServer",
+    "BundleContract",
     "FetchResult",
+    # Compiled artifacts
+    "CompiledABI",
+    "compile_abi",
+    "load_compiled",
+    "load_or_compile",
+    "save_compiled",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Module attributes, including names not imported yet."""
+    return sorted(set(globals()) | set(_MODULES))
@@ -0,0 +1,463 @@
+"""Compiled ABI artifact module.
+
+A compiled artifact stores a ParsedABI together with the tools and resources
+mapped from it, so that generating, inspecting or validating the same ABI
+again skips the parser and mapper entirely.
+
+File layout::
+
+    header   magic (8 bytes) | format version (u16) | marshal version (u16) | ABI sha256 (32 bytes)
+    payload  zlib(marshal((package version, marshal(parsed), marshal((tools, resources)))))
+
+Models are stored as plain tuples and rebuilt through their (slotted)
+dataclass constructors. The mapped section is only decoded when tools or
+resources are first accessed, so inspect and validate pay for the parsed
+section alone. Like .pyc files, artifacts are a local cache format:
+they are only valid for the package version and Python marshal format that
+wrote them, and must not be loaded from untrusted sources.
+"""
+
+import gc
+import hashlib
+import json
+import marshal
+import os
+import struct
+import tempfile
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from abi_to_mcp.core.exceptions import ABIParseError
+from abi_to_mcp.core.models import (
+    ABIError,
+    ABIEvent,
+    ABIFunction,
+    ABIParameter,
+    MappedResource,
+    MappedTool,
+    ParsedABI,
+    ResourceField,
+    StateMutability,
+    ToolParameter,
+)
+from abi_to_mcp.utils.logging import get_logger
+from abi_to_mcp.version import __version__
+
+logger = get_logger(__name__)
+
+# Bump when the encoded model layout changes; older artifacts are rejected.
+COMPILED_FORMAT_VERSION = 1
+
+COMPILED_SUFFIX = ".abic"
+
+MAGIC = b"ABI2MCP\x00"
+
+_HEADER = struct.Struct(">8sHH32s")
+
+
+class CompiledABI:
+    """A parsed and mapped ABI.
+
+    Attributes:
+        abi_hash: Content hash of the source ABI (see hash_abi)
+        parsed: Parser output
+        tools: Every function mapped to a tool (read and write)
+        resources: Every event mapped to a resource
+    """
+
+    __slots__ = ("abi_hash", "parsed", "_tools", "_resources", "_mapped_data")
+
+    def __init__(
+        self,
+        abi_hash: str,
+        parsed: ParsedABI,
+        tools: Optional[List[MappedTool]] = None,
+        resources: Optional[List[MappedResource]] = None,
+        mapped_data: Optional[bytes] = None,
+    ):
+        """
+        Initialize a compiled ABI.
+
+        Args:
+            abi_hash: Content hash of the source ABI
+            parsed: Parser output
+            tools: Mapped tools
+            resources: Mapped resources
+            mapped_data: Encoded tools and resources, decoded on first access
+                (used instead of tools and resources when loading artifacts)
+        """
+        self.abi_hash = abi_hash
+        self.parsed = parsed
+        self._tools = tools if mapped_data is None else None
+        self._resources = resources if mapped_data is None else None
+        self._mapped_data = mapped_data
+
+    @property
+    def tools(self) -> List[MappedTool]:
+        """Every function mapped to a tool."""
+        self._decode_mapped()
+        return self._tools or []
+
+    @property
+    def resources(self) -> List[MappedResource]:
+        """Every event mapped to a resource."""
+        self._decode_mapped()
+        return self._resources or []
+
+    def _decode_mapped(self) -> None:
+        """Decode the mapped section of a loaded artifact."""
+        if self._mapped_data is None:
+            return
+        with _gc_paused():
+            tools, resources = marshal.loads(self._mapped_data)
+            self._tools = [_decode_tool(t) for t in tools]
+            self._resources = [_decode_resource(r) for r in resources]
+        self._mapped_data = None
+
+    def select(
+        self, read_only: bool = False, include_events: bool = True
+    ) -> Tuple[List[MappedTool], List[MappedResource]]:
+        """Get the tools and resources for the given generation options."""
+        tools = [t for t in self.tools if t.is_read_only] if read_only else list(self.tools)
+        resources = list(self.resources) if include_events else []
+        return tools, resources
+
+
+def hash_abi(abi: List[Dict[str, Any]]) -> str:
+    """Compute the content hash of an ABI (stable across key ordering)."""
+    canonical = json.dumps(abi, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_abi(abi: List[Dict[str, Any]], abi_hash: Optional[str] = None) -> CompiledABI:
+    """
+    Parse and map an ABI.
+
+    Args:
+        abi: ABI JSON
+        abi_hash: Precomputed hash_abi(abi), if already known
+
+    Returns:
+        CompiledABI with every function and event mapped
+    """
+    from abi_to_mcp.mapper import EventMapper, FunctionMapper, TypeMapper
+    from abi_to_mcp.parser import ABIParser
+
+    parsed = ABIParser().parse(abi)
+    type_mapper = TypeMapper()
+    func_mapper = FunctionMapper(type_mapper)
+    event_mapper = EventMapper(type_mapper)
+
+    return CompiledABI(
+        abi_hash=abi_hash or hash_abi(abi),
+        parsed=parsed,
+        tools=[func_mapper.map_function(f) for f in parsed.functions],
+        resources=[event_mapper.map_event(e) for e in parsed.events],
+    )
+
+
+def dump_compiled(compiled: CompiledABI) -> bytes:
+    """Serialize a compiled ABI to artifact bytes."""
+    mapped = (
+        [_encode_tool(t) for t in compiled.tools],
+        [_encode_resource(r) for r in compiled.resources],
+    )
+    payload = (
+        __version__,
+        marshal.dumps(_encode_parsed(compiled.parsed)),
+        marshal.dumps(mapped),
+    )
+    header = _HEADER.pack(
+        MAGIC, COMPILED_FORMAT_VERSION, marshal.version, bytes.fromhex(compiled.abi_hash)
+    )
+    return header + zlib.compress(marshal.dumps(payload), 1)
+
+
+def load_compiled_bytes(data: bytes, abi_hash: Optional[str] = None) -> CompiledABI:
+    """
+    Deserialize artifact bytes.
+
+    Args:
+        data: Artifact bytes
+        abi_hash: Expected ABI hash; the artifact is rejected if it differs
+
+    Returns:
+        The compiled ABI
+
+    Raises:
+        ABIParseError: If the data is not an artifact, was written by another
+            format, package or Python version, or does not match abi_hash
+    """
+    if len(data) < _HEADER.size or not data.startswith(MAGIC):
+        raise ABIParseError("Not a compiled ABI artifact", entry_type="compiled")
+
+    _, format_version, marshal_version, digest = _HEADER.unpack_from(data)
+    if format_version != COMPILED_FORMAT_VERSION or marshal_version != marshal.version:
+        raise ABIParseError(
+            f"Compiled artifact format {format_version} is not supported "
+            f"(expected {COMPILED_FORMAT_VERSION}); recompile the ABI",
+            entry_type="compiled",
+        )
+    if abi_hash is not None and digest.hex() != abi_hash:
+        raise ABIParseError("Compiled artifact does not match the ABI", entry_type="compiled")
+
+    try:
+        version, parsed_data, mapped_data = marshal.loads(zlib.decompress(data[_HEADER.size :]))
+        if version != __version__:
+            raise ABIParseError(
+                f"Compiled artifact was written by version {version}; recompile the ABI",
+                entry_type="compiled",
+            )
+        with _gc_paused():
+            parsed = _decode_parsed(marshal.loads(parsed_data))
+    except (ValueError, EOFError, TypeError, zlib.error) as e:
+        raise ABIParseError(f"Corrupt compiled artifact: {e}", entry_type="compiled") from e
+
+    return CompiledABI(abi_hash=digest.hex(), parsed=parsed, mapped_data=mapped_data)
+
+
+def save_compiled(compiled: CompiledABI, path: Union[str, Path]) -> Path:
+    """
+    Atomically write a compiled artifact (safe for concurrent writers).
+
+    Args:
+        compiled: Compiled ABI
+        path: Destination file
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dump_compiled(compiled))
+        # mkstemp creates owner-only files; artifacts are as readable as the ABI
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def load_compiled(path: Union[str, Path], abi_hash: Optional[str] = None) -> CompiledABI:
+    """
+    Load a compiled artifact.
+
+    Args:
+        path: Artifact file
+        abi_hash: Expected ABI hash; the artifact is rejected if it differs
+
+    Returns:
+        The compiled ABI
+
+    Raises:
+        ABIParseError: If the file cannot be read or is not a valid, current artifact
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        raise ABIParseError(
+            f"Cannot read compiled artifact {path}: {e}", entry_type="compiled"
+        ) from e
+    return load_compiled_bytes(data, abi_hash)
+
+
+def is_compiled_artifact(path: Union[str, Path]) -> bool:
+    """Check whether a file starts with the compiled artifact magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def load_or_compile(
+    abi: List[Dict[str, Any]], directory: Optional[Union[str, Path]] = None
+) -> CompiledABI:
+    """
+    Get the compiled form of an ABI, reusing a cached artifact when its hash matches.
+
+    Args:
+        abi: ABI JSON
+        directory: Artifact directory (files named <abi hash>.abic); None to
+            compile without caching
+
+    Returns:
+        The compiled ABI
+    """
+    if directory is None:
+        return compile_abi(abi)
+
+    abi_hash = hash_abi(abi)
+    path = Path(directory) / f"{abi_hash}{COMPILED_SUFFIX}"
+    if path.exists():
+        try:
+            return load_compiled(path, abi_hash)
+        except ABIParseError as e:
+            logger.debug(f"Ignoring compiled artifact {path}: {e.message}")
+
+    compiled = compile_abi(abi, abi_hash)
+    try:
+        save_compiled(compiled, path)
+    except OSError as e:
+        logger.warning(f"Could not write compiled artifact {path}: {e}")
+    return compiled
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic GC while decoding; the rebuilt models hold no cycles."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# =============================================================================
+# Model encoding
+# =============================================================================
+
+
+def _encode_params(params: List[ABIParameter]) -> list:
+    return [
+        (
+            p.name,
+            p.type,
+            p.indexed,
+            _encode_params(p.components) if p.components is not None else None,
+            p.internal_type,
+        )
+        for p in params
+    ]
+
+
+def _decode_params(params: list) -> List[ABIParameter]:
+    return [
+        ABIParameter(
+            name,
+            type_,
+            indexed,
+            _decode_params(components) if components is not None else None,
+            internal_type,
+        )
+        for name, type_, indexed, components, internal_type in params
+    ]
+
+
+def _encode_parsed(parsed: ParsedABI) -> tuple:
+    return (
+        [
+            (
+                f.name,
+                _encode_params(f.inputs),
+                _encode_params(f.outputs),
+                f.state_mutability.value,
+                f.selector,
+            )
+            for f in parsed.functions
+        ],
+        [(e.name, _encode_params(e.inputs), e.anonymous) for e in parsed.events],
+        [(e.name, _encode_params(e.inputs)) for e in parsed.errors],
+        parsed.raw_abi,
+        parsed.detected_standard,
+        parsed.has_constructor,
+        parsed.has_fallback,
+        parsed.has_receive,
+    )
+
+
+def _decode_parsed(data: tuple) -> ParsedABI:
+    functions, events, errors, raw_abi, standard, constructor, fallback, receive = data
+    return ParsedABI(
+        functions=[
+            ABIFunction(
+                name,
+                _decode_params(inputs),
+                _decode_params(outputs),
+                StateMutability(mutability),
+                selector,
+            )
+            for name, inputs, outputs, mutability, selector in functions
+        ],
+        events=[
+            ABIEvent(name, _decode_params(inputs), anonymous) for name, inputs, anonymous in events
+        ],
+        errors=[ABIError(name, _decode_params(inputs)) for name, inputs in errors],
+        raw_abi=raw_abi,
+        detected_standard=standard,
+        has_constructor=constructor,
+        has_fallback=fallback,
+        has_receive=receive,
+    )
+
+
+def _encode_tool(tool: MappedTool) -> tuple:
+    return (
+        tool.name,
+        tool.original_name,
+        tool.description,
+        tool.tool_type,
+        [
+            (
+                p.name,
+                p.original_name,
+                p.solidity_type,
+                p.json_schema,
+                p.python_type,
+                p.description,
+                p.required,
+            )
+            for p in tool.parameters
+        ],
+        tool.return_schema,
+        tool.return_description,
+        tool.python_signature,
+    )
+
+
+def _decode_tool(data: tuple) -> MappedTool:
+    name, original, description, tool_type, params, return_schema, return_desc, signature = data
+    return MappedTool(
+        name,
+        original,
+        description,
+        tool_type,
+        [ToolParameter(*p) for p in params],
+        return_schema,
+        return_desc,
+        signature,
+    )
+
+
+def _encode_resource(resource: MappedResource) -> tuple:
+    return (
+        resource.name,
+        resource.original_name,
+        resource.description,
+        resource.uri_template,
+        [
+            (f.name, f.original_name, f.solidity_type, f.json_schema, f.description, f.indexed)
+            for f in resource.fields
+        ],
+        resource.function_name,
+    )
+
+
+def _decode_resource(data: tuple) -> MappedResource:
+    name, original, description, uri_template, fields, function_name = data
+    return MappedResource(
+        name,
+        original,
+        description,
+        uri_template,
+        [ResourceField(*f) for f in fields],
+        function_name,
+    )
@@ -31,7 +31,13 @@ class GeneratorConfig:
     read_only: bool = False
     include_events: bool = True
     include_utilities: bool = True
+    # Emit per-tool metrics (metrics://tools resource, Prometheus text over HTTP)
+    include_metrics: bool = True
     simulation_default: bool = True
+    # Emit async tools on AsyncWeb3 instead of blocking Web3 calls
+    async_mode: bool = False
+    # Emit one module per tool group (None: only above SPLIT_MODULES_THRESHOLD tools)
+    split_modules: Optional[bool] = None
 
     # Code generation settings
     include_docstrings: bool = True
@@ -42,10 +48,18 @@ class GeneratorConfig:
     server_name: Optional[str] = None
     server_version: str = "1.0.0"
 
+    # Incremental generation: skip rendering and writing files that are unchanged
+    incremental: bool = False
+    # Compiled-template cache (None: <ABI cache dir>/templates)
+    template_cache: bool = True
+    template_cache_dir: Optional[Path] = None
+
     def __post_init__(self):
-        """Convert output_dir to Path if string."""
+        """Convert output_dir and template_cache_dir to Path if string."""
         if isinstance(self.output_dir, str):
             self.output_dir = Path(self.output_dir)
+        if isinstance(self.template_cache_dir, str):
+            self.template_cache_dir = Path(self.template_cache_dir)
 
 
 @dataclass
@@ -65,10 +79,32 @@ class FetcherConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
 
+    # Address fetch strategy: "sequential" (Etherscan, then Sourcify) or
+    # "race" (all explorers concurrently, first valid ABI wins)
+    fetch_strategy: Optional[str] = None
+
+    # Explorer API rate limiting (shared by all fetches in the process)
+    rate_limit_tier: Optional[str] = None
+    rate_limit: Optional[float] = None
+    max_retry_delay: float = 60.0
+
+    # HTTP connection pool (shared by all network fetchers of a registry)
+    connect_timeout: float = 10.0
+    probe_timeout: float = 10.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
     # Proxy detection
     detect_proxy: bool = True
     fetch_implementation: bool = True
 
+    # ABI cache
+    use_cache: bool = True
+    cache_ttl: float = 86400.0
+    offline: bool = False
+
     def __post_init__(self):
         """Load API keys from environment if not provided."""
         env_mappings = {
@@ -84,6 +120,12 @@ class FetcherConfig:
             if getattr(self, attr) is None:
                 setattr(self, attr, os.environ.get(env_var))
 
+        if self.fetch_strategy is None:
+            self.fetch_strategy = os.environ.get("ABI_TO_MCP_FETCH_STRATEGY", "sequential")
+
+        if self.rate_limit_tier is None:
+            self.rate_limit_tier = os.environ.get("ABI_TO_MCP_RATE_LIMIT_TIER", "free")
+
     def get_api_key(self, network: str) -> Optional[str]:
         """Get the appropriate API key for a network."""
         key_mapping = {
@@ -193,3 +235,14 @@ def get_default_config() -> AppConfig:
             return AppConfig.load_from_file(path)
 
     return AppConfig()
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache directory.
+
+    Uses ABI_TO_MCP_CACHE_DIR if set, otherwise ~/.cache/abi-to-mcp/abi-cache.
+    """
+    env_dir = os.environ.get("ABI_TO_MCP_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir).expanduser()
+    return Path.home() / ".cache" / "abi-to-mcp" / "abi-cache"
@@ -6,6 +6,10 @@ from typing import Dict, Any
 # Supported EVM Networks
 # =============================================================================
 
+# Multicall3 is deployed at the same address on every supported network
+# (https://www.multicall3.com); networks without it set "multicall3" to None.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 NETWORKS: Dict[str, Dict[str, Any]] = {
     "mainnet": {
         "chain_id": 1,
@@ -15,6 +19,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api.etherscan.io/api",
         "currency": "ETH",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "sepolia": {
         "chain_id": 11155111,
@@ -24,6 +29,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api-sepolia.etherscan.io/api",
         "currency": "ETH",
         "is_testnet": True,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "goerli": {
         "chain_id": 5,
@@ -33,6 +39,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api-goerli.etherscan.io/api",
         "currency": "ETH",
         "is_testnet": True,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "polygon": {
         "chain_id": 137,
@@ -42,6 +49,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api.polygonscan.com/api",
         "currency": "MATIC",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "arbitrum": {
         "chain_id": 42161,
@@ -51,6 +59,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api.arbiscan.io/api",
         "currency": "ETH",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "optimism": {
         "chain_id": 10,
@@ -60,6 +69,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api-optimistic.etherscan.io/api",
         "currency": "ETH",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "base": {
         "chain_id": 8453,
@@ -69,6 +79,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api.basescan.org/api",
         "currency": "ETH",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "bsc": {
         "chain_id": 56,
@@ -78,6 +89,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api.bscscan.com/api",
         "currency": "BNB",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "avalanche": {
         "chain_id": 43114,
@@ -87,6 +99,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api.snowtrace.io/api",
         "currency": "AVAX",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
     "fantom": {
         "chain_id": 250,
@@ -96,6 +109,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "etherscan_api": "https://api.ftmscan.com/api",
         "currency": "FTM",
         "is_testnet": False,
+        "multicall3": MULTICALL3_ADDRESS,
     },
 }
 
@@ -242,6 +256,9 @@ for bits in [
         "description": f"Signed {bits}-bit integer as string",
     }
 
+# Distinct types (and their JSON schemas) kept by the TypeMapper/TypeParser caches
+TYPE_CACHE_SIZE = 4096
+
 
 # =============================================================================
 # State Mutability → Tool Behavior Mapping
@@ -275,6 +292,15 @@ STATE_MUTABILITY_MAP = {
 }
 
 
+# Zero-argument view getters whose result is fixed at deployment. Generated
+# servers cache these (and pure or CONSTANT_CASE getters) for the process lifetime.
+IMMUTABLE_GETTERS = frozenset({"name", "symbol", "decimals"})
+
+# Servers with more tools and event queries than this are split into one
+# module per tool group (read, write, events) next to a shared runtime module
+SPLIT_MODULES_THRESHOLD = 64
+
+
 # =============================================================================
 # Common ERC Standards
 # =============================================================================
@@ -376,6 +402,14 @@ DEFAULT_GAS_LIMITS = {
 }
 
 
+# =============================================================================
+# JSON-RPC Batching
+# =============================================================================
+
+# Requests per JSON-RPC batch payload (most public providers accept 100)
+RPC_BATCH_SIZE = 100
+
+
 # =============================================================================
 # Python Type Mappings
 # =============================================================================
@@ -415,6 +449,8 @@ PROXY_STORAGE_SLOTS = {
     "implementation": "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc",
     "admin": "0xb53127684a568b3173ae13b9f8a6016e243e63b6e8ee1178d6a717850b5d6103",
     "beacon": "0xa3f0ad74e5423aebfd80d3ef4346578335a9a72aeaee59ff6cb3582b35133d50",
+    # EIP-1822 (UUPS): keccak256("PROXIABLE")
+    "proxiable": "0xc5f16f0fcc639fa48a6947836d9850f504798523bf8c9a3a87d5876cf622bcf7",
 }
 
 # EIP-1167 minimal proxy bytecode prefix
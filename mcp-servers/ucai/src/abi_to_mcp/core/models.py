@@ -46,7 +46,7 @@ class ToolType(Enum):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ABIParameter:
     """A function or event parameter from the ABI.
 
@@ -80,7 +80,7 @@ class ABIParameter:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ABIFunction:
     """A parsed contract function.
 
@@ -134,7 +134,7 @@ class ABIFunction:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ABIEvent:
     """A parsed contract event.
 
@@ -168,7 +168,7 @@ class ABIEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ABIError:
     """A parsed custom error.
 
@@ -189,7 +189,7 @@ class ABIError:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedABI:
     """Complete parsed ABI.
 
@@ -231,7 +231,7 @@ class ParsedABI:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParameter:
     """A parameter in an MCP tool definition.
 
@@ -254,7 +254,7 @@ class ToolParameter:
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedTool:
     """A function mapped to an MCP tool definition.
 
@@ -296,7 +296,7 @@ class MappedTool:
         return self.tool_type == "write_payable"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceField:
     """A field in an MCP resource (event parameter).
 
@@ -317,7 +317,7 @@ class ResourceField:
     indexed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MappedResource:
     """An event mapped to an MCP resource definition.
 
@@ -363,11 +363,14 @@ class GeneratedFile:
         path: Relative path within output directory
         content: File content as string
         is_executable: Whether file should be executable
+        render_key: Hash of the template and rendering context, recorded in the
+            output manifest for incremental generation (None for static files)
     """
 
     path: str
     content: str
     is_executable: bool = False
+    render_key: Optional[str] = None
 
 
 @dataclass
@@ -386,6 +389,8 @@ class GeneratedServer:
         server_name: Name of the generated server
         contract_address: Target contract address
         network: Target network
+        unchanged_files: Files left untouched by the last write because their
+            content was already on disk
     """
 
     files: List[GeneratedFile]
@@ -397,6 +402,7 @@ class GeneratedServer:
     server_name: str
     contract_address: str
     network: str
+    unchanged_files: List[str] = field(default_factory=list)
 
     def get_file(self, path: str) -> Optional[GeneratedFile]:
         """Get a specific file by path."""
@@ -406,6 +412,29 @@ class GeneratedServer:
         return None
 
 
+@dataclass
+class BundleContract:
+    """A contract served by a bundle server.
+
+    Attributes:
+        namespace: Package name under contracts/ and tool name prefix
+        name: Human-readable contract name
+        address: Contract address
+        network: Network name
+        read_tools: Names of read-only tools (without the namespace prefix)
+        write_tools: Names of write tools
+        events: Names of event resources
+    """
+
+    namespace: str
+    name: str
+    address: str
+    network: str
+    read_tools: List[str] = field(default_factory=list)
+    write_tools: List[str] = field(default_factory=list)
+    events: List[str] = field(default_factory=list)
+
+
 # =============================================================================
 # Fetcher Models
 # =============================================================================
@@ -1,14 +1,23 @@
 """Fetchers module for abi-to-mcp."""
 
+from abi_to_mcp.fetchers.artifact import ArtifactContract, iter_artifact_contracts
 from abi_to_mcp.fetchers.base import ABIFetcher
+from abi_to_mcp.fetchers.cache import ABICache
 from abi_to_mcp.fetchers.file import FileFetcher
+from abi_to_mcp.fetchers.ratelimit import RateLimiter, TokenBucket, get_rate_limiter
 from abi_to_mcp.fetchers.etherscan import EtherscanFetcher
 from abi_to_mcp.fetchers.sourcify import SourcifyFetcher
 from abi_to_mcp.fetchers.registry import FetcherRegistry, create_default_registry
 
 __all__ = [
     "ABIFetcher",
+    "ArtifactContract",
+    "iter_artifact_contracts",
+    "ABICache",
     "FileFetcher",
+    "RateLimiter",
+    "TokenBucket",
+    "get_rate_limiter",
     "EtherscanFetcher",
     "SourcifyFetcher",
     "FetcherRegistry",
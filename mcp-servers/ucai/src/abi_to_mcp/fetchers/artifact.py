@@ -0,0 +1,372 @@
+"""Streaming artifact reader module.
+
+This module extracts contract ABIs from large compiler artifacts without
+loading them into memory. Hardhat build-info files and solc standard-json
+output embed full sources and ASTs (often hundreds of MB) next to the few
+kilobytes we need; the reader walks the JSON incrementally, decodes only
+`abi`, contract names and compiler versions, and skips everything else.
+
+Supported layouts:
+- Hardhat build-info: {"solcVersion", "input", "output": {"contracts": {file: {name: {...}}}}}
+- solc standard-json output: {"contracts": {file: {name: {"abi", "metadata", ...}}}}
+- Single-contract artifacts (Hardhat, Truffle, Foundry): {"abi": [...], "contractName", ...}
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NoReturn, Optional, TextIO, Union
+
+from abi_to_mcp.core.exceptions import ABINotFoundError, ABIParseError
+
+# Read buffer size for streaming
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_NON_WS = re.compile(r"\S")
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_SCALAR = re.compile(r"[^\s,:\]}]+")
+
+
+@dataclass
+class ArtifactContract:
+    """A contract found in a compiler artifact."""
+
+    name: str
+    abi: List[Dict[str, Any]]
+    source_name: Optional[str] = None
+    compiler_version: Optional[str] = None
+
+    @property
+    def qualified_name(self) -> str:
+        """Fully qualified name ("contracts/Token.sol:Token")."""
+        return f"{self.source_name}:{self.name}" if self.source_name else self.name
+
+    def matches(self, selector: str) -> bool:
+        """Check whether a name or fully qualified name selects this contract."""
+        return selector in (self.name, self.qualified_name)
+
+
+class JSONStreamReader:
+    """
+    Incremental reader over a JSON text stream.
+
+    Values are either decoded (read_value) or skipped (skip_value); skipping
+    scans the text without building Python objects, so only the buffer and
+    the values actually decoded are held in memory.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            stream: Text stream positioned at the start of a JSON document
+            chunk_size: Characters read per refill
+        """
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._mark: Optional[int] = None
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+        while True:
+            match = _NON_WS.search(self._buf, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            if not self._fill():
+                return ""
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the object at the current position.
+
+        The caller must consume each key's value with read_value() or
+        skip_value() before advancing the iterator.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                self._error("Expected object key")
+            key = json.loads(self._take(self.skip_value))
+            self._expect(":")
+            yield key
+
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                self._error("Expected ',' or '}'")
+
+    def read_value(self) -> Any:
+        """Decode the value at the current position."""
+        text = self._take(self.skip_value)
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ABIParseError(f"Invalid JSON value: {e}", entry_type="file") from e
+
+    def skip_value(self) -> None:
+        """Advance past the value at the current position without decoding it."""
+        first = self.peek()
+        if first == '"':
+            self._skip_string()
+        elif first in "{[":
+            self._skip_container()
+        elif first:
+            self._skip_scalar()
+        else:
+            self._error("Unexpected end of input")
+
+    def _take(self, skip: Callable[[], None]) -> str:
+        """Run a skip function and return the text it passed over."""
+        self.peek()
+        self._mark = self._pos
+        try:
+            skip()
+            return self._buf[self._mark : self._pos]
+        finally:
+            self._mark = None
+
+    def _skip_string(self) -> None:
+        """Skip a string literal (opening quote at the current position)."""
+        self._pos += 1
+        while True:
+            match = _STRING_BODY.match(self._buf, self._pos)
+            if match is None:
+                self._error("Invalid string")
+            end = match.end()
+            if end < len(self._buf) and self._buf[end] == '"':
+                self._pos = end + 1
+                return
+            # Keep any dangling backslash so its escape is seen after refilling
+            self._pos = end
+            if not self._fill():
+                self._error("Unterminated string")
+
+    def _skip_container(self) -> None:
+        """Skip an object or array (opening bracket at the current position)."""
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    self._error("Unterminated object or array")
+                continue
+
+            char = match.group()
+            self._pos = match.start()
+            if char == '"':
+                self._skip_string()
+                continue
+
+            self._pos += 1
+            if char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_scalar(self) -> None:
+        """Skip a number, true, false or null."""
+        while True:
+            match = _SCALAR.match(self._buf, self._pos)
+            if match is None:
+                self._error(f"Unexpected character {self._buf[self._pos : self._pos + 1]!r}")
+            end = match.end()
+            if end < len(self._buf) or not self._fill():
+                self._pos = end
+                return
+
+    def _expect(self, char: str) -> None:
+        """Consume an expected structural character."""
+        if self.peek() != char:
+            self._error(f"Expected '{char}'")
+        self._pos += 1
+
+    def _fill(self) -> bool:
+        """Read more input, discarding consumed text. Returns False at end of input."""
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            return False
+
+        keep = self._pos if self._mark is None else min(self._mark, self._pos)
+        self._buf = self._buf[keep:] + chunk
+        self._pos -= keep
+        if self._mark is not None:
+            self._mark -= keep
+        return True
+
+    def _error(self, message: str) -> NoReturn:
+        """Raise a parse error with context."""
+        raise ABIParseError(f"Invalid JSON: {message}", entry_type="file")
+
+
+def iter_artifact_contracts(
+    path: Union[str, Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ArtifactContract]:
+    """
+    Stream every contract with an ABI out of a compiler artifact.
+
+    Contracts from build-info and standard-json files are yielded as soon
+    as they are read, and reading stops at the end of the contracts
+    section, so the trailing sources and ASTs are never scanned.
+
+    Args:
+        path: Artifact file
+        chunk_size: Characters read per refill
+
+    Yields:
+        Contracts in file order
+
+    Raises:
+        ABIParseError: If the file is not valid JSON or not an object
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = JSONStreamReader(f, chunk_size)
+        first = reader.peek()
+        if first == "[":
+            # Plain ABI array
+            yield ArtifactContract(name=Path(path).stem, abi=reader.read_value())
+            return
+        if first != "{":
+            raise ABIParseError(f"Expected a JSON object or array in {path}", entry_type="file")
+
+        top: Dict[str, Any] = {}
+        for key in reader.iter_object():
+            if key in (
+                "abi",
+                "contractName",
+                "sourceName",
+                "compiler",
+                "solcVersion",
+                "solcLongVersion",
+            ):
+                top[key] = reader.read_value()
+            elif key == "metadata" and "compiler_version" not in top:
+                top["compiler_version"] = _metadata_compiler_version(reader.read_value())
+            elif key == "contracts":
+                # Everything after the contracts section (sources, ASTs) is irrelevant
+                yield from _iter_contracts_section(reader, _compiler_version(top))
+                return
+            elif key == "output" and reader.peek() == "{":
+                for output_key in reader.iter_object():
+                    if output_key == "contracts":
+                        yield from _iter_contracts_section(reader, _compiler_version(top))
+                        return
+                    reader.skip_value()
+            else:
+                reader.skip_value()
+
+    if isinstance(top.get("abi"), list):
+        yield ArtifactContract(
+            name=top.get("contractName") or Path(path).stem,
+            abi=top["abi"],
+            source_name=top.get("sourceName"),
+            compiler_version=_compiler_version(top),
+        )
+
+
+def find_artifact_contract(
+    path: Union[str, Path],
+    contract: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ArtifactContract:
+    """
+    Stream a single contract out of a compiler artifact.
+
+    Args:
+        path: Artifact file
+        contract: Contract name or fully qualified name ("path/File.sol:Name");
+            may be omitted when the artifact holds exactly one contract
+        chunk_size: Characters read per refill
+
+    Returns:
+        The selected contract
+
+    Raises:
+        ABINotFoundError: If the contract is not in the artifact
+        ABIParseError: If no contract was requested and the artifact holds several
+    """
+    found: List[ArtifactContract] = []
+    for candidate in iter_artifact_contracts(path, chunk_size):
+        if contract is not None and candidate.matches(contract):
+            return candidate
+        found.append(candidate)
+
+    names = ", ".join(c.qualified_name for c in found) or "none"
+    if contract is not None:
+        raise ABINotFoundError(
+            str(path), f"Contract '{contract}' not in artifact. Available: {names}"
+        )
+    if not found:
+        raise ABIParseError(f"No contract with an ABI found in {path}", entry_type="file")
+    if len(found) > 1:
+        raise ABIParseError(
+            f"Artifact {path} contains {len(found)} contracts; select one with "
+            f"--contract. Available: {names}",
+            entry_type="file",
+        )
+    return found[0]
+
+
+def _iter_contracts_section(
+    reader: JSONStreamReader, compiler_version: Optional[str]
+) -> Iterator[ArtifactContract]:
+    """Read {source_file: {contract_name: {"abi": ..., ...}}}."""
+    for source_name in reader.iter_object():
+        for name in reader.iter_object():
+            abi = None
+            version = compiler_version
+            for field in reader.iter_object():
+                if field == "abi":
+                    abi = reader.read_value()
+                elif field == "metadata" and version is None:
+                    version = _metadata_compiler_version(reader.read_value())
+                else:
+                    reader.skip_value()
+
+            if isinstance(abi, list) and abi:
+                yield ArtifactContract(
+                    name=name,
+                    abi=abi,
+                    source_name=source_name,
+                    compiler_version=version,
+                )
+
+
+def _compiler_version(top: Dict[str, Any]) -> Optional[str]:
+    """Pick the compiler version from top-level artifact fields."""
+    compiler = top.get("compiler")
+    if isinstance(compiler, dict) and compiler.get("version"):
+        return str(compiler["version"])
+    if isinstance(compiler, str):
+        return compiler
+    version = top.get("solcLongVersion") or top.get("solcVersion") or top.get("compiler_version")
+    return str(version) if version else None
+
+
+def _metadata_compiler_version(metadata: Any) -> Optional[str]:
+    """Extract compiler.version from solc metadata (JSON string or object)."""
+    try:
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        if isinstance(metadata, dict):
+            version = metadata.get("compiler", {}).get("version")
+            return str(version) if version else None
+    except (json.JSONDecodeError, AttributeError):
+        pass
+    return None
@@ -19,6 +19,7 @@ class ABIFetcher(ABC):
 
     Fetchers may optionally implement:
     - validate_source(): Validate source format before fetching
+    - aclose(): Release network resources such as HTTP clients
     """
 
     @abstractmethod
@@ -63,3 +64,7 @@ class ABIFetcher(ABC):
             Error message if invalid, None if valid
         """
         return None
+
+    async def aclose(self) -> None:
+        """Release any resources held by the fetcher."""
+        return None
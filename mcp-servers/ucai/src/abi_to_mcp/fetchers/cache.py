@@ -0,0 +1,244 @@
+"""ABI cache module.
+
+This module provides a persistent, content-addressed on-disk cache for
+fetched ABIs so that repeated generations of the same contract do not go
+back to Etherscan or Sourcify.
+
+Layout of the cache directory::
+
+    <root>/abis/<sha256>.json                  # canonical ABI JSON, content addressed
+    <root>/index/<chain_id>/<address>.json     # entry pointing at an ABI blob
+    <root>/compiled/<sha256>.abic              # parsed and mapped ABI (see core.compiled)
+    <root>/templates/                          # compiled Jinja templates (see generator)
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from abi_to_mcp.core.compiled import hash_abi
+from abi_to_mcp.core.config import default_cache_dir
+from abi_to_mcp.core.models import FetchResult
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the on-disk entry format changes; older entries are ignored.
+CACHE_FORMAT_VERSION = 1
+
+# Default time-to-live for cache entries (24 hours)
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+
+class ABICache:
+    """
+    Persistent on-disk cache of fetch results.
+
+    Entries are keyed by (chain_id, address) and record the resolved
+    implementation address for proxies. ABI bodies are stored once per
+    content hash, so many proxies pointing at the same implementation share
+    a single blob.
+
+    Example:
+        cache = ABICache(ttl=3600)
+        cache.put("0xA0b8...", 1, fetch_result)
+        result = cache.get("0xA0b8...", 1)
+
+        # After a proxy upgrade, drop everything resolved through the old implementation
+        cache.invalidate("0x43506849...")
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: Optional[float] = DEFAULT_CACHE_TTL,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Root directory (default: default_cache_dir())
+            ttl: Entry lifetime in seconds, None for entries that never expire
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.ttl = ttl
+
+    @property
+    def abi_dir(self) -> Path:
+        """Directory holding content-addressed ABI blobs."""
+        return self.cache_dir / "abis"
+
+    @property
+    def index_dir(self) -> Path:
+        """Directory holding per-(chain, address) entries."""
+        return self.cache_dir / "index"
+
+    @property
+    def compiled_dir(self) -> Path:
+        """Directory holding compiled ABI artifacts, named by ABI content hash."""
+        return self.cache_dir / "compiled"
+
+    @staticmethod
+    def hash_abi(abi: List[Dict[str, Any]]) -> str:
+        """Compute the content hash of an ABI (stable across key ordering)."""
+        return hash_abi(abi)
+
+    def get(
+        self,
+        address: str,
+        chain_id: int,
+        allow_expired: bool = False,
+    ) -> Optional[FetchResult]:
+        """
+        Look up a cached fetch result.
+
+        Args:
+            address: Contract address
+            chain_id: Chain ID
+            allow_expired: Return the entry even if its TTL has passed
+
+        Returns:
+            Cached FetchResult, or None on a miss
+        """
+        entry = self._read_json(self._entry_path(address, chain_id))
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_FORMAT_VERSION:
+            return None
+
+        if not allow_expired and self._is_expired(entry):
+            return None
+
+        abi = self._read_json(self.abi_dir / f"{entry['abi_hash']}.json")
+        if not isinstance(abi, list):
+            return None
+
+        logger.debug(f"ABI cache hit for {address} on chain {chain_id}")
+
+        return FetchResult(
+            abi=abi,
+            source=entry.get("source", "cache"),
+            source_location=entry.get("source_location", address.lower()),
+            contract_name=entry.get("contract_name"),
+            compiler_version=entry.get("compiler_version"),
+            is_proxy=entry.get("is_proxy", False),
+            implementation_address=entry.get("implementation_address"),
+        )
+
+    def put(self, address: str, chain_id: int, result: FetchResult) -> str:
+        """
+        Store a fetch result.
+
+        Args:
+            address: Contract address the result was fetched for
+            chain_id: Chain ID
+            result: Fetch result to store
+
+        Returns:
+            Content hash of the stored ABI
+        """
+        abi_hash = self.hash_abi(result.abi)
+
+        blob_path = self.abi_dir / f"{abi_hash}.json"
+        if not blob_path.exists():
+            self._write_json(blob_path, result.abi)
+
+        entry = {
+            "version": CACHE_FORMAT_VERSION,
+            "chain_id": chain_id,
+            "address": address.lower(),
+            "implementation_address": (
+                result.implementation_address.lower() if result.implementation_address else None
+            ),
+            "is_proxy": result.is_proxy,
+            "abi_hash": abi_hash,
+            "contract_name": result.contract_name,
+            "compiler_version": result.compiler_version,
+            "source": result.source,
+            "source_location": result.source_location,
+            "fetched_at": time.time(),
+        }
+        self._write_json(self._entry_path(address, chain_id), entry)
+
+        return abi_hash
+
+    def invalidate(self, address: str, chain_id: Optional[int] = None) -> int:
+        """
+        Remove entries for an address.
+
+        Matches entries stored under the address as well as proxy entries
+        whose resolved implementation is the address.
+
+        Args:
+            address: Contract or implementation address
+            chain_id: Restrict to one chain (default: all chains)
+
+        Returns:
+            Number of entries removed
+        """
+        address = address.lower()
+        removed = 0
+
+        for entry_path in self._iter_entries(chain_id):
+            entry = self._read_json(entry_path)
+            if entry_path.stem == address or (
+                isinstance(entry, dict) and entry.get("implementation_address") == address
+            ):
+                entry_path.unlink(missing_ok=True)
+                removed += 1
+
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry and ABI blob."""
+        import shutil
+
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _entry_path(self, address: str, chain_id: int) -> Path:
+        """Get the index path for an entry."""
+        return self.index_dir / str(chain_id) / f"{address.lower()}.json"
+
+    def _iter_entries(self, chain_id: Optional[int] = None) -> List[Path]:
+        """List entry files, optionally for a single chain."""
+        if chain_id is not None:
+            chain_dirs = [self.index_dir / str(chain_id)]
+        elif self.index_dir.is_dir():
+            chain_dirs = [p for p in self.index_dir.iterdir() if p.is_dir()]
+        else:
+            chain_dirs = []
+
+        entries: List[Path] = []
+        for chain_dir in chain_dirs:
+            if chain_dir.is_dir():
+                entries.extend(chain_dir.glob("*.json"))
+        return entries
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry has outlived the TTL."""
+        if self.ttl is None:
+            return False
+        return bool(time.time() - entry.get("fetched_at", 0) > self.ttl)
+
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        """Read a JSON file, returning None if missing or corrupt."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Atomically write a JSON file (safe for concurrent writers)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
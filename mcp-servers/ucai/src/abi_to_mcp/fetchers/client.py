@@ -0,0 +1,57 @@
+"""HTTP client module.
+
+This module builds the pooled httpx.AsyncClient shared by network fetchers,
+so that one fetch (ABI, proxy probes, implementation ABI) reuses a single
+keep-alive connection instead of opening a new one per request.
+"""
+
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+
+from abi_to_mcp.core.config import FetcherConfig
+
+
+def http_client_options(config: Optional[FetcherConfig] = None) -> Dict[str, Any]:
+    """
+    Build httpx.AsyncClient keyword arguments from fetcher configuration.
+
+    Args:
+        config: Fetcher configuration (uses defaults if not provided)
+
+    Returns:
+        Keyword arguments for httpx.AsyncClient (limits, timeout, http2)
+
+    Raises:
+        ImportError: If HTTP/2 is requested but the h2 package is missing
+    """
+    config = config or FetcherConfig()
+
+    if config.http2 and importlib.util.find_spec("h2") is None:
+        raise ImportError(
+            "HTTP/2 support requires the h2 package. Install with: pip install 'httpx[http2]'"
+        )
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        "timeout": httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        "http2": config.http2,
+    }
+
+
+def create_http_client(config: Optional[FetcherConfig] = None) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client from fetcher configuration.
+
+    Args:
+        config: Fetcher configuration (uses defaults if not provided)
+
+    Returns:
+        Configured httpx.AsyncClient; the caller is responsible for closing it
+    """
+    return httpx.AsyncClient(**http_client_options(config))
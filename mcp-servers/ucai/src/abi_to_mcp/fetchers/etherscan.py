@@ -4,16 +4,29 @@ This module provides the EtherscanFetcher class for fetching ABIs from
 Etherscan-compatible block explorers.
 """
 
+import asyncio
+import math
 import os
 import re
 import json
-from typing import Optional, Dict, Any
+from types import TracebackType
+from typing import Awaitable, List, Optional, Dict, Any, Tuple, Type
+from urllib.parse import urlparse
 
 import httpx
 
 from abi_to_mcp.fetchers.base import ABIFetcher
+from abi_to_mcp.fetchers.client import create_http_client
+from abi_to_mcp.fetchers.ratelimit import (
+    RateLimiter,
+    get_rate_limiter,
+    resolve_rate,
+    send_with_retry,
+    throttle_status,
+)
+from abi_to_mcp.core.config import FetcherConfig
 from abi_to_mcp.core.models import FetchResult
-from abi_to_mcp.core.constants import NETWORKS
+from abi_to_mcp.core.constants import NETWORKS, PROXY_STORAGE_SLOTS, MINIMAL_PROXY_PREFIX
 from abi_to_mcp.core.exceptions import (
     ABINotFoundError,
     ContractNotVerifiedError,
@@ -38,31 +51,59 @@ class EtherscanFetcher(ABIFetcher):
 
     Features:
     - Automatic proxy detection
-    - Rate limit handling
+    - Per-key token-bucket rate limiting with backoff on throttling
     - API key management
+    - Pooled keep-alive HTTP client shared across requests
     """
 
     ADDRESS_PATTERN = re.compile(r"^0x[a-fA-F0-9]{40}$")
 
     # EIP-1967 implementation slot
-    IMPLEMENTATION_SLOT = "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
+    IMPLEMENTATION_SLOT = PROXY_STORAGE_SLOTS["implementation"]
+
+    # EIP-1967 beacon slot
+    BEACON_SLOT = PROXY_STORAGE_SLOTS["beacon"]
+
+    # EIP-1822 (UUPS) proxiable slot
+    PROXIABLE_SLOT = PROXY_STORAGE_SLOTS["proxiable"]
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        config: Optional[FetcherConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
         """
         Initialize with optional API key.
 
         If no key provided, will check environment variables:
         - ETHERSCAN_API_KEY
         - Network-specific: POLYGONSCAN_API_KEY, etc.
+
+        Args:
+            api_key: Explicit API key
+            client: Shared HTTP client (not closed by this fetcher)
+            config: Fetcher configuration for timeouts, rate limits and the connection pool
+            rate_limiter: Rate limiter (default: the process-wide shared limiter)
+
+        Raises:
+            ValueError: If the configured rate limit tier is unknown
         """
         self._api_key = api_key
-        self._client: Optional[httpx.AsyncClient] = None
+        self._config = config or FetcherConfig()
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._rate = resolve_rate(
+            "etherscan", self._config.rate_limit_tier, self._config.rate_limit
+        )
 
     async def fetch(
         self,
         source: str,
         network: str = "mainnet",
-        **kwargs,
+        **kwargs: Any,
     ) -> FetchResult:
         """
         Fetch ABI from Etherscan API.
@@ -94,25 +135,37 @@ class EtherscanFetcher(ABIFetcher):
         api_url = net_config["etherscan_api"]
         api_key = self._get_api_key(network)
 
-        # Fetch ABI
-        abi_data = await self._fetch_abi(api_url, address, api_key, network)
+        detect_proxy = kwargs.get("detect_proxy", True)
 
-        if abi_data is None:
-            raise ContractNotVerifiedError(address, network)
+        # Fetch the proxy ABI while the proxy probes are in flight
+        abi_task = asyncio.ensure_future(self._fetch_abi(api_url, address, api_key, network))
+        proxy_task = (
+            asyncio.ensure_future(self._detect_proxy(address, network, api_url, api_key))
+            if detect_proxy
+            else None
+        )
+
+        try:
+            abi_data = await abi_task
+            if abi_data is None:
+                raise ContractNotVerifiedError(address, network)
+            impl = await proxy_task if proxy_task is not None else None
+        finally:
+            if proxy_task is not None and not proxy_task.done():
+                proxy_task.cancel()
+                await asyncio.gather(proxy_task, return_exceptions=True)
 
         # Check for proxy
         is_proxy = False
         implementation_address = None
 
-        if kwargs.get("detect_proxy", True):
-            impl = await self._detect_proxy(address, network, api_url, api_key)
-            if impl:
-                is_proxy = True
-                implementation_address = impl
-                # Fetch implementation ABI instead
-                impl_abi = await self._fetch_abi(api_url, impl, api_key, network)
-                if impl_abi:
-                    abi_data = impl_abi
+        if impl:
+            is_proxy = True
+            implementation_address = impl
+            # Fetch implementation ABI instead
+            impl_abi = await self._fetch_abi(api_url, impl, api_key, network)
+            if impl_abi:
+                abi_data = impl_abi
 
         return FetchResult(
             abi=json.loads(abi_data),
@@ -126,6 +179,88 @@ class EtherscanFetcher(ABIFetcher):
         """Check if source is an Ethereum address."""
         return bool(self.ADDRESS_PATTERN.match(source))
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = create_http_client(self._config)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this fetcher created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "EtherscanFetcher":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def _request(
+        self,
+        api_url: str,
+        params: Dict[str, Any],
+        api_key: Optional[str],
+        timeout: float,
+    ) -> httpx.Response:
+        """
+        Send a GET request through the per-key rate limiter.
+
+        Throttled responses are retried with jittered exponential backoff
+        (or the server's Retry-After); all fetches sharing the key back off
+        together.
+
+        Args:
+            api_url: Etherscan API base URL
+            params: Query parameters
+            api_key: API key selecting the rate limit bucket
+            timeout: Request timeout in seconds
+
+        Returns:
+            The response; still throttled only if retries were exhausted
+        """
+        bucket = self._rate_limiter.bucket(urlparse(api_url).netloc or api_url, api_key, self._rate)
+        client = self._get_client()
+
+        return await send_with_retry(
+            lambda: client.get(api_url, params=params, timeout=timeout),
+            bucket,
+            max_retries=self._config.max_retries,
+            base_delay=self._config.retry_delay,
+            max_delay=self._config.max_retry_delay,
+            is_throttled=self._throttle_status,
+        )
+
+    @staticmethod
+    def _throttle_status(response: httpx.Response) -> Tuple[bool, Optional[float]]:
+        """
+        Check for throttling, including Etherscan's HTTP 200 rate limit body.
+
+        Returns:
+            Tuple of (throttled, Retry-After seconds if provided)
+        """
+        throttled, retry_after = throttle_status(response)
+        if throttled or response.status_code != 200:
+            return throttled, retry_after
+
+        try:
+            data = response.json()
+        except ValueError:
+            return False, None
+
+        result = data.get("result") if isinstance(data, dict) else None
+        if isinstance(result, str) and "rate limit" in result.lower():
+            return True, None
+        return False, None
+
     def _get_api_key(self, network: str) -> Optional[str]:
         """Get API key for network."""
         if self._api_key:
@@ -178,35 +313,37 @@ class EtherscanFetcher(ABIFetcher):
         if api_key:
             params["apikey"] = api_key
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(api_url, params=params, timeout=30.0)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429:
-                    raise RateLimitError("Etherscan", retry_after=60) from e
-                raise NetworkError(
-                    f"HTTP error fetching ABI: {e}", url=api_url, status_code=e.response.status_code
-                ) from e
-            except httpx.TimeoutException as e:
-                raise NetworkError(f"Timeout fetching ABI from {network}", url=api_url) from e
-            except httpx.RequestError as e:
-                raise NetworkError(f"Request failed: {e}", url=api_url) from e
-
-            data = response.json()
-
-            if data.get("status") == "1":
-                return data.get("result")
-
-            # Check for specific errors
-            result = data.get("result", "")
-
-            if "not verified" in result.lower() or "source code not verified" in result.lower():
-                return None
-
-            # Other error
+        try:
+            response = await self._request(api_url, params, api_key, self._config.timeout)
+            throttled, retry_after = self._throttle_status(response)
+            if throttled:
+                raise RateLimitError(
+                    "Etherscan", retry_after=math.ceil(retry_after) if retry_after else 60
+                )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise NetworkError(
+                f"HTTP error fetching ABI: {e}", url=api_url, status_code=e.response.status_code
+            ) from e
+        except httpx.TimeoutException as e:
+            raise NetworkError(f"Timeout fetching ABI from {network}", url=api_url) from e
+        except httpx.RequestError as e:
+            raise NetworkError(f"Request failed: {e}", url=api_url) from e
+
+        data = response.json()
+
+        if data.get("status") == "1":
+            return data.get("result")
+
+        # Check for specific errors
+        result = data.get("result", "")
+
+        if "not verified" in result.lower() or "source code not verified" in result.lower():
             return None
 
+        # Other error
+        return None
+
     async def _detect_proxy(
         self,
         address: str,
@@ -217,10 +354,14 @@ class EtherscanFetcher(ABIFetcher):
         """
         Detect if address is a proxy and return implementation.
 
+        All probes are launched concurrently and the first one to find an
+        implementation wins; the remaining probes are cancelled.
+
         Checks for common proxy patterns:
-        - EIP-1967 storage slots
-        - EIP-1822 (UUPS)
-        - OpenZeppelin TransparentProxy
+        - EIP-1967 implementation slot (OpenZeppelin TransparentProxy)
+        - EIP-1967 beacon slot, resolved through the beacon's implementation()
+        - EIP-1822 (UUPS) proxiable slot
+        - implementation() getter
         - Minimal proxy (EIP-1167)
 
         Args:
@@ -232,26 +373,68 @@ class EtherscanFetcher(ABIFetcher):
         Returns:
             Implementation address if proxy, None otherwise
         """
-        # Try EIP-1967 implementation slot using Etherscan proxy API
-        impl = await self._get_storage_at(api_url, address, self.IMPLEMENTATION_SLOT, api_key)
-        if impl and impl != "0x" + "0" * 64 and len(impl) >= 42:
-            # Extract address from bytes32 (last 20 bytes = 40 hex chars)
-            impl_addr = "0x" + impl[-40:]
-            if self._is_valid_address(impl_addr) and impl_addr != "0x" + "0" * 40:
-                return impl_addr
+        return await self._first_conclusive(
+            [
+                self._read_address_slot(api_url, address, self.IMPLEMENTATION_SLOT, api_key),
+                self._call_implementation_function(api_url, address, api_key),
+                self._detect_minimal_proxy(api_url, address, api_key),
+                self._read_address_slot(api_url, address, self.PROXIABLE_SLOT, api_key),
+                self._detect_beacon_proxy(api_url, address, api_key),
+            ]
+        )
 
-        # Try calling implementation() function
-        impl = await self._call_implementation_function(api_url, address, api_key)
-        if impl:
-            return impl
+    @staticmethod
+    async def _first_conclusive(probes: List[Awaitable[Optional[str]]]) -> Optional[str]:
+        """
+        Run probes concurrently and return the first non-empty result.
 
-        # Try detecting EIP-1167 minimal proxy from bytecode
-        impl = await self._detect_minimal_proxy(api_url, address, api_key)
-        if impl:
-            return impl
+        When several probes finish in the same step, the one listed first
+        wins. Probes that raise are treated as inconclusive.
 
+        Args:
+            probes: Awaitables resolving to an address or None
+
+        Returns:
+            First conclusive result, or None if every probe came back empty
+        """
+        tasks = [asyncio.ensure_future(probe) for probe in probes]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task in done and not task.cancelled() and task.exception() is None:
+                        result = task.result()
+                        if result:
+                            return result
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _read_address_slot(
+        self, api_url: str, address: str, slot: str, api_key: Optional[str]
+    ) -> Optional[str]:
+        """Read an address stored in a proxy storage slot."""
+        value = await self._get_storage_at(api_url, address, slot, api_key)
+        if value and value != "0x" + "0" * 64 and len(value) >= 42:
+            # Extract address from bytes32 (last 20 bytes = 40 hex chars)
+            impl_addr = "0x" + value[-40:]
+            if self._is_valid_address(impl_addr) and impl_addr != "0x" + "0" * 40:
+                return impl_addr
         return None
 
+    async def _detect_beacon_proxy(
+        self, api_url: str, address: str, api_key: Optional[str]
+    ) -> Optional[str]:
+        """Detect an EIP-1967 beacon proxy and ask the beacon for its implementation."""
+        beacon = await self._read_address_slot(api_url, address, self.BEACON_SLOT, api_key)
+        if beacon is None:
+            return None
+        return await self._call_implementation_function(api_url, beacon, api_key)
+
     async def _get_storage_at(
         self, api_url: str, address: str, slot: str, api_key: Optional[str]
     ) -> Optional[str]:
@@ -267,11 +450,10 @@ class EtherscanFetcher(ABIFetcher):
             params["apikey"] = api_key
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url, params=params, timeout=10.0)
-                data = response.json()
-                if data.get("result"):
-                    return data["result"]
+            response = await self._request(api_url, params, api_key, self._config.probe_timeout)
+            data = response.json()
+            if data.get("result"):
+                return data["result"]
         except Exception:
             pass
 
@@ -293,14 +475,13 @@ class EtherscanFetcher(ABIFetcher):
             params["apikey"] = api_key
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url, params=params, timeout=10.0)
-                result = response.json().get("result")
-
-                if result and result != "0x" and len(result) >= 42:
-                    impl_addr = "0x" + result[-40:]
-                    if self._is_valid_address(impl_addr) and impl_addr != "0x" + "0" * 40:
-                        return impl_addr
+            response = await self._request(api_url, params, api_key, self._config.probe_timeout)
+            result = response.json().get("result")
+
+            if result and result != "0x" and len(result) >= 42:
+                impl_addr = "0x" + result[-40:]
+                if self._is_valid_address(impl_addr) and impl_addr != "0x" + "0" * 40:
+                    return impl_addr
         except Exception:
             pass
 
@@ -320,15 +501,15 @@ class EtherscanFetcher(ABIFetcher):
             params["apikey"] = api_key
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url, params=params, timeout=10.0)
-                code = response.json().get("result", "")
-
-                # EIP-1167 pattern: 0x363d3d373d3d3d363d73[20-byte-address]5af43d82803e903d91602b57fd5bf3
-                if len(code) >= 44 and code.startswith("0x363d3d373d3d3d363d73"):
-                    impl_addr = "0x" + code[22:62]
-                    if self._is_valid_address(impl_addr):
-                        return impl_addr
+            response = await self._request(api_url, params, api_key, self._config.probe_timeout)
+            code = response.json().get("result", "")
+
+            # EIP-1167 pattern: 0x363d3d373d3d3d363d73[20-byte-address]5af43d82803e903d91602b57fd5bf3
+            if len(code) >= 44 and code.startswith(MINIMAL_PROXY_PREFIX):
+                start = len(MINIMAL_PROXY_PREFIX)
+                impl_addr = "0x" + code[start : start + 40]
+                if self._is_valid_address(impl_addr):
+                    return impl_addr
         except Exception:
             pass
 
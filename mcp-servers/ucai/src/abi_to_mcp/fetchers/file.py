@@ -7,8 +7,9 @@ AGENT 2: This file needs full implementation. See AGENTS.md for requirements.
 
 import json
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from abi_to_mcp.fetchers.artifact import find_artifact_contract, iter_artifact_contracts
 from abi_to_mcp.fetchers.base import ABIFetcher
 from abi_to_mcp.core.models import FetchResult
 from abi_to_mcp.core.exceptions import ABINotFoundError, ABIParseError
@@ -22,25 +23,32 @@ class FileFetcher(ABIFetcher):
     - Plain ABI array: [{"type": "function", ...}]
     - Truffle/Hardhat artifact: {"abi": [...], "contractName": "..."}
     - Foundry output: {"abi": [...]}
+    - Hardhat build-info and solc standard-json output (multi-contract)
+
+    Files larger than STREAMING_THRESHOLD, multi-contract artifacts and
+    requests for a specific contract are read incrementally, so only the
+    selected ABI is held in memory.
     """
 
-    async def fetch(self, source: str, **kwargs) -> FetchResult:
+    # Files above this size (bytes) are streamed instead of json.load-ed
+    STREAMING_THRESHOLD = 16 * 1024 * 1024
+
+    async def fetch(self, source: str, contract: Optional[str] = None, **kwargs) -> FetchResult:
         """
         Load ABI from local file.
 
         Args:
             source: Path to JSON file
+            contract: Contract name or "path/File.sol:Name" to select from a
+                build-info or standard-json artifact
 
         Returns:
             FetchResult with ABI data
         """
-        path = Path(source).expanduser().resolve()
-
-        if not path.exists():
-            raise ABINotFoundError(source, f"File not found: {path}")
+        path = self._resolve_path(source)
 
-        if not path.is_file():
-            raise ABINotFoundError(source, f"Not a file: {path}")
+        if contract is not None or path.stat().st_size > self.STREAMING_THRESHOLD:
+            return self._fetch_streaming(path, contract)
 
         try:
             with open(path, "r", encoding="utf-8") as f:
@@ -50,6 +58,14 @@ class FileFetcher(ABIFetcher):
         except Exception as e:
             raise ABINotFoundError(source, f"Failed to read file: {e}") from e
 
+        # Multi-contract artifacts (build-info, standard-json output)
+        if (
+            isinstance(data, dict)
+            and "abi" not in data
+            and ("contracts" in data or "output" in data)
+        ):
+            return self._fetch_streaming(path, None)
+
         # Extract ABI from various formats
         abi, contract_name, compiler_version = self._extract_abi(data, str(path))
 
@@ -61,6 +77,29 @@ class FileFetcher(ABIFetcher):
             compiler_version=compiler_version,
         )
 
+    async def fetch_all(self, source: str) -> List[FetchResult]:
+        """
+        Load every contract ABI from an artifact.
+
+        Args:
+            source: Path to a build-info, standard-json or single-contract artifact
+
+        Returns:
+            One FetchResult per contract with a non-empty ABI
+        """
+        path = self._resolve_path(source)
+
+        return [
+            FetchResult(
+                abi=found.abi,
+                source="file",
+                source_location=str(path),
+                contract_name=found.name,
+                compiler_version=found.compiler_version,
+            )
+            for found in iter_artifact_contracts(path)
+        ]
+
     def can_handle(self, source: str) -> bool:
         """Check if source is a local file path."""
         # Check for common file path patterns
@@ -87,6 +126,33 @@ class FileFetcher(ABIFetcher):
 
         return False
 
+    def _resolve_path(self, source: str) -> Path:
+        """Resolve a source to an existing file path."""
+        path = Path(source).expanduser().resolve()
+
+        if not path.exists():
+            raise ABINotFoundError(source, f"File not found: {path}")
+
+        if not path.is_file():
+            raise ABINotFoundError(source, f"Not a file: {path}")
+
+        return path
+
+    def _fetch_streaming(self, path: Path, contract: Optional[str]) -> FetchResult:
+        """Stream a single contract's ABI out of a (large) artifact."""
+        try:
+            found = find_artifact_contract(path, contract)
+        except OSError as e:
+            raise ABINotFoundError(str(path), f"Failed to read file: {e}") from e
+
+        return FetchResult(
+            abi=found.abi,
+            source="file",
+            source_location=str(path),
+            contract_name=found.name,
+            compiler_version=found.compiler_version,
+        )
+
     def _extract_abi(self, data: Any, source_location: str = "memory") -> tuple:
         """
         Extract ABI from various file formats.
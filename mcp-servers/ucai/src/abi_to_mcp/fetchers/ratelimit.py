@@ -0,0 +1,299 @@
+"""Rate limiting module.
+
+This module provides token-bucket rate limiting for block explorer APIs.
+Buckets are keyed by (explorer, API key) and live in a process-wide
+RateLimiter, so every concurrent fetch using the same key draws from the
+same budget. Throttled responses (HTTP 429 or Etherscan's "Max rate limit
+reached" body) are retried with jittered exponential backoff, honoring
+Retry-After when the server sends it.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Requests per second allowed by each explorer API tier
+EXPLORER_RATE_LIMITS: Dict[str, Dict[str, float]] = {
+    "etherscan": {
+        "free": 5.0,
+        "standard": 10.0,
+        "advanced": 20.0,
+        "professional": 30.0,
+    },
+    "sourcify": {
+        "free": 10.0,
+    },
+}
+
+DEFAULT_TIER = "free"
+
+
+def resolve_rate(
+    explorer: str,
+    tier: Optional[str] = None,
+    override: Optional[float] = None,
+) -> float:
+    """
+    Get the request rate for an explorer tier.
+
+    Args:
+        explorer: Explorer family ("etherscan", "sourcify")
+        tier: API plan tier (default: "free")
+        override: Explicit requests per second, takes precedence over the tier
+
+    Returns:
+        Allowed requests per second
+
+    Raises:
+        ValueError: If the tier is unknown for the explorer
+    """
+    if override is not None:
+        if override <= 0:
+            raise ValueError(f"Rate limit must be positive, got {override}")
+        return float(override)
+
+    tiers = EXPLORER_RATE_LIMITS.get(explorer, EXPLORER_RATE_LIMITS["etherscan"])
+    tier = tier or DEFAULT_TIER
+    if tier not in tiers:
+        raise ValueError(
+            f"Unknown rate limit tier '{tier}' for {explorer}. Supported: {list(tiers.keys())}"
+        )
+    return tiers[tier]
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second with bursts up to `capacity`.
+
+    Tokens are reserved synchronously, so concurrent callers queue up in
+    arrival order; a caller that has to wait sleeps until its token is due.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, rate: float) -> None:
+        """Change the refill rate (e.g. when a key's tier is known)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+            self.capacity = max(1.0, rate)
+            self._tokens = min(self._tokens, self.capacity)
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        delay = self._reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+            # A backoff may have been requested while we slept
+            delay = self._blocked_until - time.monotonic()
+        return waited
+
+    def defer(self, delay: float) -> None:
+        """
+        Block every caller of this bucket for `delay` seconds.
+
+        Used when the server signals throttling, so that all concurrent
+        fetches sharing the key back off together.
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+    def _reserve(self) -> float:
+        """Reserve a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update."""
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Registry of token buckets keyed by explorer and API key.
+
+    Example:
+        limiter = get_rate_limiter()
+        bucket = limiter.bucket("api.etherscan.io", api_key, rate=5.0)
+        await bucket.acquire()
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty limiter."""
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(
+        self,
+        explorer: str,
+        api_key: Optional[str] = None,
+        rate: float = EXPLORER_RATE_LIMITS["etherscan"][DEFAULT_TIER],
+    ) -> TokenBucket:
+        """
+        Get the bucket for an (explorer, API key) pair, creating it on first use.
+
+        Args:
+            explorer: Explorer identifier (usually the API host)
+            api_key: API key, None for keyless access
+            rate: Requests per second for this key
+
+        Returns:
+            Shared TokenBucket
+        """
+        key = (explorer, api_key)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate)
+        if bucket.rate != rate:
+            bucket.configure(rate)
+        return bucket
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+
+_shared_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by all fetchers."""
+    return _shared_limiter
+
+
+def parse_retry_after(value: object) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if missing or malformed
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Compute the delay before retrying a throttled request.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base_delay: Delay for the first retry
+        max_delay: Upper bound for any delay
+        retry_after: Server-provided delay, used instead of backoff if present
+
+    Returns:
+        Delay in seconds
+    """
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    ceiling = min(max_delay, base_delay * float(2**attempt))
+    # Equal jitter: keep half the backoff, randomize the rest
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def throttle_status(response: httpx.Response) -> Tuple[bool, Optional[float]]:
+    """
+    Check whether a response signals throttling.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Tuple of (throttled, Retry-After seconds if provided)
+    """
+    if response.status_code != 429:
+        return False, None
+    headers = getattr(response, "headers", None) or {}
+    return True, parse_retry_after(headers.get("Retry-After"))
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    bucket: TokenBucket,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    is_throttled: Callable[[httpx.Response], Tuple[bool, Optional[float]]] = throttle_status,
+) -> httpx.Response:
+    """
+    Send a request through a token bucket, retrying while throttled.
+
+    Args:
+        send: Coroutine factory performing the request
+        bucket: Bucket to draw tokens from
+        max_retries: Retries after the first attempt
+        base_delay: Backoff delay for the first retry
+        max_delay: Upper bound for any backoff delay
+        is_throttled: Classifies a response as throttled
+
+    Returns:
+        The first non-throttled response, or the last throttled one once
+        retries are exhausted (callers turn it into RateLimitError)
+    """
+    attempt = 0
+    while True:
+        await bucket.acquire()
+        response = await send()
+        throttled, retry_after = is_throttled(response)
+        if not throttled or attempt >= max_retries:
+            return response
+
+        delay = backoff_delay(attempt, base_delay, max_delay, retry_after)
+        logger.debug(f"Throttled, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
+        bucket.defer(delay)
+        attempt += 1
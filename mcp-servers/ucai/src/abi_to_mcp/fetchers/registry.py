@@ -3,22 +3,101 @@
 AGENT 2: This file needs full implementation. See AGENTS.md for requirements.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from types import TracebackType
+from typing import List, Optional, Dict, Any, Type
+
+import httpx
+
 from abi_to_mcp.fetchers.base import ABIFetcher
+from abi_to_mcp.fetchers.cache import ABICache
+from abi_to_mcp.core.config import FetcherConfig
 from abi_to_mcp.core.models import FetchResult
+from abi_to_mcp.core.constants import NETWORKS
 from abi_to_mcp.core.exceptions import ABINotFoundError
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Try address fetchers one after another, in registration order
+STRATEGY_SEQUENTIAL = "sequential"
+# Query every address fetcher concurrently and keep the first valid ABI
+STRATEGY_RACE = "race"
+
+FETCH_STRATEGIES = (STRATEGY_SEQUENTIAL, STRATEGY_RACE)
 
 
 class FetcherRegistry:
-    """Registry that selects appropriate fetcher for a source."""
+    """Registry that selects appropriate fetcher for a source.
+
+    Use as an async context manager to release the fetchers' HTTP
+    connection pool when done:
+
+        async with create_default_registry() as registry:
+            result = await registry.fetch("0x...")
+
+    With the "race" strategy, address sources are sent to every address
+    fetcher at once and the first valid ABI wins; `stats` counts which
+    source served each fetch.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ABICache] = None,
+        offline: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        strategy: str = STRATEGY_SEQUENTIAL,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            cache: Optional persistent ABI cache for address sources
+            offline: Serve address sources only from the cache (expired entries included)
+            http_client: Shared HTTP client owned by the registry and closed by aclose()
+            strategy: Address fetch strategy, "sequential" or "race"
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy not in FETCH_STRATEGIES:
+            raise ValueError(
+                f"Unknown fetch strategy: {strategy}. Supported: {list(FETCH_STRATEGIES)}"
+            )
 
-    def __init__(self):
         self.fetchers: List[ABIFetcher] = []
+        self.cache = cache
+        self.offline = offline
+        self.strategy = strategy
+        self.stats: Dict[str, int] = {}
+        self._http_client = http_client
 
     def register(self, fetcher: ABIFetcher) -> None:
         """Register a fetcher."""
         self.fetchers.append(fetcher)
 
+    async def aclose(self) -> None:
+        """Close all fetchers and the shared HTTP client."""
+        for fetcher in self.fetchers:
+            await fetcher.aclose()
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self) -> "FetcherRegistry":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
     def get_fetcher(self, source: str) -> Optional[ABIFetcher]:
         """Get first fetcher that can handle the source."""
         for fetcher in self.fetchers:
@@ -26,10 +105,12 @@ class FetcherRegistry:
                 return fetcher
         return None
 
-    async def fetch(self, source: str, **kwargs) -> FetchResult:
+    async def fetch(self, source: str, **kwargs: Any) -> FetchResult:
         """
         Fetch from appropriate source with fallback.
 
+        Address sources are served from the cache when one is configured.
+
         Args:
             source: Source identifier
             **kwargs: Additional fetch options
@@ -40,6 +121,37 @@ class FetcherRegistry:
         Raises:
             ABINotFoundError: If no fetcher can retrieve the ABI
         """
+        if not self._is_address(source):
+            return await self._fetch_from_sources(source, **kwargs)
+
+        chain_id = self._resolve_chain_id(kwargs)
+
+        if self.cache is not None:
+            cached = self.cache.get(source, chain_id, allow_expired=self.offline)
+            if cached is not None:
+                self._record("cache")
+                return cached
+
+        if self.offline:
+            raise ABINotFoundError(
+                source,
+                f"Not in ABI cache for chain {chain_id} (offline mode)",
+                network=kwargs.get("network"),
+            )
+
+        if self.strategy == STRATEGY_RACE:
+            result = await self._race(source, **kwargs)
+        else:
+            result = await self._fetch_from_sources(source, **kwargs)
+        self._record(result.source)
+
+        if self.cache is not None:
+            self.cache.put(source, chain_id, result)
+
+        return result
+
+    async def _fetch_from_sources(self, source: str, **kwargs: Any) -> FetchResult:
+        """Fetch from the registered fetchers, falling back for addresses."""
         # Try fetcher that can handle the source
         fetcher = self.get_fetcher(source)
         if fetcher:
@@ -47,13 +159,13 @@ class FetcherRegistry:
                 return await fetcher.fetch(source, **kwargs)
             except ABINotFoundError:
                 # For addresses, try fallback fetchers
-                if source.startswith("0x") and len(source) == 42:
+                if self._is_address(source):
                     pass  # Continue to fallback
                 else:
                     raise
 
         # For Ethereum addresses, try all address-based fetchers as fallback
-        if source.startswith("0x") and len(source) == 42:
+        if self._is_address(source):
             errors = []
             for fetcher in self.fetchers:
                 if fetcher.can_handle(source):
@@ -69,21 +181,138 @@ class FetcherRegistry:
 
         raise ABINotFoundError(source, "No fetcher can handle this source")
 
+    async def _race(self, source: str, **kwargs: Any) -> FetchResult:
+        """
+        Query every address fetcher concurrently and return the first valid ABI.
+
+        Losing fetches are cancelled. A result that looks like an unresolved
+        proxy ABI (e.g. from Sourcify, which does not follow proxies) is held
+        back while a proxy-resolving fetcher is still running, and used only
+        if nothing better arrives. If every fetcher fails, the errors are
+        combined into a single ABINotFoundError.
+        """
+        fetchers = [f for f in self.fetchers if f.can_handle(source)]
+        if not fetchers:
+            raise ABINotFoundError(source, "No fetcher can handle this source")
+
+        tasks = {asyncio.ensure_future(f.fetch(source, **kwargs)): f for f in fetchers}
+        pending = set(tasks)
+        errors: List[str] = []
+        fallback: Optional[FetchResult] = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Several may finish in the same step: keep registration order
+                for task, fetcher in tasks.items():
+                    if task not in done:
+                        continue
+                    name = fetcher.__class__.__name__
+                    if task.cancelled():
+                        errors.append(f"{name}: cancelled")
+                        continue
+                    error = task.exception()
+                    if isinstance(error, ABINotFoundError):
+                        errors.append(f"{name}: {error.reason}")
+                    elif error is not None:
+                        errors.append(f"{name}: {error}")
+                    elif not task.result().abi:
+                        errors.append(f"{name}: empty ABI")
+                    else:
+                        result = task.result()
+                        if pending and not result.is_proxy and self._looks_like_proxy(result.abi):
+                            fallback = fallback or result
+                            continue
+                        logger.debug(f"Race for {source} won by {result.source}")
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if fallback is not None:
+            logger.debug(f"Race for {source} fell back to {fallback.source} proxy ABI")
+            return fallback
+
+        raise ABINotFoundError(source, f"All fetchers failed. Errors: {'; '.join(errors)}")
+
+    @staticmethod
+    def _looks_like_proxy(abi: List[Dict[str, Any]]) -> bool:
+        """Heuristic: ABI of a proxy whose implementation was not resolved."""
+        names = {item.get("name") for item in abi if item.get("type") == "function"}
+        has_fallback = any(item.get("type") == "fallback" for item in abi)
+        return has_fallback and bool(
+            names & {"implementation", "upgradeTo", "upgradeToAndCall", "admin"} or len(names) <= 2
+        )
+
+    def _record(self, source: str) -> None:
+        """Count which source served a fetch."""
+        self.stats[source] = self.stats.get(source, 0) + 1
+
+    @staticmethod
+    def _is_address(source: str) -> bool:
+        """Check if source looks like an Ethereum address."""
+        return source.startswith("0x") and len(source) == 42
+
+    @staticmethod
+    def _resolve_chain_id(kwargs: Dict[str, Any]) -> int:
+        """Resolve the chain ID from fetch options (default: mainnet)."""
+        if kwargs.get("chain_id") is not None:
+            return int(kwargs["chain_id"])
+        network = kwargs.get("network") or "mainnet"
+        return int(NETWORKS.get(network, NETWORKS["mainnet"])["chain_id"])
+
+
+def create_default_registry(
+    api_keys: Optional[Dict[str, str]] = None,
+    cache: Optional[ABICache] = None,
+    offline: bool = False,
+    config: Optional[FetcherConfig] = None,
+    strategy: Optional[str] = None,
+) -> FetcherRegistry:
+    """
+    Create registry with all default fetchers.
+
+    Network fetchers share one pooled HTTP client owned by the registry,
+    which is closed by FetcherRegistry.aclose().
 
-def create_default_registry(api_keys: Optional[Dict[str, str]] = None) -> FetcherRegistry:
-    """Create registry with all default fetchers."""
+    Args:
+        api_keys: Explorer API keys, e.g. {"etherscan": "..."}
+        cache: Optional persistent ABI cache for address sources
+        offline: Serve address sources only from the cache
+        config: Fetcher configuration; when given without a cache, its
+            use_cache, cache_ttl and offline settings pick the ABI cache
+        strategy: "sequential" or "race" (default: config.fetch_strategy)
+    """
+    from abi_to_mcp.fetchers.client import create_http_client
     from abi_to_mcp.fetchers.file import FileFetcher
     from abi_to_mcp.fetchers.etherscan import EtherscanFetcher
     from abi_to_mcp.fetchers.sourcify import SourcifyFetcher
 
-    registry = FetcherRegistry()
+    if config is not None:
+        offline = offline or config.offline
+        if cache is None and (config.use_cache or offline):
+            cache = ABICache(ttl=config.cache_ttl)
+    config = config or FetcherConfig()
+    strategy = strategy or config.fetch_strategy or STRATEGY_SEQUENTIAL
+    http_client = create_http_client(config)
+    registry = FetcherRegistry(
+        cache=cache, offline=offline, http_client=http_client, strategy=strategy
+    )
 
     # Order matters - file first, then etherscan, then sourcify
     registry.register(FileFetcher())
 
     etherscan_key = (api_keys or {}).get("etherscan")
-    registry.register(EtherscanFetcher(api_key=etherscan_key))
+    registry.register(EtherscanFetcher(api_key=etherscan_key, client=http_client, config=config))
 
-    registry.register(SourcifyFetcher())
+    registry.register(
+        SourcifyFetcher(
+            client=http_client,
+            config=config,
+            parallel_matches=strategy == STRATEGY_RACE,
+        )
+    )
 
     return registry
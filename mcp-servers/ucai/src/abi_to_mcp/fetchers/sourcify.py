@@ -3,9 +3,11 @@
 This module handles fetching ABIs from Sourcify.
 """
 
+import asyncio
 import json
 import re
-from typing import Optional, Dict, Any, List
+from types import TracebackType
+from typing import Optional, Dict, Any, List, Type
 
 try:
     import httpx
@@ -13,9 +15,21 @@ except ImportError:
     httpx = None
 
 from abi_to_mcp.fetchers.base import ABIFetcher
+from abi_to_mcp.fetchers.ratelimit import (
+    RateLimiter,
+    get_rate_limiter,
+    resolve_rate,
+    send_with_retry,
+)
+from abi_to_mcp.core.config import FetcherConfig
 from abi_to_mcp.core.models import FetchResult
 from abi_to_mcp.core.constants import NETWORKS
-from abi_to_mcp.core.exceptions import ABINotFoundError, NetworkError, InvalidAddressError
+from abi_to_mcp.core.exceptions import (
+    ABINotFoundError,
+    NetworkError,
+    InvalidAddressError,
+    RateLimitError,
+)
 
 
 class SourcifyFetcher(ABIFetcher):
@@ -28,17 +42,43 @@ class SourcifyFetcher(ABIFetcher):
     SOURCIFY_API = "https://sourcify.dev/server"
     ADDRESS_PATTERN = re.compile(r"^0x[a-fA-F0-9]{40}$")
 
-    def __init__(self):
-        """Initialize Sourcify fetcher."""
+    def __init__(
+        self,
+        client: Optional["httpx.AsyncClient"] = None,
+        config: Optional[FetcherConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        parallel_matches: bool = False,
+    ) -> None:
+        """
+        Initialize Sourcify fetcher.
+
+        Args:
+            client: Shared HTTP client (not closed by this fetcher)
+            config: Fetcher configuration for timeouts, retries and the connection pool
+            rate_limiter: Rate limiter (default: the process-wide shared limiter)
+            parallel_matches: Request full and partial matches concurrently
+                instead of trying partial only after full fails
+        """
         if httpx is None:
             raise ImportError(
                 "httpx is required for Sourcify fetcher. Install with: pip install httpx"
             )
 
-        self.client = httpx.AsyncClient(timeout=30.0)
+        if client is None:
+            from abi_to_mcp.fetchers.client import http_client_options
+
+            client = httpx.AsyncClient(**http_client_options(config))
+            self._owns_client = True
+        else:
+            self._owns_client = False
+
+        self.client = client
+        self._config: Optional[FetcherConfig] = config
+        self._rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.parallel_matches = parallel_matches
 
     async def fetch(
-        self, source: str, chain_id: int = 1, network: Optional[str] = None, **kwargs
+        self, source: str, chain_id: int = 1, network: Optional[str] = None, **kwargs: Any
     ) -> FetchResult:
         """
         Fetch ABI from Sourcify.
@@ -60,6 +100,16 @@ class SourcifyFetcher(ABIFetcher):
         if network and network in NETWORKS:
             chain_id = NETWORKS[network]["chain_id"]
 
+        if self.parallel_matches:
+            result = await self._fetch_matches_concurrently(address, chain_id)
+            if result:
+                return result
+            raise ABINotFoundError(
+                source=address,
+                reason=f"Contract not found on Sourcify (chain_id: {chain_id})",
+                network=network,
+            )
+
         # Try full match first
         try:
             result = await self._fetch_match(address, chain_id, "full_match")
@@ -82,6 +132,36 @@ class SourcifyFetcher(ABIFetcher):
             network=network,
         )
 
+    async def _fetch_matches_concurrently(
+        self, address: str, chain_id: int
+    ) -> Optional[FetchResult]:
+        """
+        Request full and partial matches at once, preferring the full match.
+
+        The partial request is cancelled as soon as a full match arrives;
+        otherwise the partial match is used.
+        """
+        full = asyncio.ensure_future(self._fetch_match(address, chain_id, "full_match"))
+        partial = asyncio.ensure_future(self._fetch_match(address, chain_id, "partial_match"))
+
+        try:
+            try:
+                result = await full
+                if result:
+                    return result
+            except ABINotFoundError:
+                pass
+
+            try:
+                return await partial
+            except ABINotFoundError:
+                return None
+        finally:
+            for task in (full, partial):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(full, partial, return_exceptions=True)
+
     async def _fetch_match(
         self, address: str, chain_id: int, match_type: str
     ) -> Optional[FetchResult]:
@@ -89,7 +169,7 @@ class SourcifyFetcher(ABIFetcher):
         url = f"{self.SOURCIFY_API}/files/{match_type}/{chain_id}/{address}"
 
         try:
-            response = await self.client.get(url)
+            response = await self._get(url)
 
             if response.status_code == 404:
                 raise ABINotFoundError(source=address, reason=f"No {match_type} found")
@@ -100,6 +180,8 @@ class SourcifyFetcher(ABIFetcher):
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 raise ABINotFoundError(source=address, reason=f"No {match_type} found") from e
+            if e.response.status_code == 429:
+                raise RateLimitError("Sourcify") from e
             raise NetworkError(
                 f"HTTP error: {e}", url=url, status_code=e.response.status_code
             ) from e
@@ -108,6 +190,22 @@ class SourcifyFetcher(ABIFetcher):
 
         return self._parse_files(files, address)
 
+    async def _get(self, url: str) -> "httpx.Response":
+        """GET through the shared rate limiter, retrying while throttled."""
+        config = self._config or FetcherConfig()
+        limiter = self._rate_limiter or get_rate_limiter()
+        bucket = limiter.bucket(
+            "sourcify", None, resolve_rate("sourcify", override=config.rate_limit)
+        )
+
+        return await send_with_retry(
+            lambda: self.client.get(url),
+            bucket,
+            max_retries=config.max_retries,
+            base_delay=config.retry_delay,
+            max_delay=config.max_retry_delay,
+        )
+
     def _parse_files(self, files: List[Dict[str, Any]], address: str) -> FetchResult:
         """Parse Sourcify files to extract ABI."""
         abi = None
@@ -163,10 +261,20 @@ class SourcifyFetcher(ABIFetcher):
         """Check if source is an Ethereum address."""
         return bool(self.ADDRESS_PATTERN.match(source))
 
-    async def __aenter__(self):
+    async def __aenter__(self) -> "SourcifyFetcher":
         """Async context manager entry."""
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
         """Async context manager exit."""
-        await self.client.aclose()
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this fetcher created it."""
+        if self._owns_client:
+            await self.client.aclose()
@@ -1,25 +1,88 @@
 """Server generator module.
 
 Orchestrates all generators to produce a complete MCP server package.
+
+In incremental mode the generator records, in a manifest in the output
+directory, a hash of each file's template and rendering context together
+with a hash of the content written. Files whose hash matches the manifest
+(and whose content on disk is intact) are neither re-rendered nor rewritten,
+so regenerating an unchanged server leaves every file and mtime untouched.
+
+The contract ABI is written to an abi.json sidecar that the server reads on
+its first tool call. Servers with more than SPLIT_MODULES_THRESHOLD tools get
+one module per tool group (tools_read.py, tools_write.py, tools_events.py)
+next to a shared common.py, so no single module grows to thousands of lines.
+
+A bundle serves many contracts from one server: each contract's tools are a
+module under contracts/<namespace>/ (generate_bundle_contract()), loaded by
+a server.py that shares one Web3 client and read cache per network between
+them (generate_bundle()).
 """
 
+import hashlib
 import json
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, meta, select_autoescape
 
-from abi_to_mcp.core.config import GeneratorConfig
-from abi_to_mcp.core.constants import NETWORKS
+from abi_to_mcp.core.compiled import CompiledABI, load_compiled
+from abi_to_mcp.core.config import GeneratorConfig, default_cache_dir
+from abi_to_mcp.core.constants import IMMUTABLE_GETTERS, NETWORKS, SPLIT_MODULES_THRESHOLD
+from abi_to_mcp.core.exceptions import GeneratorError
 from abi_to_mcp.core.models import (
+    ABIFunction,
+    BundleContract,
     GeneratedFile,
     GeneratedServer,
     MappedResource,
     MappedTool,
     ParsedABI,
+    StateMutability,
 )
 from abi_to_mcp.generator.resource_generator import ResourceGenerator
+from abi_to_mcp.generator.templates import typing_names
 from abi_to_mcp.generator.tool_generator import ToolGenerator
+from abi_to_mcp.utils.logging import get_logger
+from abi_to_mcp.version import __version__
+
+logger = get_logger(__name__)
+
+# Manifest written to the output directory by incremental generation
+MANIFEST_FILENAME = ".abi-to-mcp-manifest.json"
+
+# Bump when render keys change meaning; older manifests are ignored.
+MANIFEST_VERSION = 2
+
+# ABI sidecar read by generated servers
+ABI_FILENAME = "abi.json"
+
+# Networks and contracts of a bundle server, read by its bundle_runtime.py
+BUNDLE_CONFIG_FILENAME = "bundle.json"
+
+# Tool group -> module of a split server, in import order
+TOOL_MODULES = {"read": "tools_read", "write": "tools_write", "events": "tools_events"}
+
+
+@dataclass
+class _PreviousOutput:
+    """Files recorded by the last incremental generation into a directory."""
+
+    output_dir: Path
+    context_key: str
+    entries: dict[str, dict[str, Any]]
+
+    def reuse(self, path: str, render_key: str) -> str | None:
+        """Return the file's content if it was rendered from the same key and is intact."""
+        entry = self.entries.get(path)
+        if not entry or entry.get("key") != render_key:
+            return None
+        content = _read_text(self.output_dir / path)
+        if content is None or _content_hash(content) != entry.get("sha256"):
+            return None
+        return content
 
 
 class ServerGenerator:
@@ -41,6 +104,7 @@ class ServerGenerator:
         >>> for f in server.files:
         ...     print(f.path)
         server.py
+        abi.json
         config.py
         README.md
         pyproject.toml
@@ -58,23 +122,47 @@ class ServerGenerator:
         self.jinja_env = self._create_jinja_env()
         self.tool_gen = ToolGenerator(self.jinja_env)
         self.resource_gen = ResourceGenerator(self.jinja_env)
+        self._template_sources: dict[str, str] = {}
 
     def _create_jinja_env(self) -> Environment:
-        """Create and configure the Jinja2 environment."""
+        """Create and configure the Jinja2 environment.
+
+        Compiled templates are kept in a persistent bytecode cache (keyed by
+        template source and Jinja version), so only the first generator in a
+        fresh environment pays for compiling them.
+        """
         env = Environment(
             loader=PackageLoader("abi_to_mcp.generator", "templates"),
             autoescape=select_autoescape(default=False),
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            bytecode_cache=self._create_bytecode_cache(),
         )
 
         # Add custom filters
         env.filters["to_snake_case"] = self._to_snake_case
         env.filters["to_package_name"] = self._to_package_name
+        env.filters["typing_names"] = typing_names
 
         return env
 
+    def _create_bytecode_cache(self) -> FileSystemBytecodeCache | None:
+        """Create the compiled-template cache, or None if it is disabled or unusable."""
+        if not self.config.template_cache:
+            return None
+
+        directory = self.config.template_cache_dir
+        if directory is None:
+            directory = default_cache_dir() / "templates"
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Template cache disabled, cannot create {directory}: {e}")
+            return None
+        return FileSystemBytecodeCache(str(directory))
+
     def generate(
         self,
         parsed: ParsedABI,
@@ -86,6 +174,10 @@ class ServerGenerator:
     ) -> GeneratedServer:
         """Generate a complete MCP server package.
 
+        With config.incremental, files recorded in the manifest of
+        config.output_dir with the same template and context are read back
+        from disk instead of being rendered.
+
         Args:
             parsed: The parsed ABI
             tools: List of mapped tools
@@ -97,50 +189,46 @@ class ServerGenerator:
         Returns:
             GeneratedServer with all generated files
         """
-        # Determine server name
-        server_name = self._determine_server_name(
-            contract_name, parsed.detected_standard, contract_address
+        context = self._contract_context(
+            parsed, tools, resources, contract_address, network, contract_name
         )
+        tools = context["tools"]
+        read_tools = context["read_tools"]
+        write_tools = context["write_tools"]
+        server_name = context["server_name"]
 
-        # Get network configuration
-        network_config = NETWORKS.get(network, NETWORKS["mainnet"])
-
-        # Separate read/write tools
-        read_tools = [t for t in tools if t.tool_type == "read"]
-        write_tools = [t for t in tools if t.tool_type in ("write", "write_payable")]
-
-        # Filter write tools if read_only mode
-        if self.config.read_only:
-            tools = read_tools
-            write_tools = []
-
-        # Prepare template context
-        context = self._build_context(
-            parsed=parsed,
-            tools=tools,
-            resources=resources,
-            read_tools=read_tools,
-            write_tools=write_tools,
-            contract_address=contract_address,
-            network=network,
-            network_config=network_config,
-            server_name=server_name,
-        )
+        previous = self._previous_output(context)
 
         # Generate all files
         files = []
 
         # Main server file
-        files.append(self._generate_server_file(context))
+        files.append(self._generate_server_file(context, previous))
+
+        # Shared runtime and tool group modules of a split server
+        if context["split_modules"]:
+            files.append(self._render_file("common.py", "common.py.jinja2", context, previous))
+            for group, module in context["tool_modules"].items():
+                files.append(
+                    self._render_file(
+                        f"{module}.py",
+                        "tools_module.py.jinja2",
+                        {**context, "group": group},
+                        previous,
+                    )
+                )
+
+        # ABI sidecar
+        files.append(self._generate_abi_file(context, previous))
 
         # Configuration file
-        files.append(self._generate_config_file(context))
+        files.append(self._generate_config_file(context, previous))
 
         # README
-        files.append(self._generate_readme(context))
+        files.append(self._generate_readme(context, previous))
 
         # pyproject.toml
-        files.append(self._generate_pyproject(context))
+        files.append(self._generate_pyproject(context, previous))
 
         # requirements.txt
         files.append(self._generate_requirements())
@@ -160,6 +248,247 @@ class ServerGenerator:
             network=network,
         )
 
+    def generate_compiled(
+        self,
+        compiled: CompiledABI | str | Path,
+        contract_address: str,
+        network: str,
+        contract_name: str | None = None,
+    ) -> GeneratedServer:
+        """Generate a server from a compiled ABI, skipping the parser and mapper.
+
+        Tools and resources are selected according to the generator's
+        read_only and include_events settings.
+
+        Args:
+            compiled: Compiled ABI, or the path of a compiled artifact
+            contract_address: Target contract address
+            network: Target network name
+            contract_name: Optional contract name
+
+        Returns:
+            GeneratedServer with all generated files
+        """
+        if not isinstance(compiled, CompiledABI):
+            compiled = load_compiled(compiled)
+
+        tools, resources = compiled.select(
+            read_only=self.config.read_only, include_events=self.config.include_events
+        )
+        return self.generate(
+            parsed=compiled.parsed,
+            tools=tools,
+            resources=resources,
+            contract_address=contract_address,
+            network=network,
+            contract_name=contract_name,
+        )
+
+    def generate_bundle_contract(
+        self,
+        parsed: ParsedABI,
+        tools: list[MappedTool],
+        resources: list[MappedResource],
+        namespace: str,
+        contract_address: str,
+        network: str,
+        contract_name: str | None = None,
+    ) -> GeneratedServer:
+        """Generate one contract's module of a bundle server.
+
+        The module (__init__.py, with its abi.json) is written to
+        contracts/<namespace>/ of the bundle and registers the contract's
+        tools, named <namespace>__<tool>, on the bundle's server. Its address
+        and network are read from bundle.json (see generate_bundle()).
+
+        Args:
+            parsed: The parsed ABI
+            tools: List of mapped tools
+            resources: List of mapped resources
+            namespace: Package name and tool name prefix (a Python identifier)
+            contract_address: Target contract address
+            network: Target network name
+            contract_name: Optional contract name
+
+        Returns:
+            GeneratedServer with the module's files
+        """
+        if not namespace.isidentifier():
+            raise GeneratorError(
+                f"Bundle namespace must be a Python identifier: {namespace!r}",
+                details={"namespace": namespace},
+            )
+
+        context = self._contract_context(
+            parsed, tools, resources, contract_address, network, contract_name
+        )
+        context.update(
+            bundle="contract",
+            namespace=namespace,
+            contract_name=contract_name or context["server_name"],
+            split_modules=False,
+        )
+        previous = self._previous_output(context)
+
+        files = [
+            self._render_file("__init__.py", "bundle_contract.py.jinja2", context, previous),
+            self._generate_abi_file(context, previous),
+        ]
+
+        return GeneratedServer(
+            files=files,
+            tool_count=len(context["tools"]),
+            resource_count=len(resources),
+            read_tools=[t.name for t in context["read_tools"]],
+            write_tools=[t.name for t in context["write_tools"]],
+            events=[r.name for r in resources],
+            server_name=context["server_name"],
+            contract_address=contract_address,
+            network=network,
+        )
+
+    def generate_bundle(
+        self, contracts: list[BundleContract], server_name: str | None = None
+    ) -> GeneratedServer:
+        """Generate the server of a bundle whose contract modules are generated.
+
+        The bundle's server.py loads contracts/<namespace> for every entry of
+        bundle.json. All contracts share bundle_runtime.py: one FastMCP
+        server, and per network one Web3 client and one read cache.
+
+        Args:
+            contracts: The bundle's contracts, whose modules were generated with
+                generate_bundle_contract()
+            server_name: Server name (default: config.server_name or "Contract Bundle")
+
+        Returns:
+            GeneratedServer with the bundle-level files
+        """
+        if not contracts:
+            raise GeneratorError("A bundle needs at least one contract")
+        namespaces = [c.namespace for c in contracts]
+        duplicates = sorted({ns for ns in namespaces if namespaces.count(ns) > 1})
+        if duplicates:
+            raise GeneratorError(
+                f"Duplicate bundle namespaces: {', '.join(duplicates)}",
+                details={"namespaces": duplicates},
+            )
+
+        server_name = server_name or self.config.server_name or "Contract Bundle MCP Server"
+        networks = list(dict.fromkeys(c.network for c in contracts))
+        network_configs = {
+            network: NETWORKS.get(network, NETWORKS["mainnet"]) for network in networks
+        }
+        has_reads = any(c.read_tools for c in contracts)
+        has_events = any(c.events for c in contracts)
+
+        context = {
+            "server_name": server_name,
+            "bundle": "server",
+            "contracts": contracts,
+            "networks": networks,
+            "network_configs": network_configs,
+            "default_network": networks[0],
+            "has_reads": has_reads,
+            "has_events": has_events,
+            "include_utilities": self.config.include_utilities,
+            "include_metrics": self.config.include_metrics,
+            "async_mode": self.config.async_mode,
+            "output_path": str(self.config.output_dir),
+        }
+        previous = self._previous_output(context)
+
+        config = {
+            "networks": {
+                network: {
+                    "chain_id": network_configs[network].get("chain_id", 1),
+                    "rpc": network_configs[network].get("rpc", "https://eth.llamarpc.com"),
+                    "multicall3": network_configs[network].get("multicall3"),
+                }
+                for network in networks
+            },
+            "contracts": {
+                c.namespace: {"name": c.name, "address": c.address, "network": c.network}
+                for c in contracts
+            },
+        }
+
+        files = [
+            self._render_file(
+                "server.py", "bundle_server.py.jinja2", context, previous, is_executable=True
+            ),
+            self._render_file("bundle_runtime.py", "bundle_runtime.py.jinja2", context, previous),
+            GeneratedFile(path=BUNDLE_CONFIG_FILENAME, content=json.dumps(config, indent=2) + "\n"),
+            GeneratedFile(
+                path="contracts/__init__.py",
+                content='"""Contract modules of the bundle, one package per bundle.json entry."""\n',
+            ),
+            self._render_file("README.md", "bundle_readme.md.jinja2", context, previous),
+            self._generate_requirements(),
+            self._generate_bundle_env_example(context),
+        ]
+
+        return GeneratedServer(
+            files=files,
+            tool_count=sum(len(c.read_tools) + len(c.write_tools) for c in contracts),
+            resource_count=sum(len(c.events) for c in contracts),
+            read_tools=[f"{c.namespace}__{name}" for c in contracts for name in c.read_tools],
+            write_tools=[f"{c.namespace}__{name}" for c in contracts for name in c.write_tools],
+            events=[f"{c.namespace}__{name}" for c in contracts for name in c.events],
+            server_name=server_name,
+            contract_address="",
+            network=", ".join(networks),
+        )
+
+    def _contract_context(
+        self,
+        parsed: ParsedABI,
+        tools: list[MappedTool],
+        resources: list[MappedResource],
+        contract_address: str,
+        network: str,
+        contract_name: str | None,
+    ) -> dict[str, Any]:
+        """Build the rendering context of one contract's tools."""
+        # Determine server name
+        server_name = self._determine_server_name(
+            contract_name, parsed.detected_standard, contract_address
+        )
+
+        # Get network configuration
+        network_config = NETWORKS.get(network, NETWORKS["mainnet"])
+
+        # Separate read/write tools
+        read_tools = [t for t in tools if t.tool_type == "read"]
+        write_tools = [t for t in tools if t.tool_type in ("write", "write_payable")]
+
+        # Filter write tools if read_only mode
+        if self.config.read_only:
+            tools = read_tools
+            write_tools = []
+
+        return self._build_context(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            read_tools=read_tools,
+            write_tools=write_tools,
+            contract_address=contract_address,
+            network=network,
+            network_config=network_config,
+            server_name=server_name,
+        )
+
+    def _previous_output(self, context: dict[str, Any]) -> _PreviousOutput | None:
+        """Files of the last incremental generation into config.output_dir."""
+        if not self.config.incremental:
+            return None
+        return _PreviousOutput(
+            output_dir=Path(self.config.output_dir),
+            context_key=self._context_key(context),
+            entries=self._load_manifest(Path(self.config.output_dir)),
+        )
+
     def _build_context(
         self,
         parsed: ParsedABI,
@@ -173,12 +502,16 @@ class ServerGenerator:
         server_name: str,
     ) -> dict[str, Any]:
         """Build the template rendering context."""
-        # Serialize ABI to JSON for embedding
-        abi_json = json.dumps(parsed.raw_abi, indent=2)
-
         # Create package name from server name
         package_name = self._to_package_name(server_name)
 
+        resources = resources if self.config.include_events else []
+        write_tools = write_tools if not self.config.read_only else []
+        split_modules = self.config.split_modules
+        if split_modules is None:
+            split_modules = len(tools) + len(resources) > SPLIT_MODULES_THRESHOLD
+        groups = {"read": read_tools, "write": write_tools, "events": resources}
+
         return {
             # Server identification
             "server_name": server_name,
@@ -187,67 +520,168 @@ class ServerGenerator:
             # Contract info
             "contract_address": contract_address,
             "detected_standard": parsed.detected_standard,
-            "abi_json": abi_json,
+            "raw_abi": parsed.raw_abi,
             # Network info
             "network": network,
             "chain_id": network_config.get("chain_id", 1),
             "default_rpc": network_config.get("rpc", "https://eth.llamarpc.com"),
             "currency": network_config.get("currency", "ETH"),
+            "multicall3_address": network_config.get("multicall3"),
+            "immutable_reads": self._immutable_reads(parsed, read_tools),
             # Tools and resources
             "tools": tools,
-            "resources": resources if self.config.include_events else [],
+            "resources": resources,
             "read_tools": read_tools,
-            "write_tools": write_tools if not self.config.read_only else [],
+            "write_tools": write_tools,
+            # Module layout
+            "split_modules": split_modules,
+            "tool_modules": {
+                group: module for group, module in TOOL_MODULES.items() if groups[group]
+            },
             # Settings
             "simulation_default": self.config.simulation_default,
             "read_only": self.config.read_only,
             "include_utilities": self.config.include_utilities,
             "include_events": self.config.include_events,
+            "include_metrics": self.config.include_metrics,
+            "async_mode": self.config.async_mode,
             # Output path for documentation
             "output_path": str(self.config.output_dir),
         }
 
-    def _generate_server_file(self, context: dict[str, Any]) -> GeneratedFile:
-        """Generate the main server.py file."""
-        template = self.jinja_env.get_template("server.py.jinja2")
-        content = template.render(**context)
+    def _immutable_reads(self, parsed: ParsedABI, read_tools: list[MappedTool]) -> list[str]:
+        """Find read tools whose result cannot change after deployment.
 
-        return GeneratedFile(
-            path="server.py",
-            content=content,
-            is_executable=True,
+        These are pure functions and zero-argument getters that are either
+        well-known token metadata (IMMUTABLE_GETTERS) or named in CONSTANT_CASE,
+        Solidity's convention for constants and immutables. Every overload of
+        a name with the tool's arity must qualify.
+        """
+        immutable = []
+        for tool in read_tools:
+            functions = [
+                f
+                for f in parsed.functions
+                if f.name == tool.original_name and len(f.inputs) == len(tool.parameters)
+            ]
+            if functions and all(self._is_immutable(f) for f in functions):
+                immutable.append(tool.name)
+        return immutable
+
+    @staticmethod
+    def _is_immutable(function: ABIFunction) -> bool:
+        """Check whether a function's result is fixed for given arguments."""
+        if function.state_mutability == StateMutability.PURE:
+            return True
+        if function.inputs or function.state_mutability != StateMutability.VIEW:
+            return False
+        return function.name in IMMUTABLE_GETTERS or function.name.isupper()
+
+    def _generate_server_file(
+        self, context: dict[str, Any], previous: _PreviousOutput | None = None
+    ) -> GeneratedFile:
+        """Generate the main server.py file."""
+        return self._render_file(
+            "server.py", "server.py.jinja2", context, previous, is_executable=True
         )
 
-    def _generate_config_file(self, context: dict[str, Any]) -> GeneratedFile:
+    def _generate_config_file(
+        self, context: dict[str, Any], previous: _PreviousOutput | None = None
+    ) -> GeneratedFile:
         """Generate the config.py file."""
-        template = self.jinja_env.get_template("config.py.jinja2")
-        content = template.render(**context)
+        return self._render_file("config.py", "config.py.jinja2", context, previous)
 
-        return GeneratedFile(
-            path="config.py",
-            content=content,
-        )
-
-    def _generate_readme(self, context: dict[str, Any]) -> GeneratedFile:
+    def _generate_readme(
+        self, context: dict[str, Any], previous: _PreviousOutput | None = None
+    ) -> GeneratedFile:
         """Generate the README.md file."""
-        template = self.jinja_env.get_template("readme.md.jinja2")
-        content = template.render(**context)
+        return self._render_file("README.md", "readme.md.jinja2", context, previous)
 
+    def _generate_pyproject(
+        self, context: dict[str, Any], previous: _PreviousOutput | None = None
+    ) -> GeneratedFile:
+        """Generate the pyproject.toml file."""
+        return self._render_file("pyproject.toml", "pyproject.toml.jinja2", context, previous)
+
+    def _render_file(
+        self,
+        path: str,
+        template_name: str,
+        context: dict[str, Any],
+        previous: _PreviousOutput | None,
+        is_executable: bool = False,
+    ) -> GeneratedFile:
+        """Render a template, or reuse the file on disk if its render key is unchanged."""
+        render_key = None
+        if previous is not None:
+            render_key = self._render_key(template_name, previous.context_key)
+            content = previous.reuse(path, render_key)
+            if content is not None:
+                return GeneratedFile(
+                    path=path,
+                    content=content,
+                    is_executable=is_executable,
+                    render_key=render_key,
+                )
+
+        template = self.jinja_env.get_template(template_name)
         return GeneratedFile(
-            path="README.md",
-            content=content,
+            path=path,
+            content=template.render(**context),
+            is_executable=is_executable,
+            render_key=render_key,
         )
 
-    def _generate_pyproject(self, context: dict[str, Any]) -> GeneratedFile:
-        """Generate the pyproject.toml file."""
-        template = self.jinja_env.get_template("pyproject.toml.jinja2")
-        content = template.render(**context)
+    def _generate_abi_file(
+        self, context: dict[str, Any], previous: _PreviousOutput | None = None
+    ) -> GeneratedFile:
+        """Generate the abi.json sidecar the server loads on its first tool call."""
+        render_key = None
+        if previous is not None:
+            render_key = _hash_parts(ABI_FILENAME, previous.context_key)
+            content = previous.reuse(ABI_FILENAME, render_key)
+            if content is not None:
+                return GeneratedFile(path=ABI_FILENAME, content=content, render_key=render_key)
 
         return GeneratedFile(
-            path="pyproject.toml",
-            content=content,
+            path=ABI_FILENAME,
+            content=json.dumps(context["raw_abi"], indent=2) + "\n",
+            render_key=render_key,
         )
 
+    def _render_key(self, template_name: str, context_key: str) -> str:
+        """Hash a template's source (and its includes) with the rendering context hash."""
+        return _hash_parts(template_name, self._template_source(template_name), context_key)
+
+    def _template_source(self, template_name: str) -> str:
+        """Source of a template followed by the sources of the templates it includes."""
+        if template_name not in self._template_sources:
+            loader = self.jinja_env.loader
+            assert loader is not None
+            source, _, _ = loader.get_source(self.jinja_env, template_name)
+            # Dynamic includes (None) cannot be resolved statically
+            included = {
+                name
+                for name in meta.find_referenced_templates(self.jinja_env.parse(source))
+                if name is not None
+            }
+            self._template_sources[template_name] = "\0".join(
+                [source] + [self._template_source(name) for name in sorted(included)]
+            )
+        return self._template_sources[template_name]
+
+    @staticmethod
+    def _context_key(context: dict[str, Any]) -> str:
+        """Hash a rendering context (tools and resources included)."""
+        keyed = dict(context)
+        # read_tools and write_tools are subsets of tools, which is hashed in full
+        for group in ("read_tools", "write_tools"):
+            if group in context:
+                keyed[group] = [t.name for t in context[group]]
+        # Dataclass reprs are deterministic and much cheaper than asdict()
+        text = json.dumps(keyed, sort_keys=True, default=repr)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
     def _generate_requirements(self) -> GeneratedFile:
         """Generate the requirements.txt file."""
         requirements = [
@@ -275,19 +709,78 @@ class ServerGenerator:
             "# Only needed if you want to execute transactions",
             "# PRIVATE_KEY=your-private-key-here",
             "",
+            "# Multicall3 contract used by batch_read (empty: run calls sequentially)",
+            f"# MULTICALL3_ADDRESS={context['multicall3_address'] or ''}",
+            "",
+            "# Read-result cache (0 disables) and block-number check interval in seconds",
+            "# READ_CACHE_SIZE=1024",
+            "# READ_CACHE_BLOCK_INTERVAL=1.0",
+            "",
+            "# Event queries: blocks per eth_getLogs, concurrent requests, local index",
+            "# LOG_CHUNK_SIZE=5000",
+            "# LOG_CONCURRENCY=4",
+            "# EVENT_INDEX_PATH=./events.sqlite3",
+            "# EVENT_INDEX_CONFIRMATIONS=12",
+            "",
             "# Optional settings",
             "# GAS_LIMIT_MULTIPLIER=1.2",
             "# MAX_GAS_PRICE_GWEI=500",
             "# TX_TIMEOUT=120",
             "# LOG_LEVEL=INFO",
+            "# MCP_TRANSPORT=stdio",
             "",
         ]
+        if context["include_metrics"]:
+            lines += [
+                "# Per-tool metrics (metrics://tools, /metrics on HTTP transports)",
+                "# TOOL_METRICS=true",
+                "",
+            ]
+        if context["split_modules"]:
+            lines += [
+                "# Tool groups to load (default: all)",
+                f"# TOOL_GROUPS={','.join(context['tool_modules'])}",
+                "",
+            ]
 
         return GeneratedFile(
             path=".env.example",
             content="\n".join(lines),
         )
 
+    def _generate_bundle_env_example(self, context: dict[str, Any]) -> GeneratedFile:
+        """Generate the .env.example file of a bundle server."""
+        lines = ["# RPC endpoint per network (default: the rpc of bundle.json)"]
+        for network in context["networks"]:
+            env_name = "RPC_URL_" + network.upper().replace("-", "_")
+            lines.append(f"# {env_name}={context['network_configs'][network].get('rpc', '')}")
+        lines += [
+            "",
+            "# Networks and contracts file, and the contracts to load (default: all)",
+            "# BUNDLE_CONFIG=./bundle.json",
+            f"# BUNDLE_CONTRACTS={','.join(c.namespace for c in context['contracts'])}",
+            "",
+            "# Private key for write operations (NEVER commit this!)",
+            "# Only needed if you want to execute transactions",
+            "# PRIVATE_KEY=your-private-key-here",
+            "",
+        ]
+        if context["has_reads"]:
+            lines += [
+                "# Read-result cache per network (0 disables)",
+                "# READ_CACHE_SIZE=1024",
+                "",
+            ]
+        lines += ["# Optional settings", "# MCP_TRANSPORT=stdio", ""]
+        if context["include_metrics"]:
+            lines += [
+                "# Per-tool metrics (metrics://tools, /metrics on HTTP transports)",
+                "# TOOL_METRICS=true",
+                "",
+            ]
+
+        return GeneratedFile(path=".env.example", content="\n".join(lines))
+
     def _determine_server_name(
         self,
         contract_name: str | None,
@@ -335,6 +828,12 @@ class ServerGenerator:
     def write_to_disk(self, server: GeneratedServer, output_dir: Path | None = None) -> Path:
         """Write all generated files to disk.
 
+        With config.incremental, files whose content is already on disk are
+        not rewritten (their names are recorded in server.unchanged_files),
+        files the previous manifest recorded but this server no longer has
+        (e.g. tools_*.py after a split server shrinks) are removed, and the
+        output manifest is updated.
+
         Args:
             server: The generated server package
             output_dir: Output directory (uses config if not provided)
@@ -348,16 +847,131 @@ class ServerGenerator:
         # Create output directory
         output.mkdir(parents=True, exist_ok=True)
 
+        server.unchanged_files = []
+        previous = self._load_manifest(output) if self.config.incremental else {}
+        entries: dict[str, dict[str, Any]] = {}
+
         # Write each file
         for file in server.files:
             file_path = output / file.path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(file.content)
+            digest = _content_hash(file.content)
+
+            if self.config.incremental and _is_current(
+                file_path, file.content, digest, previous.get(file.path)
+            ):
+                server.unchanged_files.append(file.path)
+            else:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_text(file.content)
+
+            stat = os.stat(file_path)
 
             # Make executable if needed
-            if file.is_executable:
-                import os
+            if file.is_executable and stat.st_mode & 0o111 != 0o111:
+                os.chmod(file_path, stat.st_mode | 0o111)
+
+            entries[file.path] = {
+                "sha256": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            if file.render_key:
+                entries[file.path]["key"] = file.render_key
 
-                os.chmod(file_path, os.stat(file_path).st_mode | 0o111)
+        if self.config.incremental:
+            _remove_orphans(output, [path for path in previous if path not in entries])
+            self._write_manifest(output, entries)
 
         return output
+
+    @staticmethod
+    def _load_manifest(output_dir: Path) -> dict[str, dict[str, Any]]:
+        """Read the file entries of an output manifest ({} if missing or stale)."""
+        text = _read_text(output_dir / MANIFEST_FILENAME)
+        if text is None:
+            return {}
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    @staticmethod
+    def _write_manifest(output_dir: Path, entries: dict[str, dict[str, Any]]) -> None:
+        """Write the output manifest, leaving it untouched if nothing changed."""
+        text = json.dumps(
+            {"version": MANIFEST_VERSION, "generator": __version__, "files": entries},
+            indent=2,
+            sort_keys=True,
+        )
+        path = output_dir / MANIFEST_FILENAME
+        if _read_text(path) != text:
+            path.write_text(text)
+
+
+def _read_text(path: Path) -> str | None:
+    """Read a text file, or None if it does not exist or cannot be read."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _remove_orphans(output_dir: Path, paths: list[str]) -> None:
+    """Delete files of a previous output, and directories they leave empty.
+
+    Only paths inside output_dir are touched; anything else on disk (files
+    the manifest never recorded) is left alone.
+    """
+    root = output_dir.resolve()
+    for name in paths:
+        path = (output_dir / name).resolve()
+        if path == root or root not in path.parents:
+            continue
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove stale file {path}: {e}")
+            continue
+        for parent in path.parents:
+            if parent == root:
+                break
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+
+
+def _is_current(path: Path, content: str, digest: str, entry: dict[str, Any] | None) -> bool:
+    """Check whether a file on disk already holds the given content.
+
+    A manifest entry with the same hash, size and mtime avoids reading the
+    file; otherwise (e.g. no manifest yet) the file is compared directly.
+    """
+    if entry and entry.get("sha256") == digest:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+            return True
+    return _read_text(path) == content
+
+
+def _hash_parts(*parts: str) -> str:
+    """Hash render-key parts together with the manifest and generator versions."""
+    digest = hashlib.sha256()
+    for part in (str(MANIFEST_VERSION), __version__, *parts):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _content_hash(content: str) -> str:
+    """Hash file content as recorded in the output manifest."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
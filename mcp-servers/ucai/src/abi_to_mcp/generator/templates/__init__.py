@@ -32,6 +32,7 @@ def create_jinja_env() -> Environment:
     env.filters["to_snake_case"] = to_snake_case
     env.filters["to_package_name"] = to_package_name
     env.filters["escape_python_string"] = escape_python_string
+    env.filters["typing_names"] = typing_names
 
     return env
 
@@ -94,9 +95,39 @@ def escape_python_string(value: str) -> str:
     return value.replace("\\", "\\\\").replace('"', '\\"').replace("'", "\\'")
 
 
+def typing_names(code: str) -> list[str]:
+    """Find the typing names used in annotations of rendered code.
+
+    Split modules import only these, so generated files have no unused imports.
+
+    Args:
+        code: Rendered Python source
+
+    Returns:
+        The used names among Optional, Dict, Any and List, in import order
+
+    Example:
+        >>> typing_names("def f(x: List) -> Dict[str, Any]:")
+        ['Dict', 'Any', 'List']
+    """
+    import re
+
+    return [
+        name
+        for name in ("Optional", "Dict", "Any", "List")
+        if re.search(rf"(?:[\[(,:]\s*|->\s*){name}\b", code)
+    ]
+
+
 # Template file names
 TEMPLATES = {
     "server": "server.py.jinja2",
+    "common": "common.py.jinja2",
+    "tools_module": "tools_module.py.jinja2",
+    "bundle_server": "bundle_server.py.jinja2",
+    "bundle_runtime": "bundle_runtime.py.jinja2",
+    "bundle_contract": "bundle_contract.py.jinja2",
+    "bundle_readme": "bundle_readme.md.jinja2",
     "config": "config.py.jinja2",
     "readme": "readme.md.jinja2",
     "pyproject": "pyproject.toml.jinja2",
@@ -111,5 +142,6 @@ __all__ = [
     "to_snake_case",
     "to_package_name",
     "escape_python_string",
+    "typing_names",
     "TEMPLATES",
 ]
@@ -2,19 +2,32 @@
 
 This module provides the TypeMapper class which converts Solidity types
 to JSON Schema definitions for use in MCP tool parameter validation.
+
+Parsed types are interned: large ABIs repeat the same structs and arrays
+hundreds of times, so each distinct (type string, components) pair is parsed
+once into an immutable SolidityType shared by every occurrence, and its JSON
+schema is built once per interned type.
 """
 
+import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from ..core.constants import SOLIDITY_TO_JSON_SCHEMA, SOLIDITY_TO_PYTHON_TYPE
+from ..core.constants import SOLIDITY_TO_JSON_SCHEMA, SOLIDITY_TO_PYTHON_TYPE, TYPE_CACHE_SIZE
+
+# Hashable form of ABI tuple components: ((type, name, components), ...)
+ComponentsKey = tuple[tuple[str, str, "ComponentsKey | None"], ...]
 
 
-@dataclass
+@dataclass(frozen=True)
 class SolidityType:
     """Parsed Solidity type representation.
 
+    Instances are immutable and hashable; those returned by
+    TypeMapper.parse_type are shared between equal types.
+
     Attributes:
         base_type: The base Solidity type (e.g., "address", "uint256")
         is_array: Whether this is an array type
@@ -28,8 +41,15 @@ class SolidityType:
     is_array: bool = False
     array_length: int | None = None
     is_tuple: bool = False
-    tuple_components: list["SolidityType"] | None = None
-    tuple_names: list[str] | None = None
+    tuple_components: tuple["SolidityType", ...] | None = None
+    tuple_names: tuple[str, ...] | None = None
+
+    def __post_init__(self) -> None:
+        """Store component sequences as tuples so the type stays hashable."""
+        if self.tuple_components is not None and not isinstance(self.tuple_components, tuple):
+            object.__setattr__(self, "tuple_components", tuple(self.tuple_components))
+        if self.tuple_names is not None and not isinstance(self.tuple_names, tuple):
+            object.__setattr__(self, "tuple_names", tuple(self.tuple_names))
 
 
 class TypeMapper:
@@ -52,7 +72,7 @@ class TypeMapper:
     INT_PATTERN = re.compile(r"^int(\d+)?$")
     BYTES_PATTERN = re.compile(r"^bytes(\d+)?$")
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the TypeMapper."""
         self.custom_types: dict[str, dict[str, Any]] = {}
 
@@ -64,8 +84,12 @@ class TypeMapper:
             components: Tuple components for struct types
 
         Returns:
-            SolidityType representing the parsed type
+            Interned SolidityType representing the parsed type
         """
+        return _parse_interned(type(self), type_str, _components_key(components))
+
+    def _parse_uncached(self, type_str: str, components: ComponentsKey | None) -> SolidityType:
+        """Parse a type string whose components are already canonicalised."""
         # Handle arrays first
         array_match = self.ARRAY_PATTERN.match(type_str)
         if array_match:
@@ -85,7 +109,7 @@ class TypeMapper:
                 )
             else:
                 # Single-dimensional array
-                inner_type = self.parse_type(base, components)
+                inner_type = _parse_interned(type(self), base, components)
                 return SolidityType(
                     base_type=inner_type.base_type,
                     is_array=True,
@@ -100,10 +124,11 @@ class TypeMapper:
             return SolidityType(
                 base_type="tuple",
                 is_tuple=True,
-                tuple_components=[
-                    self.parse_type(c["type"], c.get("components")) for c in components
-                ],
-                tuple_names=[c.get("name", f"field_{i}") for i, c in enumerate(components)],
+                tuple_components=tuple(
+                    _parse_interned(type(self), c_type, c_components)
+                    for c_type, _, c_components in components
+                ),
+                tuple_names=tuple(name for _, name, _ in components),
             )
 
         # Handle unsigned integers with size normalization
@@ -141,14 +166,35 @@ class TypeMapper:
             param_description: Optional explicit description
 
         Returns:
-            JSON Schema dictionary
+            JSON Schema dictionary (a fresh copy the caller may modify)
         """
+        # Arrays and tuples are built once per interned type; decoding the cached
+        # JSON text is the cheapest way to hand out a private copy
+        if solidity_type.is_array or solidity_type.is_tuple:
+            copy: dict[str, Any] = json.loads(_schema_text(type(self), solidity_type))
+            return copy
+
+        schema = self._build_schema(solidity_type)
+
+        # Add custom description if provided
+        if param_description:
+            schema["description"] = param_description
+        elif param_name:
+            # Generate description from parameter name
+            readable_name = self._camel_to_readable(param_name)
+            if "description" not in schema:
+                schema["description"] = readable_name
+
+        return schema
+
+    def _build_schema(self, solidity_type: SolidityType) -> dict[str, Any]:
+        """Build the description-free JSON Schema for a type (cached by _schema_text)."""
         # Handle arrays
         if solidity_type.is_array:
             # Check if base_type itself is an array (nested arrays)
             if self.ARRAY_PATTERN.match(solidity_type.base_type):
                 # Recursively parse the inner array type
-                inner_type = self.parse_type(solidity_type.base_type)
+                inner_type = _parse_interned(type(self), solidity_type.base_type, None)
             else:
                 # Create inner type without the array flag
                 inner_type = SolidityType(
@@ -159,7 +205,7 @@ class TypeMapper:
                 )
             schema: dict[str, Any] = {
                 "type": "array",
-                "items": self.to_json_schema(inner_type),
+                "items": json.loads(_schema_text(type(self), inner_type)),
             }
             # Add length constraints for fixed arrays
             if solidity_type.array_length is not None:
@@ -194,24 +240,13 @@ class TypeMapper:
         base_type = solidity_type.base_type
 
         if base_type in SOLIDITY_TO_JSON_SCHEMA:
-            schema = SOLIDITY_TO_JSON_SCHEMA[base_type].copy()
-        else:
-            # Unknown type - default to string with warning
-            schema = {
-                "type": "string",
-                "description": f"Unknown Solidity type: {base_type}",
-            }
-
-        # Add custom description if provided
-        if param_description:
-            schema["description"] = param_description
-        elif param_name:
-            # Generate description from parameter name
-            readable_name = self._camel_to_readable(param_name)
-            if "description" not in schema:
-                schema["description"] = readable_name
+            return SOLIDITY_TO_JSON_SCHEMA[base_type].copy()
 
-        return schema
+        # Unknown type - default to string with warning
+        return {
+            "type": "string",
+            "description": f"Unknown Solidity type: {base_type}",
+        }
 
     def to_python_type(self, solidity_type: SolidityType) -> str:
         """Convert SolidityType to Python type hint string.
@@ -247,10 +282,7 @@ class TypeMapper:
         Returns:
             Human-readable string with spaces
         """
-        # Insert spaces before capitals
-        result = re.sub(r"([A-Z])", r" \1", name)
-        # Clean up and capitalize first letter
-        return result.strip().capitalize()
+        return _readable_name(name)
 
     def map_function_params(self, params: list[dict[str, Any]]) -> tuple[dict[str, Any], list[str]]:
         """Map function parameters to JSON Schema properties.
@@ -303,3 +335,62 @@ class TypeMapper:
             "type": "object",
             "properties": properties,
         }
+
+
+class _TypeCache:
+    """Interned types and schemas of one mapper class.
+
+    Each class gets its own caches, filled by an instance of that class, so a
+    subclass overriding _parse_uncached or _build_schema sees its overrides.
+    """
+
+    def __init__(self, mapper: TypeMapper) -> None:
+        self.parse = lru_cache(maxsize=TYPE_CACHE_SIZE)(mapper._parse_uncached)
+
+        @lru_cache(maxsize=TYPE_CACHE_SIZE)
+        def schema_text(solidity_type: SolidityType) -> str:
+            return json.dumps(mapper._build_schema(solidity_type))
+
+        self.schema_text = schema_text
+
+
+_type_caches: dict[type[TypeMapper], _TypeCache] = {}
+
+
+def _cache_for(mapper_cls: type[TypeMapper]) -> _TypeCache:
+    """The caches of a mapper class, created on first use."""
+    cache = _type_caches.get(mapper_cls)
+    if cache is None:
+        cache = _type_caches.setdefault(mapper_cls, _TypeCache(mapper_cls()))
+    return cache
+
+
+def _parse_interned(
+    mapper_cls: type[TypeMapper], type_str: str, components: ComponentsKey | None
+) -> SolidityType:
+    """Parse a type once per (type string, canonical components) pair."""
+    return _cache_for(mapper_cls).parse(type_str, components)
+
+
+def _schema_text(mapper_cls: type[TypeMapper], solidity_type: SolidityType) -> str:
+    """Build a type's JSON Schema once, serialized so every caller gets its own copy."""
+    return _cache_for(mapper_cls).schema_text(solidity_type)
+
+
+def _components_key(components: list[dict] | None) -> ComponentsKey | None:
+    """Canonicalise ABI components, keeping only what affects the parsed type."""
+    if not components:
+        return None
+    return tuple(
+        (c["type"], c.get("name", f"field_{i}"), _components_key(c.get("components")))
+        for i, c in enumerate(components)
+    )
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def _readable_name(name: str) -> str:
+    """Convert a camelCase parameter name to a readable string once."""
+    # Insert spaces before capitals
+    result = re.sub(r"([A-Z])", r" \1", name)
+    # Clean up and capitalize first letter
+    return result.strip().capitalize()
@@ -7,15 +7,19 @@ AGENT 1: This file needs full implementation. See AGENTS.md for requirements.
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
 
+from abi_to_mcp.core.constants import TYPE_CACHE_SIZE
 
-@dataclass
+
+@dataclass(frozen=True)
 class ParsedType:
-    """Parsed Solidity type information."""
+    """Parsed Solidity type information (immutable, shared between equal type strings)."""
 
     base_type: str
     is_array: bool = False
-    array_dimensions: list[int | None] = None  # None = dynamic, int = fixed
+    array_dimensions: tuple[int | None, ...] | None = None  # None = dynamic, int = fixed
     is_tuple: bool = False
 
 
@@ -43,8 +47,12 @@ class TypeParser:
             type_str: Solidity type string (e.g., "address", "uint256[]")
 
         Returns:
-            ParsedType with parsed information
+            Interned ParsedType with parsed information
         """
+        return _parse_interned(type(self), type_str)
+
+    def _parse_uncached(self, type_str: str) -> ParsedType:
+        """Parse a type string without consulting the cache."""
         # Check for array
         array_match = self.ARRAY_PATTERN.match(type_str)
         if array_match:
@@ -53,7 +61,7 @@ class TypeParser:
             return ParsedType(
                 base_type=self._normalize_base_type(base),
                 is_array=True,
-                array_dimensions=[int(d) if d else None for d in dimensions],
+                array_dimensions=tuple(int(d) if d else None for d in dimensions),
             )
 
         # Check for tuple
@@ -95,3 +103,17 @@ class TypeParser:
             return True
 
         return False
+
+
+# Interned parses per parser class, so a subclass overriding _parse_uncached
+# gets entries built by its override
+_parse_caches: dict[type[TypeParser], Callable[[str], ParsedType]] = {}
+
+
+def _parse_interned(parser_cls: type[TypeParser], type_str: str) -> ParsedType:
+    """Parse each distinct type string once."""
+    parse = _parse_caches.get(parser_cls)
+    if parse is None:
+        cached = lru_cache(maxsize=TYPE_CACHE_SIZE)(parser_cls()._parse_uncached)
+        parse = _parse_caches.setdefault(parser_cls, cached)
+    return parse(type_str)
@@ -1,16 +1,23 @@
 """Runtime utilities for Web3 and transaction handling."""
 
-from abi_to_mcp.runtime.web3_client import Web3Client
+from abi_to_mcp.runtime.web3_client import RPCResult, Web3Client
+from abi_to_mcp.runtime.failover import EndpointHealth, FailoverProvider
 from abi_to_mcp.runtime.transaction import TransactionBuilder
 from abi_to_mcp.runtime.simulator import TransactionSimulator
 from abi_to_mcp.runtime.signer import TransactionSigner
-from abi_to_mcp.runtime.gas import GasEstimator, GasPrice
+from abi_to_mcp.runtime.gas import GasEstimator, GasOracle, GasPrice
+from abi_to_mcp.runtime.nonce import NonceManager
 
 __all__ = [
     "Web3Client",
+    "RPCResult",
+    "FailoverProvider",
+    "EndpointHealth",
     "TransactionBuilder",
     "TransactionSimulator",
     "TransactionSigner",
     "GasEstimator",
+    "GasOracle",
     "GasPrice",
+    "NonceManager",
 ]
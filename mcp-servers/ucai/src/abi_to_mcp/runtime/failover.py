@@ -0,0 +1,319 @@
+"""Multi-endpoint JSON-RPC provider with failover and hedged reads.
+
+FailoverProvider spreads requests over an ordered list of RPC URLs. Each
+endpoint keeps rolling latency samples and an error score; requests go to
+the healthiest endpoint, and endpoints that keep failing are ejected for a
+cooldown. Reads that take longer than the endpoint's usual (p95) latency
+are hedged: the same request is sent to the next-best endpoint and the
+first successful response wins.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple, cast
+
+from web3 import HTTPProvider
+from web3.providers.base import BaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from abi_to_mcp.core.exceptions import Web3ConnectionError
+from abi_to_mcp.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Methods with side effects: never hedged (still failed over on transport errors)
+UNHEDGED_METHODS = frozenset(
+    {
+        "eth_sendRawTransaction",
+        "eth_sendTransaction",
+        "eth_sign",
+        "eth_signTransaction",
+        "eth_signTypedData",
+        "eth_newFilter",
+        "eth_newBlockFilter",
+        "eth_newPendingTransactionFilter",
+        "eth_uninstallFilter",
+        "eth_getFilterChanges",
+    }
+)
+
+# JSON-RPC error codes that mean the endpoint (not the request) is at fault
+ENDPOINT_ERROR_CODES = frozenset({-32005, 429})
+
+# Internal error: an endpoint fault, except that some nodes (Hardhat, Ganache,
+# some hosted RPCs) also use it for "execution reverted"
+INTERNAL_ERROR_CODE = -32603
+
+
+@dataclass
+class EndpointHealth:
+    """Rolling health statistics for one RPC endpoint."""
+
+    url: str
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=64))
+    error_score: float = 0.0  # exponentially weighted failure rate, 0..1
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    failures: int = 0
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Latency percentile over the rolling window (None without samples)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def score(self, default_latency: float) -> float:
+        """Lower is better: median latency inflated by the error score."""
+        median = self.percentile(0.5)
+        latency = default_latency if median is None else median
+        return latency * (1.0 + 10.0 * self.error_score)
+
+    def is_ejected(self, now: float) -> bool:
+        """Whether the endpoint is cooling down after repeated failures."""
+        return now < self.ejected_until
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for diagnostics."""
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "url": self.url,
+            "requests": self.requests,
+            "failures": self.failures,
+            "error_score": round(self.error_score, 4),
+            "p50_ms": None if p50 is None else round(p50 * 1000, 1),
+            "p95_ms": None if p95 is None else round(p95 * 1000, 1),
+            "ejected": self.is_ejected(time.monotonic()),
+        }
+
+
+class FailoverProvider(BaseProvider):
+    """
+    Web3 provider over several HTTP endpoints.
+
+    Example:
+        >>> provider = FailoverProvider(["https://rpc-a.example", "https://rpc-b.example"])
+        >>> w3 = Web3(provider)
+        >>> w3.eth.block_number  # served by the healthiest endpoint
+        >>> provider.close()  # stops the request threads
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        hedge: bool = True,
+        hedge_delay: float = 0.5,
+        min_hedge_delay: float = 0.05,
+        max_hedge_delay: float = 2.0,
+        eject_after: int = 3,
+        cooldown: float = 30.0,
+        timeout: float = 10.0,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            urls: RPC URLs in order of preference (ties go to earlier URLs)
+            hedge: Send slow reads to a second endpoint
+            hedge_delay: Hedge delay until an endpoint has latency samples (seconds)
+            min_hedge_delay: Lower bound of the p95-based hedge delay
+            max_hedge_delay: Upper bound of the p95-based hedge delay
+            eject_after: Consecutive failures before an endpoint is ejected
+            cooldown: Seconds an ejected endpoint is skipped
+            timeout: Per-request HTTP timeout in seconds
+        """
+        super().__init__()
+        if not urls:
+            raise ValueError("FailoverProvider needs at least one RPC URL")
+
+        self.urls = list(dict.fromkeys(urls))
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.eject_after = eject_after
+        self.cooldown = cooldown
+
+        self._providers = {url: _http_provider(url, timeout) for url in self.urls}
+        self.health = {url: EndpointHealth(url) for url in self.urls}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * len(self.urls) + 2, thread_name_prefix="rpc-failover"
+        )
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a request to the best endpoint, failing over and hedging as needed."""
+        hedge = self.hedge and method not in UNHEDGED_METHODS
+        return cast(RPCResponse, self._route(lambda url: self._send(url, method, params), hedge))
+
+    def make_batch_request(self, batch_requests: List[Tuple[RPCEndpoint, Any]]) -> Any:
+        """
+        Send a JSON-RPC batch to the best endpoint, failing over and hedging as needed.
+
+        Args:
+            batch_requests: (method, params) pairs
+
+        Returns:
+            Responses in request order, or a single error response if the
+            endpoint rejected the batch as a whole
+        """
+        hedge = self.hedge and not any(m in UNHEDGED_METHODS for m, _ in batch_requests)
+        return self._route(lambda url: self._send_batch(url, batch_requests), hedge)
+
+    def close(self) -> None:
+        """Stop the request threads; pending hedged requests are abandoned."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __del__(self) -> None:
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Whether any endpoint answers."""
+        for url in self.ranked_endpoints():
+            try:
+                if self._providers[url].is_connected():
+                    return True
+            except Exception:
+                continue
+        return False
+
+    def ranked_endpoints(self) -> List[str]:
+        """Endpoints from best to worst; ejected ones last, soonest-recovering first."""
+        now = time.monotonic()
+        with self._lock:
+            medians = (h.percentile(0.5) for h in self.health.values())
+            known = [m for m in medians if m is not None]
+            default = max(known) if known else 1.0
+            healthy = [u for u in self.urls if not self.health[u].is_ejected(now)]
+            ejected = [u for u in self.urls if self.health[u].is_ejected(now)]
+            healthy.sort(key=lambda u: self.health[u].score(default))
+            ejected.sort(key=lambda u: self.health[u].ejected_until)
+        return healthy + ejected
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Health summary of every endpoint, in configured order."""
+        with self._lock:
+            return [self.health[url].to_dict() for url in self.urls]
+
+    def _route(self, send: Callable[[str], Any], hedge: bool) -> Any:
+        """Run send(url) on endpoints in rank order until one succeeds."""
+        candidates = self.ranked_endpoints()
+        hedge = hedge and len(candidates) > 1
+        last_error: Optional[Exception] = None
+
+        pending: Dict[Future, str] = {}
+        while candidates or pending:
+            if candidates and (not pending or hedge):
+                url = candidates.pop(0)
+                pending[self._executor.submit(send, url)] = url
+
+            timeout = self._hedge_delay(url) if hedge and candidates else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+
+        raise Web3ConnectionError(", ".join(self.urls), last_error)
+
+    def _send(self, url: str, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send one request and record its outcome against the endpoint."""
+        started = time.monotonic()
+        try:
+            response = self._providers[url].make_request(method, params)
+        except Exception:
+            self._record(url, None)
+            raise
+
+        if _is_endpoint_error(response):
+            self._record(url, None)
+            raise Web3ConnectionError(url, Exception(_error_message(response)))
+
+        self._record(url, time.monotonic() - started)
+        return response
+
+    def _send_batch(self, url: str, batch_requests: List[Tuple[RPCEndpoint, Any]]) -> Any:
+        """Send one batch and record its outcome against the endpoint."""
+        provider = self._providers[url]
+        started = time.monotonic()
+        try:
+            if hasattr(provider, "make_batch_request"):
+                response = provider.make_batch_request(batch_requests)
+            else:
+                # web3 6 providers cannot batch
+                response = [provider.make_request(m, p) for m, p in batch_requests]
+        except Exception:
+            self._record(url, None)
+            raise
+
+        if _is_endpoint_error(response):
+            self._record(url, None)
+            raise Web3ConnectionError(url, Exception(_error_message(response)))
+
+        self._record(url, time.monotonic() - started)
+        return response
+
+    def _record(self, url: str, latency: Optional[float]) -> None:
+        """Update an endpoint's statistics (latency None means failure)."""
+        with self._lock:
+            health = self.health[url]
+            health.requests += 1
+            failed = latency is None
+            health.error_score = 0.8 * health.error_score + (0.2 if failed else 0.0)
+
+            if latency is not None:
+                health.latencies.append(latency)
+                health.consecutive_failures = 0
+                return
+
+            health.failures += 1
+            health.consecutive_failures += 1
+            if health.consecutive_failures >= self.eject_after:
+                health.ejected_until = time.monotonic() + self.cooldown
+                health.consecutive_failures = 0
+                logger.warning(f"Ejecting RPC endpoint {url} for {self.cooldown:.0f}s")
+
+    def _hedge_delay(self, url: str) -> float:
+        """How long to wait on an endpoint before hedging: its clamped p95 latency."""
+        with self._lock:
+            health = self.health[url]
+            p95 = health.percentile(0.95) if len(health.latencies) >= 5 else None
+        if p95 is None:
+            return self.hedge_delay
+        return min(self.max_hedge_delay, max(self.min_hedge_delay, p95))
+
+
+def _is_endpoint_error(response: Any) -> bool:
+    """Whether a response is an error of the endpoint rather than of the request."""
+    error = response.get("error") if isinstance(response, dict) else None
+    if not isinstance(error, dict):
+        return False
+    code = error.get("code")
+    if code == INTERNAL_ERROR_CODE:
+        return "revert" not in str(error.get("message", "")).lower()
+    return code in ENDPOINT_ERROR_CODES
+
+
+def _error_message(response: Any) -> str:
+    """Message of an error response."""
+    error = response["error"]
+    return str(error.get("message", error))
+
+
+def _http_provider(url: str, timeout: float) -> HTTPProvider:
+    """HTTP provider without its own retries (failover replaces them)."""
+    request_kwargs = {"timeout": timeout}
+    try:
+        return HTTPProvider(url, request_kwargs=request_kwargs, exception_retry_configuration=None)
+    except TypeError:
+        # web3 6 has no exception_retry_configuration
+        return HTTPProvider(url, request_kwargs=request_kwargs)
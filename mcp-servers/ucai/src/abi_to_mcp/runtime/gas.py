@@ -1,8 +1,12 @@
 """Gas estimation and pricing utilities."""
 
-from typing import Dict, Any, Optional
+import statistics
+import threading
+import time
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from abi_to_mcp.runtime.web3_client import Web3Client
 from abi_to_mcp.core.exceptions import GasEstimationError
@@ -10,6 +14,22 @@ from abi_to_mcp.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Priority fee reward percentile per speed tier (eth_feeHistory)
+TIER_PERCENTILES: Dict[str, float] = {
+    "slow": 10,
+    "standard": 50,
+    "fast": 75,
+    "instant": 95,
+}
+
+# Legacy (pre-EIP-1559) multipliers of eth_gasPrice per speed tier
+LEGACY_MULTIPLIERS: Dict[str, float] = {
+    "slow": 0.8,
+    "standard": 1.0,
+    "fast": 1.2,
+    "instant": 1.5,
+}
+
 
 @dataclass
 class GasPrice:
@@ -22,6 +42,8 @@ class GasPrice:
     base_fee: Optional[int] = None  # Wei (EIP-1559 only)
     priority_fee: Optional[int] = None  # Wei (EIP-1559 only)
     is_eip1559: bool = False
+    priority_fees: Dict[str, int] = field(default_factory=dict)  # Wei per tier (EIP-1559 only)
+    block_number: Optional[int] = None  # Newest block the prices are based on
 
     def to_gwei(self, price: int) -> float:
         """Convert wei to gwei."""
@@ -48,17 +70,225 @@ class GasPrice:
         return self.to_gwei(self.instant)
 
 
+class GasOracle:
+    """
+    Gas price oracle built on eth_feeHistory, cached per block.
+
+    Priority fee tiers are the median, over the last ``block_count`` non-empty
+    blocks, of each tier's reward percentile (TIER_PERCENTILES). Max fees are
+    twice the next block's base fee plus the tier's priority fee. Networks
+    without eth_feeHistory fall back to eth_gasPrice multiples.
+
+    Prices are reused for ``max_age`` seconds without any RPC; after that, a
+    single eth_blockNumber call tells whether the block changed before fee
+    history is fetched again. With start(), a background thread keeps the
+    prices current so callers never wait on the node.
+
+    Use GasOracle.for_client() to share one oracle per Web3Client.
+    """
+
+    _shared: "weakref.WeakKeyDictionary[Any, GasOracle]" = weakref.WeakKeyDictionary()
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        web3_client: Web3Client,
+        block_count: int = 20,
+        max_age: float = 2.0,
+        tier_percentiles: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize gas oracle.
+
+        Args:
+            web3_client: Web3Client instance
+            block_count: Blocks of fee history to sample
+            max_age: Seconds prices are served without checking the block number
+            tier_percentiles: Reward percentile per tier, merged over
+                TIER_PERCENTILES so the slow/standard/fast/instant tiers always exist
+        """
+        self.client = web3_client
+        self.block_count = block_count
+        self.max_age = max_age
+        # eth_feeHistory wants percentiles in ascending order
+        self.tier_percentiles = dict(
+            sorted({**TIER_PERCENTILES, **(tier_percentiles or {})}.items(), key=lambda t: t[1])
+        )
+
+        self._price: Optional[GasPrice] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+        self.stats = {"hits": 0, "block_checks": 0, "fetches": 0}
+
+    @classmethod
+    def for_client(cls, web3_client: Web3Client) -> "GasOracle":
+        """Get the oracle shared by everything using this client."""
+        with cls._shared_lock:
+            oracle = cls._shared.get(web3_client)
+            if oracle is None:
+                oracle = cls._shared[web3_client] = cls(web3_client)
+            return oracle
+
+    def get_gas_price(self) -> GasPrice:
+        """
+        Get gas price tiers for the current block.
+
+        Returns:
+            GasPrice with slow/standard/fast/instant options
+
+        Raises:
+            GasEstimationError: If price fetching fails
+        """
+        price = self._fresh()
+        if price is not None:
+            return price
+
+        with self._lock:
+            # Another caller may have refreshed while we waited
+            price = self._fresh()
+            if price is not None:
+                return price
+
+            try:
+                if self._price is not None and self._price.block_number is not None:
+                    self.stats["block_checks"] += 1
+                    if self.client.w3.eth.block_number == self._price.block_number:
+                        self._fetched_at = time.monotonic()
+                        return self._price
+
+                self.stats["fetches"] += 1
+                self._price = self._fetch()
+                self._fetched_at = time.monotonic()
+                return self._price
+
+            except Exception as e:
+                raise GasEstimationError(f"Failed to get gas price: {e}") from e
+
+    def invalidate(self) -> None:
+        """Drop cached prices so the next call fetches fee history."""
+        with self._lock:
+            self._price = None
+
+    def start(self, interval: float = 4.0) -> None:
+        """
+        Refresh prices in a background thread.
+
+        Args:
+            interval: Seconds between refreshes (about one block)
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, args=(interval,), name="gas-oracle", daemon=True
+        )
+        self._refresher.start()
+
+    def stop(self) -> None:
+        """Stop the background refresher."""
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+
+    def _fresh(self) -> Optional[GasPrice]:
+        """Cached prices if younger than max_age."""
+        price = self._price
+        if price is not None and time.monotonic() - self._fetched_at < self.max_age:
+            self.stats["hits"] += 1
+            return price
+        return None
+
+    def _refresh_loop(self, interval: float) -> None:
+        """Background refresher body."""
+        while not self._stop.wait(interval):
+            try:
+                with self._lock:
+                    self._price = self._fetch()
+                    self._fetched_at = time.monotonic()
+                    self.stats["fetches"] += 1
+            except Exception as e:
+                logger.debug(f"Gas oracle refresh failed: {e}")
+
+    def _fetch(self) -> GasPrice:
+        """Fetch fee history (or the legacy gas price) and build tiers."""
+        tiers = list(self.tier_percentiles)
+        percentiles = [self.tier_percentiles[t] for t in tiers]
+
+        try:
+            history = self.client.w3.eth.fee_history(self.block_count, "latest", percentiles)
+            base_fees = [int(fee) for fee in history["baseFeePerGas"]]
+            rewards = [[int(r) for r in block] for block in history["reward"]]
+            ratios = list(history["gasUsedRatio"])
+            newest = int(history["oldestBlock"]) + len(ratios) - 1
+        except Exception as e:
+            logger.debug(f"eth_feeHistory unavailable, using eth_gasPrice: {e}")
+            return self._legacy_price()
+
+        if not base_fees or not any(base_fees):
+            return self._legacy_price(newest)
+
+        next_base_fee = base_fees[-1]
+        priority_fees = _tier_priority_fees(tiers, rewards, ratios)
+        max_fees = {tier: next_base_fee * 2 + priority_fees[tier] for tier in tiers}
+
+        return GasPrice(
+            slow=max_fees["slow"],
+            standard=max_fees["standard"],
+            fast=max_fees["fast"],
+            instant=max_fees["instant"],
+            base_fee=next_base_fee,
+            priority_fee=priority_fees["standard"],
+            is_eip1559=True,
+            priority_fees=priority_fees,
+            block_number=newest,
+        )
+
+    def _legacy_price(self, block_number: Optional[int] = None) -> GasPrice:
+        """Tiers as multiples of eth_gasPrice."""
+        current_price = self.client.w3.eth.gas_price
+        return GasPrice(
+            slow=int(current_price * LEGACY_MULTIPLIERS["slow"]),
+            standard=current_price,
+            fast=int(current_price * LEGACY_MULTIPLIERS["fast"]),
+            instant=int(current_price * LEGACY_MULTIPLIERS["instant"]),
+            is_eip1559=False,
+            block_number=block_number,
+        )
+
+
+def _tier_priority_fees(
+    tiers: List[str], rewards: List[List[int]], ratios: List[float]
+) -> Dict[str, int]:
+    """Median reward per tier over non-empty blocks, non-decreasing from slow to instant."""
+    samples: List[Tuple[int, ...]] = [
+        tuple(block) for block, ratio in zip(rewards, ratios, strict=False) if ratio > 0 and block
+    ]
+    fees: Dict[str, int] = {}
+    floor = 0
+    for index, tier in enumerate(tiers):
+        values = [block[index] for block in samples if index < len(block)]
+        fee = int(statistics.median(values)) if values else 0
+        floor = max(floor, fee)
+        fees[tier] = floor
+    return fees
+
+
 class GasEstimator:
     """Estimate gas costs and provide price recommendations."""
 
-    def __init__(self, web3_client: Web3Client):
+    def __init__(self, web3_client: Web3Client, oracle: Optional[GasOracle] = None):
         """
         Initialize gas estimator.
 
         Args:
             web3_client: Web3Client instance
+            oracle: Gas oracle (default: the one shared for this client)
         """
         self.client = web3_client
+        self.oracle = oracle or GasOracle.for_client(web3_client)
 
     def get_gas_price(self) -> GasPrice:
         """
@@ -70,49 +300,7 @@ class GasEstimator:
         Raises:
             GasEstimationError: If price fetching fails
         """
-        try:
-            # Check if network supports EIP-1559
-            latest_block = self.client.w3.eth.get_block("latest")
-            is_eip1559 = "baseFeePerGas" in latest_block
-
-            if is_eip1559:
-                base_fee = latest_block["baseFeePerGas"]
-
-                # Priority fee recommendations
-                slow_priority = int(1 * 10**9)  # 1 gwei
-                standard_priority = int(2 * 10**9)  # 2 gwei
-                fast_priority = int(3 * 10**9)  # 3 gwei
-                instant_priority = int(5 * 10**9)  # 5 gwei
-
-                # Max fee = base_fee * multiplier + priority_fee
-                return GasPrice(
-                    slow=base_fee * 2 + slow_priority,
-                    standard=base_fee * 2 + standard_priority,
-                    fast=base_fee * 2 + fast_priority,
-                    instant=base_fee * 2 + instant_priority,
-                    base_fee=base_fee,
-                    priority_fee=standard_priority,
-                    is_eip1559=True,
-                )
-
-            else:
-                # Legacy gas pricing
-                current_price = self.client.w3.eth.gas_price
-
-                # Create tiers based on current price
-                return GasPrice(
-                    slow=int(current_price * 0.8),
-                    standard=current_price,
-                    fast=int(current_price * 1.2),
-                    instant=int(current_price * 1.5),
-                    is_eip1559=False,
-                )
-
-        except Exception as e:
-            raise GasEstimationError(
-                f"Failed to get gas price: {e}",
-                details={"error": str(e)},
-            ) from e
+        return self.oracle.get_gas_price()
 
     def estimate_transaction_cost(
         self,
@@ -158,14 +346,7 @@ class GasEstimator:
             }
 
         except Exception as e:
-            raise GasEstimationError(
-                f"Failed to estimate cost: {e}",
-                details={
-                    "gas_limit": gas_limit,
-                    "gas_price": gas_price,
-                    "error": str(e),
-                },
-            ) from e
+            raise GasEstimationError(f"Failed to estimate cost: {e}") from e
 
     def estimate_function_cost(
         self,
@@ -219,9 +400,5 @@ class GasEstimator:
         except Exception as e:
             raise GasEstimationError(
                 f"Failed to estimate function cost: {e}",
-                details={
-                    "function": str(contract_function),
-                    "from": from_address,
-                    "error": str(e),
-                },
+                function_name=str(contract_function),
             ) from e
@@ -0,0 +1,211 @@
+"""Local nonce management for bursts of transactions from one signer."""
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from abi_to_mcp.runtime.web3_client import Web3Client
+from abi_to_mcp.utils.logging import get_logger
+from abi_to_mcp.utils.validation import to_checksum_address
+
+logger = get_logger(__name__)
+
+# Node error messages meaning the nonce is already used on chain
+NONCE_TOO_LOW_ERRORS = ("nonce too low", "already been used", "oldnonce", "old nonce")
+
+# Node error messages meaning the nonce leaves a gap
+NONCE_TOO_HIGH_ERRORS = ("nonce too high", "nonce gap")
+
+# Node error messages meaning the transaction is already in the mempool
+ALREADY_KNOWN_ERRORS = ("already known", "already imported", "known transaction")
+
+
+@dataclass
+class _AccountNonces:
+    """Nonce state of one (chain id, address) pair."""
+
+    next_nonce: int
+    synced_at: float
+    released: List[int] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class NonceManager:
+    """
+    Reserve nonces locally per (chain id, address).
+
+    The first reservation for an address reads its pending transaction
+    count; later ones are handed out from memory, so a burst of N
+    transactions costs one RPC instead of N. Every ``resync_interval``
+    seconds the local counter is reconciled with the pending count (moving
+    forward if another process sent transactions). Nonces that were reserved
+    but never broadcast are released and reused first, so no gaps are left.
+
+    Use NonceManager.for_client() to share one manager per Web3Client.
+    """
+
+    _shared: "weakref.WeakKeyDictionary[Any, NonceManager]" = weakref.WeakKeyDictionary()
+    _shared_lock = threading.Lock()
+
+    def __init__(self, web3_client: Web3Client, resync_interval: float = 30.0):
+        """
+        Initialize nonce manager.
+
+        Args:
+            web3_client: Web3Client instance
+            resync_interval: Seconds between reconciliations with the pending count
+        """
+        self.client = web3_client
+        self.resync_interval = resync_interval
+        self._accounts: Dict[Tuple[int, str], _AccountNonces] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_client(cls, web3_client: Web3Client) -> "NonceManager":
+        """Get the nonce manager shared by everything using this client."""
+        with cls._shared_lock:
+            manager = cls._shared.get(web3_client)
+            if manager is None:
+                manager = cls._shared[web3_client] = cls(web3_client)
+            return manager
+
+    def reserve(self, address: str) -> int:
+        """
+        Reserve the next nonce for an address.
+
+        Args:
+            address: Sender address
+
+        Returns:
+            Nonce to use; call release() if the transaction is not sent
+        """
+        account = self._account(address)
+        with account.lock:
+            self._maybe_resync(address, account)
+            if account.released:
+                return account.released.pop(0)
+            nonce = account.next_nonce
+            account.next_nonce += 1
+            return nonce
+
+    def peek(self, address: str) -> int:
+        """
+        Nonce the next reservation would return, without reserving it.
+
+        Args:
+            address: Sender address
+
+        Returns:
+            Next nonce
+        """
+        account = self._account(address)
+        with account.lock:
+            self._maybe_resync(address, account)
+            return account.released[0] if account.released else account.next_nonce
+
+    def release(self, address: str, nonce: int) -> None:
+        """
+        Return a reserved nonce whose transaction was never broadcast.
+
+        Args:
+            address: Sender address
+            nonce: Nonce from reserve()
+        """
+        account = self._account(address)
+        with account.lock:
+            if nonce == account.next_nonce - 1:
+                account.next_nonce = nonce
+            elif nonce < account.next_nonce and nonce not in account.released:
+                account.released.append(nonce)
+                account.released.sort()
+
+    def sync(self, address: str, reset: bool = False) -> int:
+        """
+        Reconcile with the node's pending transaction count.
+
+        Args:
+            address: Sender address
+            reset: Adopt the pending count even if it is behind the local counter
+
+        Returns:
+            Next nonce after reconciling
+        """
+        account = self._account(address)
+        with account.lock:
+            self._resync(address, account, reset=reset)
+            return account.next_nonce
+
+    def handle_send_error(self, address: str, nonce: int, error: BaseException) -> None:
+        """
+        Update state after a transaction with a reserved nonce was rejected.
+
+        - nonce too low: another sender used it; move forward to the pending count
+        - nonce too high: local counter ran ahead; reset to the pending count
+        - already known: the transaction is in the mempool; keep the nonce
+        - anything else: the nonce was not used; release it
+
+        Args:
+            address: Sender address
+            nonce: Nonce the transaction used
+            error: Error from sending
+        """
+        message = str(error).lower()
+        if any(text in message for text in ALREADY_KNOWN_ERRORS):
+            return
+        if any(text in message for text in NONCE_TOO_LOW_ERRORS):
+            logger.info(f"Nonce {nonce} too low for {address}, resyncing")
+            self.sync(address)
+        elif any(text in message for text in NONCE_TOO_HIGH_ERRORS):
+            logger.info(f"Nonce {nonce} too high for {address}, resetting")
+            self.sync(address, reset=True)
+        else:
+            self.release(address, nonce)
+
+    def reset(self, address: Optional[str] = None) -> None:
+        """
+        Forget local state so the next reservation reads the pending count.
+
+        Args:
+            address: Address to forget (all addresses if None)
+        """
+        with self._lock:
+            if address is None:
+                self._accounts.clear()
+                return
+            address = to_checksum_address(address)
+            for key in [key for key in self._accounts if key[1] == address]:
+                del self._accounts[key]
+
+    def _account(self, address: str) -> _AccountNonces:
+        """Nonce state for an address on the client's chain, created on first use."""
+        key = (self.client.get_chain_id(), to_checksum_address(address))
+        with self._lock:
+            account = self._accounts.get(key)
+        if account is not None:
+            return account
+
+        pending = self._pending_count(key[1])
+        with self._lock:
+            # Another thread may have created it meanwhile
+            return self._accounts.setdefault(
+                key, _AccountNonces(next_nonce=pending, synced_at=time.monotonic())
+            )
+
+    def _maybe_resync(self, address: str, account: _AccountNonces) -> None:
+        """Reconcile if the last sync is older than resync_interval (lock held)."""
+        if time.monotonic() - account.synced_at >= self.resync_interval:
+            self._resync(address, account)
+
+    def _resync(self, address: str, account: _AccountNonces, reset: bool = False) -> None:
+        """Adopt the pending count if it is ahead (or always, with reset). Lock held."""
+        pending = self._pending_count(to_checksum_address(address))
+        if reset or pending > account.next_nonce:
+            account.next_nonce = pending
+        account.released = [n for n in account.released if pending <= n < account.next_nonce]
+        account.synced_at = time.monotonic()
+
+    def _pending_count(self, address: str) -> int:
+        """Transaction count including the mempool."""
+        return self.client.get_transaction_count(address, block_identifier="pending")
@@ -1,28 +1,46 @@
 """Transaction simulator for testing before execution."""
 
-from typing import Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, cast
 from decimal import Decimal
 
+from web3.types import RPCEndpoint, StateOverride, TxParams
+
+from abi_to_mcp.runtime.gas import GasOracle
+from abi_to_mcp.runtime.nonce import NonceManager
 from abi_to_mcp.runtime.web3_client import Web3Client
 from abi_to_mcp.runtime.transaction import TransactionBuilder
 from abi_to_mcp.core.exceptions import SimulationError
 from abi_to_mcp.utils.logging import get_logger
+from abi_to_mcp.utils.validation import to_checksum_address
+
+if TYPE_CHECKING:
+    from web3.contract.contract import ContractFunction
 
 logger = get_logger(__name__)
 
+# simulate_batch modes
+SIMULATION_MODES = ("sequential", "independent", "chained")
+
+_ZERO_SLOT = "0x" + "0" * 64
+
 
 class TransactionSimulator:
     """Simulate transactions without executing them."""
 
-    def __init__(self, web3_client: Web3Client):
+    def __init__(self, web3_client: Web3Client, gas_oracle: Optional[GasOracle] = None):
         """
         Initialize transaction simulator.
 
         Args:
             web3_client: Web3Client instance
+            gas_oracle: Gas oracle (default: the one shared for this client)
         """
         self.client = web3_client
-        self.tx_builder = TransactionBuilder(web3_client)
+        self.gas_oracle = gas_oracle or GasOracle.for_client(web3_client)
+        self.nonce_manager = NonceManager.for_client(web3_client)
+        self.tx_builder = TransactionBuilder(web3_client, self.gas_oracle, self.nonce_manager)
 
     def simulate(
         self,
@@ -30,6 +48,7 @@ class TransactionSimulator:
         from_address: str,
         value: int = 0,
         gas_limit: Optional[int] = None,
+        nonce: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Simulate a transaction.
@@ -48,17 +67,23 @@ class TransactionSimulator:
             from_address: Sender address
             value: ETH value in wei
             gas_limit: Optional gas limit
+            nonce: Optional nonce (next unreserved nonce if not provided)
 
         Returns:
             Simulation result dictionary
         """
         try:
+            # Simulations must not consume a reserved nonce
+            if nonce is None:
+                nonce = self.nonce_manager.peek(from_address)
+
             # Build transaction
             tx = self.tx_builder.build_transaction(
                 contract_function=contract_function,
                 from_address=from_address,
                 value=value,
                 gas_limit=gas_limit,
+                nonce=nonce,
             )
 
             # Get gas estimate
@@ -70,7 +95,7 @@ class TransactionSimulator:
             elif "gasPrice" in tx:
                 gas_price_wei = tx["gasPrice"]
             else:
-                gas_price_wei = self.client.w3.eth.gas_price
+                gas_price_wei = self.gas_oracle.get_gas_price().standard
 
             # Calculate cost
             estimated_cost_wei = gas_estimate * gas_price_wei
@@ -124,25 +149,61 @@ class TransactionSimulator:
         self,
         transactions: list,
         from_address: str,
+        mode: str = "sequential",
+        max_workers: int = 8,
     ) -> list:
         """
-        Simulate multiple transactions in sequence.
+        Simulate multiple transactions.
+
+        Modes:
+        - sequential: one after another against the current state, stopping
+          at the first failure
+        - independent: concurrently, each against the current state
+        - chained: in order, each seeing the state changes of the ones
+          before it (e.g. approve then swap), stopping at the first failure.
+          State changes come from debug_traceCall (prestateTracer diffs) and
+          are replayed as eth_call state overrides, so no fork is needed.
+
+        The sender's nonce is fetched once for the whole batch. Every result
+        carries its "step" index and "elapsed_ms".
 
         Args:
             transactions: List of (contract_function, value) tuples
             from_address: Sender address
+            mode: "sequential", "independent" or "chained"
+            max_workers: Concurrent simulations in independent mode
 
         Returns:
             List of simulation results
-        """
-        results = []
 
-        for contract_function, value in transactions:
-            result = self.simulate(
-                contract_function=contract_function,
-                from_address=from_address,
-                value=value,
+        Raises:
+            ValueError: If mode is unknown
+            SimulationError: If chained mode is used on a node without debug_traceCall
+        """
+        if mode not in SIMULATION_MODES:
+            raise ValueError(
+                f"Unknown simulation mode: {mode}. Use one of: {', '.join(SIMULATION_MODES)}"
             )
+        if not transactions:
+            return []
+
+        nonce = self.nonce_manager.peek(from_address)
+
+        if mode == "chained":
+            return self._simulate_chained(transactions, from_address, nonce)
+
+        if mode == "independent":
+            workers = max(1, min(max_workers, len(transactions)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._timed_step, step, func, from_address, value, nonce)
+                    for step, (func, value) in enumerate(transactions)
+                ]
+                return [future.result() for future in futures]
+
+        results = []
+        for step, (contract_function, value) in enumerate(transactions):
+            result = self._timed_step(step, contract_function, from_address, value, nonce)
             results.append(result)
 
             # Stop if any transaction fails
@@ -150,3 +211,162 @@ class TransactionSimulator:
                 break
 
         return results
+
+    def _timed_step(
+        self,
+        step: int,
+        contract_function: "ContractFunction",
+        from_address: str,
+        value: int,
+        nonce: Any,
+    ) -> Dict[str, Any]:
+        """simulate() with step index and timing."""
+        started = time.perf_counter()
+        result = self.simulate(
+            contract_function=contract_function,
+            from_address=from_address,
+            value=value,
+            nonce=nonce,
+        )
+        result["step"] = step
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    def _simulate_chained(
+        self, transactions: list, from_address: str, nonce: int
+    ) -> List[Dict[str, Any]]:
+        """Simulate in order, carrying state changes forward as state overrides."""
+        from_address = to_checksum_address(from_address)
+        chain_id = self.client.get_chain_id()
+        gas_price_wei = self.gas_oracle.get_gas_price().standard
+        overrides: Dict[str, Dict[str, Any]] = {}
+        results = []
+
+        for step, (contract_function, value) in enumerate(transactions):
+            started = time.perf_counter()
+            call_tx = {
+                "from": from_address,
+                "to": contract_function.address,
+                "data": contract_function._encode_transaction_data(),
+                "value": value,
+            }
+            tx = {**call_tx, "nonce": nonce + step, "chainId": chain_id}
+            result: Dict[str, Any] = {
+                "step": step,
+                "success": False,
+                "result": None,
+                "error": None,
+                "gas_estimate": None,
+                "gas_price_wei": gas_price_wei,
+                "gas_price_gwei": float(gas_price_wei / 10**9),
+                "estimated_cost_wei": None,
+                "estimated_cost_eth": None,
+                "transaction": tx,
+            }
+            state = dict(overrides) or None
+
+            try:
+                result["result"] = contract_function.call(
+                    {"from": from_address, "value": value}, "latest", state
+                )
+                result["success"] = True
+            except Exception as call_error:
+                result["error"] = str(call_error)
+
+            if result["success"]:
+                try:
+                    gas_estimate = self.client.w3.eth.estimate_gas(
+                        cast(TxParams, call_tx), "latest", cast(Optional[StateOverride], state)
+                    )
+                    tx["gas"] = gas_estimate
+                    result["gas_estimate"] = gas_estimate
+                    result["estimated_cost_wei"] = gas_estimate * gas_price_wei
+                    result["estimated_cost_eth"] = float(
+                        Decimal(gas_estimate * gas_price_wei) / Decimal(10**18)
+                    )
+                except Exception as e:
+                    logger.debug(f"Gas estimation with state overrides failed: {e}")
+
+                if step < len(transactions) - 1:
+                    _merge_state_diff(overrides, self._trace_state_diff(call_tx, overrides))
+
+            result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            results.append(result)
+
+            if not result["success"]:
+                break
+
+        return results
+
+    def _trace_state_diff(
+        self, call_tx: Dict[str, Any], overrides: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Pre- and post-state of the accounts a call touches (debug_traceCall)."""
+        params: Dict[str, Any] = {
+            "tracer": "prestateTracer",
+            "tracerConfig": {"diffMode": True},
+        }
+        if overrides:
+            params["stateOverrides"] = overrides
+
+        rpc_tx = {**call_tx, "value": hex(call_tx["value"])}
+        response = self.client.w3.provider.make_request(
+            RPCEndpoint("debug_traceCall"), [rpc_tx, "latest", params]
+        )
+        error = response.get("error")
+        if error or "result" not in response:
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise SimulationError(
+                f"Chained simulation needs debug_traceCall with prestateTracer: {message}",
+            )
+        diff = response["result"]
+        return diff.get("pre") or {}, diff.get("post") or {}
+
+
+def _merge_state_diff(
+    overrides: Dict[str, Dict[str, Any]], diff: Tuple[Dict[str, Any], Dict[str, Any]]
+) -> None:
+    """Fold a prestateTracer diff into eth_call state overrides (in place)."""
+    pre, post = diff
+
+    for address, account in post.items():
+        override = overrides.setdefault(to_checksum_address(address), {})
+        if "balance" in account:
+            override["balance"] = account["balance"]
+        if "nonce" in account:
+            nonce = account["nonce"]
+            override["nonce"] = hex(nonce) if isinstance(nonce, int) else nonce
+        if "code" in account:
+            override["code"] = account["code"]
+        if account.get("storage"):
+            _storage_override(override).update(account["storage"])
+
+    for address, account in pre.items():
+        if address not in post:
+            # Account destroyed: empty it, storage included
+            overrides[to_checksum_address(address)] = {
+                "balance": "0x0",
+                "nonce": "0x0",
+                "code": "0x",
+                "state": {},
+            }
+            continue
+
+        # Slots cleared to zero appear only in the pre-state
+        cleared = set(account.get("storage") or {}) - set(
+            (post.get(address) or {}).get("storage") or {}
+        )
+        if cleared:
+            override = overrides.setdefault(to_checksum_address(address), {})
+            _storage_override(override).update(dict.fromkeys(cleared, _ZERO_SLOT))
+
+
+def _storage_override(override: Dict[str, Any]) -> Dict[str, Any]:
+    """Slot overrides of an account: "state" once it was replaced, else "stateDiff".
+
+    An override may not carry both, so writes to an emptied (destroyed)
+    account go into its replacement state.
+    """
+    if "state" in override:
+        return cast(Dict[str, Any], override["state"])
+    return cast(Dict[str, Any], override.setdefault("stateDiff", {}))
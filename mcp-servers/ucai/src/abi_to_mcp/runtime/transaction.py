@@ -8,6 +8,8 @@ try:
 except ImportError:
     from web3.contract import ContractFunction
 
+from abi_to_mcp.runtime.gas import GasOracle
+from abi_to_mcp.runtime.nonce import NonceManager
 from abi_to_mcp.runtime.web3_client import Web3Client
 from abi_to_mcp.core.exceptions import TransactionError
 from abi_to_mcp.utils.logging import get_logger
@@ -19,14 +21,23 @@ logger = get_logger(__name__)
 class TransactionBuilder:
     """Build transactions for contract calls."""
 
-    def __init__(self, web3_client: Web3Client):
+    def __init__(
+        self,
+        web3_client: Web3Client,
+        gas_oracle: Optional[GasOracle] = None,
+        nonce_manager: Optional[NonceManager] = None,
+    ):
         """
         Initialize transaction builder.
 
         Args:
             web3_client: Web3Client instance
+            gas_oracle: Gas oracle (default: the one shared for this client)
+            nonce_manager: Nonce manager (default: the one shared for this client)
         """
         self.client = web3_client
+        self.gas_oracle = gas_oracle or GasOracle.for_client(web3_client)
+        self.nonce_manager = nonce_manager or NonceManager.for_client(web3_client)
 
     def build_transaction(
         self,
@@ -52,7 +63,8 @@ class TransactionBuilder:
             gas_price: Legacy gas price (wei)
             max_fee_per_gas: EIP-1559 max fee per gas (wei)
             max_priority_fee_per_gas: EIP-1559 priority fee (wei)
-            nonce: Optional nonce (will fetch if not provided)
+            nonce: Optional nonce (reserved from the nonce manager if not
+                provided; it is released again if building fails)
 
         Returns:
             Transaction dictionary
@@ -60,12 +72,13 @@ class TransactionBuilder:
         Raises:
             TransactionError: If transaction building fails
         """
+        reserved: Optional[int] = None
         try:
             from_address = to_checksum_address(from_address)
 
-            # Get nonce if not provided
+            # Reserve nonce if not provided
             if nonce is None:
-                nonce = self.client.get_transaction_count(from_address)
+                nonce = reserved = self.nonce_manager.reserve(from_address)
 
             # Build base transaction
             tx: Dict[str, Any] = {
@@ -81,15 +94,13 @@ class TransactionBuilder:
             # Determine gas pricing strategy
             if max_fee_per_gas is not None or max_priority_fee_per_gas is not None:
                 # EIP-1559 transaction
-                if max_fee_per_gas is None:
-                    # Use current base fee + priority fee
-                    latest_block = self.client.w3.eth.get_block("latest")
-                    base_fee = latest_block.get("baseFeePerGas", 0)
-                    priority_fee = max_priority_fee_per_gas or 2_000_000_000  # 2 gwei
-                    max_fee_per_gas = base_fee * 2 + priority_fee
-
                 if max_priority_fee_per_gas is None:
-                    max_priority_fee_per_gas = 2_000_000_000  # 2 gwei
+                    max_priority_fee_per_gas = self.gas_oracle.get_gas_price().priority_fee or 0
+
+                if max_fee_per_gas is None:
+                    # Use next block's base fee + priority fee
+                    base_fee = self.gas_oracle.get_gas_price().base_fee or 0
+                    max_fee_per_gas = base_fee * 2 + max_priority_fee_per_gas
 
                 tx["maxFeePerGas"] = max_fee_per_gas
                 tx["maxPriorityFeePerGas"] = max_priority_fee_per_gas
@@ -98,18 +109,16 @@ class TransactionBuilder:
                 # Legacy transaction
                 tx["gasPrice"] = gas_price
             else:
-                # Auto-detect best strategy
+                # Auto-detect best strategy (standard tier of the shared oracle)
                 try:
-                    latest_block = self.client.w3.eth.get_block("latest")
-                    if "baseFeePerGas" in latest_block:
+                    prices = self.gas_oracle.get_gas_price()
+                    if prices.is_eip1559:
                         # Network supports EIP-1559
-                        base_fee = latest_block["baseFeePerGas"]
-                        priority_fee = 2_000_000_000  # 2 gwei
-                        tx["maxFeePerGas"] = base_fee * 2 + priority_fee
-                        tx["maxPriorityFeePerGas"] = priority_fee
+                        tx["maxFeePerGas"] = prices.standard
+                        tx["maxPriorityFeePerGas"] = prices.priority_fee
                     else:
                         # Legacy gas pricing
-                        tx["gasPrice"] = self.client.w3.eth.gas_price
+                        tx["gasPrice"] = prices.standard
                 except Exception:
                     # Fallback to legacy
                     tx["gasPrice"] = self.client.w3.eth.gas_price
@@ -128,8 +137,36 @@ class TransactionBuilder:
             return tx
 
         except Exception as e:
+            if reserved is not None:
+                self.nonce_manager.release(from_address, reserved)
             raise TransactionError(f"Failed to build transaction: {e}") from e
 
+    def send_raw_transaction(self, raw_transaction: bytes, from_address: str, nonce: int) -> str:
+        """
+        Broadcast a signed transaction built with a reserved nonce.
+
+        If the node rejects it, the nonce manager is updated: a "nonce too
+        low" error resyncs with the pending count, any other rejection
+        releases the nonce for reuse.
+
+        Args:
+            raw_transaction: Signed transaction bytes
+            from_address: Sender address
+            nonce: Nonce the transaction was built with
+
+        Returns:
+            Transaction hash (hex)
+
+        Raises:
+            TransactionError: If the node rejects the transaction
+        """
+        try:
+            tx_hash = self.client.w3.eth.send_raw_transaction(raw_transaction)
+        except Exception as e:
+            self.nonce_manager.handle_send_error(from_address, nonce, e)
+            raise TransactionError(f"Failed to send transaction: {e}") from e
+        return tx_hash.hex() if hasattr(tx_hash, "hex") else str(tx_hash)
+
     def estimate_gas(self, tx: Dict[str, Any]) -> int:
         """
         Estimate gas for transaction.
@@ -1,9 +1,12 @@
 """Web3 client for connecting to Ethereum networks."""
 
 import os
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
+from web3.types import BlockIdentifier
 
 # Handle different web3.py versions
 try:
@@ -11,21 +14,39 @@ try:
 except ImportError:
     from web3.middleware import geth_poa_middleware as POAMiddleware
 
-from abi_to_mcp.core.constants import NETWORKS
+from abi_to_mcp.core.constants import NETWORKS, RPC_BATCH_SIZE
 from abi_to_mcp.core.exceptions import NetworkError
+from abi_to_mcp.runtime.failover import FailoverProvider
 from abi_to_mcp.utils.logging import get_logger
 from abi_to_mcp.utils.validation import to_checksum_address
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class RPCResult:
+    """Outcome of one item in a batched query."""
+
+    address: str
+    value: Any = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
 class Web3Client:
     """Managed Web3 connection to Ethereum networks."""
 
     def __init__(
         self,
-        rpc_url: Optional[str] = None,
+        rpc_url: Optional[Union[str, Sequence[str]]] = None,
         network: str = "mainnet",
+        hedge: bool = True,
+        batch_size: int = RPC_BATCH_SIZE,
+        **failover_options: Any,
     ):
         """
         Initialize Web3 connection.
@@ -35,9 +56,18 @@ class Web3Client:
         2. RPC_URL environment variable
         3. Default from NETWORKS[network]
 
+        Several URLs (a list, or a comma-separated string) are used in order
+        of preference through a FailoverProvider: requests go to the
+        healthiest endpoint, slow reads are hedged to the next one, and
+        failing endpoints are ejected for a cooldown.
+
         Args:
-            rpc_url: Optional explicit RPC URL
+            rpc_url: Optional explicit RPC URL or list of URLs
             network: Network name (mainnet, polygon, etc.)
+            hedge: Hedge slow reads when several URLs are configured
+            batch_size: Maximum requests per JSON-RPC batch payload
+            **failover_options: Further FailoverProvider options
+                (hedge_delay, eject_after, cooldown, timeout, ...)
 
         Raises:
             NetworkError: If network is invalid or connection fails
@@ -53,15 +83,21 @@ class Web3Client:
 
         self.network_config = NETWORKS[self.network]
 
-        # Determine RPC URL
+        # Determine RPC URLs
         if rpc_url:
-            self._rpc_url = rpc_url
-        elif "RPC_URL" in os.environ:
-            self._rpc_url = os.environ["RPC_URL"]
+            self._rpc_urls = _split_urls(rpc_url)
         else:
-            self._rpc_url = self.network_config["rpc"]
-
+            self._rpc_urls = _split_urls(os.environ.get("RPC_URL", ""))
+        if not self._rpc_urls:
+            self._rpc_urls = [self.network_config["rpc"]]
+        self._rpc_url = self._rpc_urls[0]
+
+        self._hedge = hedge
+        self.batch_size = max(1, batch_size)
+        self._failover_options = failover_options
+        self._provider: Optional[FailoverProvider] = None
         self._w3: Optional[Web3] = None
+        self._chain_id: Optional[int] = None
         self._connected = False
 
         logger.info(f"Initialized Web3Client for {self.network}")
@@ -79,7 +115,13 @@ class Web3Client:
         """
         if self._w3 is None:
             try:
-                self._w3 = Web3(Web3.HTTPProvider(self._rpc_url))
+                if len(self._rpc_urls) > 1:
+                    self._provider = FailoverProvider(
+                        self._rpc_urls, hedge=self._hedge, **self._failover_options
+                    )
+                    self._w3 = Web3(self._provider)
+                else:
+                    self._w3 = Web3(Web3.HTTPProvider(self._rpc_url))
 
                 # Add PoA middleware for networks that need it
                 if self.network in ("polygon", "bsc"):
@@ -95,12 +137,35 @@ class Web3Client:
                 logger.info(f"Connected to {self.network} (Chain ID: {self.get_chain_id()})")
 
             except Exception as e:
+                self.close()
                 raise NetworkError(
                     f"Failed to initialize Web3 for {self.network}: {e}",
                 ) from e
 
         return self._w3
 
+    def close(self) -> None:
+        """Release the provider's request threads; the next call reconnects."""
+        if self._provider is not None:
+            self._provider.close()
+        self._provider = None
+        self._w3 = None
+        self._connected = False
+
+    @property
+    def rpc_urls(self) -> List[str]:
+        """Configured RPC URLs in order of preference."""
+        return list(self._rpc_urls)
+
+    def endpoint_stats(self) -> List[Dict[str, Any]]:
+        """
+        Latency and error statistics per RPC endpoint.
+
+        Returns:
+            One entry per URL (empty with a single URL or before connecting)
+        """
+        return self._provider.stats() if self._provider else []
+
     def get_contract(self, address: str, abi: list) -> Contract:
         """
         Create contract instance with checksum address.
@@ -134,7 +199,7 @@ class Web3Client:
 
     def get_chain_id(self) -> int:
         """
-        Get current chain ID.
+        Get chain ID (fetched once and cached for the client's lifetime).
 
         Returns:
             Chain ID
@@ -142,8 +207,11 @@ class Web3Client:
         Raises:
             NetworkError: If not connected
         """
+        if self._chain_id is not None:
+            return self._chain_id
         try:
-            return self.w3.eth.chain_id
+            self._chain_id = self.w3.eth.chain_id
+            return self._chain_id
         except Exception as e:
             raise NetworkError(
                 f"Failed to get chain ID for {self.network}: {e}",
@@ -187,12 +255,15 @@ class Web3Client:
                 f"Failed to get balance for {address}: {e}",
             ) from e
 
-    def get_transaction_count(self, address: str) -> int:
+    def get_transaction_count(
+        self, address: str, block_identifier: BlockIdentifier = "latest"
+    ) -> int:
         """
         Get nonce for an address.
 
         Args:
             address: Ethereum address
+            block_identifier: Block to count at ("pending" includes the mempool)
 
         Returns:
             Transaction count (nonce)
@@ -202,7 +273,7 @@ class Web3Client:
         """
         try:
             checksum_address = to_checksum_address(address)
-            return self.w3.eth.get_transaction_count(checksum_address)
+            return self.w3.eth.get_transaction_count(checksum_address, block_identifier)
         except Exception as e:
             raise NetworkError(
                 f"Failed to get transaction count for {address}: {e}",
@@ -244,3 +315,131 @@ class Web3Client:
             return len(code) > 0
         except Exception:
             return False
+
+    def get_balances(self, addresses: Sequence[str]) -> List[RPCResult]:
+        """
+        Get ETH balances of many addresses in batched requests.
+
+        Args:
+            addresses: Ethereum addresses
+
+        Returns:
+            One result per address, in input order; values are in wei
+        """
+        return self._batch_query("eth_getBalance", addresses, _to_int)
+
+    def get_transaction_counts(self, addresses: Sequence[str]) -> List[RPCResult]:
+        """
+        Get nonces of many addresses in batched requests.
+
+        Args:
+            addresses: Ethereum addresses
+
+        Returns:
+            One result per address, in input order
+        """
+        return self._batch_query("eth_getTransactionCount", addresses, _to_int)
+
+    def get_codes(self, addresses: Sequence[str]) -> List[RPCResult]:
+        """
+        Get bytecode at many addresses in batched requests.
+
+        Args:
+            addresses: Contract addresses
+
+        Returns:
+            One result per address, in input order; values are bytes
+        """
+        return self._batch_query("eth_getCode", addresses, HexBytes)
+
+    def is_contracts(self, addresses: Sequence[str]) -> List[RPCResult]:
+        """
+        Check which addresses are contracts, in batched requests.
+
+        Args:
+            addresses: Ethereum addresses
+
+        Returns:
+            One result per address, in input order; values are True if the
+            address has code
+        """
+        return self._batch_query("eth_getCode", addresses, lambda code: len(HexBytes(code)) > 0)
+
+    def _batch_query(
+        self, method: str, addresses: Sequence[str], convert: Callable[[Any], Any]
+    ) -> List[RPCResult]:
+        """
+        Run method(address, "latest") for every address as JSON-RPC batches.
+
+        Invalid addresses and per-request RPC errors are reported on their
+        own result; a failed batch marks only its own items as failed.
+        """
+        results = [RPCResult(address=address) for address in addresses]
+        pending: List[Tuple[int, Tuple[str, List[Any]]]] = []
+
+        for index, address in enumerate(addresses):
+            try:
+                pending.append((index, (method, [to_checksum_address(address), "latest"])))
+            except ValueError as e:
+                results[index].error = str(e)
+
+        if pending:
+            provider = self.w3.provider
+            for start in range(0, len(pending), self.batch_size):
+                chunk = pending[start : start + self.batch_size]
+                self._send_batch(provider, chunk, results, convert)
+
+        return results
+
+    def _send_batch(
+        self,
+        provider: Any,
+        chunk: List[Tuple[int, Tuple[str, List[Any]]]],
+        results: List[RPCResult],
+        convert: Callable[[Any], Any],
+    ) -> None:
+        """Send one chunk, halving it if the provider rejects the batch size."""
+        requests = [request for _, request in chunk]
+        try:
+            if hasattr(provider, "make_batch_request"):
+                responses = provider.make_batch_request(requests)
+            else:
+                # web3 6 providers cannot batch
+                responses = [provider.make_request(m, p) for m, p in requests]
+        except Exception as e:
+            for index, _ in chunk:
+                results[index].error = str(e)
+            return
+
+        if not isinstance(responses, list) or len(responses) != len(chunk):
+            # Batch rejected as a whole (usually too large): retry in halves
+            if len(chunk) > 1:
+                middle = len(chunk) // 2
+                logger.debug(f"Batch of {len(chunk)} rejected, retrying in halves")
+                self._send_batch(provider, chunk[:middle], results, convert)
+                self._send_batch(provider, chunk[middle:], results, convert)
+                return
+            responses = [responses]
+
+        for (index, _), response in zip(chunk, responses, strict=True):
+            error = response.get("error") if isinstance(response, dict) else None
+            if error is not None or not isinstance(response, dict) or "result" not in response:
+                message = error.get("message", error) if isinstance(error, dict) else error
+                results[index].error = str(message or "Invalid JSON-RPC response")
+                continue
+            try:
+                results[index].value = convert(response["result"])
+            except (TypeError, ValueError) as e:
+                results[index].error = f"Invalid {requests[0][0]} result: {e}"
+
+
+def _to_int(value: Any) -> int:
+    """Decode a JSON-RPC quantity."""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _split_urls(rpc_url: Union[str, Sequence[str]]) -> List[str]:
+    """Normalize one URL, a comma-separated string or a list into a URL list."""
+    if isinstance(rpc_url, str):
+        rpc_url = rpc_url.split(",")
+    return [url.strip() for url in rpc_url if url and url.strip()]
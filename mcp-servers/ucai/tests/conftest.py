@@ -5,8 +5,11 @@ This module provides fixtures that are available to all tests automatically.
 """
 
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 import pytest
 
@@ -261,6 +264,136 @@ def mock_etherscan_not_verified_response() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Give every test a fresh process-wide explorer rate limiter."""
+    from abi_to_mcp.fetchers.ratelimit import get_rate_limiter
+
+    get_rate_limiter().clear()
+    yield
+    get_rate_limiter().clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep ABI and compiled-artifact caches written by CLI tests out of ~/.cache."""
+    monkeypatch.setenv("ABI_TO_MCP_CACHE_DIR", str(tmp_path_factory.mktemp("abi-cache")))
+
+
+# =============================================================================
+# Stand-in JSON-RPC Server
+# =============================================================================
+
+
+class StandInRPC:
+    """
+    Minimal local JSON-RPC server for runtime tests.
+
+    Answers web3_clientVersion, eth_blockNumber, eth_chainId, eth_getBalance,
+    eth_getCode and eth_getTransactionCount from in-memory state, single or
+    batched.
+    """
+
+    def __init__(
+        self,
+        block: int = 1,
+        delay: float = 0.0,
+        status: int = 200,
+        max_batch: Optional[int] = None,
+    ):
+        self.block = block
+        self.delay = delay
+        self.status = status
+        self.max_batch = max_batch
+        self.balances: Dict[str, int] = {}
+        self.codes: Dict[str, str] = {}
+        self.nonces: Dict[str, int] = {}
+        self.errors: Dict[str, str] = {}  # address -> error message
+        self.error_code = -32601  # JSON-RPC code of those errors
+        self.requests: List[str] = []
+        self.posts = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.posts += 1
+                time.sleep(server.delay)
+                if server.status != 200:
+                    self.send_response(server.status)
+                    self.end_headers()
+                    return
+                self._reply(server.handle(body))
+
+            def _reply(self, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def handle(self, body):
+        """Answer a single request or a batch."""
+        if not isinstance(body, list):
+            return self._answer(body)
+        if self.max_batch is not None and len(body) > self.max_batch:
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "batch too large"},
+            }
+        return [self._answer(request) for request in body]
+
+    def _answer(self, request):
+        method, params = request["method"], request.get("params") or []
+        self.requests.append(method)
+        address = params[0].lower() if params and isinstance(params[0], str) else None
+        results = {
+            "eth_blockNumber": lambda: hex(self.block),
+            "eth_chainId": lambda: "0x1",
+            "web3_clientVersion": lambda: "stand-in/1.0",
+            "eth_getBalance": lambda: hex(self.balances.get(address, 0)),
+            "eth_getCode": lambda: self.codes.get(address, "0x"),
+            "eth_getTransactionCount": lambda: hex(self.nonces.get(address, 0)),
+        }
+        if method not in results or address in self.errors:
+            message = self.errors.get(address, f"method {method} not found")
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": self.error_code, "message": message},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": results[method]()}
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def rpc_servers():
+    """Factory for stand-in JSON-RPC servers, shut down after the test."""
+    servers = []
+
+    def make(**kwargs):
+        server = StandInRPC(**kwargs)
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.close()
+
+
 # =============================================================================
 # Temporary Directory Fixtures
 # =============================================================================
@@ -21,6 +21,24 @@ from pathlib import Path
 from typing import Any, Callable
 
 
+# Web3 methods that perform an RPC round trip (coroutines under AsyncWeb3)
+RPC_METHODS = {
+    "call",
+    "build_transaction",
+    "estimate_gas",
+    "get_logs",
+    "get_balance",
+    "get_code",
+    "get_transaction_count",
+    "send_raw_transaction",
+    "wait_for_transaction_receipt",
+    "is_connected",
+}
+
+# w3.eth properties that perform an RPC round trip (awaitable under AsyncWeb3)
+RPC_PROPERTIES = {"gas_price", "block_number", "chain_id"}
+
+
 @dataclass
 class ToolInfo:
     """Information about a registered MCP tool."""
@@ -67,6 +85,7 @@ class ValidationResult:
     resources: list[ResourceInfo] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    is_async: bool = False
     
     @property
     def tool_names(self) -> set[str]:
@@ -112,7 +131,8 @@ class ServerValidator:
     2. Verify FastMCP instance is created
     3. Extract registered tools and resources
     4. Validate function signatures match expected types
-    5. Run mock invocations without real blockchain calls
+    5. Check sync (Web3) and async (AsyncWeb3) servers use their client consistently
+    6. Run mock invocations without real blockchain calls
     
     Example:
         >>> validator = ServerValidator()
@@ -143,12 +163,18 @@ class ServerValidator:
             result.add_error(f"server.py not found in {server_dir}")
             return result
         
+        # Split servers keep their runtime and tool groups in sibling modules
+        modules = [server_py, *sorted(server_dir.glob("tools_*.py"))]
+        if (server_dir / "common.py").exists():
+            modules.append(server_dir / "common.py")
+        
         # Step 1: Syntax validation
-        if not self._validate_syntax(server_py, result):
-            return result
+        for module in modules:
+            if not self._validate_syntax(module, result):
+                return result
         
         # Step 2: Static analysis (AST-based extraction)
-        self._extract_from_ast(server_py, result)
+        self._extract_from_ast(modules, result)
         
         # Step 3: Import validation in subprocess
         if not self._validate_import(server_dir, result):
@@ -176,17 +202,16 @@ class ServerValidator:
             result.add_error(f"Syntax error in {py_file.name}: {e}")
             return False
     
-    def _extract_from_ast(self, server_py: Path, result: ValidationResult):
+    def _extract_from_ast(self, modules: list[Path], result: ValidationResult):
         """
         Extract tools and resources using AST analysis.
         
         This doesn't execute the code, just parses the structure.
         """
         try:
-            code = server_py.read_text()
-            tree = ast.parse(code)
+            trees = [ast.parse(module.read_text()) for module in modules]
             
-            for node in ast.walk(tree):
+            for node in (node for tree in trees for node in ast.walk(tree)):
                 # Find decorated functions
                 if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
                     for decorator in node.decorator_list:
@@ -209,10 +234,92 @@ class ServerValidator:
                                         arg = node.value.args[0]
                                         if isinstance(arg, ast.Constant):
                                             result.server_name = arg.value
+            
+            result.is_async = any(
+                isinstance(node, ast.Call) and self._get_call_name(node) == "AsyncWeb3"
+                for tree in trees
+                for node in ast.walk(tree)
+            )
+            for tree in trees:
+                self._check_client_usage(tree, result)
                                             
         except Exception as e:
             result.add_error(f"AST parsing failed: {e}")
     
+    def _check_client_usage(self, tree: ast.Module, result: ValidationResult):
+        """
+        Check RPC calls match the Web3 client the server creates.
+        
+        Under AsyncWeb3 every RPC call returns a coroutine, so it must be
+        awaited inside an async function; a missed await returns a coroutine
+        object instead of data. Under Web3 nothing may be awaited.
+        result.is_async must already be set.
+        """
+        # Calls awaited directly, inside an awaited expression (asyncio.gather)
+        # or iterated with async for (async generators)
+        awaited = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Await):
+                awaited.update(id(n) for n in ast.walk(node.value))
+            elif isinstance(node, ast.AsyncFor):
+                awaited.add(id(node.iter))
+        coroutines = {
+            node.name for node in tree.body if isinstance(node, ast.AsyncFunctionDef)
+        }
+        
+        for func in ast.walk(tree):
+            if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            
+            is_tool = any(
+                self._get_decorator_name(d) in ("mcp.tool", "mcp.resource")
+                for d in func.decorator_list
+            )
+            uses_client = any(
+                isinstance(node, ast.Name) and node.id in ("w3", "contract")
+                for node in ast.walk(func)
+            )
+            if result.is_async and is_tool and uses_client:
+                if not isinstance(func, ast.AsyncFunctionDef):
+                    result.add_error(
+                        f"'{func.name}' uses AsyncWeb3 but is not declared async def"
+                    )
+            
+            for node in self._own_nodes(func):
+                rpc = self._rpc_name(node, coroutines)
+                if rpc is None:
+                    continue
+                if result.is_async and id(node) not in awaited:
+                    result.add_error(f"'{func.name}' does not await {rpc}")
+                elif not result.is_async and id(node) in awaited:
+                    result.add_error(f"'{func.name}' awaits {rpc} on a synchronous Web3 client")
+    
+    def _own_nodes(self, func: ast.FunctionDef | ast.AsyncFunctionDef):
+        """Yield nodes in a function body, excluding nested function bodies."""
+        stack = list(func.body)
+        while stack:
+            node = stack.pop()
+            yield node
+            for child in ast.iter_child_nodes(node):
+                if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    stack.append(child)
+    
+    def _rpc_name(self, node: ast.AST, coroutines: set[str]) -> str | None:
+        """Name the RPC call or coroutine call a node performs, if any."""
+        if isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Attribute) and node.func.attr in RPC_METHODS:
+                return f"{node.func.attr}()"
+            if isinstance(node.func, ast.Name) and node.func.id in coroutines:
+                return f"{node.func.id}()"
+        elif (
+            isinstance(node, ast.Attribute)
+            and node.attr in RPC_PROPERTIES
+            and isinstance(node.value, ast.Attribute)
+            and node.value.attr == "eth"
+        ):
+            return f"eth.{node.attr}"
+        return None
+    
     def _get_decorator_name(self, decorator: ast.expr) -> str:
         """Extract decorator name from AST node."""
         if isinstance(decorator, ast.Attribute):
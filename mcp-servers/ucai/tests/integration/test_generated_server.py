@@ -1,5 +1,10 @@
 """Tests for generated MCP servers."""
 
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 
@@ -10,6 +15,248 @@ from abi_to_mcp.mapper.function_mapper import FunctionMapper
 from abi_to_mcp.mapper.event_mapper import EventMapper
 from abi_to_mcp.generator.server_generator import ServerGenerator
 from abi_to_mcp.core.config import GeneratorConfig
+from abi_to_mcp.core.compiled import compile_abi
+from abi_to_mcp.core.models import BundleContract
+
+# Cold-start target: importing a generated server for a 400-function,
+# 80-event ABI registers every tool within this many seconds, excluding the
+# mcp package's own import time (typically about 0.2 s)
+COLD_START_TARGET = 0.5
+
+# Minimal FastMCP used to time the generated code alone: records tools only
+_STAND_IN_FASTMCP = """
+class FastMCP:
+    def __init__(self, name):
+        self.name = name
+        self.tools = []
+
+    def tool(self):
+        def register(func):
+            self.tools.append(func.__name__)
+            return func
+        return register
+
+    def resource(self, uri):
+        return lambda func: func
+
+    def run(self, transport="stdio"):
+        pass
+"""
+
+# Imports server.py and reports timing and what was loaded
+_COLD_START_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import server
+elapsed = time.perf_counter() - started
+runtime = sys.modules.get("common", server)
+report = {
+    "elapsed": elapsed,
+    "tools": len(runtime.mcp.tools),
+    "web3_imported": "web3" in sys.modules,
+    "abi_loaded": runtime._load_abi.cache_info().currsize > 0,
+}
+runtime.contract.functions
+report["web3_after_call"] = "web3" in sys.modules
+report["abi_after_call"] = runtime._load_abi.cache_info().currsize > 0
+print(json.dumps(report))
+"""
+
+
+# Calls tools of server.py against an in-process provider and reports tool metrics
+_METRICS_SCRIPT = """
+import asyncio, inspect, json, sys
+import server
+from eth_abi import encode
+from web3 import AsyncWeb3, Web3
+from web3.providers.async_base import AsyncBaseProvider
+from web3.providers.base import BaseProvider
+
+runtime = sys.modules.get("common", server)
+reads = sys.modules.get("tools_read", server)
+
+
+def respond(method, params):
+    results = {"eth_chainId": "0x1", "eth_blockNumber": "0x10"}
+    result = results.get(method, "0x" + encode(["uint256"], [42]).hex())
+    return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+class Provider(BaseProvider):
+    def make_request(self, method, params):
+        return respond(method, params)
+
+
+class AsyncProvider(AsyncBaseProvider):
+    async def make_request(self, method, params):
+        return respond(method, params)
+
+
+async def call(tool, *args):
+    result = tool(*args)
+    return await result if inspect.isawaitable(result) else result
+
+
+async def main():
+    if inspect.iscoroutinefunction(reads.total_supply):
+        runtime.w3._factory = lambda: AsyncWeb3(runtime._count_rpc_requests(AsyncProvider()))
+    else:
+        runtime.w3._factory = lambda: Web3(runtime._count_rpc_requests(Provider()))
+    await call(reads.total_supply)
+    await call(reads.total_supply)
+    await call(reads.balance_of, "0x" + "22" * 20)
+    try:
+        await call(reads.batch_read, None)
+    except TypeError:
+        pass
+
+
+asyncio.run(main())
+print(json.dumps({
+    "wrapped": hasattr(reads.total_supply, "__wrapped__"),
+    "metrics": json.loads(runtime.tool_metrics()),
+    "prometheus": runtime._tool_metrics.prometheus(),
+}))
+"""
+
+
+# Queries events of server.py against an in-process provider that throttles getLogs
+_EVENTS_SCRIPT = """
+import asyncio, inspect, json, sys
+import server
+from web3 import AsyncWeb3, Web3
+from web3.providers.async_base import AsyncBaseProvider
+from web3.providers.base import BaseProvider
+
+runtime = sys.modules.get("common", server)
+runtime._RATE_LIMIT_BACKOFF = 0.001
+ranges = []
+throttled = [2]
+
+
+def respond(method, params):
+    if method == "eth_getLogs":
+        ranges.append([int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)])
+        if throttled[0]:
+            throttled[0] -= 1
+            error = {"code": 429, "message": "Rate limit exceeded"}
+            return {"jsonrpc": "2.0", "id": 1, "error": error}
+        return {"jsonrpc": "2.0", "id": 1, "result": []}
+    results = {"eth_chainId": "0x1", "eth_blockNumber": hex(1000000)}
+    return {"jsonrpc": "2.0", "id": 1, "result": results[method]}
+
+
+class Provider(BaseProvider):
+    def make_request(self, method, params):
+        return respond(method, params)
+
+
+class AsyncProvider(AsyncBaseProvider):
+    async def make_request(self, method, params):
+        return respond(method, params)
+
+
+async def call(func, *args):
+    result = func(*args)
+    return await result if inspect.isawaitable(result) else result
+
+
+async def main():
+    if inspect.iscoroutinefunction(runtime._query_events):
+        runtime.w3._factory = lambda: AsyncWeb3(AsyncProvider())
+    else:
+        runtime.w3._factory = lambda: Web3(Provider())
+    report = {}
+    await call(runtime._query_events, "Transfer", 1000, 1999)
+    report["throttled_ranges"] = list(ranges)
+    report["span"] = runtime._get_event_index().span("Transfer")
+    ranges.clear()
+    await call(runtime._query_events, "Transfer", 500000, 500099)
+    report["disjoint_ranges"] = list(ranges)
+    report["span_after"] = runtime._get_event_index().span("Transfer")
+    return report
+
+
+print(json.dumps(asyncio.run(main())))
+"""
+
+
+# Calls the tools of a bundle's contract modules against in-process providers
+_BUNDLE_SCRIPT = """
+import asyncio, inspect, json, sys
+import server
+import bundle_runtime
+web3_at_import = "web3" in sys.modules
+from eth_abi import encode
+from web3 import AsyncWeb3, Web3
+from web3.providers.async_base import AsyncBaseProvider
+from web3.providers.base import BaseProvider
+
+requests = {"mainnet": 0, "arbitrum": 0}
+
+
+def responder(network):
+    def respond(method, params):
+        requests[network] += 1
+        results = {"eth_chainId": "0x1", "eth_blockNumber": "0x10"}
+        result = results.get(method, "0x" + encode(["uint256"], [42]).hex())
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+    return respond
+
+
+class Provider(BaseProvider):
+    def __init__(self, respond):
+        super().__init__()
+        self.respond = respond
+
+    def make_request(self, method, params):
+        return self.respond(method, params)
+
+
+class AsyncProvider(AsyncBaseProvider):
+    def __init__(self, respond):
+        super().__init__()
+        self.respond = respond
+
+    async def make_request(self, method, params):
+        return self.respond(method, params)
+
+
+async def call(tool, *args):
+    result = tool(*args)
+    return await result if inspect.isawaitable(result) else result
+
+
+usdc = sys.modules["contracts.usdc"]
+arb_usdc = sys.modules["contracts.arb_usdc"]
+nft = sys.modules["contracts.nft"]
+
+
+async def main():
+    for network in requests:
+        respond = responder(network)
+        if inspect.iscoroutinefunction(usdc.usdc__total_supply):
+            factory = lambda respond=respond: AsyncWeb3(AsyncProvider(respond))
+        else:
+            factory = lambda respond=respond: Web3(Provider(respond))
+        bundle_runtime.client(network)._factory = factory
+    await call(usdc.usdc__total_supply)
+    await call(usdc.usdc__total_supply)
+    await call(arb_usdc.arb_usdc__total_supply)
+    await call(nft.nft__balance_of, "0x" + "22" * 20)
+
+
+asyncio.run(main())
+print(json.dumps({
+    "tools": bundle_runtime.mcp.tools,
+    "shared_client": usdc.w3 is nft.w3,
+    "separate_networks": usdc.w3 is not arb_usdc.w3,
+    "requests": requests,
+    "contracts": server.list_contracts(),
+    "cache": server.get_read_cache_stats(),
+    "web3_at_import": web3_at_import,
+}))
+"""
 
 
 @pytest.fixture
@@ -252,3 +499,331 @@ class TestGeneratedServerStructure:
         assert len(content) > 100, "server.py should have substantial content"
         assert "def " in content or "async def " in content, \
             "server.py should contain function definitions"
+
+
+def _large_abi(functions: int = 400, events: int = 80) -> list:
+    """Synthetic ABI with a mix of read, write and payable functions."""
+    mutabilities = ["view", "nonpayable", "payable", "pure"]
+    inputs = [
+        {"name": "account", "type": "address"},
+        {"name": "amount", "type": "uint256"},
+        {"name": "data", "type": "bytes32[]"},
+    ]
+    abi = [
+        {
+            "type": "function",
+            "name": f"fn{i}",
+            "stateMutability": mutabilities[i % 4],
+            "inputs": inputs[: i % 3 + 1],
+            "outputs": [{"name": "", "type": "uint256"}],
+        }
+        for i in range(functions)
+    ]
+    abi += [
+        {
+            "type": "event",
+            "name": f"Event{i}",
+            "anonymous": False,
+            "inputs": [
+                {"name": "who", "type": "address", "indexed": True},
+                {"name": "value", "type": "uint256", "indexed": False},
+            ],
+        }
+        for i in range(events)
+    ]
+    return abi
+
+
+def _run_with_stand_in(server_dir: Path, tmp_path: Path, script: str, **env: str) -> dict:
+    """Run a script next to server.py in a fresh interpreter with a stand-in FastMCP.
+
+    The script prints a JSON report as its last line.
+    """
+    package = tmp_path / "stand-in" / "mcp" / "server"
+    package.mkdir(parents=True)
+    (package.parent / "__init__.py").write_text("")
+    (package / "__init__.py").write_text("")
+    (package / "fastmcp.py").write_text(_STAND_IN_FASTMCP)
+
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=server_dir,
+        env={
+            "PYTHONPATH": f"{server_dir}{os.pathsep}{package.parent.parent}",
+            "RPC_URL": "http://127.0.0.1:9",
+            "PATH": os.environ.get("PATH", ""),
+            **env,
+        },
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.integration
+class TestColdStart:
+    """Startup cost of servers generated for large ABIs."""
+
+    @pytest.fixture(params=[False, True], ids=["sync", "async"])
+    def large_server(self, request, tmp_path):
+        """Generate a server for a large ABI (split into tool modules)."""
+        compiled = compile_abi(_large_abi())
+        output_dir = tmp_path / "large-server"
+        generator = ServerGenerator(
+            GeneratorConfig(output_dir=output_dir, async_mode=request.param)
+        )
+        server = generator.generate(
+            parsed=compiled.parsed,
+            tools=compiled.tools,
+            resources=compiled.resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        generator.write_to_disk(server, output_dir)
+        return output_dir, server
+
+    def test_large_abi_is_split(self, large_server):
+        """The tools are spread over group modules and the ABI is a sidecar."""
+        output_dir, server = large_server
+
+        for name in ("common.py", "tools_read.py", "tools_write.py", "tools_events.py"):
+            assert (output_dir / name).exists()
+        assert len(json.loads((output_dir / "abi.json").read_text())) == 480
+        for module in output_dir.glob("*.py"):
+            assert '"name": "Event0"' not in module.read_text()
+
+    def test_cold_start(self, large_server, tmp_path):
+        """Import registers every tool without loading web3 or the ABI."""
+        output_dir, server = large_server
+
+        report = _run_with_stand_in(output_dir, tmp_path, _COLD_START_SCRIPT)
+
+        # Contract tools, event tools, batch_read, cache stats and 4 utilities
+        assert report["tools"] == server.tool_count + server.resource_count + 6
+        assert not report["web3_imported"]
+        assert not report["abi_loaded"]
+        assert report["web3_after_call"]
+        assert report["abi_after_call"]
+        # Twice the target, so a loaded CI machine does not fail the build
+        assert report["elapsed"] < 2 * COLD_START_TARGET
+
+    def test_split_matches_single_module(self, large_server, tmp_path):
+        """Splitting changes the layout, not the tools a server exposes."""
+        from tests.integration.server_validator import ServerValidator
+
+        output_dir, server = large_server
+        compiled = compile_abi(_large_abi())
+        single_dir = tmp_path / "single"
+        generator = ServerGenerator(GeneratorConfig(output_dir=single_dir, split_modules=False))
+        generator.write_to_disk(
+            generator.generate(
+                parsed=compiled.parsed,
+                tools=compiled.tools,
+                resources=compiled.resources,
+                contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                network="mainnet",
+            ),
+            single_dir,
+        )
+
+        validator = ServerValidator()
+        split = validator.validate(output_dir)
+        single = validator.validate(single_dir)
+
+        assert split.success, split.errors
+        assert single.success, single.errors
+        assert split.tool_names == single.tool_names
+
+
+@pytest.mark.integration
+class TestToolMetrics:
+    """Per-tool instrumentation of generated servers."""
+
+    @pytest.fixture(
+        params=[(False, False), (True, False), (False, True)],
+        ids=["sync", "async", "split"],
+    )
+    def erc20_server(self, request, tmp_path, erc20_abi_path):
+        """Generate an ERC20 server in sync, async and split layouts."""
+        async_mode, split_modules = request.param
+        compiled = compile_abi(json.loads(erc20_abi_path.read_text()))
+        output_dir = tmp_path / "erc20-server"
+        generator = ServerGenerator(
+            GeneratorConfig(
+                output_dir=output_dir, async_mode=async_mode, split_modules=split_modules
+            )
+        )
+        generator.write_to_disk(
+            generator.generate(
+                parsed=compiled.parsed,
+                tools=compiled.tools,
+                resources=compiled.resources,
+                contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                network="mainnet",
+            ),
+            output_dir,
+        )
+        return output_dir
+
+    def test_tool_calls_recorded(self, erc20_server, tmp_path):
+        """Calls, RPC requests, cache hits and errors are counted per tool."""
+        report = _run_with_stand_in(erc20_server, tmp_path, _METRICS_SCRIPT)
+        tools = report["metrics"]["tools"]
+
+        assert report["wrapped"]
+        assert report["metrics"]["enabled"]
+        total_supply = tools["total_supply"]
+        assert total_supply["calls"] == 2
+        assert total_supply["errors"] == 0
+        assert total_supply["cache_hits"] == 1
+        assert total_supply["cache_misses"] == 1
+        # Block number and eth_call on the miss; nothing on the hit
+        assert total_supply["rpc_calls"] >= 2
+        assert total_supply["latency_buckets"]["+Inf"] == 2
+        assert tools["balance_of"]["calls"] == 1
+        assert tools["balance_of"]["rpc_calls"] >= 1
+        assert tools["batch_read"]["errors"] == 1
+        assert tools["transfer"]["calls"] == 0
+
+        prometheus = report["prometheus"]
+        assert '# TYPE mcp_tool_latency_seconds histogram' in prometheus
+        assert 'mcp_tool_calls_total{tool="total_supply"} 2' in prometheus
+        assert 'mcp_tool_errors_total{tool="batch_read"} 1' in prometheus
+        assert 'mcp_tool_latency_seconds_bucket{tool="total_supply",le="+Inf"} 2' in prometheus
+        assert 'mcp_tool_latency_seconds_count{tool="transfer"} 0' in prometheus
+
+    def test_disabled_leaves_tools_unwrapped(self, erc20_server, tmp_path):
+        """TOOL_METRICS=false registers the tool functions as written."""
+        report = _run_with_stand_in(
+            erc20_server, tmp_path, _METRICS_SCRIPT, TOOL_METRICS="false"
+        )
+
+        assert not report["wrapped"]
+        assert not report["metrics"]["enabled"]
+        assert report["metrics"]["tools"] == {}
+
+
+@pytest.mark.integration
+class TestEventQueries:
+    """Chunked getLogs fetching and the event index of generated servers."""
+
+    @pytest.fixture(params=[False, True], ids=["sync", "async"])
+    def erc20_server(self, request, tmp_path, erc20_abi_path):
+        """Generate an ERC20 server (Transfer and Approval events)."""
+        compiled = compile_abi(json.loads(erc20_abi_path.read_text()))
+        output_dir = tmp_path / "erc20-server"
+        generator = ServerGenerator(
+            GeneratorConfig(output_dir=output_dir, async_mode=request.param)
+        )
+        generator.write_to_disk(
+            generator.generate(
+                parsed=compiled.parsed,
+                tools=compiled.tools,
+                resources=compiled.resources,
+                contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                network="mainnet",
+            ),
+            output_dir,
+        )
+        return output_dir
+
+    def test_rate_limits_and_disjoint_ranges(self, erc20_server, tmp_path):
+        """Throttled ranges are retried whole; a disjoint query keeps the index."""
+        report = _run_with_stand_in(erc20_server, tmp_path, _EVENTS_SCRIPT)
+
+        # Two rate-limit errors, then success: the same range, never split
+        assert report["throttled_ranges"] == [[1000, 1999]] * 3
+        assert report["span"] == [1000, 1999]
+        # Fetched uncached; the synced span is untouched
+        assert report["disjoint_ranges"] == [[500000, 500099]]
+        assert report["span_after"] == [1000, 1999]
+
+
+@pytest.mark.integration
+class TestBundle:
+    """Bundle servers serving several contracts from one process."""
+
+    @pytest.fixture(params=[False, True], ids=["sync", "async"])
+    def bundle_server(self, request, tmp_path, erc20_abi_path, erc721_abi_path):
+        """Bundle two ERC20s on different networks with an ERC721."""
+        output_dir = tmp_path / "bundle"
+        entries = [
+            ("usdc", erc20_abi_path, "mainnet"),
+            ("nft", erc721_abi_path, "mainnet"),
+            ("arb_usdc", erc20_abi_path, "arbitrum"),
+        ]
+        contracts = []
+        for index, (namespace, abi_path, network) in enumerate(entries):
+            compiled = compile_abi(json.loads(abi_path.read_text()))
+            address = f"0x{index + 1:040x}"
+            generator = ServerGenerator(
+                GeneratorConfig(
+                    output_dir=output_dir / "contracts" / namespace, async_mode=request.param
+                )
+            )
+            module = generator.generate_bundle_contract(
+                parsed=compiled.parsed,
+                tools=compiled.tools,
+                resources=compiled.resources,
+                namespace=namespace,
+                contract_address=address,
+                network=network,
+            )
+            generator.write_to_disk(module)
+            contracts.append(
+                BundleContract(
+                    namespace,
+                    module.server_name,
+                    address,
+                    network,
+                    module.read_tools,
+                    module.write_tools,
+                    module.events,
+                )
+            )
+
+        generator = ServerGenerator(GeneratorConfig(output_dir=output_dir, async_mode=request.param))
+        generator.write_to_disk(generator.generate_bundle(contracts))
+        return output_dir
+
+    def test_contracts_share_runtime(self, bundle_server, tmp_path):
+        """Tools are namespaced; clients and read caches are shared per network."""
+        report = _run_with_stand_in(bundle_server, tmp_path, _BUNDLE_SCRIPT)
+        tools = report["tools"]
+
+        assert "usdc__total_supply" in tools
+        assert "arb_usdc__total_supply" in tools
+        assert "nft__owner_of" in tools
+        assert "nft__get_contract_info" in tools
+        assert tools.count("get_balance") == 1
+        shared = {"list_contracts", "get_read_cache_stats", "format_units", "parse_units"}
+        shared.add("get_balance")
+        assert all(tool in shared or tool.split("__")[0] in report["contracts"] for tool in tools)
+        assert not report["web3_at_import"]
+
+        assert report["shared_client"]
+        assert report["separate_networks"]
+        assert report["requests"]["arbitrum"] > 0
+        assert list(report["contracts"]) == ["usdc", "nft", "arb_usdc"]
+        assert report["contracts"]["arb_usdc"]["network"] == "arbitrum"
+
+        # The second usdc read is a hit; the same read of arb_usdc is not
+        cache = report["cache"]
+        assert cache["mainnet"]["hits"] == 1
+        assert cache["mainnet"]["misses"] == 2
+        assert cache["arbitrum"]["hits"] == 0
+        assert cache["arbitrum"]["misses"] == 1
+
+    def test_bundle_contracts_selects_modules(self, bundle_server, tmp_path):
+        """BUNDLE_CONTRACTS loads only the listed contracts."""
+        script = (
+            "import json, server, bundle_runtime\n"
+            "print(json.dumps({'tools': bundle_runtime.mcp.tools}))"
+        )
+
+        report = _run_with_stand_in(bundle_server, tmp_path, script, BUNDLE_CONTRACTS="nft")
+
+        assert "nft__owner_of" in report["tools"]
+        assert not any(tool.startswith("usdc__") for tool in report["tools"])
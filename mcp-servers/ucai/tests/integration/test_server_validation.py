@@ -53,6 +53,8 @@ async def generate_server_from_abi(
     contract_address: str = "0x0000000000000000000000000000000000000001",
     network: str = "mainnet",
     contract_name: str | None = None,
+    async_mode: bool = False,
+    split_modules: bool | None = None,
 ) -> Path:
     """Helper to generate a server from an ABI file."""
     fetcher = FileFetcher()
@@ -68,7 +70,9 @@ async def generate_server_from_abi(
     tools = [func_mapper.map_function(f) for f in parsed.functions]
     resources = [event_mapper.map_event(e) for e in parsed.events]
     
-    config = GeneratorConfig(output_dir=output_dir)
+    config = GeneratorConfig(
+        output_dir=output_dir, async_mode=async_mode, split_modules=split_modules
+    )
     generator = ServerGenerator(config)
     
     server = generator.generate(
@@ -144,6 +148,14 @@ class TestERC20ServerValidation:
             assert result.has_tool(tool), \
                 f"Missing write tool: {tool}. Available: {result.tool_names}"
     
+    @pytest.mark.asyncio
+    async def test_server_has_batch_read_tool(self, erc20_server, validator):
+        """Server should expose batch_read for Multicall3 reads."""
+        result = validator.validate(erc20_server)
+
+        assert result.has_tool("batch_read")
+        assert result.get_tool("batch_read").parameter_names == ["calls"]
+
     @pytest.mark.asyncio
     async def test_server_has_erc20_events(self, erc20_server, validator):
         """Server should have Transfer and Approval event query tools."""
@@ -577,18 +589,25 @@ class TestCrossContractPatterns:
     """Test patterns that should work across all contract types."""
     
     @pytest.fixture(params=[
-        "erc20.json",
-        "erc721.json",
-        "uniswap_v2_router.json",
-        "gnosis_safe.json",
-        "governor.json",
-    ])
+        (abi_file, async_mode, split_modules)
+        for abi_file in [
+            "erc20.json",
+            "erc721.json",
+            "uniswap_v2_router.json",
+            "gnosis_safe.json",
+            "governor.json",
+        ]
+        for async_mode in (False, True)
+        for split_modules in (False, True)
+    ], ids=lambda p: f"{p[0]}-{'async' if p[1] else 'sync'}-{'split' if p[2] else 'single'}")
     async def any_server(self, request, fixtures_dir, tmp_path):
-        """Generate server from any fixture."""
-        abi_file = request.param
+        """Generate sync and async, single-module and split servers from any fixture."""
+        abi_file, async_mode, split_modules = request.param
         return await generate_server_from_abi(
             fixtures_dir / abi_file,
             tmp_path / abi_file.replace(".json", "-server"),
+            async_mode=async_mode,
+            split_modules=split_modules,
         )
     
     @pytest.mark.asyncio
@@ -612,6 +631,17 @@ class TestCrossContractPatterns:
             assert tool.docstring is not None and len(tool.docstring) > 0, \
                 f"Tool '{tool.name}' missing docstring"
     
+    @pytest.mark.asyncio
+    async def test_all_servers_use_client_consistently(self, any_server, validator):
+        """Async servers await every RPC call; sync servers await none."""
+        result = validator.validate(any_server)
+        assert result.success, f"Validation failed: {result.errors}"
+        
+        if result.is_async:
+            local_tools = ("format_units", "parse_units", "get_read_cache_stats")
+            client_tools = [t for t in result.tools if t.name not in local_tools]
+            assert all(t.is_async for t in client_tools)
+    
     @pytest.mark.asyncio
     async def test_server_has_expected_files(self, any_server):
         """Generated server should have essential files."""
@@ -708,6 +738,26 @@ class TestErrorCases:
         assert tool is not None
         # Should have all 15 params plus simulate
         assert len(tool.parameters) >= 15
+    
+    @pytest.mark.asyncio
+    async def test_missing_await_in_async_server(self, fixtures_dir, tmp_path):
+        """A tool that forgets to await an AsyncWeb3 call should fail validation."""
+        output_dir = await generate_server_from_abi(
+            fixtures_dir / "erc20.json", tmp_path / "erc20-async", async_mode=True
+        )
+        server_py = output_dir / "server.py"
+        code = server_py.read_text()
+        code = code.replace(
+            'result = await _cached_read("name", ',
+            'result = _cached_read("name", ',
+        )
+        server_py.write_text(code)
+        
+        result = ServerValidator().validate(output_dir)
+        
+        assert result.is_async
+        assert not result.success
+        assert "'name' does not await _cached_read()" in result.errors
 
 
 # =============================================================================
@@ -0,0 +1,83 @@
+"""Tests for the compile command."""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from abi_to_mcp.cli.main import app
+from abi_to_mcp.core.compiled import is_compiled_artifact, load_compiled
+
+runner = CliRunner()
+
+
+class TestCompileCommand:
+    """Tests for abi-to-mcp compile and loading its artifacts."""
+
+    @pytest.fixture
+    def erc20_abi_path(self):
+        """Get path to ERC20 ABI fixture."""
+        return Path(__file__).parent.parent.parent / "fixtures" / "abis" / "erc20.json"
+
+    @pytest.fixture
+    def artifact(self, erc20_abi_path, tmp_path):
+        """Compile the ERC20 fixture."""
+        output = tmp_path / "erc20.abic"
+        result = runner.invoke(app, ["compile", str(erc20_abi_path), "-o", str(output)])
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        return output
+
+    def test_compile_writes_artifact(self, artifact):
+        """compile writes a loadable artifact."""
+        assert is_compiled_artifact(artifact)
+        compiled = load_compiled(artifact)
+        assert compiled.parsed.detected_standard == "ERC20"
+        assert compiled.tools
+
+    def test_compile_default_output(self, erc20_abi_path, tmp_path, monkeypatch):
+        """Without -o the artifact is named after the source."""
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(app, ["compile", str(erc20_abi_path)])
+
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        assert is_compiled_artifact(tmp_path / "erc20.abic")
+
+    def test_compile_missing_file(self, tmp_path):
+        """Missing sources fail."""
+        result = runner.invoke(app, ["compile", str(tmp_path / "missing.json")])
+        assert result.exit_code != 0
+
+    def test_generate_from_artifact(self, artifact, tmp_path):
+        """generate accepts an artifact in place of the ABI."""
+        output = tmp_path / "server"
+        result = runner.invoke(app, [
+            "generate", str(artifact),
+            "-o", str(output),
+            "-a", "0x1234567890123456789012345678901234567890",
+        ])
+
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        assert "transfer" in (output / "server.py").read_text()
+
+    def test_inspect_artifact(self, artifact):
+        """inspect accepts an artifact."""
+        result = runner.invoke(app, ["inspect", str(artifact)])
+
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        assert "compiled artifact" in result.stdout
+        assert "balanceOf" in result.stdout
+
+    def test_validate_artifact(self, artifact):
+        """validate accepts an artifact."""
+        result = runner.invoke(app, ["validate", str(artifact)])
+
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        assert "Compiled artifact" in result.stdout
+
+    def test_validate_stale_artifact(self, artifact):
+        """validate rejects a corrupt artifact."""
+        artifact.write_bytes(artifact.read_bytes()[:-20])
+        result = runner.invoke(app, ["validate", str(artifact)])
+
+        assert result.exit_code == 1
+        assert "Corrupt" in result.stdout
@@ -0,0 +1,267 @@
+"""Tests for the generate-batch command."""
+
+import json
+
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+
+from abi_to_mcp.cli.main import app
+from abi_to_mcp.cli.commands.generate_batch import load_manifest, REPORT_FILENAME
+from abi_to_mcp.core.exceptions import ConfigurationError
+
+runner = CliRunner()
+
+ABIS_DIR = Path(__file__).parent.parent.parent / "fixtures" / "abis"
+ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    """Write a YAML manifest for two local ABIs."""
+    path = tmp_path / "deployment.yaml"
+    path.write_text(
+        f"""
+defaults:
+  network: polygon
+  address: "{ADDRESS}"
+contracts:
+  - source: {ABIS_DIR / "erc20.json"}
+    name: My Token
+  - source: {ABIS_DIR / "erc721.json"}
+    output: nft
+    read_only: true
+"""
+    )
+    return path
+
+
+class TestLoadManifest:
+    """Tests for manifest parsing."""
+
+    def test_defaults_and_outputs(self, manifest, tmp_path):
+        """Defaults apply to every entry and outputs are derived."""
+        entries = load_manifest(manifest, tmp_path / "out")
+
+        assert [e.output.name for e in entries] == ["my-token", "nft"]
+        assert all(e.network == "polygon" for e in entries)
+        assert entries[1].read_only is True
+
+    def test_relative_sources(self, tmp_path):
+        """File sources are resolved relative to the manifest."""
+        (tmp_path / "abis").mkdir()
+        path = tmp_path / "m.json"
+        path.write_text(
+            json.dumps(
+                {"contracts": [{"source": "abis/token.json", "address": ADDRESS}, ADDRESS]}
+            )
+        )
+
+        entries = load_manifest(path, tmp_path)
+
+        assert entries[0].source == str(tmp_path / "abis" / "token.json")
+        assert entries[1].source == ADDRESS
+
+    def test_async_mode(self, tmp_path):
+        """The CLI default is overridden by an entry's "async" key."""
+        path = tmp_path / "m.json"
+        path.write_text(
+            json.dumps({"contracts": [{"source": ADDRESS}, {"source": ADDRESS, "async": False}]})
+        )
+
+        entries = load_manifest(path, tmp_path, async_mode=True)
+
+        assert [e.async_mode for e in entries] == [True, False]
+
+    def test_duplicate_outputs_are_unique(self, tmp_path):
+        """Entries with the same name get distinct directories."""
+        path = tmp_path / "m.json"
+        path.write_text(json.dumps({"contracts": [{"source": ADDRESS, "name": "Pool"}] * 2}))
+
+        entries = load_manifest(path, tmp_path)
+
+        assert [e.output.name for e in entries] == ["pool", "pool-2"]
+
+    def test_bundle_namespaces(self, tmp_path):
+        """Bundle entries are rendered to contracts/<namespace>, a unique identifier."""
+        path = tmp_path / "m.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "contracts": [
+                        {"source": ADDRESS, "name": "USD Coin"},
+                        {"source": ADDRESS, "name": "USD Coin", "network": "base"},
+                        {"source": ADDRESS, "output": "1inch-router"},
+                    ]
+                }
+            )
+        )
+
+        entries = load_manifest(path, tmp_path / "out", bundle=True)
+
+        assert [e.namespace for e in entries] == [
+            "usd_coin",
+            "usd_coin_2",
+            "contract_1inch_router",
+        ]
+        assert entries[0].output == tmp_path / "out" / "contracts" / "usd_coin"
+        assert all(e.namespace.isidentifier() for e in entries)
+
+    def test_bundle_requires_one_async_mode(self, tmp_path):
+        """A bundle cannot mix sync and async contract modules."""
+        path = tmp_path / "m.json"
+        path.write_text(
+            json.dumps({"contracts": [{"source": ADDRESS}, {"source": ADDRESS, "async": True}]})
+        )
+
+        with pytest.raises(ConfigurationError, match="async"):
+            load_manifest(path, tmp_path, bundle=True)
+
+    def test_file_source_requires_address(self, tmp_path):
+        """File sources without an address are rejected instead of using 0x0."""
+        path = tmp_path / "m.json"
+        path.write_text(json.dumps({"contracts": [ADDRESS, {"source": "abis/token.json"}]}))
+
+        with pytest.raises(ConfigurationError, match=r"#2 .*address"):
+            load_manifest(path, tmp_path)
+
+    def test_unknown_key_rejected(self, tmp_path):
+        """Typos in the manifest are reported."""
+        path = tmp_path / "m.json"
+        path.write_text(json.dumps({"contracts": [{"source": ADDRESS, "netwrok": "base"}]}))
+
+        with pytest.raises(ConfigurationError, match="netwrok"):
+            load_manifest(path, tmp_path)
+
+    def test_missing_contracts(self, tmp_path):
+        """A manifest without contracts is rejected."""
+        path = tmp_path / "m.json"
+        path.write_text(json.dumps({"defaults": {}}))
+
+        with pytest.raises(ConfigurationError):
+            load_manifest(path, tmp_path)
+
+
+class TestGenerateBatchCommand:
+    """Tests for abi-to-mcp generate-batch."""
+
+    def test_generates_each_contract(self, manifest, tmp_path):
+        """One server directory per contract plus a report."""
+        output = tmp_path / "servers"
+        result = runner.invoke(
+            app, ["generate-batch", str(manifest), "-o", str(output), "--workers", "0"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert (output / "my-token" / "server.py").exists()
+        assert (output / "nft" / "server.py").exists()
+
+        report = json.loads((output / REPORT_FILENAME).read_text())
+        assert report["succeeded"] == 2
+        assert report["failed"] == 0
+        assert all(c["tools"] > 0 for c in report["contracts"])
+
+    def test_regeneration_skips_unchanged_files(self, manifest, tmp_path):
+        """A second run writes nothing unless forced."""
+        output = tmp_path / "servers"
+        args = ["generate-batch", str(manifest), "-o", str(output), "--workers", "0"]
+
+        runner.invoke(app, args)
+        server_py = output / "nft" / "server.py"
+        mtime = server_py.stat().st_mtime_ns
+
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        report = json.loads((output / REPORT_FILENAME).read_text())
+        assert all(c["written"] == 0 for c in report["contracts"])
+        assert server_py.stat().st_mtime_ns == mtime
+
+        result = runner.invoke(app, args + ["--force"])
+        assert result.exit_code == 0, result.output
+        report = json.loads((output / REPORT_FILENAME).read_text())
+        assert all(c["written"] == c["files"] for c in report["contracts"])
+
+    def test_process_pool(self, manifest, tmp_path):
+        """Rendering works in worker processes."""
+        output = tmp_path / "servers"
+        result = runner.invoke(
+            app, ["generate-batch", str(manifest), "-o", str(output), "--workers", "1"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert (output / "nft" / "server.py").exists()
+
+    def test_failures_reported(self, tmp_path):
+        """A failing contract does not stop the others and sets the exit code."""
+        path = tmp_path / "m.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "contracts": [
+                        {"source": str(ABIS_DIR / "erc20.json"), "address": ADDRESS},
+                        {
+                            "source": str(tmp_path / "missing.json"),
+                            "name": "Missing",
+                            "address": ADDRESS,
+                        },
+                    ]
+                }
+            )
+        )
+        output = tmp_path / "servers"
+
+        result = runner.invoke(
+            app, ["generate-batch", str(path), "-o", str(output), "--workers", "0"]
+        )
+
+        assert result.exit_code == 1
+        report = json.loads((output / REPORT_FILENAME).read_text())
+        assert report["succeeded"] == 1
+        failed = report["contracts"][1]
+        assert failed["status"] == "fetch failed"
+        assert failed["error"]
+
+    def test_invalid_manifest(self, tmp_path):
+        """Malformed manifests fail before any work."""
+        path = tmp_path / "m.yaml"
+        path.write_text("contracts: {not: a list}")
+
+        result = runner.invoke(app, ["generate-batch", str(path), "-o", str(tmp_path / "o")])
+
+        assert result.exit_code == 1
+        assert "contracts" in result.output
+
+    def test_bundle(self, manifest, tmp_path):
+        """--bundle writes one server with a module per contract."""
+        output = tmp_path / "bundle"
+        args = ["generate-batch", str(manifest), "-o", str(output), "--workers", "0", "--bundle"]
+
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 0, result.output
+        assert (output / "server.py").exists()
+        assert (output / "bundle_runtime.py").exists()
+        assert (output / "contracts" / "my_token" / "__init__.py").exists()
+        assert (output / "contracts" / "nft" / "abi.json").exists()
+        assert not (output / "nft" / "server.py").exists()
+
+        config = json.loads((output / "bundle.json").read_text())
+        assert list(config["contracts"]) == ["my_token", "nft"]
+        assert config["contracts"]["nft"] == {
+            "name": "ERC721",
+            "address": ADDRESS,
+            "network": "polygon",
+        }
+        assert list(config["networks"]) == ["polygon"]
+
+        report = json.loads((output / REPORT_FILENAME).read_text())
+        assert [c["namespace"] for c in report["contracts"]] == ["my_token", "nft"]
+        assert "bundle_contract" not in report["contracts"][0]
+
+        # Regenerating an unchanged bundle rewrites nothing
+        server_py = output / "server.py"
+        mtime = server_py.stat().st_mtime_ns
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert server_py.stat().st_mtime_ns == mtime
+        assert "(0 files written)" in " ".join(result.output.split())
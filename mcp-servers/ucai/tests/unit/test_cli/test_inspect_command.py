@@ -95,3 +95,40 @@ class TestInspectCommand:
         result = runner.invoke(app, ["inspect", str(bad_file)])
         # Should either error or show that no functions/events were found
         assert result.exit_code != 0 or "0" in result.stdout or "empty" in result.stdout.lower()
+
+
+class TestInspectCheckAddresses:
+    """Tests for inspect --check."""
+
+    @pytest.fixture
+    def erc20_abi_path(self):
+        """Get path to ERC20 ABI fixture."""
+        return Path(__file__).parent.parent.parent / "fixtures" / "abis" / "erc20.json"
+
+    def test_check_addresses(self, erc20_abi_path, rpc_servers, tmp_path):
+        """Addresses from options and @files are checked in batched requests."""
+        node = rpc_servers()
+        contract, wallet = f"0x{1:040x}", f"0x{2:040x}"
+        node.codes[contract] = "0x6080"
+        node.balances[wallet] = 2 * 10**18
+        node.nonces[wallet] = 7
+        listing = tmp_path / "addresses.txt"
+        listing.write_text(f"{wallet}  # treasury\n\n")
+
+        result = runner.invoke(
+            app,
+            [
+                "inspect", str(erc20_abi_path),
+                "--rpc-url", node.url,
+                "--check", f"{contract},0xbad",
+                "--check", f"@{listing}",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "contract" in result.stdout
+        assert "2.000000" in result.stdout
+        assert "Checked: 3 (1 failed)" in result.stdout
+        # one batch per query kind after connecting
+        assert node.requests.count("eth_getBalance") == 2
+        assert node.posts <= 6
@@ -0,0 +1,87 @@
+"""Tests for CLI startup cost.
+
+`abi-to-mcp --version` and `--help` only need Typer. These tests fail when an
+import at the top of cli.main (or a package __init__) starts loading the
+command modules or their heavy dependencies again.
+"""
+
+import json
+import subprocess
+import sys
+import time
+
+# Seconds `import abi_to_mcp.cli.main` may take, best of RUNS. The import takes
+# about 30 ms; the budget leaves room for slow CI machines.
+IMPORT_BUDGET = 0.2
+# Seconds a whole `--version` run may take, interpreter startup included
+# (about 90 ms, of which 40 ms is the bare interpreter).
+VERSION_BUDGET = 0.5
+RUNS = 3
+
+# Modules only the commands themselves need
+DEFERRED_MODULES = [
+    "rich",
+    "web3",
+    "eth_abi",
+    "jinja2",
+    "httpx",
+    "yaml",
+    "asyncio",
+    "abi_to_mcp.core",
+    "abi_to_mcp.cli.commands",
+]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import abi_to_mcp.cli.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _probe() -> dict:
+    """Import cli.main in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+class TestStartup:
+    """Tests for the cost of starting the CLI."""
+
+    def test_heavy_modules_deferred(self):
+        """Importing the CLI loads none of the command dependencies."""
+        modules = set(_probe()["modules"])
+
+        loaded = [
+            name
+            for name in DEFERRED_MODULES
+            if name in modules or any(m.startswith(name + ".") for m in modules)
+        ]
+        assert loaded == []
+
+    def test_import_within_budget(self):
+        """Importing the CLI stays within the startup budget."""
+        elapsed = min(_probe()["elapsed"] for _ in range(RUNS))
+
+        assert elapsed < IMPORT_BUDGET, f"import took {elapsed * 1000:.0f} ms"
+
+    def test_version_within_budget(self):
+        """--version runs in a fresh interpreter within the startup budget."""
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-m", "abi_to_mcp.cli.main", "--version"],
+                capture_output=True,
+                text=True,
+            )
+            timings.append(time.perf_counter() - started)
+
+            assert result.returncode == 0, result.stderr
+            assert "UCAI version" in result.stdout
+
+        elapsed = min(timings)
+        assert elapsed < VERSION_BUDGET, f"--version took {elapsed * 1000:.0f} ms"
@@ -148,12 +148,12 @@ runner = CliRunner()
 class TestValidateCommandExtended:
     """Extended tests for validate command."""
 
-    def test_validate_not_a_file(self, tmp_path):
-        """Error when path is a directory."""
+    def test_validate_empty_directory(self, tmp_path):
+        """Error when a directory holds no ABI files."""
         result = runner.invoke(app, ["validate", str(tmp_path)])
-        
+
         assert result.exit_code != 0
-        assert "Not a file" in result.output or "not found" in result.output.lower()
+        assert "No ABI files found" in result.output
 
     def test_validate_with_strict_mode(self, tmp_path):
         """Strict mode performs additional checks."""
@@ -499,3 +499,105 @@ class TestValidateCommandExceptions:
                 assert result.exit_code != 0 or "error" in result.output.lower()
             finally:
                 os.unlink(f.name)
+
+
+class TestValidateMany:
+    """Tests for validating directories, globs and several files."""
+
+    ABIS_DIR = Path(__file__).parent.parent.parent / "fixtures" / "abis"
+
+    @pytest.fixture
+    def abi_dir(self, tmp_path):
+        """A directory tree of ABIs, one of them invalid."""
+        root = tmp_path / "abis"
+        (root / "nested").mkdir(parents=True)
+        for name in ("erc20.json", "erc721.json"):
+            (root / name).write_text((self.ABIS_DIR / name).read_text())
+        (root / "nested" / "token.dbg.json").write_text('{"buildInfo": "x"}')
+        (root / "nested" / "broken.json").write_text("not json")
+        (root / "notes.txt").write_text("ignored")
+        return root
+
+    def _jsonl(self, result):
+        return [json.loads(line) for line in result.stdout.splitlines()]
+
+    def test_directory(self, abi_dir):
+        """Directories are searched recursively; any failure sets the exit code."""
+        result = runner.invoke(app, ["validate", str(abi_dir), "--workers", "0"])
+
+        assert result.exit_code == 1
+        assert "broken.json" in result.output
+        assert "4 file(s): 2 passed, 2 failed" in " ".join(result.output.split())
+
+    def test_jsonl_and_exclude(self, abi_dir):
+        """JSONL has one object per file; excluded files are left out."""
+        result = runner.invoke(
+            app,
+            ["validate", str(abi_dir), "-f", "jsonl", "-x", "*.dbg.json", "-x", "*/nested/*"],
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = self._jsonl(result)
+        assert [Path(r["path"]).name for r in lines] == ["erc20.json", "erc721.json"]
+        assert all(r["status"] == "passed" and r["hash"] for r in lines)
+
+    def test_glob_and_missing_file(self, abi_dir):
+        """Glob patterns are expanded; sources matching nothing fail."""
+        result = runner.invoke(
+            app,
+            ["validate", str(abi_dir / "erc*.json"), str(abi_dir / "missing.json"), "-f", "jsonl"],
+        )
+
+        assert result.exit_code == 1
+        lines = self._jsonl(result)
+        assert len(lines) == 3
+        assert lines[-1]["errors"] == ["File not found"]
+
+    def test_unchanged_files_skipped(self, abi_dir):
+        """A re-run reuses results of files with the same structural hash."""
+        args = ["validate", str(abi_dir), "-f", "jsonl", "-x", "*/nested/*", "-w", "0"]
+        first = self._jsonl(runner.invoke(app, args))
+        assert not any(r["cached"] for r in first)
+
+        second = self._jsonl(runner.invoke(app, args))
+        assert all(r["cached"] for r in second)
+        assert [r["hash"] for r in second] == [r["hash"] for r in first]
+
+        # Reformatting keeps the structural hash; changing the ABI does not
+        erc20 = abi_dir / "erc20.json"
+        erc20.write_text(json.dumps(json.loads(erc20.read_text()), indent=4))
+        erc721 = abi_dir / "erc721.json"
+        erc721.write_text(json.dumps(json.loads(erc721.read_text())[:3]))
+
+        third = {Path(r["path"]).name: r for r in self._jsonl(runner.invoke(app, args))}
+        assert third["erc20.json"]["cached"] is True
+        assert third["erc721.json"]["cached"] is False
+        assert third["erc721.json"]["entries"] == 3
+
+        # --strict results are cached separately
+        strict = self._jsonl(runner.invoke(app, args + ["--strict"]))
+        assert not any(r["cached"] for r in strict)
+
+    def test_deleted_files_pruned_from_cache(self, abi_dir):
+        """Cache entries of files that no longer exist are dropped on save."""
+        from abi_to_mcp.cli.commands.validate import _cache_path
+
+        args = ["validate", str(abi_dir), "-f", "jsonl", "-w", "0"]
+        runner.invoke(app, args)
+        erc20 = (abi_dir / "erc20.json").resolve()
+        assert str(erc20) in json.loads(_cache_path().read_text())["files"]
+
+        erc20.unlink()
+        runner.invoke(app, args)
+
+        assert str(erc20) not in json.loads(_cache_path().read_text())["files"]
+
+    def test_process_pool(self, abi_dir):
+        """Files are validated in worker processes."""
+        result = runner.invoke(
+            app, ["validate", str(abi_dir), "-f", "jsonl", "--workers", "2", "--no-cache"]
+        )
+
+        lines = self._jsonl(result)
+        assert len(lines) == 4
+        assert sum(r["status"] == "failed" for r in lines) == 2
@@ -0,0 +1,183 @@
+"""Tests for compiled ABI artifacts."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from abi_to_mcp.core import compiled as compiled_module
+from abi_to_mcp.core.compiled import (
+    COMPILED_SUFFIX,
+    CompiledABI,
+    compile_abi,
+    dump_compiled,
+    hash_abi,
+    is_compiled_artifact,
+    load_compiled,
+    load_compiled_bytes,
+    load_or_compile,
+    save_compiled,
+)
+from abi_to_mcp.core.exceptions import ABIParseError
+
+FIXTURES = Path(__file__).parent.parent.parent / "fixtures" / "abis"
+
+
+@pytest.fixture
+def erc20_abi():
+    """ERC20 ABI fixture."""
+    return json.loads((FIXTURES / "erc20.json").read_text())
+
+
+@pytest.fixture
+def struct_abi():
+    """ABI with nested tuples, arrays and a payable function."""
+    order = {
+        "name": "order",
+        "type": "tuple",
+        "internalType": "struct Order",
+        "components": [
+            {"name": "maker", "type": "address"},
+            {
+                "name": "legs",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "token", "type": "address"},
+                    {"name": "amount", "type": "uint256"},
+                ],
+            },
+        ],
+    }
+    return [
+        {
+            "type": "function",
+            "name": "fill",
+            "stateMutability": "payable",
+            "inputs": [order, {"name": "ids", "type": "uint256[3]"}],
+            "outputs": [{"name": "", "type": "bytes32"}],
+        },
+        {
+            "type": "event",
+            "name": "Filled",
+            "anonymous": False,
+            "inputs": [{"name": "maker", "type": "address", "indexed": True}],
+        },
+        {"type": "error", "name": "Expired", "inputs": [{"name": "at", "type": "uint64"}]},
+        {"type": "receive", "stateMutability": "payable"},
+    ]
+
+
+class TestRoundTrip:
+    """Tests for dumping and loading artifacts."""
+
+    @pytest.mark.parametrize("abi_fixture", ["erc20_abi", "struct_abi"])
+    def test_round_trip_preserves_models(self, abi_fixture, request):
+        """Loaded artifacts equal the freshly compiled models."""
+        abi = request.getfixturevalue(abi_fixture)
+        compiled = compile_abi(abi)
+
+        loaded = load_compiled_bytes(dump_compiled(compiled))
+
+        assert loaded.abi_hash == compiled.abi_hash == hash_abi(abi)
+        assert loaded.parsed == compiled.parsed
+        assert loaded.tools == compiled.tools
+        assert loaded.resources == compiled.resources
+
+    def test_mapped_section_decoded_lazily(self, struct_abi):
+        """Tools are only decoded on first access."""
+        loaded = load_compiled_bytes(dump_compiled(compile_abi(struct_abi)))
+
+        assert loaded._tools is None
+        assert loaded.tools[0].name == "fill"
+        assert loaded._mapped_data is None
+
+    def test_save_and_load_file(self, struct_abi, tmp_path):
+        """Artifacts are written atomically and recognised by their magic."""
+        path = save_compiled(compile_abi(struct_abi), tmp_path / "nested" / "fill.abic")
+
+        assert is_compiled_artifact(path)
+        assert not is_compiled_artifact(FIXTURES / "erc20.json")
+        assert not is_compiled_artifact(tmp_path / "missing.abic")
+        assert load_compiled(path).parsed.functions[0].name == "fill"
+
+    def test_select(self, erc20_abi):
+        """select applies the read-only and events options."""
+        compiled = compile_abi(erc20_abi)
+
+        tools, resources = compiled.select(read_only=True, include_events=False)
+
+        assert tools and all(t.is_read_only for t in tools)
+        assert len(tools) < len(compiled.tools)
+        assert resources == []
+
+
+class TestRejection:
+    """Tests for rejecting stale or invalid artifacts."""
+
+    def test_not_an_artifact(self):
+        """Arbitrary bytes are rejected."""
+        with pytest.raises(ABIParseError, match="Not a compiled"):
+            load_compiled_bytes(b'[{"type": "function"}]')
+
+    def test_hash_mismatch(self, erc20_abi):
+        """An artifact for another ABI is rejected."""
+        data = dump_compiled(compile_abi(erc20_abi))
+
+        with pytest.raises(ABIParseError, match="does not match"):
+            load_compiled_bytes(data, abi_hash="00" * 32)
+
+    def test_format_version_mismatch(self, erc20_abi, monkeypatch):
+        """Artifacts written by another format version are rejected."""
+        data = dump_compiled(compile_abi(erc20_abi))
+        monkeypatch.setattr(compiled_module, "COMPILED_FORMAT_VERSION", 99)
+
+        with pytest.raises(ABIParseError, match="not supported"):
+            load_compiled_bytes(data)
+
+    def test_package_version_mismatch(self, erc20_abi, monkeypatch):
+        """Artifacts written by another package version are rejected."""
+        data = dump_compiled(compile_abi(erc20_abi))
+        monkeypatch.setattr(compiled_module, "__version__", "0.0.0-other")
+
+        with pytest.raises(ABIParseError, match="recompile"):
+            load_compiled_bytes(data)
+
+    def test_corrupt_payload(self, erc20_abi):
+        """Truncated payloads are reported as corrupt."""
+        data = dump_compiled(compile_abi(erc20_abi))
+
+        with pytest.raises(ABIParseError, match="Corrupt"):
+            load_compiled_bytes(data[:-20])
+
+
+class TestLoadOrCompile:
+    """Tests for the hash-keyed compiled cache."""
+
+    def test_compiles_once(self, struct_abi, tmp_path, monkeypatch):
+        """The second call loads the artifact written by the first."""
+        first = load_or_compile(struct_abi, tmp_path)
+        assert (tmp_path / f"{first.abi_hash}{COMPILED_SUFFIX}").exists()
+
+        monkeypatch.setattr(
+            compiled_module, "compile_abi", lambda *a: pytest.fail("recompiled")
+        )
+        second = load_or_compile(struct_abi, tmp_path)
+
+        assert second.tools == first.tools
+
+    def test_stale_artifact_replaced(self, struct_abi, tmp_path):
+        """An unreadable artifact is recompiled and overwritten."""
+        path = tmp_path / f"{hash_abi(struct_abi)}{COMPILED_SUFFIX}"
+        path.write_bytes(b"garbage")
+
+        compiled = load_or_compile(struct_abi, tmp_path)
+
+        assert isinstance(compiled, CompiledABI)
+        assert is_compiled_artifact(path)
+
+    def test_without_directory(self, erc20_abi, tmp_path):
+        """No directory means no caching."""
+        compiled = load_or_compile(erc20_abi)
+
+        assert compiled.parsed.detected_standard == "ERC20"
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,175 @@
+"""Tests for streaming artifact extraction."""
+
+import io
+import json
+
+import pytest
+
+from abi_to_mcp.core.exceptions import ABINotFoundError, ABIParseError
+from abi_to_mcp.fetchers.artifact import (
+    JSONStreamReader,
+    find_artifact_contract,
+    iter_artifact_contracts,
+)
+from abi_to_mcp.fetchers.file import FileFetcher
+
+
+TOKEN_ABI = [{"type": "function", "name": "transfer", "inputs": [], "outputs": []}]
+VAULT_ABI = [{"type": "function", "name": "deposit", "inputs": [], "outputs": []}]
+
+
+@pytest.fixture
+def build_info(tmp_path):
+    """Write a Hardhat build-info file with sources, bytecode and ASTs."""
+    source = 'contract Token { string s = "}{\\"]["; }\n' * 50
+    data = {
+        "id": "4f2c",
+        "_format": "hh-sol-build-info-1",
+        "solcVersion": "0.8.20",
+        "solcLongVersion": "0.8.20+commit.a1b79de6",
+        "input": {"language": "Solidity", "sources": {"contracts/Token.sol": {"content": source}}},
+        "output": {
+            "contracts": {
+                "contracts/Token.sol": {
+                    "Token": {"abi": TOKEN_ABI, "evm": {"bytecode": {"object": "60" * 500}}},
+                    "ITokenHook": {"abi": []},
+                },
+                "contracts/Vault.sol": {"Vault": {"abi": VAULT_ABI, "metadata": "{}"}},
+            },
+            "sources": {
+                "contracts/Token.sol": {"id": 0, "ast": {"nodes": [{"a": [1, 2.5e3, None, True]}]}}
+            },
+        },
+    }
+    path = tmp_path / "build-info.json"
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+class TestJSONStreamReader:
+    """Tests for the incremental JSON reader."""
+
+    def test_read_and_skip_across_chunks(self):
+        """Values split across tiny buffers are read correctly."""
+        text = json.dumps(
+            {"skip": {"x": ["}", '\\"', [1, {"y": "]"}]]}, "n": -1.5e3, "keep": [1, 'a"b\\']}
+        )
+        reader = JSONStreamReader(io.StringIO(text), chunk_size=3)
+
+        values = {}
+        for key in reader.iter_object():
+            if key == "skip":
+                reader.skip_value()
+            else:
+                values[key] = reader.read_value()
+
+        assert values == {"n": -1500.0, "keep": [1, 'a"b\\']}
+
+    def test_empty_object(self):
+        """Empty objects yield no keys."""
+        reader = JSONStreamReader(io.StringIO("{ }"))
+        assert list(reader.iter_object()) == []
+
+    def test_truncated_input(self):
+        """Truncated documents raise ABIParseError."""
+        reader = JSONStreamReader(io.StringIO('{"a": [1, 2'), chunk_size=4)
+
+        with pytest.raises(ABIParseError):
+            for _ in reader.iter_object():
+                reader.skip_value()
+
+    def test_missing_value(self):
+        """A separator where a value belongs raises ABIParseError."""
+        reader = JSONStreamReader(io.StringIO('{"a": , "b": 1}'))
+
+        with pytest.raises(ABIParseError, match="Unexpected character ','"):
+            for _ in reader.iter_object():
+                reader.skip_value()
+
+
+class TestArtifactContracts:
+    """Tests for contract enumeration and selection."""
+
+    def test_enumerate_build_info(self, build_info):
+        """Every contract with an ABI is listed with its compiler version."""
+        contracts = list(iter_artifact_contracts(build_info, chunk_size=64))
+
+        assert [c.qualified_name for c in contracts] == [
+            "contracts/Token.sol:Token",
+            "contracts/Vault.sol:Vault",
+        ]
+        assert contracts[0].abi == TOKEN_ABI
+        assert contracts[0].compiler_version == "0.8.20+commit.a1b79de6"
+
+    def test_standard_json_version_from_metadata(self, tmp_path):
+        """solc standard-json output takes the version from contract metadata."""
+        metadata = json.dumps({"compiler": {"version": "0.8.24+commit.e11b9ed9"}})
+        path = tmp_path / "out.json"
+        path.write_text(
+            json.dumps({"contracts": {"A.sol": {"A": {"abi": TOKEN_ABI, "metadata": metadata}}}})
+        )
+
+        (contract,) = iter_artifact_contracts(path)
+
+        assert contract.compiler_version == "0.8.24+commit.e11b9ed9"
+
+    def test_single_contract_artifact(self, tmp_path):
+        """Hardhat artifacts yield their one contract."""
+        path = tmp_path / "Token.json"
+        path.write_text(
+            json.dumps(
+                {"contractName": "Token", "abi": TOKEN_ABI, "compiler": {"version": "0.8.1"}}
+            )
+        )
+
+        (contract,) = iter_artifact_contracts(path)
+
+        assert contract.name == "Token"
+        assert contract.compiler_version == "0.8.1"
+
+    def test_select_by_name(self, build_info):
+        """Contracts can be selected by short or qualified name."""
+        assert find_artifact_contract(build_info, "Vault").abi == VAULT_ABI
+        assert find_artifact_contract(build_info, "contracts/Token.sol:Token").abi == TOKEN_ABI
+
+    def test_ambiguous_without_selection(self, build_info):
+        """Multi-contract artifacts require a selection."""
+        with pytest.raises(ABIParseError, match="Token.*Vault"):
+            find_artifact_contract(build_info)
+
+    def test_unknown_contract(self, build_info):
+        """Unknown names list what is available."""
+        with pytest.raises(ABINotFoundError, match="Available"):
+            find_artifact_contract(build_info, "Missing")
+
+
+class TestFileFetcherStreaming:
+    """Tests for FileFetcher on build artifacts."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_contract(self, build_info):
+        """A contract can be requested from a build-info file."""
+        result = await FileFetcher().fetch(str(build_info), contract="Vault")
+
+        assert result.contract_name == "Vault"
+        assert result.abi == VAULT_ABI
+        assert result.source == "file"
+
+    @pytest.mark.asyncio
+    async def test_large_files_are_streamed(self, tmp_path, monkeypatch):
+        """Files above the threshold skip json.load."""
+        path = tmp_path / "Token.json"
+        path.write_text(json.dumps({"contractName": "Token", "abi": TOKEN_ABI}))
+        monkeypatch.setattr(FileFetcher, "STREAMING_THRESHOLD", 0)
+        monkeypatch.setattr(json, "load", lambda *a, **k: pytest.fail("json.load called"))
+
+        result = await FileFetcher().fetch(str(path))
+
+        assert result.contract_name == "Token"
+
+    @pytest.mark.asyncio
+    async def test_fetch_all(self, build_info):
+        """All contracts are enumerated."""
+        results = await FileFetcher().fetch_all(str(build_info))
+
+        assert [r.contract_name for r in results] == ["Token", "Vault"]
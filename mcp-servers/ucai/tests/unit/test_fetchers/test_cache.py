@@ -0,0 +1,216 @@
+"""Tests for the persistent ABI cache."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from abi_to_mcp.fetchers.base import ABIFetcher
+from abi_to_mcp.fetchers.cache import ABICache
+from abi_to_mcp.fetchers.registry import FetcherRegistry
+from abi_to_mcp.core.models import FetchResult
+from abi_to_mcp.core.exceptions import ABINotFoundError
+
+
+PROXY = "0x" + "a" * 40
+IMPL = "0x" + "b" * 40
+OTHER = "0x" + "c" * 40
+ABI = [{"type": "function", "name": "balanceOf", "inputs": [], "outputs": []}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    return ABICache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def proxy_result():
+    """A fetch result for a proxy contract."""
+    return FetchResult(
+        abi=ABI,
+        source="etherscan",
+        source_location=PROXY,
+        contract_name="Token",
+        is_proxy=True,
+        implementation_address=IMPL,
+    )
+
+
+class TestABICache:
+    """Tests for ABICache."""
+
+    def test_miss_returns_none(self, cache):
+        """Unknown entries are a miss."""
+        assert cache.get(PROXY, 1) is None
+
+    def test_round_trip(self, cache, proxy_result):
+        """Stored results come back with proxy metadata."""
+        cache.put(PROXY, 1, proxy_result)
+
+        result = cache.get(PROXY.upper().replace("0X", "0x"), 1)
+
+        assert result is not None
+        assert result.abi == ABI
+        assert result.is_proxy is True
+        assert result.implementation_address == IMPL
+        assert result.contract_name == "Token"
+        assert result.source == "etherscan"
+
+    def test_entries_are_per_chain(self, cache, proxy_result):
+        """The same address on another chain is a separate entry."""
+        cache.put(PROXY, 1, proxy_result)
+
+        assert cache.get(PROXY, 137) is None
+
+    def test_abi_blobs_are_content_addressed(self, cache, proxy_result):
+        """Identical ABIs are stored once."""
+        cache.put(PROXY, 1, proxy_result)
+        cache.put(OTHER, 1, proxy_result)
+
+        assert len(list(cache.abi_dir.glob("*.json"))) == 1
+
+    def test_hash_ignores_key_order(self):
+        """Content hash is stable across dict key ordering."""
+        a = [{"type": "function", "name": "x"}]
+        b = [{"name": "x", "type": "function"}]
+        assert ABICache.hash_abi(a) == ABICache.hash_abi(b)
+
+    def test_expired_entry_is_miss(self, tmp_path, proxy_result):
+        """Entries older than the TTL are not served."""
+        cache = ABICache(cache_dir=tmp_path, ttl=0)
+        cache.put(PROXY, 1, proxy_result)
+
+        assert cache.get(PROXY, 1) is None
+        assert cache.get(PROXY, 1, allow_expired=True) is not None
+
+    def test_no_ttl_never_expires(self, tmp_path, proxy_result):
+        """A TTL of None keeps entries forever."""
+        cache = ABICache(cache_dir=tmp_path, ttl=None)
+        cache.put(PROXY, 1, proxy_result)
+
+        assert cache.get(PROXY, 1) is not None
+
+    def test_invalidate_by_address(self, cache, proxy_result):
+        """Invalidate removes entries for the address."""
+        cache.put(PROXY, 1, proxy_result)
+        cache.put(PROXY, 137, proxy_result)
+
+        assert cache.invalidate(PROXY, chain_id=1) == 1
+        assert cache.get(PROXY, 1) is None
+        assert cache.get(PROXY, 137) is not None
+
+    def test_invalidate_by_implementation(self, cache, proxy_result):
+        """Invalidating an implementation drops proxies resolved through it."""
+        cache.put(PROXY, 1, proxy_result)
+
+        assert cache.invalidate(IMPL) == 1
+        assert cache.get(PROXY, 1) is None
+
+    def test_clear(self, cache, proxy_result):
+        """Clear removes everything."""
+        cache.put(PROXY, 1, proxy_result)
+        cache.clear()
+
+        assert cache.get(PROXY, 1) is None
+
+    def test_corrupt_entry_is_miss(self, cache, proxy_result):
+        """Corrupt files are treated as a miss."""
+        cache.put(PROXY, 1, proxy_result)
+        (cache.index_dir / "1" / f"{PROXY}.json").write_text("{not json")
+
+        assert cache.get(PROXY, 1) is None
+
+    def test_default_dir_from_env(self, tmp_path, monkeypatch):
+        """ABI_TO_MCP_CACHE_DIR overrides the default location."""
+        monkeypatch.setenv("ABI_TO_MCP_CACHE_DIR", str(tmp_path))
+        assert ABICache().cache_dir == tmp_path
+
+
+class TestRegistryWithCache:
+    """Tests for FetcherRegistry cache integration."""
+
+    @pytest.fixture
+    def fetcher(self, proxy_result):
+        """A mock address fetcher."""
+        fetcher = Mock(spec=ABIFetcher)
+        fetcher.can_handle = Mock(return_value=True)
+        fetcher.fetch = AsyncMock(return_value=proxy_result)
+        return fetcher
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_served_from_cache(self, cache, fetcher):
+        """Only the first fetch reaches the fetcher."""
+        registry = FetcherRegistry(cache=cache)
+        registry.register(fetcher)
+
+        first = await registry.fetch(PROXY, network="mainnet")
+        second = await registry.fetch(PROXY, network="mainnet")
+
+        assert fetcher.fetch.call_count == 1
+        assert second.abi == first.abi
+        assert second.implementation_address == IMPL
+
+    @pytest.mark.asyncio
+    async def test_network_selects_chain(self, cache, fetcher):
+        """Different networks do not share entries."""
+        registry = FetcherRegistry(cache=cache)
+        registry.register(fetcher)
+
+        await registry.fetch(PROXY, network="mainnet")
+        await registry.fetch(PROXY, network="polygon")
+
+        assert fetcher.fetch.call_count == 2
+        assert cache.get(PROXY, 137) is not None
+
+    @pytest.mark.asyncio
+    async def test_offline_serves_from_cache(self, tmp_path, fetcher, proxy_result):
+        """Offline mode serves expired entries without fetching."""
+        cache = ABICache(cache_dir=tmp_path, ttl=0)
+        cache.put(PROXY, 1, proxy_result)
+
+        registry = FetcherRegistry(cache=cache, offline=True)
+        registry.register(fetcher)
+
+        result = await registry.fetch(PROXY)
+
+        assert result.abi == ABI
+        fetcher.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_offline_miss_raises(self, cache, fetcher):
+        """Offline mode never goes to the network."""
+        registry = FetcherRegistry(cache=cache, offline=True)
+        registry.register(fetcher)
+
+        with pytest.raises(ABINotFoundError, match="offline"):
+            await registry.fetch(PROXY)
+
+        fetcher.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_cached(self, cache, fetcher):
+        """Failures leave no cache entry."""
+        fetcher.fetch = AsyncMock(side_effect=ABINotFoundError(PROXY))
+        registry = FetcherRegistry(cache=cache)
+        registry.register(fetcher)
+
+        with pytest.raises(ABINotFoundError):
+            await registry.fetch(PROXY)
+
+        assert cache.get(PROXY, 1) is None
+
+    @pytest.mark.asyncio
+    async def test_file_sources_bypass_cache(self, cache, tmp_path):
+        """Local files are never cached."""
+        from abi_to_mcp.fetchers.file import FileFetcher
+        import json
+
+        abi_file = tmp_path / "abi.json"
+        abi_file.write_text(json.dumps(ABI))
+
+        registry = FetcherRegistry(cache=cache, offline=True)
+        registry.register(FileFetcher())
+
+        result = await registry.fetch(str(abi_file))
+
+        assert result.source == "file"
+        assert not cache.index_dir.exists()
@@ -0,0 +1,141 @@
+"""Tests for the pooled HTTP client shared by network fetchers."""
+
+import json
+import sys
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from abi_to_mcp.core.config import FetcherConfig
+from abi_to_mcp.fetchers.client import create_http_client, http_client_options
+from abi_to_mcp.fetchers.etherscan import EtherscanFetcher
+from abi_to_mcp.fetchers.registry import create_default_registry
+
+
+class MockResponse:
+    """Mock httpx response."""
+
+    def __init__(self, json_data, status_code=200):
+        self._json_data = json_data
+        self.status_code = status_code
+
+    def json(self):
+        return self._json_data
+
+    def raise_for_status(self):
+        pass
+
+
+class TestHTTPClientOptions:
+    """Tests for client construction from FetcherConfig."""
+
+    def test_pool_knobs_from_config(self):
+        """Pool limits and timeouts come from the config."""
+        config = FetcherConfig(
+            timeout=12.0,
+            connect_timeout=3.0,
+            max_connections=7,
+            max_keepalive_connections=4,
+            keepalive_expiry=9.0,
+        )
+
+        options = http_client_options(config)
+
+        assert options["limits"].max_connections == 7
+        assert options["limits"].max_keepalive_connections == 4
+        assert options["limits"].keepalive_expiry == 9.0
+        assert options["timeout"].read == 12.0
+        assert options["timeout"].connect == 3.0
+        assert options["http2"] is False
+
+    def test_http2_requires_h2(self):
+        """Requesting HTTP/2 without h2 gives an install hint."""
+        with patch.dict(sys.modules, {"h2": None}):
+            with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+                http_client_options(FetcherConfig(http2=True))
+
+    @pytest.mark.asyncio
+    async def test_create_http_client(self):
+        """A real client is created with the defaults."""
+        client = create_http_client()
+        try:
+            assert isinstance(client, httpx.AsyncClient)
+        finally:
+            await client.aclose()
+
+
+class TestEtherscanClientReuse:
+    """Tests for connection reuse in EtherscanFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_proxied_fetch_uses_one_client(self):
+        """ABI fetch, proxy probes and implementation fetch share one client."""
+        impl = "0x" + "b" * 40
+        abi = json.dumps([{"type": "function", "name": "balanceOf"}])
+
+        def respond(url, params=None, timeout=None):
+            if params["action"] == "getabi":
+                return MockResponse({"status": "1", "result": abi})
+            if params["action"] == "eth_getStorageAt":
+                return MockResponse({"result": "0x" + "0" * 24 + impl[2:]})
+            return MockResponse({"result": "0x"})
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.get = AsyncMock(side_effect=respond)
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with EtherscanFetcher(api_key="test-key") as fetcher:
+                result = await fetcher.fetch("0x" + "a" * 40, network="mainnet")
+
+            assert result.is_proxy is True
+            assert mock_client_class.call_count == 1
+            assert mock_client.get.await_count >= 3
+            mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_injected_client_not_closed(self):
+        """A client passed in by the caller is left open."""
+        shared = Mock()
+        shared.aclose = AsyncMock()
+
+        fetcher = EtherscanFetcher(client=shared)
+        await fetcher.aclose()
+
+        assert fetcher._get_client() is shared
+        shared.aclose.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_probe_timeout_from_config(self):
+        """Proxy probes use the configured probe timeout."""
+        client = Mock()
+        client.get = AsyncMock(return_value=MockResponse({"result": "0x"}))
+
+        fetcher = EtherscanFetcher(client=client, config=FetcherConfig(probe_timeout=2.5))
+        await fetcher._detect_minimal_proxy("https://api", "0x" + "a" * 40, None)
+
+        assert client.get.call_args.kwargs["timeout"] == 2.5
+
+
+class TestRegistrySharedClient:
+    """Tests for the registry-scoped connection pool."""
+
+    @pytest.mark.asyncio
+    async def test_fetchers_share_registry_client(self):
+        """Etherscan and Sourcify use the registry's client."""
+        registry = create_default_registry()
+        etherscan, sourcify = registry.fetchers[1], registry.fetchers[2]
+
+        assert etherscan._get_client() is sourcify.client
+
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self):
+        """Leaving the registry context closes the shared client."""
+        async with create_default_registry() as registry:
+            client = registry.fetchers[2].client
+
+        assert client.is_closed
@@ -129,8 +129,16 @@ async def test_unknown_network(etherscan_fetcher):
 
 
 @pytest.mark.asyncio
-async def test_rate_limit_error(etherscan_fetcher):
-    """Test rate limit handling."""
+async def test_rate_limit_error():
+    """Test rate limit handling once retries are exhausted."""
+    from abi_to_mcp.core.config import FetcherConfig
+    from abi_to_mcp.fetchers.ratelimit import RateLimiter
+
+    etherscan_fetcher = EtherscanFetcher(
+        api_key="test-key",
+        config=FetcherConfig(retry_delay=0.0),
+        rate_limiter=RateLimiter(),
+    )
     mock_response = MockResponse({}, status_code=429)
     
     with patch("httpx.AsyncClient") as mock_client_class:
@@ -415,3 +423,137 @@ class TestEtherscanImportError:
         # Invalid addresses
         assert not fetcher.ADDRESS_PATTERN.match("invalid")
         assert not fetcher.ADDRESS_PATTERN.match("0x123")
+
+
+class TestConcurrentProxyDetection:
+    """Tests for concurrent proxy probing."""
+
+    PROXY = "0x" + "a" * 40
+    IMPL = "0x" + "b" * 40
+    BEACON = "0x" + "c" * 40
+
+    @pytest.fixture
+    def fetcher(self):
+        """Create fetcher whose probes all come back empty by default."""
+        fetcher = EtherscanFetcher(api_key="test-key")
+        fetcher._get_storage_at = AsyncMock(return_value=None)
+        fetcher._call_implementation_function = AsyncMock(return_value=None)
+        fetcher._detect_minimal_proxy = AsyncMock(return_value=None)
+        return fetcher
+
+    def _slot_value(self, address):
+        return "0x" + "0" * 24 + address[2:]
+
+    @pytest.mark.asyncio
+    async def test_not_a_proxy(self, fetcher):
+        """All probes inconclusive means no proxy."""
+        assert await fetcher._detect_proxy(self.PROXY, "mainnet", "https://api", None) is None
+
+    @pytest.mark.asyncio
+    async def test_uups_slot(self, fetcher):
+        """EIP-1822 proxiable slot is detected."""
+        async def storage(api_url, address, slot, api_key):
+            if slot == fetcher.PROXIABLE_SLOT:
+                return self._slot_value(self.IMPL)
+            return "0x" + "0" * 64
+
+        fetcher._get_storage_at = AsyncMock(side_effect=storage)
+
+        impl = await fetcher._detect_proxy(self.PROXY, "mainnet", "https://api", None)
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_beacon_proxy(self, fetcher):
+        """Beacon proxies resolve through the beacon's implementation()."""
+        async def storage(api_url, address, slot, api_key):
+            if slot == fetcher.BEACON_SLOT:
+                return self._slot_value(self.BEACON)
+            return None
+
+        async def implementation(api_url, address, api_key):
+            return self.IMPL if address == self.BEACON else None
+
+        fetcher._get_storage_at = AsyncMock(side_effect=storage)
+        fetcher._call_implementation_function = AsyncMock(side_effect=implementation)
+
+        impl = await fetcher._detect_proxy(self.PROXY, "mainnet", "https://api", None)
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_first_conclusive_wins_and_cancels_rest(self, fetcher):
+        """A fast conclusive probe does not wait for slow ones."""
+        import asyncio
+
+        cancelled = asyncio.Event()
+
+        async def slow_storage(api_url, address, slot, api_key):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        fetcher._get_storage_at = AsyncMock(side_effect=slow_storage)
+        fetcher._detect_minimal_proxy = AsyncMock(return_value=self.IMPL)
+
+        impl = await asyncio.wait_for(
+            fetcher._detect_proxy(self.PROXY, "mainnet", "https://api", None), timeout=1
+        )
+
+        assert impl == self.IMPL
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_failing_probe_is_inconclusive(self, fetcher):
+        """A probe that raises does not abort detection."""
+        fetcher._get_storage_at = AsyncMock(side_effect=RuntimeError("boom"))
+        fetcher._call_implementation_function = AsyncMock(return_value=self.IMPL)
+
+        impl = await fetcher._detect_proxy(self.PROXY, "mainnet", "https://api", None)
+
+        assert impl == self.IMPL
+
+    @pytest.mark.asyncio
+    async def test_abi_fetch_overlaps_probes(self, fetcher):
+        """The proxy ABI fetch starts before proxy detection finishes."""
+        import asyncio
+
+        started = asyncio.Event()
+        abi_json = '[{"type": "function", "name": "test"}]'
+
+        async def fetch_abi(api_url, address, api_key, network="mainnet"):
+            started.set()
+            return abi_json
+
+        async def detect(address, network, api_url, api_key):
+            await asyncio.wait_for(started.wait(), timeout=1)
+            return None
+
+        with patch.object(fetcher, "_fetch_abi", side_effect=fetch_abi):
+            with patch.object(fetcher, "_detect_proxy", side_effect=detect):
+                result = await fetcher.fetch(self.PROXY, network="mainnet")
+
+        assert result.is_proxy is False
+
+    @pytest.mark.asyncio
+    async def test_unverified_cancels_probes(self, fetcher):
+        """Probes are cancelled when the proxy is not verified."""
+        import asyncio
+
+        cancelled = asyncio.Event()
+
+        async def detect(address, network, api_url, api_key):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch.object(fetcher, "_fetch_abi", new_callable=AsyncMock, return_value=None):
+            with patch.object(fetcher, "_detect_proxy", side_effect=detect):
+                with pytest.raises(ContractNotVerifiedError):
+                    await fetcher.fetch(self.PROXY, network="mainnet")
+
+        assert cancelled.is_set()
@@ -0,0 +1,256 @@
+"""Tests for explorer API rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from abi_to_mcp.core.config import FetcherConfig
+from abi_to_mcp.core.exceptions import RateLimitError
+from abi_to_mcp.fetchers.etherscan import EtherscanFetcher
+from abi_to_mcp.fetchers.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    backoff_delay,
+    get_rate_limiter,
+    parse_retry_after,
+    resolve_rate,
+    send_with_retry,
+)
+
+
+ABI_JSON = '[{"type": "function", "name": "test"}]'
+
+
+def make_response(status_code=200, json_data=None, headers=None):
+    """Build a minimal httpx-like response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json = Mock(return_value=json_data if json_data is not None else {})
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestResolveRate:
+    """Tests for tier lookup."""
+
+    def test_free_tier_default(self):
+        """Etherscan free tier allows 5 requests per second."""
+        assert resolve_rate("etherscan") == 5.0
+
+    def test_named_tier(self):
+        """Paid tiers raise the rate."""
+        assert resolve_rate("etherscan", "professional") == 30.0
+
+    def test_override(self):
+        """An explicit rate wins over the tier."""
+        assert resolve_rate("etherscan", "free", override=2.5) == 2.5
+
+    def test_unknown_tier(self):
+        """Unknown tiers are rejected."""
+        with pytest.raises(ValueError, match="Unknown rate limit tier"):
+            resolve_rate("etherscan", "platinum")
+
+    def test_tier_from_env(self, monkeypatch):
+        """FetcherConfig reads the tier from the environment."""
+        monkeypatch.setenv("ABI_TO_MCP_RATE_LIMIT_TIER", "advanced")
+        assert FetcherConfig().rate_limit_tier == "advanced"
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity(self):
+        """A full bucket serves a burst without waiting."""
+        bucket = TokenBucket(rate=5.0)
+
+        waited = [await bucket.acquire() for _ in range(5)]
+
+        assert waited == [0.0] * 5
+
+    @pytest.mark.asyncio
+    async def test_waits_when_empty(self):
+        """Once drained, callers wait for the refill."""
+        bucket = TokenBucket(rate=50.0, capacity=1)
+
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.015
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_spaced(self):
+        """Concurrent callers share the same budget."""
+        bucket = TokenBucket(rate=100.0, capacity=1)
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+        assert time.monotonic() - start >= 0.035
+
+    @pytest.mark.asyncio
+    async def test_defer_blocks_callers(self):
+        """A backoff applies to every caller of the bucket."""
+        bucket = TokenBucket(rate=100.0)
+        bucket.defer(0.05)
+
+        waited = await bucket.acquire()
+
+        assert waited >= 0.04
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_buckets_per_key(self):
+        """Each (explorer, key) pair has its own bucket."""
+        limiter = RateLimiter()
+
+        a = limiter.bucket("api.etherscan.io", "key-a")
+        assert limiter.bucket("api.etherscan.io", "key-a") is a
+        assert limiter.bucket("api.etherscan.io", "key-b") is not a
+        assert limiter.bucket("api.bscscan.com", "key-a") is not a
+
+    def test_rate_update(self):
+        """Requesting a different rate reconfigures the bucket."""
+        limiter = RateLimiter()
+
+        bucket = limiter.bucket("api.etherscan.io", "key", rate=5.0)
+        limiter.bucket("api.etherscan.io", "key", rate=20.0)
+
+        assert bucket.rate == 20.0
+
+    def test_fetchers_share_process_limiter(self):
+        """Fetchers default to the process-wide limiter."""
+        fetcher = EtherscanFetcher(api_key="key")
+        assert fetcher._rate_limiter is get_rate_limiter()
+
+
+class TestBackoff:
+    """Tests for retry delays."""
+
+    def test_exponential_with_jitter(self):
+        """Delays grow exponentially and stay within the jitter band."""
+        for attempt in range(4):
+            delay = backoff_delay(attempt, base_delay=1.0, max_delay=60.0)
+            assert 2**attempt / 2 <= delay <= 2**attempt
+
+    def test_capped(self):
+        """Delays never exceed the maximum."""
+        assert backoff_delay(20, base_delay=1.0, max_delay=10.0) <= 10.0
+
+    def test_retry_after_wins(self):
+        """A server-provided delay replaces the backoff."""
+        assert backoff_delay(0, base_delay=1.0, max_delay=60.0, retry_after=7) == 7
+
+    def test_parse_retry_after_seconds(self):
+        """Delay-seconds form is parsed."""
+        assert parse_retry_after("3") == 3.0
+
+    def test_parse_retry_after_date(self):
+        """HTTP-date form is converted to a delay."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_parse_retry_after_invalid(self):
+        """Missing or malformed values are ignored."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestSendWithRetry:
+    """Tests for send_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Throttled responses are retried."""
+        send = AsyncMock(side_effect=[make_response(429), make_response(429), make_response(200)])
+
+        response = await send_with_retry(
+            send, TokenBucket(rate=100.0), max_retries=3, base_delay=0.0, max_delay=1.0
+        )
+
+        assert response.status_code == 200
+        assert send.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """The last throttled response is returned once retries run out."""
+        send = AsyncMock(return_value=make_response(429))
+
+        response = await send_with_retry(
+            send, TokenBucket(rate=100.0), max_retries=2, base_delay=0.0, max_delay=1.0
+        )
+
+        assert response.status_code == 429
+        assert send.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self):
+        """Retry-After delays the retry."""
+        send = AsyncMock(
+            side_effect=[make_response(429, headers={"Retry-After": "0.05"}), make_response(200)]
+        )
+
+        start = time.monotonic()
+        await send_with_retry(
+            send, TokenBucket(rate=100.0), max_retries=1, base_delay=0.0, max_delay=1.0
+        )
+
+        assert time.monotonic() - start >= 0.04
+
+
+class TestEtherscanThrottling:
+    """Tests for throttling in EtherscanFetcher."""
+
+    @pytest.fixture
+    def fetcher(self):
+        """Create a fetcher with instant retries and a mocked client."""
+        client = MagicMock()
+        client.get = AsyncMock()
+        return EtherscanFetcher(
+            api_key="key",
+            client=client,
+            config=FetcherConfig(retry_delay=0.0),
+            rate_limiter=RateLimiter(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_retries_429_then_succeeds(self, fetcher):
+        """A 429 no longer aborts the fetch."""
+        fetcher._client.get.side_effect = [
+            make_response(429),
+            make_response(200, {"status": "1", "result": ABI_JSON}),
+        ]
+
+        result = await fetcher.fetch("0x" + "a" * 40, detect_proxy=False)
+
+        assert result.abi[0]["name"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_body_rate_limit_is_retried(self, fetcher):
+        """Etherscan's HTTP 200 'Max rate limit reached' is treated as throttling."""
+        fetcher._client.get.side_effect = [
+            make_response(200, {"status": "0", "result": "Max rate limit reached"}),
+            make_response(200, {"status": "1", "result": ABI_JSON}),
+        ]
+
+        result = await fetcher.fetch("0x" + "a" * 40, detect_proxy=False)
+
+        assert result.abi[0]["name"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_raise(self, fetcher):
+        """Persistent throttling raises RateLimitError with the server's delay."""
+        fetcher._client.get.return_value = make_response(
+            200, {"status": "0", "result": "Max rate limit reached"}
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await fetcher.fetch("0x" + "a" * 40, detect_proxy=False)
+
+        assert fetcher._client.get.call_count == fetcher._config.max_retries + 1
+        assert exc_info.value.retry_after == 60
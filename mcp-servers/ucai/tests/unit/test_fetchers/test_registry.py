@@ -5,6 +5,8 @@ from unittest.mock import AsyncMock, Mock
 import json
 import tempfile
 
+from abi_to_mcp.core.config import FetcherConfig
+from abi_to_mcp.fetchers.cache import ABICache
 from abi_to_mcp.fetchers.registry import FetcherRegistry, create_default_registry
 from abi_to_mcp.fetchers.file import FileFetcher
 from abi_to_mcp.fetchers.etherscan import EtherscanFetcher
@@ -117,6 +119,21 @@ def test_create_default_registry():
     assert isinstance(registry.fetchers[2], SourcifyFetcher)
 
 
+def test_create_default_registry_cache_from_config():
+    """FetcherConfig selects the ABI cache when no cache is passed."""
+    registry = create_default_registry(config=FetcherConfig(cache_ttl=3600, offline=True))
+
+    assert registry.cache.ttl == 3600
+    assert registry.offline is True
+
+    registry = create_default_registry(config=FetcherConfig(use_cache=False))
+    assert registry.cache is None
+
+    cache = ABICache(ttl=None)
+    registry = create_default_registry(cache=cache, config=FetcherConfig(cache_ttl=3600))
+    assert registry.cache is cache
+
+
 def test_create_default_registry_with_api_keys():
     """Test creating registry with API keys."""
     api_keys = {"etherscan": "test-key"}
@@ -336,3 +353,126 @@ class TestFetcherRegistryIntegration:
         # Will fail without API key, but should select correct fetcher
         with pytest.raises(Exception):  # Some error from the network fetcher
             await registry.fetch("0x1234567890123456789012345678901234567890")
+
+
+class TestRaceStrategy:
+    """Tests for the race fetch strategy."""
+
+    ADDRESS = "0x1234567890123456789012345678901234567890"
+
+    @staticmethod
+    def make_fetcher(result=None, error=None, delay=0.0, name="etherscan"):
+        """Create an address fetcher that answers after a delay."""
+        import asyncio
+
+        from abi_to_mcp.core.models import FetchResult
+
+        fetcher = Mock(spec=ABIFetcher)
+        fetcher.can_handle = Mock(return_value=True)
+        fetcher.cancelled = False
+
+        async def fetch(source, **kwargs):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                fetcher.cancelled = True
+                raise
+            if error is not None:
+                raise error
+            return result or FetchResult(
+                abi=[{"type": "function", "name": "transfer"}],
+                source=name,
+                source_location=source,
+            )
+
+        fetcher.fetch = AsyncMock(side_effect=fetch)
+        return fetcher
+
+    def test_unknown_strategy(self):
+        """Unknown strategies are rejected."""
+        with pytest.raises(ValueError, match="Unknown fetch strategy"):
+            FetcherRegistry(strategy="fastest")
+
+    @pytest.mark.asyncio
+    async def test_fastest_wins_and_losers_cancelled(self):
+        """The first valid result wins and the slower fetch is cancelled."""
+        slow = self.make_fetcher(delay=5, name="etherscan")
+        fast = self.make_fetcher(name="sourcify")
+        registry = FetcherRegistry(strategy="race")
+        registry.register(slow)
+        registry.register(fast)
+
+        result = await registry.fetch(self.ADDRESS)
+
+        assert result.source == "sourcify"
+        assert slow.cancelled is True
+        assert registry.stats == {"sourcify": 1}
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_end_race(self):
+        """A fast failure waits for the other fetchers."""
+        failing = self.make_fetcher(error=ABINotFoundError(self.ADDRESS, "not verified"))
+        ok = self.make_fetcher(delay=0.01, name="sourcify")
+        registry = FetcherRegistry(strategy="race")
+        registry.register(failing)
+        registry.register(ok)
+
+        result = await registry.fetch(self.ADDRESS)
+
+        assert result.source == "sourcify"
+
+    @pytest.mark.asyncio
+    async def test_all_fail(self):
+        """Errors from every fetcher are combined."""
+        registry = FetcherRegistry(strategy="race")
+        registry.register(self.make_fetcher(error=ABINotFoundError(self.ADDRESS, "nope")))
+        registry.register(self.make_fetcher(error=RuntimeError("boom")))
+
+        with pytest.raises(ABINotFoundError, match="nope.*boom"):
+            await registry.fetch(self.ADDRESS)
+
+    @pytest.mark.asyncio
+    async def test_unresolved_proxy_abi_held_back(self):
+        """A proxy ABI does not beat a fetcher that resolves implementations."""
+        from abi_to_mcp.core.models import FetchResult
+
+        proxy_abi = [
+            {"type": "function", "name": "upgradeTo"},
+            {"type": "fallback"},
+        ]
+        sourcify = self.make_fetcher(
+            result=FetchResult(abi=proxy_abi, source="sourcify", source_location=self.ADDRESS)
+        )
+        etherscan = self.make_fetcher(delay=0.01, name="etherscan")
+        registry = FetcherRegistry(strategy="race")
+        registry.register(etherscan)
+        registry.register(sourcify)
+
+        result = await registry.fetch(self.ADDRESS)
+
+        assert result.source == "etherscan"
+
+    @pytest.mark.asyncio
+    async def test_non_address_sources_not_raced(self, tmp_path):
+        """File sources still use the first matching fetcher."""
+        abi_file = tmp_path / "abi.json"
+        abi_file.write_text(json.dumps([{"type": "function", "name": "test"}]))
+        registry = FetcherRegistry(strategy="race")
+        registry.register(FileFetcher())
+
+        result = await registry.fetch(str(abi_file))
+
+        assert result.source == "file"
+
+    def test_default_registry_strategy(self):
+        """The race strategy enables parallel Sourcify matches."""
+        registry = create_default_registry(strategy="race")
+
+        assert registry.strategy == "race"
+        assert registry.fetchers[2].parallel_matches is True
+
+    def test_strategy_from_env(self, monkeypatch):
+        """ABI_TO_MCP_FETCH_STRATEGY selects the default strategy."""
+        monkeypatch.setenv("ABI_TO_MCP_FETCH_STRATEGY", "race")
+
+        assert create_default_registry().strategy == "race"
@@ -7,6 +7,13 @@ import json
 from abi_to_mcp.fetchers.sourcify import SourcifyFetcher
 from abi_to_mcp.core.exceptions import ABINotFoundError, InvalidAddressError
 
+_real_init = SourcifyFetcher.__init__
+
+
+def _init_without_client(fetcher):
+    """Default initialisation with a placeholder client the test replaces."""
+    _real_init(fetcher, client=MagicMock())
+
 
 @pytest.fixture
 def mock_metadata_file():
@@ -65,7 +72,7 @@ async def test_fetch_full_match(mock_metadata_file, mock_source_file):
     """Test fetching with full match."""
     mock_response = MockResponse([mock_metadata_file, mock_source_file])
     
-    with patch.object(SourcifyFetcher, '__init__', lambda x: None):
+    with patch.object(SourcifyFetcher, '__init__', _init_without_client):
         fetcher = SourcifyFetcher()
         fetcher.SOURCIFY_API = "https://sourcify.dev/server"
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
@@ -96,7 +103,7 @@ async def test_fetch_partial_match(mock_metadata_file):
     # Second call (partial_match) succeeds
     mock_response_200 = MockResponse([mock_metadata_file])
     
-    with patch.object(SourcifyFetcher, '__init__', lambda x: None):
+    with patch.object(SourcifyFetcher, '__init__', _init_without_client):
         fetcher = SourcifyFetcher()
         fetcher.SOURCIFY_API = "https://sourcify.dev/server"
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
@@ -120,7 +127,7 @@ async def test_fetch_not_found():
     """Test handling of contract not found."""
     mock_response = MockResponse([], status_code=404)
     
-    with patch.object(SourcifyFetcher, '__init__', lambda x: None):
+    with patch.object(SourcifyFetcher, '__init__', _init_without_client):
         fetcher = SourcifyFetcher()
         fetcher.SOURCIFY_API = "https://sourcify.dev/server"
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
@@ -140,7 +147,7 @@ async def test_fetch_not_found():
 @pytest.mark.asyncio
 async def test_invalid_address():
     """Test invalid address format."""
-    with patch.object(SourcifyFetcher, '__init__', lambda x: None):
+    with patch.object(SourcifyFetcher, '__init__', _init_without_client):
         fetcher = SourcifyFetcher()
         fetcher.SOURCIFY_API = "https://sourcify.dev/server"
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
@@ -155,7 +162,7 @@ async def test_fetch_with_network_name(mock_metadata_file):
     """Test fetch using network name instead of chain_id."""
     mock_response = MockResponse([mock_metadata_file])
     
-    with patch.object(SourcifyFetcher, '__init__', lambda x: None):
+    with patch.object(SourcifyFetcher, '__init__', _init_without_client):
         fetcher = SourcifyFetcher()
         fetcher.SOURCIFY_API = "https://sourcify.dev/server"
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
@@ -175,7 +182,7 @@ async def test_fetch_with_network_name(mock_metadata_file):
 
 def test_can_handle_valid_address():
     """Test can_handle recognizes valid addresses."""
-    with patch.object(SourcifyFetcher, '__init__', lambda x: None):
+    with patch.object(SourcifyFetcher, '__init__', _init_without_client):
         fetcher = SourcifyFetcher()
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
         
@@ -185,7 +192,7 @@ def test_can_handle_valid_address():
 
 def test_can_handle_invalid_format():
     """Test can_handle rejects invalid formats."""
-    with patch.object(SourcifyFetcher, '__init__', lambda x: None):
+    with patch.object(SourcifyFetcher, '__init__', _init_without_client):
         fetcher = SourcifyFetcher()
         fetcher.ADDRESS_PATTERN = SourcifyFetcher.ADDRESS_PATTERN
         
@@ -477,3 +484,54 @@ class TestSourcifyImportError:
                         sourcify_module.SourcifyFetcher()
                 finally:
                     sourcify_module.httpx = orig_httpx
+
+
+@pytest.mark.asyncio
+async def test_parallel_matches_prefers_full(mock_metadata_file):
+    """Full and partial matches are requested together; full wins."""
+    from abi_to_mcp.core.models import FetchResult
+
+    fetcher = SourcifyFetcher(client=MagicMock(), parallel_matches=True)
+    full = FetchResult(abi=[{"type": "function", "name": "full"}], source="sourcify", source_location="x")
+    partial = FetchResult(abi=[{"type": "function", "name": "partial"}], source="sourcify", source_location="x")
+
+    async def fetch_match(address, chain_id, match_type):
+        return full if match_type == "full_match" else partial
+
+    with patch.object(fetcher, "_fetch_match", side_effect=fetch_match) as mock_match:
+        result = await fetcher.fetch("0x" + "a" * 40)
+
+    assert result.abi[0]["name"] == "full"
+    assert mock_match.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_parallel_matches_falls_back_to_partial():
+    """The partial match is used when there is no full match."""
+    from abi_to_mcp.core.models import FetchResult
+
+    fetcher = SourcifyFetcher(client=MagicMock(), parallel_matches=True)
+    partial = FetchResult(abi=[{"type": "function", "name": "partial"}], source="sourcify", source_location="x")
+
+    async def fetch_match(address, chain_id, match_type):
+        if match_type == "full_match":
+            raise ABINotFoundError(source=address, reason="No full_match found")
+        return partial
+
+    with patch.object(fetcher, "_fetch_match", side_effect=fetch_match):
+        result = await fetcher.fetch("0x" + "a" * 40)
+
+    assert result.abi[0]["name"] == "partial"
+
+
+@pytest.mark.asyncio
+async def test_parallel_matches_not_found():
+    """Neither match raises ABINotFoundError."""
+    fetcher = SourcifyFetcher(client=MagicMock(), parallel_matches=True)
+
+    async def fetch_match(address, chain_id, match_type):
+        raise ABINotFoundError(source=address, reason=f"No {match_type} found")
+
+    with patch.object(fetcher, "_fetch_match", side_effect=fetch_match):
+        with pytest.raises(ABINotFoundError):
+            await fetcher.fetch("0x" + "a" * 40)
@@ -107,7 +107,7 @@ class TestResourceGenerator:
         assert "async def get_transfer_events" in code
         assert "from_block" in code
         assert "to_block" in code
-        assert "contract.events.Transfer.get_logs" in code
+        assert '_query_events("Transfer", from_block, to_block)' in code
 
     def test_generate_resource_with_fields(self, resource_generator, transfer_resource):
         """Verify all fields are included in generated resource."""
@@ -2,11 +2,14 @@
 
 import pytest
 import json
+import re
 from pathlib import Path
 import tempfile
 
 from abi_to_mcp.core.config import GeneratorConfig
+from abi_to_mcp.core.exceptions import GeneratorError
 from abi_to_mcp.core.models import (
+    BundleContract,
     ParsedABI,
     ABIFunction,
     ABIEvent,
@@ -451,3 +454,728 @@ class TestGeneratedFiles:
         assert "[project]" in pyproject.content
         assert "mcp" in pyproject.content
         assert "requires-python" in pyproject.content
+
+
+class TestGenerateCompiled:
+    """Tests for generating from compiled ABI artifacts."""
+
+    @pytest.fixture
+    def compiled_erc20(self):
+        """Compiled ERC20 fixture ABI."""
+        from abi_to_mcp.core.compiled import compile_abi
+
+        abi_path = Path(__file__).parent.parent.parent / "fixtures" / "abis" / "erc20.json"
+        return compile_abi(json.loads(abi_path.read_text()))
+
+    def test_matches_parse_and_map(self, compiled_erc20):
+        """Generating from a compiled ABI gives the same files."""
+        generator = ServerGenerator(GeneratorConfig(output_dir=Path("/tmp/out")))
+
+        direct = generator.generate(
+            parsed=compiled_erc20.parsed,
+            tools=compiled_erc20.tools,
+            resources=compiled_erc20.resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        from_compiled = generator.generate_compiled(
+            compiled_erc20, "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "mainnet"
+        )
+
+        assert [f.content for f in from_compiled.files] == [f.content for f in direct.files]
+
+    def test_from_artifact_path_respects_config(self, compiled_erc20, tmp_path):
+        """Artifact paths are loaded and read_only/include_events applied."""
+        from abi_to_mcp.core.compiled import save_compiled
+
+        path = save_compiled(compiled_erc20, tmp_path / "erc20.abic")
+        generator = ServerGenerator(
+            GeneratorConfig(output_dir=tmp_path, read_only=True, include_events=False)
+        )
+
+        result = generator.generate_compiled(path, "0x" + "1" * 40, "mainnet")
+
+        assert result.write_tools == []
+        assert result.resource_count == 0
+        assert "balance_of" in result.read_tools
+
+
+class TestIncrementalGeneration:
+    """Tests for hash-aware incremental output."""
+
+    ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        """Incremental configuration writing to a temporary directory."""
+        return GeneratorConfig(
+            output_dir=tmp_path / "server",
+            incremental=True,
+            template_cache_dir=tmp_path / "templates",
+        )
+
+    def _generate(self, config, parsed, tools, resources):
+        generator = ServerGenerator(config)
+        server = generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address=self.ADDRESS,
+            network="mainnet",
+        )
+        generator.write_to_disk(server)
+        return generator, server
+
+    def test_unchanged_regeneration_is_noop(
+        self, config, sample_parsed_abi, sample_tools, sample_resources, monkeypatch
+    ):
+        """Regenerating unchanged input renders and writes nothing."""
+        from abi_to_mcp.generator.server_generator import MANIFEST_FILENAME
+
+        _, first = self._generate(config, sample_parsed_abi, sample_tools, sample_resources)
+        assert first.unchanged_files == []
+        assert (config.output_dir / MANIFEST_FILENAME).exists()
+        mtimes = {p.name: p.stat().st_mtime_ns for p in config.output_dir.iterdir()}
+
+        generator = ServerGenerator(config)
+        monkeypatch.setattr(
+            generator.jinja_env,
+            "get_template",
+            lambda name: pytest.fail(f"{name} was re-rendered"),
+        )
+        second = generator.generate(
+            parsed=sample_parsed_abi,
+            tools=sample_tools,
+            resources=sample_resources,
+            contract_address=self.ADDRESS,
+            network="mainnet",
+        )
+        generator.write_to_disk(second)
+
+        assert sorted(second.unchanged_files) == sorted(f.path for f in second.files)
+        assert [f.content for f in second.files] == [f.content for f in first.files]
+        assert {p.name: p.stat().st_mtime_ns for p in config.output_dir.iterdir()} == mtimes
+
+    def test_changed_context_rerenders(
+        self, config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """A different rendering context produces new content."""
+        self._generate(config, sample_parsed_abi, sample_tools, sample_resources)
+
+        _, server = self._generate(config, sample_parsed_abi, sample_tools[:1], sample_resources)
+
+        assert "server.py" not in server.unchanged_files
+        assert "requirements.txt" in server.unchanged_files
+        assert (config.output_dir / "server.py").read_text() == server.get_file("server.py").content
+
+    def test_edited_file_is_restored(
+        self, config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """A file modified on disk is re-rendered even if its key matches."""
+        _, first = self._generate(config, sample_parsed_abi, sample_tools, sample_resources)
+        (config.output_dir / "config.py").write_text("# edited\n")
+
+        _, second = self._generate(config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert "config.py" not in second.unchanged_files
+        assert (config.output_dir / "config.py").read_text() == first.get_file("config.py").content
+
+    def test_stale_files_removed(self, config, sample_parsed_abi, sample_tools, sample_resources):
+        """Files only the previous output had are deleted; unrelated files are kept."""
+        config.split_modules = True
+        self._generate(config, sample_parsed_abi, sample_tools, sample_resources)
+        assert (config.output_dir / "common.py").exists()
+        (config.output_dir / "notes.txt").write_text("mine\n")
+
+        config.split_modules = False
+        _, server = self._generate(config, sample_parsed_abi, sample_tools, sample_resources)
+
+        on_disk = {p.name for p in config.output_dir.iterdir()}
+        assert "common.py" not in on_disk
+        assert not any(name.startswith("tools_") for name in on_disk)
+        assert "notes.txt" in on_disk
+        assert {f.path for f in server.files} <= on_disk
+
+    def test_full_mode_always_writes(
+        self, generator_config, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Without incremental mode every file is rewritten."""
+        _, first = self._generate(generator_config, sample_parsed_abi, sample_tools, sample_resources)
+        _, second = self._generate(
+            generator_config, sample_parsed_abi, sample_tools, sample_resources
+        )
+
+        assert first.unchanged_files == second.unchanged_files == []
+        assert all(f.render_key is None for f in second.files)
+
+    def test_template_bytecode_cache(self, config, sample_parsed_abi, sample_tools, sample_resources):
+        """Compiled templates are stored in the template cache directory."""
+        self._generate(config, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert any(config.template_cache_dir.iterdir())
+
+    def test_template_cache_disabled(self, tmp_path):
+        """The bytecode cache can be turned off."""
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path, template_cache=False))
+
+        assert generator.jinja_env.bytecode_cache is None
+
+
+class TestBatchRead:
+    """Tests for the generated Multicall3 batch_read tool."""
+
+    ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+    def _server_py(self, generator, parsed, tools, resources, network="mainnet"):
+        server = generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address=self.ADDRESS,
+            network=network,
+        )
+        return server.get_file("server.py").content
+
+    def test_batch_read_generated(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """batch_read and the read tool table are emitted."""
+        from abi_to_mcp.core.constants import MULTICALL3_ADDRESS
+
+        content = self._server_py(
+            server_generator, sample_parsed_abi, sample_tools, sample_resources
+        )
+
+        assert "def batch_read(calls: List[Any])" in content
+        assert '"balance_of": (\n        "balanceOf",\n        ("account", ),' in content
+        assert MULTICALL3_ADDRESS in content
+        assert '"transfer": (' not in content.split("_READ_TOOLS = {")[1].split("}")[0]
+        compile(content, "server.py", "exec")
+
+    def test_network_without_multicall(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources, monkeypatch
+    ):
+        """Networks without Multicall3 fall back to sequential calls."""
+        from abi_to_mcp.core.constants import NETWORKS
+
+        monkeypatch.setitem(NETWORKS, "devnet", {"chain_id": 1337, "multicall3": None})
+
+        content = self._server_py(
+            server_generator, sample_parsed_abi, sample_tools, sample_resources, network="devnet"
+        )
+
+        assert 'os.environ.get("MULTICALL3_ADDRESS", "")' in content
+
+    def test_no_read_tools(self, server_generator, sample_parsed_abi, sample_tools):
+        """batch_read is omitted when the contract has no read functions."""
+        write_tools = [t for t in sample_tools if t.tool_type != "read"]
+
+        content = self._server_py(server_generator, sample_parsed_abi, write_tools, [])
+
+        assert "def batch_read" not in content
+        compile(content, "server.py", "exec")
+
+
+class TestAsyncMode:
+    """Tests for servers generated on AsyncWeb3."""
+
+    def _server_py(self, tmp_path, parsed, tools, resources, async_mode):
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path, async_mode=async_mode))
+        server = generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return server.get_file("server.py").content
+
+    def test_async_server(self, tmp_path, sample_parsed_abi, sample_tools, sample_resources):
+        """Tools are coroutines and every RPC call is awaited."""
+        content = self._server_py(
+            tmp_path, sample_parsed_abi, sample_tools, sample_resources, async_mode=True
+        )
+
+        assert "provider = AsyncWeb3.AsyncHTTPProvider(RPC_URL)" in content
+        assert "async def balance_of(" in content
+        assert 'result = await _cached_read(\n        "balance_of",' in content
+        assert "async def transfer(" in content
+        assert "tx = await func.build_transaction(tx_params)" in content
+        assert "async def batch_read(" in content
+        assert "await asyncio.gather(" in content
+        assert "async def get_balance(" in content
+        compile(content, "server.py", "exec")
+
+    def test_sync_server_unchanged(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """The default mode keeps blocking Web3 calls."""
+        content = self._server_py(
+            tmp_path, sample_parsed_abi, sample_tools, sample_resources, async_mode=False
+        )
+
+        assert "provider = Web3.HTTPProvider(RPC_URL)" in content
+        assert "AsyncWeb3" not in content
+        assert "def balance_of(" in content
+        assert "async def balance_of(" not in content
+        # Only the metrics wrapper of the (always async) event tools awaits
+        assert "await w3." not in content
+        assert "await _" not in content
+
+    def test_mode_changes_render_key(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Switching modes invalidates incrementally generated files."""
+        keys = []
+        for async_mode in (False, True):
+            generator = ServerGenerator(
+                GeneratorConfig(output_dir=tmp_path, async_mode=async_mode, incremental=True)
+            )
+            server = generator.generate(
+                parsed=sample_parsed_abi,
+                tools=sample_tools,
+                resources=sample_resources,
+                contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+                network="mainnet",
+            )
+            keys.append(server.get_file("server.py").render_key)
+
+        assert keys[0] != keys[1]
+
+
+class TestReadCache:
+    """Tests for the generated block-aware read cache."""
+
+    @staticmethod
+    def _read_tool(name, original_name, parameters=()):
+        return MappedTool(
+            name=name,
+            original_name=original_name,
+            description="",
+            tool_type="read",
+            parameters=list(parameters),
+            return_schema={},
+            return_description="",
+            python_signature="",
+        )
+
+    def test_immutable_reads_detected(self, server_generator, sample_parsed_abi, sample_tools):
+        """Token metadata, CONSTANT_CASE getters and pure functions never expire."""
+        amount = ABIParameter(name="amount", type="uint256")
+        sample_parsed_abi.functions.extend(
+            [
+                ABIFunction("WETH", [], [], StateMutability.VIEW),
+                ABIFunction("owner", [], [], StateMutability.VIEW),
+                ABIFunction("quote", [amount], [], StateMutability.PURE),
+            ]
+        )
+        amount_param = ToolParameter(
+            name="amount",
+            original_name="amount",
+            solidity_type="uint256",
+            json_schema={"type": "string"},
+            python_type="str",
+            description="Amount",
+        )
+        read_tools = [t for t in sample_tools if t.tool_type == "read"] + [
+            self._read_tool("weth", "WETH"),
+            self._read_tool("owner", "owner"),
+            self._read_tool("quote", "quote", [amount_param]),
+        ]
+
+        immutable = server_generator._immutable_reads(sample_parsed_abi, read_tools)
+
+        assert immutable == ["name", "weth", "quote"]
+
+    def test_read_tools_use_cache(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Read tools go through the cache and its stats are exposed."""
+        server = server_generator.generate(
+            parsed=sample_parsed_abi,
+            tools=sample_tools,
+            resources=sample_resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        content = server.get_file("server.py").content
+
+        assert '_IMMUTABLE_READS = frozenset({\n    "name",\n})' in content
+        assert 'READ_CACHE_SIZE = int(os.environ.get("READ_CACHE_SIZE", "1024"))' in content
+        assert "value = func.call(block_identifier=tag)" in content
+        assert 'result = _cached_read("name", (), contract.functions.name())' in content
+        assert "def get_read_cache_stats()" in content
+        compile(content, "server.py", "exec")
+
+    def test_no_cache_without_read_tools(self, server_generator, sample_parsed_abi, sample_tools):
+        """Servers without read tools carry no cache."""
+        write_tools = [t for t in sample_tools if t.tool_type != "read"]
+
+        server = server_generator.generate(
+            parsed=sample_parsed_abi,
+            tools=write_tools,
+            resources=[],
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        content = server.get_file("server.py").content
+
+        assert "_read_cache" not in content
+        compile(content, "server.py", "exec")
+
+
+class TestEventQueries:
+    """Tests for chunked event queries and the local event index."""
+
+    def _server_py(self, generator, parsed, tools, resources):
+        server = generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+        return server.get_file("server.py").content
+
+    def test_event_tools_use_index(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Event tools query through the chunked fetcher and SQLite index."""
+        content = self._server_py(
+            server_generator, sample_parsed_abi, sample_tools, sample_resources
+        )
+
+        assert "import sqlite3" in content
+        assert "class _EventIndex:" in content
+        assert "def _iter_log_chunks(" in content
+        assert 'LOG_CHUNK_SIZE = int(os.environ.get("LOG_CHUNK_SIZE", "5000"))' in content
+        assert 'events = _query_events("Transfer", from_block, to_block)' in content
+        assert ".get_logs(fromBlock" not in content
+        compile(content, "server.py", "exec")
+
+    def test_events_without_read_tools(
+        self, server_generator, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Event helpers do not depend on the read-tool sections."""
+        write_tools = [t for t in sample_tools if t.tool_type != "read"]
+
+        content = self._server_py(
+            server_generator, sample_parsed_abi, write_tools, sample_resources
+        )
+
+        assert "def _abi_type(" in content
+        assert "_read_cache" not in content
+        compile(content, "server.py", "exec")
+
+    def test_async_event_fetching(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Async servers fetch chunks with asyncio.gather."""
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path, async_mode=True))
+
+        content = self._server_py(generator, sample_parsed_abi, sample_tools, sample_resources)
+
+        assert "async def _iter_log_chunks(" in content
+        assert "ThreadPoolExecutor" not in content
+        assert 'events = await _query_events("Transfer", from_block, to_block)' in content
+        compile(content, "server.py", "exec")
+
+    def test_no_event_index_without_resources(
+        self, server_generator, sample_parsed_abi, sample_tools
+    ):
+        """Servers without events carry no event machinery."""
+        content = self._server_py(server_generator, sample_parsed_abi, sample_tools, [])
+
+        assert "sqlite3" not in content
+        assert "_query_events" not in content
+
+
+class TestModuleLayout:
+    """Tests for the ABI sidecar, lazy client creation and split tool modules."""
+
+    def _generate(self, tmp_path, parsed, tools, resources, **options):
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path, **options))
+        return generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+
+    def test_abi_sidecar(self, tmp_path, sample_parsed_abi, sample_tools, sample_resources):
+        """The ABI is written next to the server instead of inlined."""
+        server = self._generate(tmp_path, sample_parsed_abi, sample_tools, sample_resources)
+        content = server.get_file("server.py").content
+
+        assert json.loads(server.get_file("abi.json").content) == sample_parsed_abi.raw_abi
+        assert "json.loads('''" not in content
+        assert '__file__)), "abi.json")' in content
+
+    def test_client_created_lazily(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """web3 is neither imported nor connected when the server module loads."""
+        server = self._generate(tmp_path, sample_parsed_abi, sample_tools, sample_resources)
+        content = server.get_file("server.py").content
+
+        assert "from web3 import" not in content.split("class _Lazy")[0]
+        assert "w3 = _Lazy(_create_w3)" in content
+        assert "contract = _Lazy(_create_contract)" in content
+        assert "Web3 = _Lazy(_import_web3)" in content
+
+    def test_small_server_is_single_module(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Below the threshold every tool stays in server.py."""
+        server = self._generate(tmp_path, sample_parsed_abi, sample_tools, sample_resources)
+        paths = [f.path for f in server.files]
+
+        assert "common.py" not in paths
+        assert not any(p.startswith("tools_") for p in paths)
+        assert "def balance_of(" in server.get_file("server.py").content
+
+    def test_large_server_is_split(self, tmp_path, sample_parsed_abi, sample_tools, monkeypatch):
+        """Above the threshold each tool group gets its own module."""
+        from abi_to_mcp.generator import server_generator
+
+        monkeypatch.setattr(server_generator, "SPLIT_MODULES_THRESHOLD", len(sample_tools) - 1)
+        server = self._generate(tmp_path, sample_parsed_abi, sample_tools, [])
+        paths = [f.path for f in server.files]
+
+        assert paths[:4] == ["server.py", "common.py", "tools_read.py", "tools_write.py"]
+        assert "tools_events.py" not in paths
+
+        entry = server.get_file("server.py").content
+        assert '"read": "tools_read",' in entry
+        assert '"events"' not in entry
+        assert "importlib.import_module(_TOOL_MODULES[_group])" in entry
+        assert "def balance_of(" not in entry
+
+        read = server.get_file("tools_read.py").content
+        assert "from common import _batch_read, _cached_read, _read_cache, contract, mcp" in read
+        assert "def balance_of(" in read
+        assert "def transfer(" not in read
+        assert "def transfer(" in server.get_file("tools_write.py").content
+        assert "class _ReadCache:" in server.get_file("common.py").content
+
+        for file in server.files:
+            if file.path.endswith(".py"):
+                compile(file.content, file.path, "exec")
+
+    @pytest.mark.parametrize("async_mode", [False, True])
+    def test_forced_split(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources, async_mode
+    ):
+        """split_modules=True splits small servers too, in both modes."""
+        server = self._generate(
+            tmp_path,
+            sample_parsed_abi,
+            sample_tools,
+            sample_resources,
+            split_modules=True,
+            async_mode=async_mode,
+        )
+
+        events = server.get_file("tools_events.py").content
+        assert "from common import _query_events, mcp" in events
+        assert "def get_transfer_events(" in events
+        for file in server.files:
+            if file.path.endswith(".py"):
+                compile(file.content, file.path, "exec")
+
+    def test_split_typing_imports_are_used(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Split modules import only the typing names they annotate with."""
+        server = self._generate(
+            tmp_path, sample_parsed_abi, sample_tools, sample_resources, split_modules=True
+        )
+
+        for path in ("server.py", "tools_read.py", "tools_write.py", "tools_events.py"):
+            content = server.get_file(path).content
+            line = next(ln for ln in content.splitlines() if ln.startswith("from typing import"))
+            rest = content.replace(line, "")
+            for name in line.removeprefix("from typing import ").split(", "):
+                assert re.search(rf"\b{name}\b", rest), f"{path}: unused typing.{name}"
+        assert "Optional" not in server.get_file("server.py").content
+
+    def test_render_key_covers_partials(self, tmp_path):
+        """Render keys hash the partials a template includes."""
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path))
+        sources = generator._template_source("server.py.jinja2")
+
+        assert "class _Lazy:" in sources
+        assert "{{ adef }} {{ tp }}batch_read(" in sources
+
+
+class TestToolMetrics:
+    """Tests for the per-tool instrumentation layer."""
+
+    def _generate(self, tmp_path, parsed, tools, resources, **options):
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path, **options))
+        return generator.generate(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            contract_address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+            network="mainnet",
+        )
+
+    @pytest.mark.parametrize("async_mode", [False, True])
+    def test_metrics_emitted(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources, async_mode
+    ):
+        """Tools, the provider and the read cache report to the metrics registry."""
+        server = self._generate(
+            tmp_path, sample_parsed_abi, sample_tools, sample_resources, async_mode=async_mode
+        )
+        content = server.get_file("server.py").content
+
+        assert content.index("mcp.tool = _instrumented_tool") < content.index("@mcp.tool()")
+        assert '@mcp.resource("metrics://tools")' in content
+        assert '@mcp.custom_route("/metrics", methods=["GET"])' in content
+        assert "_count_rpc_requests(provider)" in content
+        assert "_tool_metrics.count_cache(found)" in content
+        assert 'mcp.run(transport=os.environ.get("MCP_TRANSPORT", "stdio"))' in content
+        assert "# TOOL_METRICS=true" in server.get_file(".env.example").content
+        compile(content, "server.py", "exec")
+
+    def test_metrics_in_common_module(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources
+    ):
+        """Split servers instrument tools from common.py, before any group loads."""
+        server = self._generate(
+            tmp_path, sample_parsed_abi, sample_tools, sample_resources, split_modules=True
+        )
+
+        assert "class _ToolMetrics:" in server.get_file("common.py").content
+        assert "_tool_metrics" not in server.get_file("tools_read.py").content
+
+    def test_metrics_disabled(self, tmp_path, sample_parsed_abi, sample_tools, sample_resources):
+        """include_metrics=False emits no instrumentation at all."""
+        server = self._generate(
+            tmp_path, sample_parsed_abi, sample_tools, sample_resources, include_metrics=False
+        )
+        content = server.get_file("server.py").content
+
+        assert "_tool_metrics" not in content
+        assert "metrics://tools" not in content
+        assert "contextvars" not in content
+        assert "TOOL_METRICS" not in server.get_file(".env.example").content
+        assert "TOOL_METRICS" not in server.get_file("README.md").content
+        compile(content, "server.py", "exec")
+
+
+class TestBundle:
+    """Tests for bundle servers serving several contracts."""
+
+    ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+
+    def _contract(self, tmp_path, parsed, tools, resources, namespace="usdc", **options):
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path, **options))
+        return generator.generate_bundle_contract(
+            parsed=parsed,
+            tools=tools,
+            resources=resources,
+            namespace=namespace,
+            contract_address=self.ADDRESS,
+            network="mainnet",
+            contract_name="USDC",
+        )
+
+    @pytest.mark.parametrize("async_mode", [False, True])
+    def test_contract_module(
+        self, tmp_path, sample_parsed_abi, sample_tools, sample_resources, async_mode
+    ):
+        """A contract module prefixes its tools and uses the bundle's shared runtime."""
+        module = self._contract(
+            tmp_path, sample_parsed_abi, sample_tools, sample_resources, async_mode=async_mode
+        )
+        content = module.get_file("__init__.py").content
+
+        assert [f.path for f in module.files] == ["__init__.py", "abi.json"]
+        assert " usdc__balance_of(" in content
+        assert " usdc__transfer(" in content
+        assert " usdc__batch_read(" in content
+        assert " usdc__get_contract_info(" in content
+        assert "from bundle_runtime import (" in content
+        assert "w3 = client(NETWORK)" in content
+        assert "_read_cache = read_cache(NETWORK)" in content
+        assert 'f"{NAMESPACE}__{name}"' in content
+        # The server, client factory, cache class and bundle-wide tools live elsewhere
+        assert "FastMCP(" not in content
+        assert "class _ReadCache" not in content
+        assert "RPC_URL" not in content
+        assert "def get_read_cache_stats" not in content
+        assert "def get_balance" not in content
+        assert "if __name__" not in content
+        compile(content, "__init__.py", "exec")
+
+    def test_invalid_namespace(self, tmp_path, sample_parsed_abi, sample_tools, sample_resources):
+        """Namespaces must be usable as package and tool names."""
+        with pytest.raises(GeneratorError, match="identifier"):
+            self._contract(
+                tmp_path, sample_parsed_abi, sample_tools, sample_resources, namespace="my-token"
+            )
+
+    @pytest.mark.parametrize("async_mode", [False, True])
+    def test_bundle_files(self, tmp_path, async_mode):
+        """The bundle server loads each contract and shares clients per network."""
+        contracts = [
+            BundleContract("usdc", "USDC", self.ADDRESS, "mainnet", ["balance_of"], [], []),
+            BundleContract("pool", "Pool", self.ADDRESS, "arbitrum", [], ["swap"], ["Swap"]),
+        ]
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path, async_mode=async_mode))
+
+        bundle = generator.generate_bundle(contracts, server_name="DeFi")
+
+        assert [f.path for f in bundle.files] == [
+            "server.py",
+            "bundle_runtime.py",
+            "bundle.json",
+            "contracts/__init__.py",
+            "README.md",
+            "requirements.txt",
+            ".env.example",
+        ]
+        assert bundle.read_tools == ["usdc__balance_of"]
+        assert bundle.write_tools == ["pool__swap"]
+        assert bundle.network == "mainnet, arbitrum"
+
+        config = json.loads(bundle.get_file("bundle.json").content)
+        assert config["contracts"]["pool"] == {
+            "name": "Pool",
+            "address": self.ADDRESS,
+            "network": "arbitrum",
+        }
+        assert config["networks"]["arbitrum"]["chain_id"] == 42161
+
+        server = bundle.get_file("server.py").content
+        assert 'importlib.import_module(f"contracts.{_namespace}")' in server
+        assert "def list_contracts()" in server
+        assert "def get_read_cache_stats()" in server
+        assert 'get_balance(address: str, network: str = "mainnet")' in server
+        assert "def get_contract_info" not in server
+        compile(server, "server.py", "exec")
+
+        runtime = bundle.get_file("bundle_runtime.py").content
+        assert 'mcp = FastMCP("DeFi")' in runtime
+        assert "def client(network: str)" in runtime
+        assert "def read_cache(network: str)" in runtime
+        assert ("log_executor = ThreadPoolExecutor" in runtime) is not async_mode
+        compile(runtime, "bundle_runtime.py", "exec")
+
+        env = bundle.get_file(".env.example").content
+        assert "# RPC_URL_ARBITRUM=" in env
+        assert "# BUNDLE_CONTRACTS=usdc,pool" in env
+
+    def test_bundle_validation(self, tmp_path):
+        """A bundle needs contracts with distinct namespaces."""
+        generator = ServerGenerator(GeneratorConfig(output_dir=tmp_path))
+        contract = BundleContract("usdc", "USDC", self.ADDRESS, "mainnet")
+
+        with pytest.raises(GeneratorError):
+            generator.generate_bundle([])
+        with pytest.raises(GeneratorError, match="usdc"):
+            generator.generate_bundle([contract, contract])
@@ -155,7 +155,7 @@ class TestTemplateRendering:
         
         assert "Test Server" in content
         assert "0x1234567890123456789012345678901234567890" in content
-        assert "mcp.run()" in content
+        assert "mcp.run(" in content
 
     def test_render_config_template(self):
         """Test rendering the config template."""
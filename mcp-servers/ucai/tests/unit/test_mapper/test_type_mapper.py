@@ -583,3 +583,114 @@ class TestTypeMapperMethodCoverage:
         )
         
         assert schema["description"] == "The recipient of the transfer"
+
+
+class TestTypeInterning:
+    """Tests for interned types and cached schemas."""
+
+    COMPONENTS = [
+        {"name": "token", "type": "address", "internalType": "contract IERC20"},
+        {
+            "name": "route",
+            "type": "tuple[]",
+            "components": [
+                {"name": "pool", "type": "address"},
+                {"name": "fee", "type": "uint24"},
+            ],
+        },
+    ]
+
+    def test_equal_types_are_shared(self):
+        """Test that parse_type returns one object per distinct type."""
+        first = TypeMapper().parse_type("tuple", self.COMPONENTS)
+        second = TypeMapper().parse_type("tuple", [dict(c) for c in self.COMPONENTS])
+
+        assert first is second
+        assert first.tuple_components[0] is TypeMapper().parse_type("address")
+
+    def test_components_are_canonicalised(self):
+        """Test that keys not affecting the type do not split the cache."""
+        with_internal = TypeMapper().parse_type("tuple", [{"name": "a", "type": "uint"}])
+        without = TypeMapper().parse_type(
+            "tuple", [{"name": "a", "type": "uint", "internalType": "uint256"}]
+        )
+        renamed = TypeMapper().parse_type("tuple", [{"name": "b", "type": "uint"}])
+
+        assert with_internal is without
+        assert renamed is not with_internal
+        assert renamed.tuple_names == ("b",)
+
+    def test_subclass_overrides_are_used(self):
+        """Test that a subclass's parse and schema overrides are not bypassed by the cache."""
+
+        class AliasMapper(TypeMapper):
+            def _parse_uncached(self, type_str, components):
+                if type_str == "addr":
+                    type_str = "address"
+                return super()._parse_uncached(type_str, components)
+
+            def _build_schema(self, solidity_type):
+                schema = super()._build_schema(solidity_type)
+                schema["x-alias"] = True
+                return schema
+
+        mapper = AliasMapper()
+        parsed = mapper.parse_type("addr[]")
+
+        assert parsed.base_type == "address"
+        assert mapper.to_json_schema(parsed)["x-alias"] is True
+        assert TypeMapper().parse_type("addr").base_type == "addr"
+        assert "x-alias" not in TypeMapper().to_json_schema(TypeMapper().parse_type("address[]"))
+
+    def test_types_are_immutable(self):
+        """Test that shared types cannot be modified."""
+        import dataclasses
+
+        solidity_type = TypeMapper().parse_type("address[]")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            solidity_type.array_length = 3
+
+    def test_schema_copies_are_independent(self):
+        """Test that callers can modify returned schemas without affecting the cache."""
+        mapper = TypeMapper()
+        solidity_type = mapper.parse_type("tuple[]", self.COMPONENTS)
+
+        schema = mapper.to_json_schema(solidity_type)
+        schema["items"]["properties"]["token"]["pattern"] = "changed"
+        schema["items"]["required"].append("extra")
+
+        fresh = mapper.to_json_schema(solidity_type)
+        assert fresh["items"]["properties"]["token"]["pattern"] != "changed"
+        assert fresh["items"]["required"] == ["token", "route"]
+
+    def test_description_not_cached(self):
+        """Test that per-parameter descriptions do not leak between calls."""
+        mapper = TypeMapper()
+        solidity_type = mapper.parse_type("bool")
+
+        named = mapper.to_json_schema(solidity_type, param_name="isActive")
+        described = mapper.to_json_schema(solidity_type, param_description="Flag")
+        bare = mapper.to_json_schema(solidity_type)
+
+        assert named["description"] == "Is active"
+        assert described["description"] == "Flag"
+        assert "description" not in bare
+
+    def test_list_fields_are_accepted(self):
+        """Test that SolidityType still accepts lists and stays hashable."""
+        st = SolidityType(
+            base_type="tuple",
+            is_tuple=True,
+            tuple_components=[SolidityType(base_type="address")],
+            tuple_names=["owner"],
+        )
+
+        assert st.tuple_names == ("owner",)
+        assert hash(st) == hash(
+            SolidityType(
+                base_type="tuple",
+                is_tuple=True,
+                tuple_components=(SolidityType(base_type="address"),),
+                tuple_names=("owner",),
+            )
+        )
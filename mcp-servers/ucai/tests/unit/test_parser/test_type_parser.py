@@ -1,5 +1,7 @@
 """Tests for type parser module."""
 
+import dataclasses
+
 import pytest
 
 from abi_to_mcp.parser.type_parser import TypeParser
@@ -84,7 +86,7 @@ def test_parse_dynamic_array():
     parsed = parser.parse("address[]")
     assert parsed.base_type == "address"
     assert parsed.is_array
-    assert parsed.array_dimensions == [None]  # None means dynamic
+    assert parsed.array_dimensions == (None,)  # None means dynamic
     
     # uint256[]
     parsed = parser.parse("uint256[]")
@@ -100,12 +102,12 @@ def test_parse_fixed_array():
     parsed = parser.parse("uint256[5]")
     assert parsed.base_type == "uint256"
     assert parsed.is_array
-    assert parsed.array_dimensions == [5]
+    assert parsed.array_dimensions == (5,)
     
     # bytes32[10]
     parsed = parser.parse("bytes32[10]")
     assert parsed.base_type == "bytes32"
-    assert parsed.array_dimensions == [10]
+    assert parsed.array_dimensions == (10,)
 
 
 def test_parse_nested_array():
@@ -116,17 +118,17 @@ def test_parse_nested_array():
     parsed = parser.parse("address[][]")
     assert parsed.base_type == "address"
     assert parsed.is_array
-    assert parsed.array_dimensions == [None, None]
+    assert parsed.array_dimensions == (None, None)
     
     # uint256[5][]
     parsed = parser.parse("uint256[5][]")
     assert parsed.base_type == "uint256"
-    assert parsed.array_dimensions == [5, None]
+    assert parsed.array_dimensions == (5, None)
     
     # uint256[][3]
     parsed = parser.parse("uint256[][3]")
     assert parsed.base_type == "uint256"
-    assert parsed.array_dimensions == [None, 3]
+    assert parsed.array_dimensions == (None, 3)
 
 
 def test_parse_tuple():
@@ -167,3 +169,24 @@ def test_normalize_types():
     # int -> int256
     parsed = parser.parse("int")
     assert parsed.base_type == "int256"
+
+
+def test_parse_is_interned():
+    """Test that equal type strings share one immutable ParsedType."""
+    first = TypeParser().parse("uint256[][3]")
+    second = TypeParser().parse("uint256[][3]")
+
+    assert first is second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.base_type = "address"
+
+
+def test_parse_subclass_override():
+    """Test that a subclass's _parse_uncached is used despite the shared cache."""
+
+    class AliasParser(TypeParser):
+        def _parse_uncached(self, type_str):
+            return super()._parse_uncached("address" if type_str == "addr" else type_str)
+
+    assert AliasParser().parse("addr").base_type == "address"
+    assert TypeParser().parse("addr").base_type == "addr"
@@ -0,0 +1,183 @@
+"""Tests for FailoverProvider against local stand-in JSON-RPC servers (see conftest)."""
+
+import time
+
+import pytest
+from web3 import Web3
+
+from abi_to_mcp.core.exceptions import Web3ConnectionError
+from abi_to_mcp.runtime.failover import FailoverProvider
+from abi_to_mcp.runtime.web3_client import Web3Client
+
+ACCOUNT = "0x1234567890123456789012345678901234567890"
+
+
+def test_routes_to_first_healthy_endpoint(rpc_servers):
+    """Requests go to the first URL while it is healthy."""
+    first, second = rpc_servers(block=100), rpc_servers(block=200)
+    w3 = Web3(FailoverProvider([first.url, second.url], hedge=False))
+
+    assert w3.eth.block_number == 100
+    assert second.requests == []
+
+
+def test_fails_over_on_transport_errors(rpc_servers):
+    """A failing endpoint is skipped and demoted behind healthy ones."""
+    broken, healthy = rpc_servers(block=1, status=503), rpc_servers(block=200)
+    provider = FailoverProvider([broken.url, healthy.url], hedge=False)
+    w3 = Web3(provider)
+
+    for _ in range(3):
+        assert w3.eth.block_number == 200
+
+    assert broken.posts == 1
+    assert provider.ranked_endpoints() == [healthy.url, broken.url]
+    assert provider.stats()[0]["failures"] == 1
+
+
+def test_ejects_after_consecutive_failures(rpc_servers):
+    """An endpoint failing eject_after times in a row is ejected."""
+    broken = rpc_servers(block=1, status=503)
+    provider = FailoverProvider([broken.url], eject_after=2)
+
+    for _ in range(2):
+        with pytest.raises(Web3ConnectionError):
+            provider.make_request("eth_blockNumber", [])
+
+    assert provider.stats()[0]["ejected"] is True
+
+
+def test_ejected_endpoint_returns_after_cooldown(rpc_servers):
+    """Ejection lasts only for the cooldown."""
+    flaky, healthy = rpc_servers(block=1, status=503), rpc_servers(block=200)
+    provider = FailoverProvider([flaky.url, healthy.url], hedge=False, eject_after=1, cooldown=0.2)
+    w3 = Web3(provider)
+
+    assert w3.eth.block_number == 200
+    assert provider.ranked_endpoints()[0] == healthy.url
+
+    time.sleep(0.25)
+    assert not provider.health[flaky.url].is_ejected(time.monotonic())
+
+
+def test_hedges_slow_reads(rpc_servers):
+    """A read slower than the hedge delay is answered by the second endpoint."""
+    slow, fast = rpc_servers(block=100, delay=1.0), rpc_servers(block=200)
+    w3 = Web3(FailoverProvider([slow.url, fast.url], hedge_delay=0.1))
+
+    started = time.monotonic()
+    assert w3.eth.block_number == 200
+    assert time.monotonic() - started < 0.8
+
+
+def test_writes_are_not_hedged(rpc_servers):
+    """Side-effecting methods wait for one endpoint instead of hedging."""
+    slow, fast = rpc_servers(block=100, delay=0.3), rpc_servers(block=200)
+    provider = FailoverProvider([slow.url, fast.url], hedge_delay=0.05)
+
+    provider.make_request("eth_sendRawTransaction", ["0x00"])
+
+    assert fast.requests == []
+
+
+def test_prefers_lower_latency(rpc_servers):
+    """Rolling latency scores route traffic to the faster endpoint."""
+    slow, fast = rpc_servers(block=100, delay=0.05), rpc_servers(block=200)
+    provider = FailoverProvider([slow.url, fast.url], hedge_delay=0.01, min_hedge_delay=0.01)
+    w3 = Web3(provider)
+
+    for _ in range(5):
+        assert w3.eth.block_number in (100, 200)
+    time.sleep(0.1)  # let the losing hedges finish and record their latency
+
+    assert provider.ranked_endpoints()[0] == fast.url
+
+
+def test_all_endpoints_down(rpc_servers):
+    """With every endpoint failing, the error names them all."""
+    a, b = rpc_servers(block=1, status=500), rpc_servers(block=2, status=502)
+    provider = FailoverProvider([a.url, b.url], hedge=False)
+
+    with pytest.raises(Web3ConnectionError) as exc_info:
+        provider.make_request("eth_blockNumber", [])
+
+    assert a.url in str(exc_info.value)
+    assert b.url in str(exc_info.value)
+
+
+def test_reverts_are_not_failed_over(rpc_servers):
+    """A revert reported as -32603 is returned without failover or ejection."""
+    first, second = rpc_servers(block=1), rpc_servers(block=2)
+    first.error_code = -32603
+    first.errors[ACCOUNT] = "execution reverted: insufficient balance"
+    provider = FailoverProvider([first.url, second.url], hedge=False, eject_after=2)
+
+    for _ in range(3):
+        response = provider.make_request("eth_getBalance", [ACCOUNT, "latest"])
+        assert "execution reverted" in response["error"]["message"]
+
+    assert second.requests == []
+    assert provider.stats()[0]["failures"] == 0
+    assert provider.stats()[0]["ejected"] is False
+
+
+def test_internal_errors_are_failed_over(rpc_servers):
+    """Other -32603 errors count against the endpoint."""
+    first, second = rpc_servers(block=1), rpc_servers(block=2)
+    first.error_code = -32603
+    first.errors[ACCOUNT] = "internal error"
+    second.balances[ACCOUNT] = 5
+    provider = FailoverProvider([first.url, second.url], hedge=False)
+
+    response = provider.make_request("eth_getBalance", [ACCOUNT, "latest"])
+
+    assert response["result"] == "0x5"
+    assert provider.stats()[0]["failures"] == 1
+
+
+def test_requires_urls():
+    """An empty URL list is rejected."""
+    with pytest.raises(ValueError):
+        FailoverProvider([])
+
+
+class TestWeb3ClientFailover:
+    """Web3Client with several RPC URLs."""
+
+    def test_list_of_urls(self, rpc_servers):
+        """A URL list connects through FailoverProvider."""
+        broken, healthy = rpc_servers(block=1, status=503), rpc_servers(block=321)
+        client = Web3Client(rpc_url=[broken.url, healthy.url])
+
+        assert client.get_block_number() == 321
+        assert client.rpc_urls == [broken.url, healthy.url]
+        assert [s["url"] for s in client.endpoint_stats()] == client.rpc_urls
+
+    def test_close_stops_threads(self, rpc_servers):
+        """close() shuts down the provider's thread pool."""
+        server = rpc_servers(block=5)
+        client = Web3Client(rpc_url=[server.url, server.url + "/b"])
+        assert client.get_block_number() == 5
+        executor = client._provider._executor
+
+        client.close()
+
+        assert executor._shutdown
+        assert client.endpoint_stats() == []
+        assert client.get_block_number() == 5
+
+    def test_comma_separated_env(self, monkeypatch):
+        """RPC_URL may list several endpoints."""
+        monkeypatch.setenv("RPC_URL", "https://a.example, https://b.example")
+
+        client = Web3Client(network="mainnet")
+
+        assert client.rpc_urls == ["https://a.example", "https://b.example"]
+        assert client._rpc_url == "https://a.example"
+
+    def test_single_url_has_no_stats(self):
+        """A single URL keeps the plain HTTPProvider."""
+        client = Web3Client(rpc_url="https://only.example")
+
+        assert client.rpc_urls == ["https://only.example"]
+        assert client.endpoint_stats() == []
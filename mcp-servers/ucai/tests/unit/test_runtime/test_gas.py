@@ -1,7 +1,7 @@
 """Tests for gas estimation module."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 
 from abi_to_mcp.runtime.gas import GasEstimator, GasPrice
 
@@ -94,12 +94,21 @@ class TestGasEstimator:
         client.network_config = {"currency": "ETH", "chain_id": 1}
         return client
 
+    @staticmethod
+    def fee_history(base_fee, rewards):
+        """eth_feeHistory response: one reward row per block, next base fee last."""
+        return {
+            "oldestBlock": 100,
+            "baseFeePerGas": [base_fee] * (len(rewards) + 1),
+            "gasUsedRatio": [0.5] * len(rewards),
+            "reward": rewards,
+        }
+
     def test_get_gas_price_eip1559(self, mock_web3_client):
         """Get gas price on EIP-1559 network."""
-        # Mock block with base fee
-        mock_web3_client.w3.eth.get_block.return_value = {
-            "baseFeePerGas": 10_000_000_000
-        }
+        mock_web3_client.w3.eth.fee_history.return_value = self.fee_history(
+            10_000_000_000, [[1, 2, 3, 4]]
+        )
 
         estimator = GasEstimator(mock_web3_client)
         price = estimator.get_gas_price()
@@ -138,9 +147,9 @@ class TestGasEstimator:
         """EIP-1559 max fee should include base fee and priority."""
         base_fee = 10_000_000_000  # 10 gwei
 
-        mock_web3_client.w3.eth.get_block.return_value = {
-            "baseFeePerGas": base_fee
-        }
+        mock_web3_client.w3.eth.fee_history.return_value = self.fee_history(
+            base_fee, [[1, 2, 3, 4]]
+        )
 
         estimator = GasEstimator(mock_web3_client)
         price = estimator.get_gas_price()
@@ -202,7 +211,10 @@ class TestGasEstimator:
 
     def test_gas_estimator_error_handling(self, mock_web3_client):
         """Gas estimator should handle errors gracefully."""
-        mock_web3_client.w3.eth.get_block.side_effect = Exception("Network error")
+        mock_web3_client.w3.eth.fee_history.side_effect = Exception("Network error")
+        type(mock_web3_client.w3.eth).gas_price = PropertyMock(
+            side_effect=Exception("Network error")
+        )
 
         estimator = GasEstimator(mock_web3_client)
 
@@ -240,6 +252,155 @@ import os
 import tempfile
 
 
+class TestGasOracle:
+    """Tests for the fee-history gas oracle."""
+
+    GWEI = 10**9
+
+    @pytest.fixture
+    def client(self):
+        """Mock client on an EIP-1559 network at block 104."""
+        client = Mock()
+        client.w3.eth.block_number = 104
+        client.w3.eth.gas_price = 30 * self.GWEI
+        client.w3.eth.fee_history.return_value = {
+            "oldestBlock": 100,
+            "baseFeePerGas": [9 * self.GWEI] * 5 + [10 * self.GWEI],
+            "gasUsedRatio": [0.5, 0.0, 0.9, 0.4, 0.6],
+            "reward": [
+                [1 * self.GWEI, 2 * self.GWEI, 3 * self.GWEI, 9 * self.GWEI],
+                [0, 0, 0, 0],  # empty block, ignored
+                [1 * self.GWEI, 3 * self.GWEI, 4 * self.GWEI, 8 * self.GWEI],
+                [2 * self.GWEI, 2 * self.GWEI, 2 * self.GWEI, 2 * self.GWEI],
+                [1 * self.GWEI, 2 * self.GWEI, 5 * self.GWEI, 7 * self.GWEI],
+            ],
+        }
+        return client
+
+    def test_tiers_from_fee_history(self, client):
+        """Priority fees are per-percentile medians over non-empty blocks."""
+        from abi_to_mcp.runtime.gas import GasOracle
+
+        price = GasOracle(client).get_gas_price()
+
+        assert price.is_eip1559
+        assert price.block_number == 104
+        assert price.base_fee == 10 * self.GWEI
+        assert price.priority_fees == {
+            "slow": 1 * self.GWEI,
+            "standard": 2 * self.GWEI,
+            "fast": 3_500_000_000,  # median of 3, 4, 2, 5 gwei
+            "instant": 7_500_000_000,  # median of 9, 8, 2, 7 gwei
+        }
+        assert price.priority_fee == price.priority_fees["standard"]
+        assert price.standard == 20 * self.GWEI + price.priority_fee
+        assert price.slow <= price.standard <= price.fast <= price.instant
+        client.w3.eth.fee_history.assert_called_once_with(20, "latest", [10, 50, 75, 95])
+
+    def test_partial_tier_percentiles(self, client):
+        """Custom percentiles are merged over the defaults, in ascending order."""
+        from abi_to_mcp.runtime.gas import GasOracle
+
+        oracle = GasOracle(client, tier_percentiles={"instant": 99, "urgent": 60})
+        price = oracle.get_gas_price()
+
+        assert list(price.priority_fees) == ["slow", "standard", "urgent", "fast", "instant"]
+        client.w3.eth.fee_history.assert_called_once_with(20, "latest", [10, 50, 60, 75, 99])
+
+    def test_same_block_costs_no_rpc(self, client):
+        """Calls within max_age are served from the cache."""
+        from abi_to_mcp.runtime.gas import GasOracle
+
+        oracle = GasOracle(client, max_age=60)
+        first = oracle.get_gas_price()
+        for _ in range(5):
+            assert oracle.get_gas_price() is first
+
+        assert client.w3.eth.fee_history.call_count == 1
+        assert oracle.stats["hits"] == 5
+
+    def test_block_check_after_max_age(self, client):
+        """Stale prices are kept if the block is unchanged, refetched otherwise."""
+        from abi_to_mcp.runtime.gas import GasOracle
+
+        oracle = GasOracle(client, max_age=0)
+        first = oracle.get_gas_price()
+
+        assert oracle.get_gas_price() is first
+        assert client.w3.eth.fee_history.call_count == 1
+        assert oracle.stats["block_checks"] == 1
+
+        client.w3.eth.block_number = 105
+        oracle.get_gas_price()
+        assert client.w3.eth.fee_history.call_count == 2
+
+    def test_legacy_fallback(self, client):
+        """Without eth_feeHistory (or base fees), tiers are eth_gasPrice multiples."""
+        from abi_to_mcp.runtime.gas import GasOracle
+
+        client.w3.eth.fee_history.side_effect = Exception("method not found")
+        price = GasOracle(client).get_gas_price()
+
+        assert not price.is_eip1559
+        assert price.standard == 30 * self.GWEI
+        assert price.slow == 24 * self.GWEI
+
+        client.w3.eth.fee_history.side_effect = None
+        client.w3.eth.fee_history.return_value = {
+            "oldestBlock": 1,
+            "baseFeePerGas": [0, 0],
+            "gasUsedRatio": [0.5],
+            "reward": [[0, 0, 0, 0]],
+        }
+        assert not GasOracle(client).get_gas_price().is_eip1559
+
+    def test_shared_between_components(self, client):
+        """Estimator, builder and simulator on one client share one oracle."""
+        from abi_to_mcp.runtime.gas import GasOracle
+        from abi_to_mcp.runtime.simulator import TransactionSimulator
+        from abi_to_mcp.runtime.transaction import TransactionBuilder
+
+        estimator = GasEstimator(client)
+        builder = TransactionBuilder(client)
+        simulator = TransactionSimulator(client)
+
+        assert estimator.oracle is GasOracle.for_client(client)
+        assert builder.gas_oracle is estimator.oracle
+        assert simulator.tx_builder.gas_oracle is estimator.oracle
+        assert GasOracle.for_client(Mock()) is not estimator.oracle
+
+    def test_builder_uses_oracle(self, client):
+        """Auto-priced transactions use the standard tier without extra RPCs."""
+        from abi_to_mcp.runtime.transaction import TransactionBuilder
+
+        client.get_transaction_count.return_value = 0
+        client.get_chain_id.return_value = 1
+        func = Mock()
+        func.build_transaction.side_effect = lambda tx: {**tx, "gas": 50000}
+        builder = TransactionBuilder(client)
+
+        for _ in range(3):
+            tx = builder.build_transaction(func, from_address="0x" + "1" * 40)
+
+        assert tx["maxPriorityFeePerGas"] == 2 * self.GWEI
+        assert tx["maxFeePerGas"] == 22 * self.GWEI
+        assert client.w3.eth.fee_history.call_count == 1
+        client.w3.eth.get_block.assert_not_called()
+
+    def test_background_refresher(self, client):
+        """start() keeps prices current in a background thread."""
+        import time
+        from abi_to_mcp.runtime.gas import GasOracle
+
+        oracle = GasOracle(client)
+        oracle.start(interval=0.01)
+        time.sleep(0.1)
+        oracle.stop()
+
+        assert oracle.stats["fetches"] >= 2
+        assert oracle.get_gas_price().block_number == 104
+
+
 class TestConfigEdgeCases:
     """Test edge cases in config module."""
     
@@ -0,0 +1,176 @@
+"""Tests for the local nonce manager."""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+
+from abi_to_mcp.core.exceptions import TransactionError
+from abi_to_mcp.runtime.nonce import NonceManager
+from abi_to_mcp.runtime.transaction import TransactionBuilder
+
+SENDER = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"
+
+
+@pytest.fixture
+def client():
+    """Mock client with 10 pending transactions for every address."""
+    client = Mock()
+    client.get_chain_id.return_value = 1
+    client.get_transaction_count.return_value = 10
+    return client
+
+
+class TestNonceManager:
+    """Tests for NonceManager."""
+
+    def test_burst_costs_one_rpc(self, client):
+        """Consecutive reservations come from memory after the first sync."""
+        manager = NonceManager(client)
+
+        assert [manager.reserve(SENDER) for _ in range(5)] == [10, 11, 12, 13, 14]
+        client.get_transaction_count.assert_called_once_with(SENDER, block_identifier="pending")
+
+    def test_concurrent_reservations_are_unique(self, client):
+        """Threads never receive the same nonce."""
+        manager = NonceManager(client)
+        nonces = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                nonce = manager.reserve(SENDER)
+                with lock:
+                    nonces.append(nonce)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(nonces) == list(range(10, 410))
+
+    def test_release_reuses_nonce(self, client):
+        """Released nonces are handed out again before new ones."""
+        manager = NonceManager(client)
+        first, second, third = (manager.reserve(SENDER) for _ in range(3))
+
+        manager.release(SENDER, second)
+        assert manager.peek(SENDER) == second
+        assert manager.reserve(SENDER) == second
+
+        manager.release(SENDER, third)
+        assert manager.reserve(SENDER) == third
+        assert manager.reserve(SENDER) == 13
+
+    def test_addresses_and_chains_are_separate(self, client):
+        """State is keyed by (chain id, address)."""
+        manager = NonceManager(client)
+        other = "0x" + "1" * 40
+
+        assert manager.reserve(SENDER) == 10
+        assert manager.reserve(other) == 10
+        client.get_chain_id.return_value = 5
+        assert manager.reserve(SENDER) == 10
+
+    def test_resync_moves_forward(self, client):
+        """After resync_interval the pending count wins if it is ahead."""
+        manager = NonceManager(client, resync_interval=0)
+        manager.reserve(SENDER)
+
+        client.get_transaction_count.return_value = 20
+        assert manager.reserve(SENDER) == 20
+
+        # A lower pending count (our transactions not yet seen) is ignored
+        client.get_transaction_count.return_value = 15
+        assert manager.reserve(SENDER) == 21
+
+    def test_nonce_too_low_recovers(self, client):
+        """'nonce too low' jumps to the node's pending count."""
+        manager = NonceManager(client)
+        nonce = manager.reserve(SENDER)
+
+        client.get_transaction_count.return_value = 12
+        manager.handle_send_error(SENDER, nonce, ValueError("nonce too low: next nonce 12"))
+
+        assert manager.reserve(SENDER) == 12
+
+    def test_nonce_too_high_resets(self, client):
+        """'nonce too high' falls back to the pending count."""
+        manager = NonceManager(client)
+        for _ in range(3):
+            nonce = manager.reserve(SENDER)
+
+        manager.handle_send_error(SENDER, nonce, ValueError("nonce too high"))
+
+        assert manager.reserve(SENDER) == 10
+
+    def test_other_errors_release(self, client):
+        """A rejected transaction gives its nonce back; a known one keeps it."""
+        manager = NonceManager(client)
+        nonce = manager.reserve(SENDER)
+
+        manager.handle_send_error(SENDER, nonce, ValueError("already known"))
+        assert manager.peek(SENDER) == 11
+
+        manager.handle_send_error(SENDER, nonce, ValueError("insufficient funds"))
+        assert manager.peek(SENDER) == 10
+
+    def test_reset(self, client):
+        """reset() forgets local state."""
+        manager = NonceManager(client)
+        manager.reserve(SENDER)
+        manager.reset(SENDER)
+
+        assert manager.reserve(SENDER) == 10
+        assert client.get_transaction_count.call_count == 2
+
+    def test_shared_per_client(self, client):
+        """for_client returns one manager per client."""
+        assert NonceManager.for_client(client) is NonceManager.for_client(client)
+        assert NonceManager.for_client(client) is not NonceManager.for_client(Mock())
+
+
+class TestTransactionBuilderNonces:
+    """TransactionBuilder integration with the nonce manager."""
+
+    @pytest.fixture
+    def builder(self, client):
+        client.w3.eth.fee_history.side_effect = Exception("unsupported")
+        client.w3.eth.gas_price = 10**9
+        return TransactionBuilder(client, nonce_manager=NonceManager(client))
+
+    def test_builds_reserve_consecutive_nonces(self, builder, client):
+        """A burst of builds costs one nonce RPC."""
+        func = Mock()
+        func.build_transaction.side_effect = lambda tx: {**tx, "gas": 21000}
+
+        txs = [builder.build_transaction(func, SENDER) for _ in range(3)]
+
+        assert [tx["nonce"] for tx in txs] == [10, 11, 12]
+        client.get_transaction_count.assert_called_once()
+
+    def test_failed_build_releases_nonce(self, builder):
+        """A nonce reserved for a build that fails is reused."""
+        func = Mock()
+        func.build_transaction.side_effect = Exception("execution reverted")
+
+        with pytest.raises(TransactionError):
+            builder.build_transaction(func, SENDER)
+
+        assert builder.nonce_manager.peek(SENDER) == 10
+
+    def test_send_raw_transaction(self, builder, client):
+        """Sending returns the hash; a rejection updates the nonce manager."""
+        client.w3.eth.send_raw_transaction.return_value = bytes.fromhex("ab" * 32)
+        nonce = builder.nonce_manager.reserve(SENDER)
+
+        assert builder.send_raw_transaction(b"raw", SENDER, nonce) == "ab" * 32
+
+        client.w3.eth.send_raw_transaction.side_effect = ValueError("nonce too low")
+        client.get_transaction_count.return_value = 15
+        with pytest.raises(TransactionError, match="nonce too low"):
+            builder.send_raw_transaction(b"raw", SENDER, builder.nonce_manager.reserve(SENDER))
+
+        assert builder.nonce_manager.peek(SENDER) == 15
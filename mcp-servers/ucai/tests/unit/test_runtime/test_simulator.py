@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
+from web3 import Web3
 
 from abi_to_mcp.runtime.simulator import TransactionSimulator
 from abi_to_mcp.core.exceptions import SimulationError
@@ -426,3 +427,179 @@ class TestSimulatorWithValue:
         
         assert result["success"] is True
         assert result["transaction"]["value"] == 1000000000000000000
+
+
+class TestSimulateBatchModes:
+    """Tests for independent and chained simulate_batch modes."""
+
+    SENDER = "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"
+    TOKEN = "0x" + "a" * 40
+    ROUTER = "0x" + "b" * 40
+    SLOT = "0x" + "0" * 63 + "1"
+
+    @pytest.fixture
+    def client(self):
+        """Mock client whose node supports state overrides and tracing."""
+        client = Mock()
+        client.get_transaction_count.return_value = 7
+        client.get_chain_id.return_value = 1
+        client.w3.eth.gas_price = 10**9
+        client.w3.eth.fee_history.side_effect = Exception("unsupported")
+        client.w3.eth.estimate_gas.return_value = 40000
+        client.w3.provider.make_request.return_value = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {
+                "pre": {self.TOKEN: {"balance": "0x0", "storage": {self.SLOT: "0x" + "0" * 64}}},
+                "post": {self.TOKEN: {"storage": {self.SLOT: "0x" + "f" * 64}}},
+            },
+        }
+        return client
+
+    def _function(self, address, call):
+        func = Mock()
+        func.address = address
+        func._encode_transaction_data.return_value = "0x095ea7b3"
+        func.call.side_effect = call
+        return func
+
+    def test_unknown_mode(self, client):
+        """Unknown modes are rejected."""
+        with pytest.raises(ValueError, match="Unknown simulation mode"):
+            TransactionSimulator(client).simulate_batch([], self.SENDER, mode="parallel")
+
+    def test_independent_runs_concurrently(self, client):
+        """Independent simulations overlap and keep input order."""
+        import threading
+        import time
+
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_call(*args, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return True
+
+        simulator = TransactionSimulator(client)
+        simulator.tx_builder = Mock()
+        simulator.tx_builder.build_transaction.return_value = {"gas": 21000, "gasPrice": 10**9}
+        funcs = [self._function(self.TOKEN, slow_call) for _ in range(4)]
+        funcs[2].call.side_effect = Exception("execution reverted")
+
+        results = simulator.simulate_batch(
+            [(f, 0) for f in funcs], self.SENDER, mode="independent"
+        )
+
+        assert [r["step"] for r in results] == [0, 1, 2, 3]
+        assert [r["success"] for r in results] == [True, True, False, True]
+        assert peak[0] > 1
+        assert all(r["elapsed_ms"] >= 0 for r in results)
+        # nonce fetched once for the batch
+        client.get_transaction_count.assert_called_once()
+        for call in simulator.tx_builder.build_transaction.call_args_list:
+            assert call.kwargs["nonce"] == 7
+
+    def test_chained_carries_state(self, client):
+        """Step 2 sees step 1's storage writes through state overrides."""
+        seen = {}
+
+        def swap(tx, block, state_override):
+            seen["state"] = state_override
+            return 123
+
+        approve = self._function(self.TOKEN, lambda *a: True)
+        swap_func = self._function(self.ROUTER, swap)
+
+        results = TransactionSimulator(client).simulate_batch(
+            [(approve, 0), (swap_func, 5)], self.SENDER, mode="chained"
+        )
+
+        assert [r["success"] for r in results] == [True, True]
+        assert results[1]["result"] == 123
+        token = Web3.to_checksum_address(self.TOKEN)
+        assert seen["state"] == {token: {"stateDiff": {self.SLOT: "0x" + "f" * 64}}}
+        assert [r["transaction"]["nonce"] for r in results] == [7, 8]
+        assert results[0]["gas_estimate"] == 40000
+        assert results[0]["estimated_cost_wei"] == 40000 * 10**9
+        # traced once: the last step's state is never needed
+        method, params = client.w3.provider.make_request.call_args.args
+        assert method == "debug_traceCall"
+        assert params[2]["tracer"] == "prestateTracer"
+        assert params[0]["value"] == "0x0"
+
+    def test_chained_stops_on_revert(self, client):
+        """A reverting step ends the chain."""
+        reverting = self._function(self.TOKEN, Exception("execution reverted: allowance"))
+        never = self._function(self.ROUTER, lambda *a: True)
+
+        results = TransactionSimulator(client).simulate_batch(
+            [(reverting, 0), (never, 0)], self.SENDER, mode="chained"
+        )
+
+        assert len(results) == 1
+        assert "allowance" in results[0]["error"]
+        never.call.assert_not_called()
+        client.w3.provider.make_request.assert_not_called()
+
+    def test_chained_needs_tracing(self, client):
+        """Nodes without debug_traceCall raise a clear error."""
+        client.w3.provider.make_request.return_value = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {"code": -32601, "message": "the method debug_traceCall does not exist"},
+        }
+        funcs = [self._function(self.TOKEN, lambda *a: True) for _ in range(2)]
+
+        with pytest.raises(SimulationError, match="debug_traceCall"):
+            TransactionSimulator(client).simulate_batch(
+                [(f, 0) for f in funcs], self.SENDER, mode="chained"
+            )
+
+    def test_merge_state_diff(self):
+        """Balances, nonces, code, storage and cleared slots become overrides."""
+        from abi_to_mcp.runtime.simulator import _merge_state_diff
+
+        a, b, gone = "0x" + "1" * 40, "0x" + "2" * 40, "0x" + "3" * 40
+        overrides = {}
+        _merge_state_diff(
+            overrides,
+            (
+                {
+                    a: {"balance": "0x10", "nonce": 1, "storage": {"0x01": "0x05", "0x02": "0x06"}},
+                    gone: {"balance": "0x1"},
+                },
+                {
+                    a: {"balance": "0x20", "nonce": 2, "storage": {"0x01": "0x07"}},
+                    b: {"code": "0x6080"},
+                },
+            ),
+        )
+
+        assert overrides[Web3.to_checksum_address(a)] == {
+            "balance": "0x20",
+            "nonce": "0x2",
+            "stateDiff": {"0x01": "0x07", "0x02": "0x" + "0" * 64},
+        }
+        assert overrides[Web3.to_checksum_address(b)] == {"code": "0x6080"}
+        assert overrides[Web3.to_checksum_address(gone)]["state"] == {}
+
+    def test_merge_state_diff_into_destroyed_account(self):
+        """Storage written after an account is destroyed goes into its "state"."""
+        from abi_to_mcp.runtime.simulator import _merge_state_diff
+
+        gone = "0x" + "3" * 40
+        overrides = {}
+        _merge_state_diff(overrides, ({gone: {"balance": "0x1"}}, {}))
+        _merge_state_diff(
+            overrides,
+            ({gone: {"storage": {"0x01": "0x05"}}}, {gone: {"storage": {"0x02": "0x06"}}}),
+        )
+
+        override = overrides[Web3.to_checksum_address(gone)]
+        assert "stateDiff" not in override
+        assert override["state"] == {"0x02": "0x06", "0x01": "0x" + "0" * 64}
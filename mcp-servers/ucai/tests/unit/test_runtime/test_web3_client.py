@@ -494,3 +494,104 @@ class TestWeb3ClientMethods:
         
         assert contract is mock_contract
         mock_w3.eth.contract.assert_called_once()
+
+
+class TestWeb3ClientBatching:
+    """Batched queries against a stand-in JSON-RPC server."""
+
+    ADDRESSES = [f"0x{i:040x}" for i in range(1, 6)]
+
+    @pytest.fixture
+    def node(self, rpc_servers):
+        """Stand-in node with balances, nonces and one contract."""
+        server = rpc_servers(block=10)
+        for i, address in enumerate(self.ADDRESSES, start=1):
+            server.balances[address] = i * 10**18
+            server.nonces[address] = i
+        server.codes[self.ADDRESSES[2]] = "0x6080"
+        return server
+
+    def test_get_balances_in_input_order(self, node):
+        """Balances come back in input order, one POST per chunk."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        client = Web3Client(rpc_url=node.url, batch_size=2)
+        assert client.w3 is not None  # connect before counting requests
+        posts = node.posts
+
+        results = client.get_balances(list(reversed(self.ADDRESSES)))
+
+        assert [r.value for r in results] == [i * 10**18 for i in range(5, 0, -1)]
+        assert all(r.ok for r in results)
+        assert node.posts - posts == 3
+
+    def test_transaction_counts_codes_and_contracts(self, node):
+        """Nonces, code and contract checks."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        client = Web3Client(rpc_url=node.url)
+
+        assert [r.value for r in client.get_transaction_counts(self.ADDRESSES)] == [1, 2, 3, 4, 5]
+        assert client.get_codes(self.ADDRESSES[2:3])[0].value == b"\x60\x80"
+        assert [r.value for r in client.is_contracts(self.ADDRESSES)] == [
+            False, False, True, False, False
+        ]
+
+    def test_per_item_errors(self, node):
+        """Invalid addresses and RPC errors fail only their own item."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        node.errors[self.ADDRESSES[1]] = "header not found"
+        client = Web3Client(rpc_url=node.url)
+
+        results = client.get_balances([self.ADDRESSES[0], "0xnope", self.ADDRESSES[1]])
+
+        assert results[0].value == 10**18
+        assert "Invalid Ethereum address" in results[1].error
+        assert results[2].error == "header not found"
+        assert [r.address for r in results] == [self.ADDRESSES[0], "0xnope", self.ADDRESSES[1]]
+
+    def test_oversized_batch_is_split(self, rpc_servers):
+        """A batch rejected as too large is retried in halves."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        node = rpc_servers(max_batch=2)
+        node.balances.update(dict.fromkeys(self.ADDRESSES, 7))
+        client = Web3Client(rpc_url=node.url, batch_size=5)
+
+        results = client.get_balances(self.ADDRESSES)
+
+        assert [r.value for r in results] == [7] * 5
+
+    def test_empty_input(self):
+        """No addresses means no connection at all."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        client = Web3Client(rpc_url="http://127.0.0.1:1")
+
+        assert client.get_balances([]) == []
+        assert client._w3 is None
+
+    def test_batches_fail_over(self, rpc_servers, node):
+        """Batches go through the failover provider with several URLs."""
+        from abi_to_mcp.runtime.web3_client import Web3Client
+
+        broken = rpc_servers(status=503)
+        client = Web3Client(rpc_url=[broken.url, node.url], hedge=False)
+
+        results = client.get_balances(self.ADDRESSES)
+
+        assert [r.value for r in results] == [i * 10**18 for i in range(1, 6)]
+
+
+def test_chain_id_is_cached():
+    """The chain ID is fetched once per client."""
+    client = Web3Client(rpc_url="https://test.example.com")
+    mock_w3 = Mock()
+    calls = []
+    type(mock_w3.eth).chain_id = property(lambda self: calls.append(1) or 137)
+    client._w3 = mock_w3
+
+    assert client.get_chain_id() == 137
+    assert client.get_chain_id() == 137
+    assert len(calls) == 1